@@ -15,6 +15,8 @@
 #ifndef RANDOMCLASS_H
 #define RANDOMCLASS_H
 
+#include <vector>
+
 class RandomClassImpl;
 
 
@@ -33,6 +35,7 @@ public:
   ~RandomClass();
   void seed(unsigned long int seed);
   double random();
+  std::vector<double> random_vector(unsigned int size);
   int get_rng_state();
   void forward_seed(unsigned int counts);
   int get_rng_seed();
@@ -0,0 +1,105 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Measures the time needed by the non-dominated sorting and the crowding distance (frontUtils)
+  for increasing population sizes, comparing the ranking with the successive extraction of the
+  non-dominated frontier. Each population is also ranked with duplicated points, drawing each objective
+  among a few distinct values.
+  Usage example:
+    python developer_tools/frontSortingBenchmark.py --sizes 100 1000 10000 --objectives 2 3 --levels 5
+  The exit code is the number of populations for which the rankings do not match.
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+ravenDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.append(ravenDir)
+from ravenframework.utils import frontUtils
+
+def rankByFrontierExtraction(data):
+  """
+    Reference ranking, removing the non-dominated frontier of the remaining points recursively
+    @ In, data, np.array, data matrix (nPoints, nObjectives)
+    @ Out, rank, np.array, the rank of the front of each point
+  """
+  rank = np.zeros(data.shape[0], dtype=int)
+  remaining = np.arange(data.shape[0])
+  front = 0
+  while remaining.size:
+    front += 1
+    efficient = frontUtils.nonDominatedFrontier(data[remaining].copy(), returnMask=True)
+    rank[remaining[efficient]] = front
+    remaining = remaining[~efficient]
+  return rank
+
+def timeIt(function, *args, repeat=1):
+  """
+    Calls a function several times, returning the best time
+    @ In, function, callable, the function to time
+    @ In, args, tuple, the arguments of the function
+    @ In, repeat, int, optional, number of calls
+    @ Out, best, float, the best time (s)
+    @ Out, out, object, the output of the last call
+  """
+  best = np.inf
+  for _ in range(repeat):
+    start = time.perf_counter()
+    out = function(*args)
+    best = min(best, time.perf_counter() - start)
+  return best, out
+
+def main():
+  """
+    Runs the benchmark and reports the results
+    @ In, None
+    @ Out, failures, int, number of mismatching rankings
+  """
+  parser = argparse.ArgumentParser(description='RAVEN non-dominated sorting benchmark')
+  parser.add_argument('--sizes', nargs='*', type=int, default=[100, 1000, 10000], help='population sizes')
+  parser.add_argument('--objectives', nargs='*', type=int, default=[2, 3], help='numbers of objectives')
+  parser.add_argument('--repeat', type=int, default=3, help='number of timed calls')
+  parser.add_argument('--levels', type=int, default=5,
+                      help='number of distinct values of each objective in the populations with duplicates')
+  parser.add_argument('--no-reference', dest='reference', action='store_false',
+                      help='do not time (and compare with) the frontier extraction')
+  parser.add_argument('--seed', type=int, default=42, help='random seed')
+  args = parser.parse_args()
+
+  rng = np.random.RandomState(args.seed)
+  failures = 0
+  print(f'{"objectives":>10} {"size":>8} {"duplicates":>10} {"fronts":>7} {"sort [s]":>10} {"crowding [s]":>13} {"extraction [s]":>15}')
+  for nObjectives in args.objectives:
+    for size in args.sizes:
+      for duplicates in [False, True]:
+        data = rng.rand(size, nObjectives)
+        if duplicates:
+          data = np.floor(data * args.levels)
+        sortTime, rank = timeIt(frontUtils.rankNonDominatedFrontiers, data, repeat=args.repeat)
+        crowdTime, _ = timeIt(frontUtils.crowdingDistance, rank, size, data, repeat=args.repeat)
+        nDuplicates = size - np.unique(data, axis=0).shape[0]
+        line = f'{nObjectives:>10} {size:>8} {nDuplicates:>10} {max(rank):>7} {sortTime:>10.4f} {crowdTime:>13.4f}'
+        if args.reference:
+          refTime, reference = timeIt(rankByFrontierExtraction, data)
+          line += f' {refTime:>15.4f}'
+          if not np.array_equal(rank, reference):
+            line += '  FAILED: rankings do not match'
+            failures += 1
+        print(line)
+  return failures
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,94 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Measures the time needed to import the RAVEN framework at startup, and checks that heavy
+  optional libraries (e.g. scikit-learn, tensorflow) are not imported until an input requests them.
+  Each measurement runs in a fresh interpreter, using "python -X importtime".
+  Usage example:
+    python developer_tools/importTimeBenchmark.py --repeat 5 --max-seconds 3.0
+  The exit code is the number of failed checks.
+"""
+import os
+import sys
+import argparse
+import subprocess
+import statistics
+
+ravenDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+def measureImport(module, python=sys.executable):
+  """
+    Imports a module in a fresh interpreter, collecting the import time of every module imported
+    @ In, module, str, module to import (e.g. ravenframework.Simulation)
+    @ In, python, str, optional, python executable
+    @ Out, total, float, total import time of the module (s)
+    @ Out, cumulative, dict, {module: cumulative import time (s)} for each imported module
+  """
+  # the framework modules use the "profile" decorator that the Driver defines as a builtin
+  cmd = [python, '-X', 'importtime', '-c', f'import builtins; builtins.profile = lambda f: f; import {module}']
+  run = subprocess.run(cmd, cwd=ravenDir, capture_output=True, text=True, check=True)
+  cumulative = {}
+  # lines are "import time: self [us] | cumulative | imported package"
+  for line in run.stderr.splitlines():
+    if not line.startswith('import time:') or 'imported package' in line:
+      continue
+    _, cumul, name = line[len('import time:'):].split('|')
+    cumulative[name.strip()] = int(cumul) * 1e-6
+  total = cumulative.get(module, max(cumulative.values(), default=0.0))
+  return total, cumulative
+
+def main():
+  """
+    Runs the benchmark and reports the results
+    @ In, None
+    @ Out, failures, int, number of failed checks
+  """
+  parser = argparse.ArgumentParser(description='RAVEN import-time benchmark')
+  parser.add_argument('--module', default='ravenframework.Simulation', help='module to import')
+  parser.add_argument('--repeat', type=int, default=3, help='number of fresh interpreters to time')
+  parser.add_argument('--top', type=int, default=15, help='number of slowest modules to list')
+  parser.add_argument('--max-seconds', dest='maxSeconds', type=float, default=None,
+                      help='fail if the median import time exceeds this value')
+  parser.add_argument('--forbid', nargs='*', default=['sklearn', 'tensorflow'],
+                      help='top-level libraries that must not be imported at startup')
+  args = parser.parse_args()
+
+  totals = []
+  cumulative = {}
+  for _ in range(args.repeat):
+    total, cumulative = measureImport(args.module)
+    totals.append(total)
+  median = statistics.median(totals)
+  print(f'import {args.module}: median {median:.3f} s over {args.repeat} runs '
+        f'(min {min(totals):.3f} s, max {max(totals):.3f} s)')
+  print('slowest top-level imports:')
+  topLevel = {}
+  for name, time in cumulative.items():
+    root = name.split('.')[0]
+    topLevel[root] = max(topLevel.get(root, 0.0), time)
+  for name, time in sorted(topLevel.items(), key=lambda x: -x[1])[:args.top]:
+    print(f'  {time:8.3f} s  {name}')
+
+  failures = 0
+  for lib in args.forbid:
+    if lib in topLevel:
+      print(f'FAILED: "{lib}" is imported at startup ({topLevel[lib]:.3f} s)')
+      failures += 1
+  if args.maxSeconds is not None and median > args.maxSeconds:
+    print(f'FAILED: median import time {median:.3f} s exceeds {args.maxSeconds:.3f} s')
+    failures += 1
+  return failures
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -106,7 +106,9 @@ class CodeInterfaceBase(BaseInterface):
     """
     # default to pandas, overwrite to 'numpy' if all of the following:
     # - all entries are guaranteed to be floats
-    # - results CSV have a large number of headers (>1000)
+    # - results CSV have a large number of headers (>1000) or rows
+    # codes whose outputs are parsed directly by the interface should rather return the
+    # data (dict of numpy arrays) from finalizeCodeOutput, avoiding any CSV
     return self._csvLoadUtil
 
   def setCsvLoadUtil(self, util):
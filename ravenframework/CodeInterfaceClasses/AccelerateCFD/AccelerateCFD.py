@@ -24,11 +24,11 @@ import pandas as pd
 import xml.etree.ElementTree as ET
 import glob
 import math
-from sklearn import neighbors
 from .OpenFoamPP import fieldParser
 from ravenframework.CodeInterfaceBaseClass import CodeInterfaceBase
 from ..Generic.GenericCodeInterface import GenericParser
-from ravenframework.utils import mathUtils
+from ravenframework.utils import mathUtils, importerUtils
+neighbors = importerUtils.importModuleLazyRenamed('neighbors', globals(), 'sklearn.neighbors')
 
 class AcceleratedCFD(CodeInterfaceBase):
   """
@@ -16,6 +16,7 @@ Created on Feb 7, 2013
 @author: alfoa
 This python module performs the loading of data from csv files
 """
+import warnings
 import numpy as np
 import pandas as pd
 
@@ -26,6 +27,10 @@ class CsvLoader(MessageUser):
     Class aimed to load the CSV files
   """
   acceptableUtils = ['pandas', 'numpy']
+  # column layouts of the already loaded CSVs, by header line, shared by all the loaders of this process
+  # (the samples of a code produce CSVs with the same header, so the layout is only determined once)
+  _headerNames = {}  # {header line: list of field names}
+  _floatColumns = {} # {header line: list of columns that have been read as floats (pandas)}
 
   def __init__(self):
     """
@@ -65,9 +70,20 @@ class CsvLoader(MessageUser):
       @ In, nullOK, bool, indicates if null values are acceptable
       @ Out, df, pandas.DataFrame, the loaded data
     """
+    with open(myFile, 'rb') as f:
+      head = f.readline()
+    floatColumns = self._floatColumns.get(head)
     # first try reading the file
     try:
-      df = pd.read_csv(myFile)
+      if floatColumns:
+        # skip the type inference for the columns known to be floats
+        try:
+          df = pd.read_csv(myFile, dtype=dict.fromkeys(floatColumns, float))
+        except ValueError:
+          # the types differ from the previously loaded files
+          df = pd.read_csv(myFile)
+      else:
+        df = pd.read_csv(myFile)
     except pd.errors.EmptyDataError:
       # no data in file
       self.raiseAWarning(f'Tried to read data from "{myFile}", but the file is empty!')
@@ -79,6 +95,8 @@ class CsvLoader(MessageUser):
       bad = pd.isnull(df).any(axis=1).to_numpy().nonzero()[0][0]
       self.raiseAnError(IOError, f'Invalid data in input file: row "{bad+1}" in "{myFile}"')
     self.allFieldNames = list(df.columns)
+    if floatColumns is None:
+      self._floatColumns[head] = [col for col, dtype in df.dtypes.items() if dtype == float]
     return df
 
   def _loadCsvNumpy(self, myFile, nullOK=None):
@@ -86,15 +104,36 @@ class CsvLoader(MessageUser):
       Function to load a csv file into realization format
       It also retrieves the headers
       The format of the csv must be comma-separated with all floats after header row
+      The values are parsed in a single pass and stored column-major, so that each column
+      of the returned array is contiguous in memory.
       @ In, myFile, string, Input file name (absolute path)
       @ In, nullOK, bool, indicates if null values are acceptable
       @ Out, data, np.ndarray, the loaded data
     """
     with open(myFile, 'rb') as f:
-      head = f.readline().decode()
-    self.allFieldNames = list(x.strip() for x in head.split(','))
-    data = np.loadtxt(myFile, dtype=float, delimiter=',', ndmin=2, skiprows=1)
-    return data
+      head = f.readline()
+      body = f.read().decode().strip()
+    names = self._headerNames.get(head)
+    if names is None:
+      names = list(x.strip() for x in head.decode().split(','))
+      self._headerNames[head] = names
+    self.allFieldNames = list(names)
+    if not body:
+      return np.zeros((0, len(names)))
+    lines = body.replace('\r', '').split('\n')
+    nSep = len(names) - 1
+    # ragged rows may still total a multiple of the column count, so check each row
+    ragged = any(line.count(',') != nSep for line in lines)
+    body = ','.join(lines)
+    with warnings.catch_warnings():
+      # malformed content (e.g. empty lines, ragged rows) is detected below and handled by numpy.loadtxt
+      warnings.simplefilter('ignore', DeprecationWarning)
+      values = np.fromstring(body, dtype=float, sep=',')
+    if ragged or values.size != len(lines) * len(names):
+      data = np.loadtxt(myFile, dtype=float, delimiter=',', ndmin=2, skiprows=1)
+    else:
+      data = values.reshape(-1, len(names))
+    return np.asfortranarray(data)
 
   def toRealization(self, data):
     """
@@ -19,6 +19,7 @@
 """
 from __future__ import division, print_function, unicode_literals, absolute_import
 
+import bisect
 import copy
 import itertools
 
@@ -66,6 +67,7 @@ class DataSet(DataObject):
     self._samplerTag      = None
     self.inputKDTree      = None
     self._autogenerate    = set()             # index vars in here are automatically generated
+    self._matchIndexes    = {}               # {tuple(vars): cached_ndarray.cMatchIndex} for fast realization matching
 
   ### INPUT SPECIFICATION ###
   @classmethod
@@ -224,8 +226,9 @@ class DataSet(DataObject):
     #
     #  Yours truly, talbpw, May 2019
     #########
-    # protect against back-changing realization
-    rlz = copy.deepcopy(rlz)
+    # protect against back-changing realization; only the dictionary needs to be copied, since
+    # the values are copied into the collector columns when appended
+    rlz = dict(rlz)
     # if index map was included, remove that now before checking variables
     indexMap = rlz.pop('_indexMap', None)
     if indexMap is not None:
@@ -256,26 +259,13 @@ class DataSet(DataObject):
 
     # check alignment of indexes
     self._checkAlignedIndexes(rlz)
-    #  NB If no scalar entry is made, this construction fails.  In that case,
-    #  instead of treating each dataarrray as an object, numpy.asarray calls their asarray methods,
-    #  unfolding them and making a full numpy array with more dimensions, instead of effectively
-    #  a list of realizations, where each realization is effectively a list of xr.DataArray objects.
-    #
-    #  To mitigate this behavior, we forcibly add a [0.0] entry to each realization, then exclude
-    #  it once the realizations are constructed.  This seems like an inefficient option; others
-    #  should be explored.  - talbpaul, 12/2017
-    #  newData is a numpy array of realizations,
-    #  each of which is a numpy array of some combination of scalar values and/or xr.DataArrays.
-    #  This is because the cNDarray collector expects a LIST of realization, not a single realization.
-    #  Maybe the "append" method should be renamed to "extend" or changed to append one at a time.
-    # set realizations as a list of realizations (which are ordered lists)
-    newData = np.array(list(rlz[var] for var in self._orderedVars)+[0.0], dtype=object)
-    newData = newData[:-1]
     # if data storage isn't set up, set it up
     if self._collector is None:
       self._collector = self._newCollector(width=len(self._orderedVars))
-    # append
-    self._collector.append(newData)
+    # append; the columnar collector writes each value directly into the typed column of its variable
+    self._collector.append(list(rlz[var] for var in self._orderedVars))
+    # keep the realization matching indexes up to date
+    self._updateMatchIndexes(rlz)
 
     # if hierarchical, clear the parent as an ending
     self._clearParentEndingStatus(rlz)
@@ -538,6 +528,8 @@ class DataSet(DataObject):
       if fname.endswith('.csv'):
         fname = fname[:-4]
       self._fromCSV(fname,**kwargs)
+    elif style == 'hdf5':
+      self._fromHDF5(fname, **kwargs)
     elif style == 'dict':
       self._fromDict(fname,**kwargs)
     elif style == 'dataset':
@@ -574,7 +566,6 @@ class DataSet(DataObject):
                                      if asDataSet: xarray.Dataset, all matching realizations as xarray.Dataset OR None if not found
                                      else        : list, list of matching realizations as [{var:value1}, {var:value2}, ...]
     """
-    # TODO convert input space to KD tree for faster searching -> XArray.DataArray has this built in?
     # first, check that some direction was given, either an index or a match to find
     if (index is None and (matchDict is None and noMatchDict is None)) or (index is not None and (matchDict is not None or noMatchDict is not None)):
       self.raiseAnError(TypeError,'Either "index" OR ("matchDict" and/or "noMatchDict") (not both) must be specified to use "realization!"')
@@ -616,21 +607,26 @@ class DataSet(DataObject):
     # END select by index
     # START collect by matching realization
     else: # matchDict must not be None
+      # if nothing in data OR collector, we can't have a match
+      if numInData + numInCollector == 0:
+        return 0, None
+      # narrow down the search using the match index, if possible
+      dataRows, collectorRows = None, None
+      candidates = self._getMatchCandidates(matchDict, noMatchDict, tol)
+      if candidates is not None:
+        split = bisect.bisect_left(candidates, numInData)
+        dataRows = candidates[:split]
+        collectorRows = list(r - numInData for r in candidates[split:])
       # if nothing in data, try collector
       if numInData == 0:
-        # if nothing in data OR collector, we can't have a match
-        if numInCollector == 0:
-          return 0, None
-        # otherwise, get it from the collector
-        else:
-          index, rlz = self._getRealizationFromCollectorByValue(matchDict, noMatchDict, tol=tol, first=first)
+        index, rlz = self._getRealizationFromCollectorByValue(matchDict, noMatchDict, tol=tol, first=first, rows=collectorRows)
       # otherwise, first try to find it in the data
       else:
-        index, rlz = self._getRealizationFromDataByValue(matchDict, noMatchDict, tol=tol, first=first, unpackXArray=unpackXArray)# should we add options=options to this one as well?
+        index, rlz = self._getRealizationFromDataByValue(matchDict, noMatchDict, tol=tol, first=first, unpackXArray=unpackXArray, rows=dataRows)# should we add options=options to this one as well?
         # if no match found in data, try in the collector (if there's anything in it)
         if rlz is None:
           if numInCollector > 0:
-            index, rlz = self._getRealizationFromCollectorByValue(matchDict, noMatchDict, tol=tol, first=first)
+            index, rlz = self._getRealizationFromCollectorByValue(matchDict, noMatchDict, tol=tol, first=first, rows=collectorRows)
       # if as Dataset convert it
       if asDataSet:
         if not isinstance(rlz, xr.Dataset):
@@ -693,6 +689,7 @@ class DataSet(DataObject):
       self._scaleFactors.pop(variable,None)
     #either way reset kdtree
     self.inputKDTree = None
+    self._matchIndexes = {}
 
   def renameVariable(self, old, new):
     """
@@ -728,6 +725,7 @@ class DataSet(DataObject):
       self._scaleFactors[new] = self._scaleFactors.pop(old)
     if self._data is not None:
       self._data = self._data.rename({old:new})
+    self._matchIndexes = {}
 
   def reset(self):
     """
@@ -741,6 +739,7 @@ class DataSet(DataObject):
     self._meta = {}
     self._alignedIndexes = {}
     self._scaleFactors = {}
+    self._matchIndexes = {}
 
   def setData(self, data, meta):
     """
@@ -753,6 +752,7 @@ class DataSet(DataObject):
     self._collector = None
     self._data = data
     self._meta = meta
+    self._matchIndexes = {}
     # if we have meta information, we can reconstruct the IO space for this DO
     if 'DataSet' in meta:
       self._setStructureFromMetaXML(meta['DataSet'])
@@ -814,6 +814,15 @@ class DataSet(DataObject):
       # then the metaxml
       if len(self._meta):
         self._toCSVXML(fname, **kwargs)
+    elif style.lower() == 'hdf5':
+      if len(self) == 0:
+        self.raiseAWarning('Nothing to write to HDF5! Checking metadata ...')
+      else:
+        firstIndex = kwargs.get('firstIndex',0)
+        self._toHDF5(fname, start=firstIndex, **kwargs)
+      # the metadata are stored in the same XML used for the CSV
+      if len(self._meta):
+        self._toCSVXML(fname, **kwargs)
     # TODO dask?
     else:
       self.raiseAnError(NotImplementedError, f'Unrecognized write style: "{style}"')
@@ -831,6 +840,7 @@ class DataSet(DataObject):
     """
     super().flush()
     self.types = None
+    self._matchIndexes = {}
 
   ### BUILTINS AND PROPERTIES ###
   # These are special commands that RAVEN entities can use to interact with the data object
@@ -920,12 +930,14 @@ class DataSet(DataObject):
     assert(mathUtils.isSingleValued(value)) #['float','str','int','unicode','bool'])
     lenColl = len(self._collector) if self._collector is not None else 0
     lenData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    # the stored values change, so the match indexes can't be trusted anymore
+    self._matchIndexes = {}
     # if it's in the data ...
     if index < lenData:
       self._data[var].values[index] = value
     # if it's in the collector ...
     elif index < lenColl + lenData:
-      self._collector[index][self._orderedVars.index(var)] = value
+      self._collector[index - lenData, self._orderedVars.index(var)] = value
     else:
       self.raiseAnError(IndexError, f'Requested value change for realization "{index}", which is past the end of the data object!')
 
@@ -1349,7 +1361,9 @@ class DataSet(DataObject):
           continue
         # gather the data type from first realization: if np.array, it's ND; otherwise singular
         dtype = self.types[v]
-        if isinstance(self._collector[0,v], np.ndarray):
+        # typed storage of the variable, one entry (or one row, for aligned histories) per realization
+        column = self._collector.getColumn(v)
+        if column.ndim == 2 or isinstance(column[0], np.ndarray):
           # for each index, determine if all aligned; make data arrays as required
           dims = self.getDimensions(var)[var]
           # make sure "dims" isn't polluted
@@ -1357,11 +1371,14 @@ class DataSet(DataObject):
           # loop over indexes (just one for now?) and create data
           # SPECIAL CASE: if only histories/scalars, and histories are aligned, we can shortcut this
           if len(dims) == 1 and dims[0] in self._alignedIndexes:
-            # since aligned, grab the data into one large chunk and make a datarray with all rlzs
-            data = np.vstack(self._collector[:,v]).astype(dtype)
+            # since aligned, the collector column already is one large chunk (unless the history lengths changed),
+            # so make a datarray with all rlzs directly on top of it
+            data = column if column.ndim == 2 else np.vstack(column)
+            data = data.astype(dtype, copy=False)
             coords = {dims[0]: self._alignedIndexes[dims[0]]}
             arrays[var] = self.constructNDSample(data, dims=[self.sampleTag]+dims, coords=coords)
           else:
+            samples = np.empty(len(self._collector), dtype=object)
             for r in range(len(self._collector)):
               values = self._collector[r, v]
               dtype = self._getCompatibleType(values[0])
@@ -1372,22 +1389,26 @@ class DataSet(DataObject):
                 if val is None:
                   val = self._collector[r, self._orderedVars.index(idx)]
                 coords[idx] = val
-              self._collector[r][v] = self.constructNDSample(values, dims, coords, name=str(r))
+              samples[r] = self.constructNDSample(values, dims, coords, name=str(r))
             # then collapse these entries into a single datarray
-            arrays[var] = self._collapseNDtoDataArray(self._collector[:,v], var, dtype=dtype)
+            arrays[var] = self._collapseNDtoDataArray(samples, var, dtype=dtype)
         # if it's a dataarray, then that's old-style histories, no-can do right now
-        elif isinstance(self._collector[0,v], xr.DataArray):
+        elif isinstance(column[0], xr.DataArray):
           self.raiseAnError(NotImplementedError, 'History entries should be numpy arrays, not data arrays!')
         # if not ND, then it's a simple data array construction
         else:
           try:
-            varData = np.array(self._collector[:,v], dtype=dtype)
+            if column.dtype == np.dtype(dtype):
+              # typed column: no conversion needed
+              varData = column
+            else:
+              varData = np.array(column.astype(object), dtype=dtype)
           except ValueError as e:
             # infinte/missing data can't be cast to anything but floats or objects, as far as I can tell
-            if dtype != float and pd.isnull(self._collector[:,v]).sum() != 0:
+            if dtype != float and pd.isnull(column).sum() != 0:
               self.raiseAWarning(f'NaN detected, but no safe casting NaN to "{dtype}" so switching to "object" type. ' \
                   + ' This may cause problems with other entities in RAVEN.')
-              varData = self._collector[:,v][:]
+              varData = column.astype(object)
               dtype = object
             # otherwise, let error be raised.
             else:
@@ -1413,6 +1434,37 @@ class DataSet(DataObject):
 
     return self._data
 
+  def _dataRowMatches(self, row, match, noMatch, tol):
+    """
+      Checks if a single realization of the data storage matches the provided matching (and antimatching)
+      dictionaries, with the same criteria used by _getRealizationFromDataByValue on the full data.
+      Only valid for scalar variables.
+      @ In, row, int, position of the realization in the data
+      @ In, match, dict, elements to match
+      @ In, noMatch, dict, elements to AVOID matching (should not match within tolerance)
+      @ In, tol, float, tolerance to which match should be made
+      @ Out, matches, bool, True if the realization matches
+    """
+    for var, val in match.items():
+      value = self._data[var].values[row]
+      # float instances are relative, others are absolute
+      if mathUtils.isAFloatOrInt(val):
+        loc, scale = self._getScalingFactors(var)
+        if not abs((value-loc)/scale - (val-loc)/scale) < tol:
+          return False
+      elif not value == val:
+        return False
+    for var, vals in noMatch.items():
+      value = self._data[var].values[row]
+      vals = np.atleast_1d(vals)
+      if mathUtils.isAFloatOrInt(vals[0]):
+        loc, scale = self._getScalingFactors(var)
+        if any(abs((value-loc)/scale - (val-loc)/scale) < tol for val in vals):
+          return False
+      elif any(value == val for val in vals):
+        return False
+    return True
+
   def _formatRealization(self, rlz):
     """
       Formats realization without truncating data
@@ -1499,6 +1551,15 @@ class DataSet(DataObject):
         arrays[var] = self._collapseNDtoDataArray(data, var, labels=samples, dtype=dtype)
     self._convertArrayListToDataset(arrays, action='extend')
 
+  def _fromHDF5(self, fileName, **kwargs):
+    """
+      Loads a dataset from the single-file HDF5 history store; only histories can be stored this way.
+      @ In, fileName, str, filename to load from
+      @ In, kwargs, dict, optional arguments
+      @ Out, None
+    """
+    self.raiseAnError(IOError, f'HDF5 history store only supports HistorySet, but "{self.name}" is a {self.type}!')
+
   def _fromCSVXML(self, fileName):
     """
       Loads in the XML portion of a CSV if it exists.  Returns information found.
@@ -1584,7 +1645,7 @@ class DataSet(DataObject):
         # we can set it at once, the fast way.
         data[:,v] = source[var]
     # set up collector as cached nd array of values -> TODO might be some wasteful copying here
-    self._collector = cached_ndarray.cNDarray(values=data, dtype=object)
+    self._collector = cached_ndarray.cColumnarArray(values=data)
     # set datatypes for each variable
     rlz = self.realization(index=0)
     self._setDataTypes(rlz)
@@ -1628,6 +1689,7 @@ class DataSet(DataObject):
                 self.name.strip(),'":',",".join(requiredDims))
     self._orderedVars = self.vars
     self._data = datasetSub
+    self._matchIndexes = {}
     for key, val in self._data.attrs.items():
       self._meta[key] = val
 
@@ -1656,6 +1718,73 @@ class DataSet(DataObject):
 
     return _type
 
+  def _getMatchCandidates(self, toMatch, noMatch, tol):
+    """
+      Uses (and builds, if needed) the match index on the variables of "toMatch" to find the realizations
+      that could match the request. The candidates still need to be checked exactly, since the index
+      only guarantees that no match is left out.
+      @ In, toMatch, dict, elements to match
+      @ In, noMatch, dict, elements to AVOID matching
+      @ In, tol, float, tolerance to which match should be made
+      @ Out, candidates, list(int) or None, sorted indices (data first, then collector) of the realizations
+                                             that could match, or None if the index can't be used for this request
+    """
+    # the index only stores scalar variables, and is only useful for narrow (relative) tolerances
+    if not toMatch or not tol < 1:
+      return None
+    if noMatch is None:
+      noMatch = {}
+    ndVars = set(self.indexes).union(*self._pivotParams.values())
+    for var in itertools.chain(toMatch, noMatch):
+      if var not in self._orderedVars or var in ndVars:
+        return None
+    if not all(mathUtils.isSingleValued(val, zeroDOk=False) for val in toMatch.values()):
+      return None
+    names = tuple(sorted(toMatch))
+    size = len(self)
+    index = self._matchIndexes.get(names, None)
+    try:
+      # if rows were removed, start over
+      if index is not None and len(index) > size:
+        index = None
+      if index is None:
+        index = cached_ndarray.cMatchIndex(names, list(self._getMatchColumn(var, 0) for var in names))
+        self._matchIndexes[names] = index
+      # catch up with realizations that were not added through addRealization (e.g. loaded from file)
+      elif len(index) < size:
+        index.extend(list(self._getMatchColumn(var, len(index)) for var in names))
+    except TypeError:
+      # unhashable or non-numeric values, can't be indexed
+      self._matchIndexes.pop(names, None)
+      return None
+    values = list(toMatch[var] for var in names)
+    deltas = []
+    for var, val in zip(names, values):
+      if mathUtils.isAFloatOrInt(val):
+        # largest distance still matching, for both the relative (collector) and scaled (data) checks
+        _, scale = self._getScalingFactors(var)
+        deltas.append(max(tol * abs(val) / (1.0 - tol), tol * abs(scale)))
+      else:
+        deltas.append(0.0)
+    return index.lookup(values, deltas)
+
+  def _getMatchColumn(self, var, start):
+    """
+      Collects the values of a scalar variable, starting from the given realization, across the data and
+      collector storage.
+      @ In, var, str, name of the variable
+      @ In, start, int, index of the first realization to include
+      @ Out, values, list, values of "var", one per realization
+    """
+    values = []
+    numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    if start < numInData:
+      values.extend(self._data[var].values[start:].tolist())
+    if self._collector is not None and len(self._collector):
+      column = self._collector[:, self._orderedVars.index(var)]
+      values.extend(column[max(start - numInData, 0):].tolist())
+    return values
+
   def _getRealizationFromCollectorByIndex(self, index):
     """
       Obtains a realization from the collector storage using the provided index.
@@ -1671,7 +1800,7 @@ class DataSet(DataObject):
 
     return rlz
 
-  def _getRealizationFromCollectorByValue(self, toMatch, noMatch, tol=1e-15, first=True):
+  def _getRealizationFromCollectorByValue(self, toMatch, noMatch, tol=1e-15, first=True, rows=None):
     """
       Obtains a realization from the collector storage matching the provided index
       @ In, toMatch, dict, elements to match
@@ -1679,6 +1808,7 @@ class DataSet(DataObject):
       @ In, tol, float, optional, tolerance to which match should be made
       @ In, first, bool, optional, return the first matching realization only?
                                    If False, it returns a list of all mathing realizations Default:True
+      @ In, rows, list(int), optional, sorted collector rows that can match (see _getMatchCandidates); all if None
       @ Out, (r, rlz) or (rr, rlzs), tuple ( (int, dict) or (list(int),list(dict)) ), where:
                                      first element:
                                        if first:  r, int, index where match was found OR size of data if not found
@@ -1692,8 +1822,6 @@ class DataSet(DataObject):
 
     assert(self._collector is not None)
 
-    # TODO KD Tree for faster values -> still want in collector?
-    # TODO slow double loop
     matchVars, matchVals = zip(*toMatch.items()) if toMatch else ([], [])
     avoidVars, avoidVals = zip(*noMatch.items()) if noMatch else ([], [])
     try:
@@ -1706,7 +1834,10 @@ class DataSet(DataObject):
                         "Check <Input>/<Output> sections." )
     if not first:
       rr, rlz = [], []
-    for r, _ in enumerate(self._collector[:]): #TODO: CAN WE MAKE R START FROM LAST MATCHINDEXES ?
+    if rows is None:
+      rows = range(len(self._collector))
+    match = False
+    for r in rows:
       match = True
       # find matches first
       if toMatch:
@@ -1739,11 +1870,10 @@ class DataSet(DataObject):
         else:
           rr.append(r)
           rlz.append(self._getRealizationFromCollectorByIndex(r))
-    if match:
-      if first:
-        return r, self._getRealizationFromCollectorByIndex(r)
-      else:
-        return rr, rlz
+    if first and match:
+      return r, self._getRealizationFromCollectorByIndex(r)
+    elif not first and rr:
+      return rr, rlz
     else:
       return len(self), None
 
@@ -1760,7 +1890,7 @@ class DataSet(DataObject):
     return rlz
 
   # @profile
-  def _getRealizationFromDataByValue(self, match, noMatch, tol=1e-15, unpackXArray=False, first=True):
+  def _getRealizationFromDataByValue(self, match, noMatch, tol=1e-15, unpackXArray=False, first=True, rows=None):
     """
       Obtains a realization from the data storage using the provided matching (or antimatching) dictionaries.
       For "match", valid entries must be within tol of the provided value for each variable
@@ -1773,6 +1903,7 @@ class DataSet(DataObject):
                           This can be used only if "first" ==> True. Otherwise we return a Dataset directly
       @ In, first, bool, optional, return the first matching realization only?
                                    If False, it returns a list of all mathing realizations Default:True
+      @ In, rows, list(int), optional, sorted data rows that can match (see _getMatchCandidates); all if None
       @ Out, (rr, rlz), tuple ( (int, dict) or (list(int), Dataset) ), where:
                                      first element:
                                        if first:  rr, int, index where match was found OR size of data if not found
@@ -1792,7 +1923,19 @@ class DataSet(DataObject):
     matchVars = list(match.keys())
     avoidVars = list(noMatch.keys())
     # TODO what if a variable is in both??
-    # TODO this could be slow, should do KD tree instead
+    # if the candidates are known, only check those
+    if rows is not None:
+      labels = self._data[self.sampleTag].values
+      found = list(r for r in rows if self._dataRowMatches(r, match, noMatch, tol))
+      if not found:
+        return len(self), None
+      if first:
+        rr = labels[found[0]].item()
+        return rr, self._getRealizationFromDataByIndex(rr, unpackXArray)
+      mask = np.zeros(len(labels), dtype=bool)
+      mask[found] = True
+      mask = xr.DataArray(mask, dims=[self.sampleTag], coords={self.sampleTag: labels})
+      return labels[found].tolist(), self._data.where(mask, drop=True)
     mask = 1.0
     for var in matchVars: #, val in match.items():
       val = match[var]
@@ -1944,17 +2087,15 @@ class DataSet(DataObject):
 
     return dims
 
-  def _newCollector(self, width=1, length=100, dtype=None):
+  def _newCollector(self, width=1, length=100):
     """
       Creates a new collector object and returns it.
+      The collector is column-oriented: each variable is stored in its own typed buffer.
       @ In, width, int, optional, width of collector
       @ In, length, int, optional, initial length of (allocated) collector
-      @ In, dtype, type, optional, type of entires (float if all float, usually should be object)
+      @ Out, collector, cached_ndarray.cColumnarArray, the new collector
     """
-    if dtype is None:
-      dtype = self.defaultDtype # set in subclasses if different
-
-    return cached_ndarray.cNDarray(width=width, length=length, dtype=dtype)
+    return cached_ndarray.cColumnarArray(width=width, length=length)
 
   def _readPandasCSV(self, fname, nullOK=None):
     """
@@ -2110,6 +2251,16 @@ class DataSet(DataObject):
     ordered += list(m for m in self._metavars if m in keep)
     self._usePandasWriteCSV(filenameLocal, data, ordered, keepSampleTag=self.sampleTag in keep, mode=mode)
 
+  def _toHDF5(self, fileName, start=0, **kwargs):
+    """
+      Writes this data object to the single-file HDF5 history store; only histories can be stored this way.
+      @ In, fileName, str, path/name to write file
+      @ In, start, int, optional, first realization to start printing from (if > 0, implies append mode)
+      @ In, kwargs, dict, optional, keywords for options
+      @ Out, None
+    """
+    self.raiseAnError(IOError, f'HDF5 history store only supports HistorySet, but "{self.name}" is a {self.type}!')
+
   def _toCSVCluster(self, fileName, start, clusterLabel, **kwargs):
     """
       Writes this data object as a chain of CSVs, grouped by the cluster
@@ -2186,6 +2337,22 @@ class DataSet(DataObject):
         ofile.writelines(f'  {xml}\n')
       ofile.writelines('</DataObjectMetadata>\n')
 
+  def _updateMatchIndexes(self, rlz):
+    """
+      Adds the newest realization to the existing match indexes.
+      @ In, rlz, dict, realization as {var:value}, formatted as stored in the collector
+      @ Out, None
+    """
+    size = len(self)
+    for names, index in list(self._matchIndexes.items()):
+      # indexes that are behind will catch up when next used
+      if len(index) != size - 1:
+        continue
+      try:
+        index.append(list(rlz[var] for var in names))
+      except TypeError:
+        del self._matchIndexes[names]
+
   def _usePandasWriteCSV(self, fileName, data, ordered, keepSampleTag=False, keepIndex=False, mode='w'):
     """
       Uses Pandas to write a CSV.
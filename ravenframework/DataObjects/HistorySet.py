@@ -29,6 +29,7 @@ import abc
 import numpy as np
 import pandas as pd
 import xarray as xr
+import h5py
 
 from ..BaseClasses import BaseType
 from ..utils import utils, cached_ndarray, InputData, xmlUtils, mathUtils
@@ -39,6 +40,11 @@ except ValueError: #attempted relative import in non-package
 
 # name of the column containing history file names
 subFileName = "filename"
+# HDF5 history store: groups of the per-history (scalar) and per-step (concatenated histories) variables,
+# and dataset of the history offsets (history i spans steps offsets[i]:offsets[i+1])
+h5InputGroup = "inputs"
+h5HistoryGroup = "histories"
+h5Offsets = "offsets"
 
 # for profiling with kernprof
 try:
@@ -173,6 +179,44 @@ class HistorySet(DataSet):
     # construct final data object
     self.load(data,style='dict',dims=self.getDimensions())
 
+  def _fromHDF5(self, fileName, **kwargs):
+    """
+      Loads a dataset from the single-file HDF5 history store (see _toHDF5).
+      The file is only read, so several processes can load it at the same time.
+      @ In, fileName, str, filename to load from (with or without the .h5/.hdf5 extension)
+      @ In, kwargs, dict, optional arguments
+      @ Out, None
+    """
+    base, ext = os.path.splitext(fileName)
+    if ext.lower() in ['.h5', '.hdf5']:
+      h5File, fileName = fileName, base
+    else:
+      h5File = fileName+'.h5'
+    # load in metadata, if any
+    if os.path.isfile(fileName+'.xml'):
+      self._loadCsvMeta(fileName)
+    data = {}
+    with h5py.File(h5File, 'r') as h5:
+      inputs, histories = h5[h5InputGroup], h5[h5HistoryGroup]
+      provided = set(inputs.keys()).union(histories.keys())
+      missing = set(self._orderedVars) - provided
+      if len(missing) > 0:
+        self.raiseAnError(IOError, f'Not all variables requested for data object "{self.name}" were found in "{h5File}"!' +
+                          f'\nNeeded: {set(self._orderedVars)}; \nProvided: {provided}; \nMissing: {missing}')
+      if len(set(self.indexes) - set(histories.keys())):
+        self.raiseAnError(IOError,'Importing HistorySet from .h5: the pivot parameters "'+', '.join(self.indexes)+'" have not been found in the file. Check that the '
+                                  'correct <pivotParameter> has been specified in the dataObject')
+      offsets = h5[h5Offsets][()]
+      nSamples = len(offsets) - 1
+      for inp in self._inputs + self._inputMetaVars:
+        data[inp] = self._readH5Column(inputs[inp])
+      for out in self._outputs + self.indexes + self._outputMetaVars:
+        data[out] = np.empty(nSamples, dtype=object)
+        for i, history in enumerate(np.split(self._readH5Column(histories[out]), offsets[1:-1])):
+          data[out][i] = history
+    # construct final data object
+    self.load(data,style='dict',dims=self.getDimensions())
+
   def _identifyVariablesInCSV(self,fileName):
     """
       Gets the list of available variables from the file "fileName.csv".
@@ -325,6 +369,138 @@ class HistorySet(DataSet):
     else:
       self.raiseAWarning('No output space variables have been requested for DataObject "{}"! No history files will be printed!'.format(self.name))
 
+  def _toHDF5(self, fileName, start=0, **kwargs):
+    """
+      Writes this data object to a single HDF5 file (for metadata see _toCSVXML), instead of one CSV per history.
+      The scalar (input) variables are stored with one entry per history, while the values of the
+      output variables (and pivot) of all the histories are concatenated in chunked datasets, delimited by
+      the "offsets" dataset. If start > 0, the new histories are appended to the existing file.
+      The file is written serially by this process (parallel writes would need an MPI-enabled h5py).
+      @ In, fileName, str, path/name to write file (without extension)
+      @ In, start, int, optional, starting realization to write
+      @ In, kwargs, dict, optional, keywords for options
+      @ Out, None
+    """
+    keep = self._getRequestedElements(kwargs)
+    toDrop = list(var for var in self._orderedVars if var not in keep)
+    pivot = self.indexes[0]
+    # as for the CSV, hierarchical data objects are always re-written, since the ending histories can change
+    startIndex = 0 if 'RAVEN_isEnding' in self.getVars() else start
+    fullData = None
+    if not self.hierarchical and 'RAVEN_isEnding' in self.getVars():
+      # the histories are reconstructed (see _constructHierPaths)
+      fullData = self._constructHierPaths()
+      data = self._data.where(self._data['RAVEN_isEnding']==True,drop=True)
+    else:
+      data = self._data
+      if startIndex > 0:
+        data = self._data.isel(**{self.sampleTag:slice(startIndex,None,None)})
+    data = data.drop(toDrop)
+    inputs = list(i for i in itertools.chain(self._inputs,self._inputMetaVars) if i in keep)
+    outputs = list(o for o in itertools.chain(self._outputs,self._outputMetaVars) if o in keep)
+    if not len(outputs):
+      self.raiseAWarning('No output space variables have been requested for DataObject "{}"! Only the input space will be stored!'.format(self.name))
+    # values of the pivot-dependent variables, concatenated history after history
+    stepVars = [var for var in data.data_vars if pivot in data[var].dims]
+    if fullData is None:
+      # steps that are not NaN for any variable, as in "dropna"
+      valid = np.ones((len(data[self.sampleTag]), len(data[pivot])), dtype=bool)
+      for var in stepVars:
+        valid &= ~pd.isnull(data[var].transpose(self.sampleTag, pivot).values)
+      lengths = valid.sum(axis=1)
+      steps = {pivot: np.broadcast_to(data[pivot].values, valid.shape)[valid]}
+      for var in outputs:
+        steps[var] = data[var].transpose(self.sampleTag, pivot).values[valid]
+    else:
+      lengths = np.zeros(len(fullData), dtype=int)
+      pieces = dict((var, []) for var in [pivot] + outputs)
+      for i, history in enumerate(fullData):
+        for subSampleTag in range(len(history[self.sampleTag].values)):
+          rlz = history.isel(**{self.sampleTag:subSampleTag}).dropna(pivot)
+          lengths[i] += len(rlz[pivot])
+          for var in pieces:
+            pieces[var].append(rlz[var].values)
+      steps = dict((var, np.concatenate(values)) for var, values in pieces.items())
+    self.raiseADebug('Writing data to HDF5: "{}"'.format(fileName+'.h5'))
+    mode = 'a' if startIndex > 0 and os.path.isfile(fileName+'.h5') else 'w'
+    with h5py.File(fileName+'.h5', mode) as h5:
+      if mode == 'w':
+        h5.attrs['pivotParameter'] = pivot
+        h5.attrs['sampleTag'] = self.sampleTag
+        h5.create_group(h5InputGroup)
+        h5.create_group(h5HistoryGroup)
+        h5.create_dataset(h5Offsets, data=np.zeros(1, dtype=np.int64), maxshape=(None,), chunks=True)
+      offsets = h5[h5Offsets]
+      nWritten = len(offsets)
+      # entries already stored for each (input) history and for each (history) step
+      stored = {h5InputGroup: nWritten - 1, h5HistoryGroup: int(offsets[nWritten-1])}
+      offsets.resize((nWritten + len(lengths),))
+      offsets[nWritten:] = offsets[nWritten-1] + np.cumsum(lengths)
+      columns = {h5InputGroup: dict((var, data[var].values) for var in [self.sampleTag] + inputs),
+                 h5HistoryGroup: steps}
+      for groupName, groupColumns in columns.items():
+        group = h5[groupName]
+        # variables stored by the previous writes but missing from these histories
+        for var in set(group.keys()) - set(groupColumns.keys()):
+          groupColumns[var] = self._h5Fill(var, group[var].dtype, len(groupColumns[next(iter(groupColumns))]))
+        for var, values in groupColumns.items():
+          self._appendH5Column(group, var, values, stored[groupName])
+
+  def _h5Fill(self, name, dtype, size):
+    """
+      Builds the values that fill a column of the HDF5 history store for histories where the variable is not available
+      @ In, name, str, the name of the dataset (variable)
+      @ In, dtype, np.dtype, the type of the dataset
+      @ In, size, int, the number of entries to fill
+      @ Out, fill, np.ndarray, the fill values (NaN or empty strings)
+    """
+    if h5py.check_string_dtype(dtype) is not None:
+      return np.full(size, '', dtype=object)
+    if dtype.kind != 'f':
+      self.raiseAnError(IOError, f'Variable "{name}" of the HDF5 history store of "{self.name}" is not available for all the histories, '+
+                        f'but its type ({dtype}) has no missing value!')
+    return np.full(size, np.nan, dtype=dtype)
+
+  def _appendH5Column(self, group, name, values, stored):
+    """
+      Appends values to a (resizable, chunked) 1D dataset of the HDF5 history store, creating it if needed.
+      A dataset created after some histories have been stored is back-filled, so that it stays aligned with the others.
+      @ In, group, h5py.Group, the group of the dataset
+      @ In, name, str, the name of the dataset (variable)
+      @ In, values, np.ndarray, the values to append
+      @ In, stored, int, the number of entries already stored in the group for each dataset
+      @ Out, None
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'OSU':
+      values = values.astype(str).astype(object)
+      dtype = h5py.string_dtype()
+    else:
+      dtype = values.dtype
+    if name not in group:
+      if stored > 0:
+        if dtype.kind in 'iub':
+          # the missing values of the previous histories need a NaN
+          dtype = np.dtype(float)
+        values = np.concatenate((self._h5Fill(name, dtype, stored), values.astype(dtype)))
+      group.create_dataset(name, data=values, dtype=dtype, maxshape=(None,), chunks=True)
+    else:
+      dataset = group[name]
+      size = len(dataset)
+      dataset.resize((size + len(values),))
+      dataset[size:] = values
+
+  @staticmethod
+  def _readH5Column(dataset):
+    """
+      Reads a 1D dataset of the HDF5 history store
+      @ In, dataset, h5py.Dataset, the dataset
+      @ Out, values, np.ndarray, the values
+    """
+    if h5py.check_string_dtype(dataset.dtype) is not None:
+      return np.asarray(dataset.asstr()[()], dtype=object)
+    return dataset[()]
+
   def addExpectedMeta(self,keys, params={}, overwrite=False):
     """
       Registers meta to look for in realizations.
@@ -226,7 +226,8 @@ class HDF5(DataBase):
     allRealizationNames = self.database.retrieveAllHistoryNames()
     # instead to use a OrderedDict in the database, I sort the names here (it is much faster)
     allRealizationNames.sort()
-    allData = [self.realization(name) for name in allRealizationNames]
+    # the realizations are retrieved at once (each variable is read from the file a single time)
+    allData = self.database._getRealizationsByName(allRealizationNames)
 
     return allData
 
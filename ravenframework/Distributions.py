@@ -400,8 +400,8 @@ class BoostDistribution(Distribution):
   def cdf(self,x):
     """
       Function to get the cdf at a provided coordinate
-      @ In, x, float, value to get the cdf at
-      @ Out, retunrCdf, float, requested cdf
+      @ In, x, float or np.ndarray, value(s) to get the cdf at
+      @ Out, retunrCdf, float or np.ndarray, requested cdf (same shape as x)
     """
     returnCdf = self._distribution.cdf(x)
     return returnCdf
@@ -409,8 +409,8 @@ class BoostDistribution(Distribution):
   def ppf(self,x):
     """
       Function to get the inverse cdf at a provided coordinate
-      @ In, x, float, value to get the inverse cdf at
-      @ Out, retunrPpf, float, requested inverse cdf
+      @ In, x, float or np.ndarray, value(s) to get the inverse cdf at
+      @ Out, retunrPpf, float or np.ndarray, requested inverse cdf (same shape as x)
     """
     returnPpf = self._distribution.inverseCdf(x)
     return returnPpf
@@ -418,8 +418,8 @@ class BoostDistribution(Distribution):
   def pdf(self,x):
     """
       Function to get the pdf at a provided coordinate
-      @ In, x, float, value to get the pdf at
-      @ Out, returnPdf, float, requested pdf
+      @ In, x, float or np.ndarray, value(s) to get the pdf at
+      @ Out, returnPdf, float or np.ndarray, requested pdf (same shape as x)
     """
     returnPdf = self._distribution.pdf(x)
     return returnPdf
@@ -427,8 +427,8 @@ class BoostDistribution(Distribution):
   def logPdf(self,x):
     """
       Function to get the log pdf at a provided coordinate
-      @ In, x, float, value to get the pdf at
-      @ Out, logPdf, float, requested log pdf
+      @ In, x, float or np.ndarray, value(s) to get the pdf at
+      @ Out, logPdf, float or np.ndarray, requested log pdf (same shape as x)
     """
     logPdf = np.log(self.pdf(x))
     return logPdf
@@ -482,17 +482,18 @@ class BoostDistribution(Distribution):
     untrMode = self._distribution.untrMode()
     return untrMode
 
-  def rvs(self, size=None):
+  def rvs(self, size=None, engine=None):
     """
       Function to get random numbers
       @ In, size, int, optional, number of entries to return (one if None)
-      @ Out, rvsValue, float or list, requested random number or numbers
+      @ In, engine, instance, optional, random number generator (the global one if None)
+      @ Out, rvsValue, float or np.ndarray, requested random number or numbers
     """
     if size is None:
-      rvsValue = self.ppf(random())
+      rvsValue = self.ppf(random(engine=engine))
     else:
-      # TODO to speed up, do this on the C side instead of in python
-      rvsValue = np.array([self.rvs() for _ in range(size)])
+      # same random numbers as "size" calls to rvs(), inverted all at once
+      rvsValue = self.ppf(random(1, size, keepMatrix=True, engine=engine)[:, 0])
     return rvsValue
 
   def selectedRvs(self, discardedElems):
@@ -1794,13 +1795,13 @@ class Categorical(Distribution):
         if cumulative >= x:
           return float(element[0]) if self.isFloat else element[0]
 
-  def rvs(self):
+  def rvs(self, engine=None):
     """
       Return a random state of the categorical distribution
-      @ In, None
+      @ In, engine, instance, optional, random number generator (the global one if None)
       @ Out, rvsValue, float, the random state
     """
-    rvsValue = self.ppf(random())
+    rvsValue = self.ppf(random(engine=engine))
     return rvsValue
 
 DistributionsCollection.addSub(Categorical.getInputSpecification())
@@ -1950,18 +1951,18 @@ class UniformDiscrete(Distribution):
     """
     return self.categoricalDist.ppf(x)
 
-  def rvs(self):
+  def rvs(self, engine=None):
     """
       Return a random state of the distribution
-      @ In, None
+      @ In, engine, instance, optional, random number generator (the global one if None)
       @ Out, rvsValue, float, the random state
     """
     if self.strategy == 'withReplacement':
-      return self.categoricalDist.rvs()
+      return self.categoricalDist.rvs(engine=engine)
     else:
       if self.pot.size == 0:
         # re-initialize the distribution
-        self.reset()
+        self.reset(engine=engine)
         self.raiseAWarning("The Uniform Discrete distribution " + str(self.name) + " has been internally reset outside the sampler.")
       rvsValue = self.pot[-1]
       self.pot = np.resize(self.pot, self.pot.size - 1)
@@ -1992,13 +1993,13 @@ class UniformDiscrete(Distribution):
     rvsValue = self.tempUniformDiscrete.rvs()
     return rvsValue
 
-  def reset(self):
+  def reset(self, engine=None):
     """
       Reset the distribution
-      @ In, None
+      @ In, engine, instance, optional, random number generator (the global one if None)
       @ Out, None
     """
-    newPerm = randomUtils.randomPermutation(self.xArray.tolist(),self)
+    newPerm = randomUtils.randomPermutation(self.xArray.tolist(),self,engine=engine)
     self.pot = np.asarray(newPerm)
 
 DistributionsCollection.addSub(UniformDiscrete.getInputSpecification())
@@ -2895,13 +2896,13 @@ class Custom1D(Distribution):
     ppfValue = self.invCDF(x)
     return ppfValue
 
-  def rvs(self):
+  def rvs(self, engine=None):
     """
       Return a random state of the custom1D distribution
-      @ In, None
+      @ In, engine, instance, optional, random number generator (the global one if None)
       @ Out, rvsValue, float/string, the random state
     """
-    rvsValue = self.ppf(random())
+    rvsValue = self.ppf(random(engine=engine))
     return rvsValue
 
 DistributionsCollection.addSub(Custom1D.getInputSpecification())
@@ -3012,13 +3013,13 @@ class LogUniform(Distribution):
       ppfValue = 10.**((self.upperBound-self.lowerBound)*x + self.lowerBound)
     return ppfValue
 
-  def rvs(self):
+  def rvs(self, engine=None):
     """
       Return a random value
-      @ In, None
+      @ In, engine, instance, optional, random number generator (the global one if None)
       @ Out, rvsValue, float, the random value
     """
-    rvsValue = self.ppf(random())
+    rvsValue = self.ppf(random(engine=engine))
     return rvsValue
 
 DistributionsCollection.addSub(LogUniform.getInputSpecification())
@@ -3347,13 +3348,14 @@ class NDInverseWeight(NDimensionalDistributions):
     """
     self.raiseAnError(NotImplementedError,'untruncatedMode not yet implemented for ' + self.type)
 
-  def rvs(self,*args):
+  def rvs(self, *args, engine=None):
     """
       Return the random coordinate
       @ In, args, dict, arguments (for future usage)
+      @ In, engine, instance, optional, random number generator (the global one if None)
       @ Out, rvsValue, np.array, the random coordinate
     """
-    rvsValue = self._distribution.inverseCdf(random(),random())
+    rvsValue = self._distribution.inverseCdf(random(engine=engine),random(engine=engine))
     return rvsValue
 
 DistributionsCollection.addSub(NDInverseWeight.getInputSpecification())
@@ -3528,13 +3530,14 @@ class NDCartesianSpline(NDimensionalDistributions):
     """
     self.raiseAnError(NotImplementedError,'untruncatedMode not yet implemented for ' + self.type)
 
-  def rvs(self,*args):
+  def rvs(self, *args, engine=None):
     """
       Return the random coordinate
       @ In, args, dict, arguments (for future usage)
+      @ In, engine, instance, optional, random number generator (the global one if None)
       @ Out, rvsValue, np.array, the random coordinate
     """
-    rvsValue = self._distribution.inverseCdf(random(),random())
+    rvsValue = self._distribution.inverseCdf(random(engine=engine),random(engine=engine))
     return rvsValue
 
 DistributionsCollection.addSub(NDCartesianSpline.getInputSpecification())
@@ -3954,18 +3957,19 @@ class MultivariateNormal(NDimensionalDistributions):
     """
     self.raiseAnError(NotImplementedError,'untruncatedMode not yet implemented for ' + self.type)
 
-  def rvs(self, *args):
+  def rvs(self, *args, engine=None):
     """
       Return the random coordinate
       @ In, args, dict, arguments (for future usage)
+      @ In, engine, instance, optional, random number generator (the global one if None)
       @ Out, rvsValue, np.array, the random coordinate
     """
     if self.method == 'spline':
-      rvsValue = self._distribution.inverseCdf(random(),random())
+      rvsValue = self._distribution.inverseCdf(random(engine=engine),random(engine=engine))
     # if no transformation, then return the coordinate for the original input parameters
     # if there is a transformation, then return the coordinate in the reduced space
     elif self.method == 'pca':
-      rands = np.atleast_1d(scipy.stats.norm.ppf(random(self.rank)))
+      rands = np.atleast_1d(scipy.stats.norm.ppf(random(self.rank, engine=engine)))
       if self.transformation:
         rvsValue = CrowDistribution1D.vectord_cxx(rands)
       else:
@@ -48,7 +48,7 @@ class ContinuousDistribution:
       @ In, x, float or np.ndarray, value to evaluate at
       @ Out, returnPdf, float or np.ndarray, probability density function value
     """
-    x = np.asarray(x)
+    x = np.asarray(x, dtype=float)
     mask = np.logical_and(x >= self._xMin, x <= self._xMax)
     returnPdf = np.zeros_like(x)
     returnPdf[mask] = self.dist.pdf(x[mask]) / (self._cdfXMax - self._cdfXMin)
@@ -62,11 +62,11 @@ class ContinuousDistribution:
     """
       Cumulative distribution function
 
-      @ In, x, float, value to evaluate at
-      @ Out, returnCdf, float, cumulative distribution function value
+      @ In, x, float or np.ndarray, value to evaluate at
+      @ Out, returnCdf, float or np.ndarray, cumulative distribution function value
     """
 
-    x = np.asarray(x)
+    x = np.asarray(x, dtype=float)
     mask = np.logical_and(x > self._xMin, x < self._xMax)
     returnCdf = np.zeros_like(x)
     returnCdf[x <= self._xMin] = 0
@@ -82,10 +82,10 @@ class ContinuousDistribution:
     """
       Inverse cumulative distribution function
 
-      @ In, x, float, quantile value to evaluate at
-      @ Out, returnInvCdf, float, inverse cumulative distribution function value
+      @ In, x, float or np.ndarray, quantile value to evaluate at
+      @ Out, returnInvCdf, float or np.ndarray, inverse cumulative distribution function value
     """
-    x = np.asarray(x)
+    x = np.asarray(x, dtype=float)
     mask = np.logical_and(x > 0, x < 1)
     returnInvCdf = np.zeros_like(x)
     returnInvCdf[mask] = self.dist.ppf(x[mask] * (self._cdfXMax - self._cdfXMin) + self._cdfXMin)
@@ -232,10 +232,10 @@ class LogNormal:
     """
       Probability density function (PDF)
 
-      @ In, x, float, value to evaluate at
-      @ Out, returnPdf, float, PDF value
+      @ In, x, float or np.ndarray, value to evaluate at
+      @ Out, returnPdf, float or np.ndarray, PDF value
     """
-    x = np.asarray(x)
+    x = np.asarray(x, dtype=float)
     returnPdf = np.zeros_like(x)
     # masking helps to not take logs of values less than or equal to zero
     xMask = x > self.low
@@ -246,10 +246,10 @@ class LogNormal:
     """
       Cumulative distribution function (CDF)
 
-      @ In, x, float, value to evaluate at
-      @ Out, returnCdf, float, CDF value
+      @ In, x, float or np.ndarray, value to evaluate at
+      @ Out, returnCdf, float or np.ndarray, CDF value
     """
-    x = np.asarray(x)
+    x = np.asarray(x, dtype=float)
     returnCdf = np.zeros_like(x)
     # masking helps to not take logs of values less than or equal to zero
     xMask = x > self.low
@@ -547,8 +547,8 @@ class DiscreteDistribution:
     """
       Probability mass function. Mapped to pdf for consistency with ContinuousDistribution.
 
-      @ In, x, float, point at which to evaluate the pmf
-      @ Out, pmf, float, probability density function at x
+      @ In, x, float or np.ndarray, point at which to evaluate the pmf
+      @ Out, pmf, float or np.ndarray, probability density function at x
     """
     return self.dist.pmf(x)
 
@@ -556,8 +556,8 @@ class DiscreteDistribution:
     """
       Cumulative distribution function.
 
-      @ In, x, float, point at which to evaluate the cdf
-      @ Out, cdf, float, cumulative distribution function at x
+      @ In, x, float or np.ndarray, point at which to evaluate the cdf
+      @ Out, cdf, float or np.ndarray, cumulative distribution function at x
     """
     return self.dist.cdf(x)
 
@@ -565,8 +565,8 @@ class DiscreteDistribution:
     """
       Inverse cumulative distribution function.
 
-      @ In, x, float, point at which to evaluate the inverse cdf
-      @ Out, inverseCdf, float, inverse cumulative distribution function at x
+      @ In, x, float or np.ndarray, point at which to evaluate the inverse cdf
+      @ Out, inverseCdf, float or np.ndarray, inverse cumulative distribution function at x
     """
     return self.dist.ppf(x)
 
@@ -684,8 +684,8 @@ class BasicBinomialDistribution(DiscreteDistribution):
       Inverse cumulative distribution function. The scipy implementation of this function does not match the behavior
       of the boost implementation, so we implement it manually here.
 
-      @ In, x, float, point at which to evaluate the inverse cdf
-      @ Out, inverseCdf, float, inverse cumulative distribution function at x
+      @ In, x, float or np.ndarray, point at which to evaluate the inverse cdf
+      @ Out, inverseCdf, float or np.ndarray, inverse cumulative distribution function at x
     """
     # Solve numerically using the complement of the incomplete beta function
     def func(a, y):
@@ -705,12 +705,13 @@ class BasicBinomialDistribution(DiscreteDistribution):
 
     # The root finding problem being solved to get the inverse CDF is not vectorized, so we need to loop over the
     # elements of x if x is an array.
-    if hasattr(x, '__len__'):
+    if np.ndim(x) > 0:
+      x = np.asarray(x, dtype=float)
       # Uses the toms748 algorithm for root finding, as stated in the boost documentation at
       # https://www.boost.org/doc/libs/1_50_0/libs/math/doc/sf_and_dist/html/math_toolkit/dist/dist_ref/dists/binomial_dist.html
-      roots = [scipy.optimize.root_scalar(func, bracket=[0, self.dist.args[0]], args=(xi), method='toms748').root for xi in x]
+      roots = np.array([scipy.optimize.root_scalar(func, bracket=[0, self.dist.args[0]], args=(xi), method='toms748').root for xi in x.ravel()])
       # Round "out": down if less than 0.5, up if greater than 0.5
-      iCdf = np.array([np.floor(root) if root < 0.5 else np.ceil(root) for root in roots])
+      iCdf = np.where(roots < 0.5, np.floor(roots), np.ceil(roots)).reshape(x.shape)
     else:
       root = scipy.optimize.root_scalar(func, bracket=[0, self.dist.args[0]], args=(x), method='toms748').root
       iCdf = np.floor(root) if root < 0.5 else np.ceil(root)
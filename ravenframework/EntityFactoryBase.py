@@ -17,6 +17,8 @@ Created March 15, 2020
 @author: talbpaul
 """
 
+import importlib
+
 from .BaseClasses import MessageUser
 from .BaseClasses import InputDataUser
 from . import PluginManager
@@ -40,6 +42,7 @@ class EntityFactory(MessageUser):
     self.needsRunInfo = needsRunInfo                 # whether entity needs run info
     self.returnInputParameter = returnInputParameter # use xml or inputParams
     self._registeredTypes = {}                       # registered types for this entity
+    self._lazyTypes = {}                             # types registered by module, imported on first request
     self._pluginFactory = PluginManager              # plugin factory, if any; provided by Simulation
 
   def registerType(self, name, obj):
@@ -55,6 +58,18 @@ class EntityFactory(MessageUser):
     #                      f'{self._registeredTypes[name]}, {obj}')
     self._registeredTypes[name] = obj
 
+  def registerLazyType(self, name, module, className=None, package=None):
+    """
+      Registers a class as type of this entity without importing it; the module is only
+      imported when the type is first requested, so heavy dependencies are loaded on demand.
+      @ In, name, str, name by which entity should be known
+      @ In, module, str, module containing the class (e.g. .ScikitLearn.SVM.SVR)
+      @ In, className, str, optional, name of the class in the module, if different from name
+      @ In, package, str, optional, package to resolve relative module names against
+      @ Out, None
+    """
+    self._lazyTypes[name] = (module, className if className is not None else name, package)
+
   def registerAllSubtypes(self, baseType, alias=None):
     """
       Registers all inheritors of the baseType as types by classname for this entity.
@@ -75,6 +90,7 @@ class EntityFactory(MessageUser):
       @ Out, None
     """
     self._registeredTypes.pop(name, None)
+    self._lazyTypes.pop(name, None)
 
   def knownTypes(self):
     """
@@ -82,7 +98,7 @@ class EntityFactory(MessageUser):
       @ Out, __knownTypes, list, list of known types
     """
     # NOTE: plugins might not be listed if they haven't been loaded yet!
-    return self._registeredTypes.keys()
+    return list(self._registeredTypes) + [name for name in self._lazyTypes if name not in self._registeredTypes]
 
   def returnClass(self, Type):
     """
@@ -95,6 +111,9 @@ class EntityFactory(MessageUser):
     try:
       return self._registeredTypes[Type]
     except KeyError:
+      # is this a type whose module has not been imported yet?
+      if Type in self._lazyTypes:
+        return self._importLazyType(Type)
       # is this a request from an unloaded plugin?
       obj = self._checkInUnloadedPlugin(Type)
       if obj is None:
@@ -145,6 +164,17 @@ class EntityFactory(MessageUser):
   #############
   # UTILITIES
 
+  def _importLazyType(self, typeName):
+    """
+      Imports the module of a lazily-registered type and registers its class
+      @ In, typeName, str, name of the entity type (e.g. SVR)
+      @ Out, obj, object, class of the requested type
+    """
+    module, className, package = self._lazyTypes[typeName]
+    obj = getattr(importlib.import_module(module, package=package), className)
+    self.registerType(typeName, obj)
+    return obj
+
   def _checkInUnloadedPlugin(self, typeName):
     """
       Checks if the requested entity is from a plugin (has '.' in type name), and if so loads plugin if it isn't already
@@ -64,7 +64,9 @@ class JobHandler(BaseType):
     self.__isDistributedInitialized = False # Is Ray or Dask Initialized?
     self._server = None         # Variable containing the info about the RAY or DASK parallel server.
                                   # If None, multi-threading is used
-    self.sleepTime = 1e-4         # Sleep time for collecting/inquiring/submitting new jobs
+    self._processPool = None      # Pool of local worker processes (parallelMethod "process")
+    self.sleepTime = 1e-4         # Sleep time for collecting/inquiring/submitting new jobs (only used while polling runners that do not notify their completion)
+    self.maxWaitTime = 0.1        # Maximum time waiting for a job event before checking the queues anyway (safeguard)
     self.completed = False        # Is the execution completed? When True, the JobHandler is shut down
     self.__profileJobs = False    # Determines whether to collect and print job timing summaries at the end of job runs.
     self.maxQueueSize = None      # Prevents the pending queue from growing indefinitely, but also
@@ -94,10 +96,28 @@ class JobHandler(BaseType):
     # something from the main thread can remove them.
     self.__finished = []
 
+    # Map from the id of each runner occupying a running slot to the
+    # (running list, index) of that slot, so that notified runners can be freed
+    # without scanning all the slots
+    self.__slots = {}
+
+    # Running jobs that cannot notify their completion and must be polled
+    self.__polled = set()
+
     # End block of __queueLock protected variables
     ############################################################################
 
     self.__queueLock = threading.RLock()
+    # Runners that notified their completion, waiting to be moved into the finished list.
+    # deque append/popleft are thread-safe, so completion callbacks do not need the lock
+    self.__completedRuns = collections.deque()
+    # Set whenever the polling thread has something to do (job added, job completed, shutdown)
+    self.__loopEvent = threading.Event()
+    # Counts (and notifies) the changes for the clients (job finished, queue availability changed).
+    # Each client thread keeps the count it has seen, so that several clients can wait at once
+    self.__clientActivity = threading.Condition()
+    self.__activityCount = 0
+    self.__seenActivity = threading.local()
     # List of submitted job identifiers, includes jobs that have completed as
     # this list is not cleared until a new step is entered
     self.__submittedJobs = []
@@ -119,6 +139,9 @@ class JobHandler(BaseType):
     """
     state = copy.copy(self.__dict__)
     state.pop('_JobHandler__queueLock')
+    state.pop('_JobHandler__loopEvent')
+    state.pop('_JobHandler__clientActivity')
+    state.pop('_JobHandler__seenActivity')
     #XXX we probably need to record how this was init, and store that
     # such as the scheduler file
     if self._parallelLib == ParallelLibEnum.dask and '_server' in state:
@@ -133,6 +156,9 @@ class JobHandler(BaseType):
     """
     self.__dict__.update(d)
     self.__queueLock = threading.RLock()
+    self.__loopEvent = threading.Event()
+    self.__clientActivity = threading.Condition()
+    self.__seenActivity = threading.local()
 
   def applyRunInfo(self, runInfo):
     """
@@ -163,6 +189,8 @@ class JobHandler(BaseType):
     with self.__queueLock:
       self.__running       = [None]*self.runInfoDict['batchSize']
       self.__clientRunning = [None]*self.runInfoDict['batchSize']
+      self.__slots         = {}
+      self.__polled        = set()
     self._parallelLib = ParallelLibEnum.shared
     if self.runInfoDict['parallelMethod'] is not None and self.runInfoDict['parallelMethod'] != ParallelLibEnum.distributed:
       self._parallelLib = self.runInfoDict['parallelMethod']
@@ -218,7 +246,12 @@ class JobHandler(BaseType):
       @ Out, None
     """
     self.raiseADebug("Initializing parallel InternalParallel: {0} Nodes: {1}".format(self.runInfoDict['internalParallel'],len(self.runInfoDict['Nodes'])))
-    if self._parallelLib != ParallelLibEnum.shared:
+    if self._parallelLib == ParallelLibEnum.process:
+      # local worker processes, started once the first job is submitted
+      self._server = None
+      self._processPool = Runners.ProcessPool(int(self.runInfoDict['batchSize']), self.runInfoDict['WorkingDir'])
+      self.raiseADebug("JobHandler initialized with a pool of", self.runInfoDict['batchSize'], "local processes")
+    elif self._parallelLib != ParallelLibEnum.shared:
       # dashboard?
       db = self.runInfoDict['includeDashboard']
       # Check if the list of unique nodes is present and, in case, initialize the
@@ -372,6 +405,8 @@ class JobHandler(BaseType):
           self.raiseAWarning("RAY FAILED TO TERMINATE ON NODE: "+nodeAddress)
       # shutdown ray API (object storage, plasma, etc.)
       ray.shutdown()
+    elif self._parallelLib == ParallelLibEnum.process and self._processPool is not None:
+      self._processPool.shutdown()
     elif self._parallelLib == ParallelLibEnum.dask and self._server is not None and not self.rayInstanciatedOutside:
       self._server.close()
       if self._daskScheduler is not None:
@@ -600,17 +635,58 @@ class JobHandler(BaseType):
 
   def startLoop(self):
     """
-    This function begins the polling loop for the JobHandler where it will
-    constantly fill up its running queue with jobs in its pending queue and
-    unload finished jobs into its finished queue to be extracted by
+    This function begins the event loop for the JobHandler where it will
+    fill up its running queue with jobs in its pending queue and
+    unload finished jobs into its finished queue to be extracted by the clients.
+    The loop sleeps until a job is added or completes; it falls back on
+    polling (every sleepTime) only while runners that cannot notify their completion are running.
     """
     while not self.completed:
+      # clear before working, so that any event raised from now on wakes up the next wait
+      self.__loopEvent.clear()
       self.fillJobQueue()
       self.cleanJobQueue()
-      # TODO May want to revisit this:
-      # http://stackoverflow.com/questions/29082268/python-time-sleep-vs-event-wait
-      # probably when we move to Python 3.
-      time.sleep(self.sleepTime)
+      self.__loopEvent.wait(self.sleepTime if self.__polled else self.maxWaitTime)
+
+  def clearActivity(self):
+    """
+      Marks the client activity as seen by the calling thread. Clients clear it before re-checking the
+      finished queue, so that a job finishing while they process the queue wakes up their next waitForActivity.
+      @ In, None
+      @ Out, None
+    """
+    with self.__clientActivity:
+      self.__seenActivity.count = self.__activityCount
+
+  def waitForActivity(self, timeout=None):
+    """
+      Blocks the calling (client) thread until a job finishes or the queues change
+      (since the last clearActivity), so that clients do not need to poll the JobHandler.
+      @ In, timeout, float, optional, maximum waiting time in seconds (defaults to maxWaitTime)
+      @ Out, activity, bool, True if something happened, False if the timeout expired
+    """
+    seen = getattr(self.__seenActivity, 'count', None)
+    with self.__clientActivity:
+      return self.__clientActivity.wait_for(lambda: self.__activityCount != seen, self.maxWaitTime if timeout is None else timeout)
+
+  def __notifyClients(self):
+    """
+      Wakes up the clients waiting for activity. It can be called from any thread.
+      @ In, None
+      @ Out, None
+    """
+    with self.__clientActivity:
+      self.__activityCount += 1
+      self.__clientActivity.notify_all()
+
+  def __jobCompleted(self, runner):
+    """
+      Completion callback attached to the started runners. It can be called from any thread.
+      @ In, runner, Runner, the runner whose job completed
+      @ Out, None
+    """
+    self.__completedRuns.append(runner)
+    self.__loopEvent.set()
 
   def addJob(self, args, functionToRun, identifier, metadata=None, forceUseThreads = False, uniqueHandler="any", clientQueue = False, groupInfo = None):
     """
@@ -642,7 +718,16 @@ class JobHandler(BaseType):
     """
     assert "original_function" in dir(functionToRun), "to parallelize a function, it must be" \
            " decorated with RAVEN Parallel decorator"
-    if self._server is None or forceUseThreads:
+    if self._processPool is not None and not forceUseThreads and len(args) > 0 and \
+       isinstance(args[0], (Models.ExternalModel, Models.ROM)):
+      # the model is shared once with the workers, each job only sends its own arguments
+      internalJob = Runners.factory.returnInstance('ProcessPoolRunner', tuple([self._processPool] + list(args)),
+                                                   functionToRun.original_function,
+                                                   identifier=identifier,
+                                                   metadata=metadata,
+                                                   uniqueHandler=uniqueHandler,
+                                                   profile=self.__profileJobs)
+    elif self._server is None or forceUseThreads:
       internalJob = Runners.factory.returnInstance('SharedMemoryRunner', args,
                                                    functionToRun.original_function,
                                                    identifier=identifier,
@@ -701,6 +786,7 @@ class JobHandler(BaseType):
       if self.__profileJobs:
         runner.trackTime('queue')
       self.__submittedJobs.append(runner.identifier)
+    self.__loopEvent.set()
 
   def addClientJob(self, args, functionToRun, identifier, metadata=None, uniqueHandler="any"):
     """
@@ -747,6 +833,7 @@ class JobHandler(BaseType):
     # place it on the finished queue
     with self.__queueLock:
       self.__finished.append(run)
+    self.__notifyClients()
 
   def isFinished(self, uniqueHandler=None):
     """
@@ -1069,11 +1156,13 @@ class JobHandler(BaseType):
               item.args[3].update(kwargs)
 
             self.__running[i] = item
-            self.__running[i].start()
+            self.__startRunner(item, self.__running, i)
             self.__running[i].trackTime('started')
             self.__nextId += 1
           else:
             break
+        # room was made in the queue
+        self.__notifyClients()
 
     # Repeat the same process above, only for the clientQueue
     emptySlots = [i for i,run in enumerate(self.__clientRunning) if run is None]
@@ -1082,11 +1171,43 @@ class JobHandler(BaseType):
         for i in emptySlots:
           if len(self.__clientQueue) > 0:
             self.__clientRunning[i] = self.__clientQueue.popleft()
-            self.__clientRunning[i].start()
+            self.__startRunner(self.__clientRunning[i], self.__clientRunning, i)
             self.__clientRunning[i].trackTime('jobHandler_started')
             self.__nextId += 1
           else:
             break
+        self.__notifyClients()
+
+  def __startRunner(self, runner, runList, index):
+    """
+      Starts a runner placed in a running slot, registering how its completion is detected.
+      Must be called with the queueLock acquired.
+      @ In, runner, Runner, the runner to start
+      @ In, runList, list, the running list holding the runner
+      @ In, index, int, the slot index of the runner in runList
+      @ Out, None
+    """
+    self.__slots[id(runner)] = (runList, index)
+    runner.setCompletionCallback(self.__jobCompleted)
+    runner.start()
+    if not runner.notifiesCompletion():
+      self.__polled.add(runner)
+
+  def __releaseSlot(self, runList, index):
+    """
+      Moves the runner in the given slot into the finished list and frees the slot.
+      Must be called with the queueLock acquired.
+      @ In, runList, list, the running list holding the runner
+      @ In, index, int, the slot index of the runner in runList
+      @ Out, None
+    """
+    run = runList[index]
+    runList[index] = None
+    self.__slots.pop(id(run), None)
+    self.__polled.discard(run)
+    run.setCompletionCallback(None)
+    self.__finished.append(run)
+    run.trackTime('jobHandler_finished')
 
   def cleanJobQueue(self):
     """
@@ -1095,18 +1216,33 @@ class JobHandler(BaseType):
     @ In, None
     @ Out, None
     """
-    # The code handling these two lists was the exact same, I have taken the
-    # liberty of condensing these loops into one and removing some of the
-    # redundant checks to make this code a bit simpler.
-    for runList in [self.__running, self.__clientRunning]:
-      with self.__queueLock:
-        # We need the queueLock, because if terminateJobs runs kill on it,
-        #  kill changes variables that can cause run.isDone to error out.
-        for i,run in enumerate(runList):
-          if run is not None and run.isDone():
-            self.__finished.append(run)
-            self.__finished[-1].trackTime('jobHandler_finished')
-            runList[i] = None
+    released = False
+    # We need the queueLock, because if terminateJobs runs kill on it,
+    #  kill changes variables that can cause run.isDone to error out.
+    with self.__queueLock:
+      # runners that notified their completion: no need to scan the running slots
+      while self.__completedRuns:
+        run = self.__completedRuns.popleft()
+        slot = self.__slots.get(id(run))
+        # the runner might have been terminated (or notified twice) in the meantime
+        if slot is None or slot[0][slot[1]] is not run:
+          continue
+        if run.isDone():
+          self.__releaseSlot(*slot)
+          released = True
+        else:
+          # the notification anticipated the runner bookkeeping, fall back on polling it
+          self.__polled.add(run)
+      # runners that cannot notify their completion are polled
+      for run in list(self.__polled):
+        slot = self.__slots.get(id(run))
+        if slot is None or slot[0][slot[1]] is not run:
+          self.__polled.discard(run)
+        elif run.isDone():
+          self.__releaseSlot(*slot)
+          released = True
+    if released:
+      self.__notifyClients()
 
   def setProfileJobs(self,profile=False):
     """
@@ -1124,6 +1260,9 @@ class JobHandler(BaseType):
     """
     with self.__queueLock:
       self.__submittedJobs = []
+    if self._processPool is not None:
+      # the models might change between steps (e.g. a ROM is trained)
+      self._processPool.reset()
 
   def shutdown(self):
     """
@@ -1133,6 +1272,8 @@ class JobHandler(BaseType):
     @ Out, None
     """
     self.completed = True
+    self.__loopEvent.set()
+    self.__notifyClients()
     self.__shutdownParallel()
 
   def terminateAll(self):
@@ -1172,6 +1313,8 @@ class JobHandler(BaseType):
           if isinstance(queue,list):
             job.kill()
             queue[queue.index(job)] = None
+            self.__slots.pop(id(job), None)
+            self.__polled.discard(job)
           # for variable queues, can just remove the job
           else:
             queue.remove(job)
@@ -22,6 +22,9 @@ import shutil
 import platform
 import shlex
 import time
+import re
+import subprocess
+import threading
 import numpy as np
 import pandas as pd
 #External Modules End--------------------------------------------------------------------------------
@@ -42,6 +45,8 @@ class Code(Model):
     This is the generic class that import an external code into the framework
   """
   interfaceFactory = factory
+  # wildcards that can be used in the execution command (e.g. %INDEX%)
+  _wildcardPattern = re.compile(r'%(INDEX1?|CURRENT_ID1?|SCRIPT_DIR|FRAMEWORK_DIR|BASE_WORKING_DIR|WORKING_DIR|METHOD|NUM_CPUS|PYTHON)%')
 
   @classmethod
   def getInputSpecification(cls):
@@ -56,6 +61,7 @@ class Code(Model):
     inputSpecification.setStrictMode(False) #Code interfaces can allow new elements.
     inputSpecification.addSub(InputData.parameterInputFactory("executable", contentType=InputTypes.StringType))
     inputSpecification.addSub(InputData.parameterInputFactory("walltime", contentType=InputTypes.FloatType))
+    inputSpecification.addSub(InputData.parameterInputFactory("linkInputFiles", contentType=InputTypes.BoolType))
     inputSpecification.addSub(InputData.parameterInputFactory("preexec", contentType=InputTypes.StringType))
 
     ## Begin command line arguments tag
@@ -117,6 +123,8 @@ class Code(Model):
     self.foundExecutable = True  # True indicates the executable is found, otherwise not found
     self.foundPreExec = True     # True indicates the pre-executable is found, otherwise not found
     self.maxWallTime = None      # If set, this indicates the maximum CPU time a job can take.
+    self.linkInputFiles = False  # If True, the input files not edited by the code interface are hard-linked in the sample directories
+    self._preparedDirs = set()   # sample directories already containing the linked input files (reused across samples and steps)
     self._ravenWorkingDir = None # RAVEN's working dir
 
   def applyRunInfo(self, runInfo):
@@ -144,6 +152,8 @@ class Code(Model):
         self.executable = child.value if child.value is not None else ''
       if child.getName() =='walltime':
         self.maxWallTime = child.value
+      if child.getName() =='linkInputFiles':
+        self.linkInputFiles = child.value
       if child.getName() =='preexec':
         self.preExec = child.value
       elif child.getName() == 'clargs':
@@ -377,6 +387,7 @@ class Code(Model):
 
     if not os.path.exists(subDirectory):
       os.mkdir(subDirectory)
+    prepared = subDirectory in self._preparedDirs
     for index in range(len(newInputSet)):
       subSubDirectory = os.path.join(subDirectory,newInputSet[index].subDirectory)
       ## Currently, there are no tests that verify the lines below can be hit
@@ -387,7 +398,9 @@ class Code(Model):
         os.makedirs(subSubDirectory)
       ##########################################################################
       newInputSet[index].setPath(subSubDirectory)
-      shutil.copy(self.oriInputFiles[index].getAbsFile(),subSubDirectory)
+      self._placeInputFile(self.oriInputFiles[index], newInputSet[index], subSubDirectory, prepared)
+    if self.linkInputFiles:
+      self._preparedDirs.add(subDirectory)
 
     kwargs['subDirectory'] = subDirectory
     kwargs['alias'] = self.alias
@@ -402,6 +415,32 @@ class Code(Model):
 
     return (newInput,kwargs)
 
+  def _placeInputFile(self, oriInputFile, newInputFile, subSubDirectory, prepared):
+    """
+      Places an original input file in the sample directory.
+      If requested (linkInputFiles), the files that the code interface does not edit (i.e. the ones
+      without one of the code input extensions) are hard-linked instead of copied, and left untouched
+      if the sample directory has already been prepared by a previous sample.
+      @ In, oriInputFile, Files.File, the original input file
+      @ In, newInputFile, Files.File, the input file for the sample
+      @ In, subSubDirectory, str, the directory where the file must be placed
+      @ In, prepared, bool, True if the sample directory has been already prepared
+      @ Out, None
+    """
+    if not self.linkInputFiles or newInputFile.getExt() in self.code.getInputExtension():
+      shutil.copy(oriInputFile.getAbsFile(),subSubDirectory)
+      return
+    newFile = newInputFile.getAbsFile()
+    if prepared and os.path.exists(newFile) and os.path.samefile(oriInputFile.getAbsFile(), newFile):
+      return
+    if os.path.lexists(newFile):
+      os.remove(newFile)
+    try:
+      os.link(oriInputFile.getAbsFile(), newFile)
+    except OSError:
+      # hard links are not available (e.g. different file systems)
+      shutil.copy(oriInputFile.getAbsFile(),subSubDirectory)
+
   def _expandCommand(self, origCommand):
     """
       Function to expand a command from string to list.
@@ -546,21 +585,22 @@ class Code(Model):
 
     command = ' && '.join(commands)+' '
 
-    command = command.replace("%INDEX%",kwargs['INDEX'])
-    command = command.replace("%INDEX1%",kwargs['INDEX1'])
-    command = command.replace("%CURRENT_ID%",kwargs['CURRENT_ID'])
-    command = command.replace("%CURRENT_ID1%",kwargs['CURRENT_ID1'])
-    command = command.replace("%SCRIPT_DIR%",kwargs['SCRIPT_DIR'])
-    command = command.replace("%FRAMEWORK_DIR%",kwargs['FRAMEWORK_DIR'])
-    ## Note this is the working directory that the subprocess will use, it is
+    ## Note %WORKING_DIR% is the working directory that the subprocess will use, it is
     ## not the directory I am currently working. This bit me as I moved the code
     ## from the old ExternalRunner because in that case this was filled in after
     ## the process was submitted by the process itself. -- DPM 5/4/17
-    command = command.replace("%WORKING_DIR%",sampleDirectory)
-    command = command.replace("%BASE_WORKING_DIR%",kwargs['BASE_WORKING_DIR'])
-    command = command.replace("%METHOD%",kwargs['METHOD'])
-    command = command.replace("%NUM_CPUS%",kwargs['NUM_CPUS'])
-    command = command.replace("%PYTHON%", sys.executable)
+    wildcards = {'INDEX': kwargs['INDEX'],
+                 'INDEX1': kwargs['INDEX1'],
+                 'CURRENT_ID': kwargs['CURRENT_ID'],
+                 'CURRENT_ID1': kwargs['CURRENT_ID1'],
+                 'SCRIPT_DIR': kwargs['SCRIPT_DIR'],
+                 'FRAMEWORK_DIR': kwargs['FRAMEWORK_DIR'],
+                 'WORKING_DIR': sampleDirectory,
+                 'BASE_WORKING_DIR': kwargs['BASE_WORKING_DIR'],
+                 'METHOD': kwargs['METHOD'],
+                 'NUM_CPUS': kwargs['NUM_CPUS'],
+                 'PYTHON': sys.executable}
+    command = self._wildcardPattern.sub(lambda match: str(wildcards[match.group(1)]), command)
 
     self.raiseAMessage('Execution command submitted:',command)
     if platform.system() == 'Windows':
@@ -578,19 +618,19 @@ class Code(Model):
     ## This code should be evaluated by the job handler, so it is fine to wait
     ## until the execution of the external subprocess completes.
     process = utils.pickleSafeSubprocessPopen(command, shell=self.code.getRunOnShell(), stdout=outFileObject, stderr=outFileObject, cwd=localenv['PWD'], env=localenv)
-    if self.maxWallTime is not None:
-      timeout = time.time() + self.maxWallTime
-      while True:
-        time.sleep(0.5)
-        process.poll()
-        if time.time() > timeout and process.returncode is None:
-          self.raiseAWarning('walltime exceeded in run in working dir: '+str(metaData['subDirectory'])+'. Killing the run...')
-          process.kill()
-          process.returncode = -1
-        if process.returncode is not None or time.time() > timeout:
-          break
-    else:
-      process.wait()
+    try:
+      # the wait returns as soon as the process ends. It is always timed, so that it can be interrupted
+      # when the job is killed (e.g. a sub-model cancelled by an EnsembleModel), which an untimed wait cannot be
+      process.wait(timeout=self.maxWallTime if self.maxWallTime is not None else threading.TIMEOUT_MAX)
+    except subprocess.TimeoutExpired:
+      self.raiseAWarning('walltime exceeded in run in working dir: '+str(metaData['subDirectory'])+'. Killing the run...')
+      utils.killProcessTree(process)
+      process.returncode = -1
+    except BaseException:
+      # the job has been killed: the code must not keep running (and writing in the sample directory) on its own
+      utils.killProcessTree(process)
+      outFileObject.close()
+      raise
 
     returnCode = process.returncode
     self.raiseADebug(" Process "+str(process.pid)+" finished "+time.ctime()+
@@ -634,6 +674,7 @@ class Code(Model):
           returnDict = finalCodeOutput
     ## If the run was successful
     if returnCode == 0:
+      loadedFromCsv = False
       ## This may be a tautology at this point --DPM 4/12/17
       ## Special case for RAVEN interface. Added ravenCase flag --ALFOA 09/17/17
       if outputFile and isStr and not ravenCase:
@@ -647,10 +688,11 @@ class Code(Model):
         loadUtility = self.code.getCsvLoadUtil()
         csvData = csvLoader.loadCsvFile(outFile.getAbsFile(), nullOK=False, utility=loadUtility)
         returnDict = csvLoader.toRealization(csvData)
+        loadedFromCsv = True
 
       if not ravenCase:
-        # check if the csv needs to be printed
-        if self.code.getIfWriteCsv():
+        # check if the csv needs to be printed (not needed if the data have been loaded from it)
+        if self.code.getIfWriteCsv() and not loadedFromCsv:
           csvFileName = os.path.join(metaData['subDirectory'],outputFile+'.csv')
           pd.DataFrame.from_dict(returnDict).to_csv(path_or_buf=csvFileName,index=False)
         self._replaceVariablesNamesWithAliasSystem(returnDict, 'inout', True)
@@ -23,9 +23,8 @@ import io
 import sys
 import copy
 import numpy as np
-import time
 import itertools
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from ..Decorators.Parallelization import Parallel
 #External Modules End--------------------------------------------------------------------------------
 
@@ -76,6 +75,8 @@ class EnsembleModel(Dummy):
     self.modelsInputDictionary  = {}                    # to allow reusability of ensemble modes (similar in construction to self.modelsDictionary)
     self.activatePicard         = False                 # is non-linear system being identified?
     self.localTargetEvaluations = {}                    # temporary storage of target evaluation data objects
+    self._targetEvaluationPool  = {}                    # {modelName: deque of reset copies of the target evaluation}, reused across samples
+    self._modelDependencies     = {}                    # {modelName: set of models that must be executed before it}
     self.maxIterations          = 30                    # max number of iterations (in case of non-linear system activated)
     self.convergenceTol         = 1.e-3                 # tolerance of the iteration scheme (if activated) => L2 norm
     self.initialConditions      = {}                    # dictionary of initial conditions in case non-linear system is detected
@@ -270,6 +271,8 @@ class EnsembleModel(Dummy):
         self.raiseAnError(IOError, "Only DataObjects are allowed as TargetEvaluation object. Got "+ str(targetEvaluation.type)+"!")
       # localTargetEvaluations are for passing data and then resetting, not keeping data between samples
       self.localTargetEvaluations[modelName] = copy.deepcopy(targetEvaluation)
+      self.localTargetEvaluations[modelName].reset()
+      self._targetEvaluationPool[modelName] = deque()
       # get input variables
       inps   = targetEvaluation.getVars('input')
       # get pivot parameters in input space if any and add it in the 'Input' list
@@ -316,6 +319,15 @@ class EnsembleModel(Dummy):
       modelsToOutputModels[modelIn] = outputMatch
     # construct the ensemble model directed graph
     self.ensembleModelGraph = graphStructure.graphObject(modelsToOutputModels)
+    # models each model depends on (the ones providing its inputs or the metadata to transfer)
+    self._modelDependencies = dict((modelIn, set()) for modelIn in self.modelsDictionary)
+    for modelIn, outputModels in modelsToOutputModels.items():
+      for modelOut in outputModels:
+        if modelOut != modelIn:
+          self._modelDependencies[modelOut].add(modelIn)
+    for modelIn in self.modelsDictionary:
+      for _, source, _ in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+        self._modelDependencies[modelIn].add(source)
     # make some checks
     if not self.ensembleModelGraph.isConnectedNet():
       isolatedModels = self.ensembleModelGraph.findIsolatedVertices()
@@ -594,7 +606,7 @@ class EnsembleModel(Dummy):
       @ In, jobHandler, object, optional, instance of jobHandler (available if parallelStrategy==2)
       @ Out, returnEvaluation, tuple, the results of the assembled model:
                                - returnEvaluation[0] dict of results from each sub-model,
-                               - returnEvaluation[1] the dataObjects where the projection of each model is stored
+                               - returnEvaluation[1] dict of the realizations projected on the target evaluation of each model
                                - returnEvaluation[2] dict used to store the optional outputs
     """
     originalInput = inRun[0]
@@ -605,10 +617,40 @@ class EnsembleModel(Dummy):
     inRunTargetEvaluations = {}
 
     for modelIn in self.orderList:
-      # reset the DataObject for the projection
-      self.localTargetEvaluations[modelIn].reset()
-      # deepcopy assures distinct copies
-      inRunTargetEvaluations[modelIn] = copy.deepcopy(self.localTargetEvaluations[modelIn])
+      # reset copies of the DataObjects for the projection are reused across samples
+      try:
+        inRunTargetEvaluations[modelIn] = self._targetEvaluationPool[modelIn].popleft()
+      except IndexError:
+        # deepcopy assures distinct copies
+        inRunTargetEvaluations[modelIn] = copy.deepcopy(self.localTargetEvaluations[modelIn])
+    try:
+      if self.parallelStrategy == 2 and not self.activatePicard and len(self.orderList) > 1:
+        returnDict, gotOutputs = self.__runConcurrently(identifier, originalInput, inputKwargs, inRunTargetEvaluations,
+                                                        samplerType, tempOutputs, jobHandler)
+      else:
+        returnDict, gotOutputs = self.__runSequentially(identifier, originalInput, inputKwargs, inRunTargetEvaluations,
+                                                        samplerType, tempOutputs, jobHandler)
+    finally:
+      for modelIn, targetEvaluation in inRunTargetEvaluations.items():
+        targetEvaluation.reset()
+        self._targetEvaluationPool[modelIn].append(targetEvaluation)
+    projections = dict((modelIn, returnDict[modelIn]['response']) for modelIn in returnDict)
+    returnEvaluation = returnDict, projections, tempOutputs
+    return returnEvaluation
+
+  def __runSequentially(self, identifier, originalInput, inputKwargs, inRunTargetEvaluations, samplerType, tempOutputs, jobHandler=None):
+    """
+      Runs the sub-models one after the other, following the execution list (iterating if Picard's iterations are activated)
+      @ In, identifier, str, current job identifier
+      @ In, originalInput, dict, the inputs of each sub-model
+      @ In, inputKwargs, dict, the kwargs of each sub-model
+      @ In, inRunTargetEvaluations, dict, the target evaluation of each sub-model
+      @ In, samplerType, str, sampler Type
+      @ InOut, tempOutputs, dict, the evaluation of each sub-model
+      @ In, jobHandler, jobHandler instance, optional, jobHandler instance (available only if parallelStrategy == 2)
+      @ Out, returnDict, dict, the results of each sub-model
+      @ Out, gotOutputs, list, the outputs of each sub-model (in execution order)
+    """
     residueContainer = dict.fromkeys(self.modelsDictionary.keys())
     gotOutputs       = [{}]*len(self.orderList)
     typeOutputs      = ['']*len(self.orderList)
@@ -632,51 +674,7 @@ class EnsembleModel(Dummy):
         self.raiseAMessage("Picard's Iteration "+ str(iterationCount))
 
       for modelCnt, modelIn in enumerate(self.orderList):
-        # clear the model's Target Evaluation data object
-        # in case there are metadataToTransfer, let's collect them from the source
-        metadataToTransfer = None
-        if self.modelsInputDictionary[modelIn]['metadataToTransfer']:
-          metadataToTransfer = {}
-        for metadataToGet, source, alias in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
-          if metadataToGet in returnDict[source]['general_metadata']:
-            metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
-          elif metadataToGet in returnDict[source]['response']:
-            metaDataValue = returnDict[source]['response'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
-          else:
-            self.raiseAnError(RuntimeError,'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
-        # get dependent outputs
-        dependentOutput = self.__retrieveDependentOutput(modelIn, gotOutputs, typeOutputs)
-        # if nonlinear system, check for initial coditions
-        if iterationCount == 1  and self.activatePicard:
-          sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
-          conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
-          for initialConditionToSet in conditionsToCheck:
-            if initialConditionToSet in self.initialConditions.keys():
-              dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
-            else:
-              self.raiseAnError(IOError,"No initial conditions provided for variable "+ initialConditionToSet)
-        # set new identifiers
-        inputKwargs[modelIn]['prefix']        = modelIn+utils.returnIdSeparator()+identifier
-        inputKwargs[modelIn]['uniqueHandler'] = self.name+identifier
-        if metadataToTransfer is not None:
-          inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
-
-        for key, value in dependentOutput.items():
-          inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
-          ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
-          ## Who has this information? -- DPM 4/11/17
-          inputKwargs[modelIn]["SampledVarsPb"][key] =  1.0
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
-        ## FIXME: this will come after we rework the "runInfo" collection in the code
-        ## if run info is present, we need to pass to to kwargs
-        ##if self.runInfoDict and 'Code' == self.modelsDictionary[modelIn]['Instance'].type:
-        ##  inputKwargs[modelIn].update(self.runInfoDict)
-
+        self.__prepareModelInput(modelIn, identifier, inputKwargs, returnDict, gotOutputs, typeOutputs, iterationCount)
         retDict, gotOuts, evaluation = self.__advanceModel(identifier, self.modelsDictionary[modelIn],
                                                         originalInput[modelIn], inputKwargs[modelIn],
                                                         inRunTargetEvaluations[modelIn], samplerType,
@@ -715,8 +713,137 @@ class EnsembleModel(Dummy):
         if residualPass:
           self.raiseAMessage("Picard's Iteration converged. Norm: "+ str(residueContainer['TotalResidue']))
           break
-    returnEvaluation = returnDict, inRunTargetEvaluations, tempOutputs
-    return returnEvaluation
+    return returnDict, gotOutputs
+
+  def __runConcurrently(self, identifier, originalInput, inputKwargs, inRunTargetEvaluations, samplerType, tempOutputs, jobHandler):
+    """
+      Runs the sub-models through the jobHandler as soon as the models they depend on are completed,
+      so that independent branches of the ensemble are executed concurrently (linear systems only)
+      @ In, identifier, str, current job identifier
+      @ In, originalInput, dict, the inputs of each sub-model
+      @ In, inputKwargs, dict, the kwargs of each sub-model
+      @ In, inRunTargetEvaluations, dict, the target evaluation of each sub-model
+      @ In, samplerType, str, sampler Type
+      @ InOut, tempOutputs, dict, the evaluation of each sub-model
+      @ In, jobHandler, jobHandler instance, jobHandler instance
+      @ Out, returnDict, dict, the results of each sub-model
+      @ Out, gotOutputs, list, the outputs of each sub-model (in execution order)
+    """
+    returnDict  = {}
+    gotOutputs  = [{}]*len(self.orderList)
+    typeOutputs = ['']*len(self.orderList)
+    running = {} # {modelName: job identifier}
+    completed = set()
+    try:
+      while len(completed) < len(self.orderList):
+        # submit all the models whose dependencies are satisfied
+        for modelIn in self.orderList:
+          if modelIn not in completed and modelIn not in running and self._modelDependencies[modelIn].issubset(completed):
+            self.__prepareModelInput(modelIn, identifier, inputKwargs, returnDict, gotOutputs, typeOutputs, 1)
+            running[modelIn] = self.__submitModel(identifier, self.modelsDictionary[modelIn], originalInput[modelIn],
+                                                  inputKwargs[modelIn], samplerType, jobHandler)
+        for modelIn in self.__waitForModels(running, jobHandler):
+          running.pop(modelIn)
+          modelCnt = self.orderList.index(modelIn)
+          retDict, gotOuts, evaluation = self.__collectModel(identifier, self.modelsDictionary[modelIn],
+                                                             inRunTargetEvaluations[modelIn], 1, jobHandler)
+          returnDict[modelIn] = retDict
+          typeOutputs[modelCnt] = inRunTargetEvaluations[modelIn].type
+          gotOutputs[modelCnt] = gotOuts
+          tempOutputs[modelIn] = evaluation
+          completed.add(modelIn)
+    except Exception:
+      # a sub-model failed: its siblings are not needed anymore
+      self.__releaseModels(identifier, list(running.values()), jobHandler)
+      raise
+    return returnDict, gotOutputs
+
+  def __waitForModels(self, running, jobHandler):
+    """
+      Blocks until at least one of the submitted sub-models is finished, waiting for the JobHandler activity instead of polling
+      @ In, running, dict, the submitted sub-models {modelName: job identifier}
+      @ In, jobHandler, jobHandler instance, jobHandler instance
+      @ Out, finished, list, the names of the finished sub-models
+    """
+    while True:
+      # clear before checking, so that a job finishing from now on wakes up the wait
+      jobHandler.clearActivity()
+      finished = [modelIn for modelIn, localIdentifier in running.items() if jobHandler.isThisJobFinished(localIdentifier)]
+      if len(finished):
+        return finished
+      jobHandler.waitForActivity()
+
+  def __releaseModels(self, identifier, localIdentifiers, jobHandler):
+    """
+      Cancels the sub-model jobs still queued or running and collects the finished ones, so that they do not leak
+      @ In, identifier, str, current job identifier
+      @ In, localIdentifiers, list, the identifiers of the sub-model jobs
+      @ In, jobHandler, jobHandler instance, jobHandler instance
+      @ Out, None
+    """
+    if not len(localIdentifiers):
+      return
+    self.raiseADebug('Cancelling the sub-model jobs', ', '.join(localIdentifiers))
+    # terminateJobs consumes the list it is given
+    jobHandler.terminateJobs(list(localIdentifiers))
+    for localIdentifier in localIdentifiers:
+      jobHandler.getFinished(jobIdentifier=localIdentifier, uniqueHandler=self.name+identifier)
+
+  def __prepareModelInput(self, modelIn, identifier, inputKwargs, returnDict, gotOutputs, typeOutputs, iterationCount):
+    """
+      Sets the kwargs of a sub-model before its execution, collecting the outputs and the metadata of the models it depends on
+      @ In, modelIn, str, the sub-model name
+      @ In, identifier, str, current job identifier
+      @ InOut, inputKwargs, dict, the kwargs of each sub-model
+      @ In, returnDict, dict, the results of the sub-models already executed
+      @ In, gotOutputs, list, the outputs of the sub-models already executed (in execution order)
+      @ In, typeOutputs, list, the type of the target evaluations of the sub-models (in execution order)
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ Out, None
+    """
+    # in case there are metadataToTransfer, let's collect them from the source
+    metadataToTransfer = None
+    if self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+      metadataToTransfer = {}
+    for metadataToGet, source, alias in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+      if metadataToGet in returnDict[source]['general_metadata']:
+        metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
+        metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+        metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+      elif metadataToGet in returnDict[source]['response']:
+        metaDataValue = returnDict[source]['response'][metadataToGet]
+        metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+        metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+      else:
+        self.raiseAnError(RuntimeError,'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
+    # get dependent outputs
+    dependentOutput = self.__retrieveDependentOutput(modelIn, gotOutputs, typeOutputs)
+    # if nonlinear system, check for initial coditions
+    if iterationCount == 1  and self.activatePicard:
+      sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
+      conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
+      for initialConditionToSet in conditionsToCheck:
+        if initialConditionToSet in self.initialConditions.keys():
+          dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
+        else:
+          self.raiseAnError(IOError,"No initial conditions provided for variable "+ initialConditionToSet)
+    # set new identifiers
+    inputKwargs[modelIn]['prefix']        = modelIn+utils.returnIdSeparator()+identifier
+    inputKwargs[modelIn]['uniqueHandler'] = self.name+identifier
+    if metadataToTransfer is not None:
+      inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
+
+    for key, value in dependentOutput.items():
+      inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
+      ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
+      ## Who has this information? -- DPM 4/11/17
+      inputKwargs[modelIn]["SampledVarsPb"][key] =  1.0
+    self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
+    self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
+    ## FIXME: this will come after we rework the "runInfo" collection in the code
+    ## if run info is present, we need to pass to to kwargs
+    ##if self.runInfoDict and 'Code' == self.modelsDictionary[modelIn]['Instance'].type:
+    ##  inputKwargs[modelIn].update(self.runInfoDict)
 
   def __advanceModel(self, identifier, modelToExecute, origInputList, inputKwargs, inRunTargetEvaluations, samplerType, iterationCount, jobHandler = None):
     """
@@ -734,55 +861,93 @@ class EnsembleModel(Dummy):
       @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
       @ Out, evaluation, dict, the evaluation dictionary with the "unprojected" data
     """
-    returnDict = {}
-
-    self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
-    localIdentifier =  modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
     if self.parallelStrategy == 1:
+      self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
+      localIdentifier =  modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
       # we evaluate the model directly
       try:
         evaluation = modelToExecute['Instance'].evaluateSample.original_function(modelToExecute['Instance'], origInputList, samplerType, inputKwargs)
       except Exception as e:
-        excType, excValue, excTrace = sys.exc_info()
-        evaluation = None
-    else:
-      moveOn = False
-      while not moveOn:
-        # run the model
-        inputKwargs.pop("jobHandler", None)
-        modelToExecute['Instance'].submit(origInputList, samplerType, jobHandler, **inputKwargs)
-        ## wait until the model finishes, in order to get ready to run the subsequential one
-        while not jobHandler.isThisJobFinished(localIdentifier):
-          time.sleep(1.e-3)
-        moveOn = True
-      # get job that just finished to gather the results
-      finishedRun = jobHandler.getFinished(jobIdentifier = localIdentifier, uniqueHandler=self.name+identifier)
-      evaluation = finishedRun[0].getEvaluation()
-      if isinstance(evaluation, rerror):
         evaluation = None
-        excType, excValue, excTrace = finishedRun[0].exceptionTrace
-        e = rerror
-        # the model failed
-        for modelToRemove in list(set(self.orderList) - set([modelToExecute['Instance'].name])):
-          jobHandler.getFinished(jobIdentifier = modelToRemove + utils.returnIdSeparator() + identifier, uniqueHandler = self.name + identifier)
-      else:
-        # collect the target evaluation
-        modelToExecute['Instance'].collectOutput(finishedRun[0],inRunTargetEvaluations)
+        self.__raiseModelFailure(modelToExecute, localIdentifier, sys.exc_info())
+      inRunTargetEvaluations.addRealization(evaluation)
+      return self.__projectEvaluation(identifier, evaluation, inRunTargetEvaluations, iterationCount)
+
+    localIdentifier = self.__submitModel(identifier, modelToExecute, origInputList, inputKwargs, samplerType, jobHandler)
+    ## wait until the model finishes, in order to get ready to run the subsequential one
+    self.__waitForModels({modelToExecute['Instance'].name: localIdentifier}, jobHandler)
+    return self.__collectModel(identifier, modelToExecute, inRunTargetEvaluations, iterationCount, jobHandler)
 
-    if not evaluation:
+  def __submitModel(self, identifier, modelToExecute, origInputList, inputKwargs, samplerType, jobHandler):
+    """
+      Submits a sub-model to the jobHandler (parallelStrategy == 2)
+      @ In, identifier, str, current job identifier
+      @ In, modelToExecute, super(Model), Model instance than needs to be advanced
+      @ In, origInputList, list, list of model input
+      @ In, inputKwargs, dict, dictionary of kwargs for this model
+      @ In, samplerType, str, sampler Type
+      @ In, jobHandler, jobHandler instance, jobHandler instance
+      @ Out, localIdentifier, str, the identifier of the job of the sub-model
+    """
+    self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
+    localIdentifier =  modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
+    inputKwargs.pop("jobHandler", None)
+    modelToExecute['Instance'].submit(origInputList, samplerType, jobHandler, **inputKwargs)
+    return localIdentifier
+
+  def __collectModel(self, identifier, modelToExecute, inRunTargetEvaluations, iterationCount, jobHandler):
+    """
+      Collects the results of a finished sub-model job (parallelStrategy == 2)
+      @ In, identifier, str, current job identifier
+      @ In, modelToExecute, super(Model), Model instance that has been advanced
+      @ In, inRunTargetEvaluations, DataObject, target evaluation for the model
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ In, jobHandler, jobHandler instance, jobHandler instance
+      @ Out, returnDict, dict, dictionary containing the data extracted from the target evaluation
+      @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
+      @ Out, evaluation, dict, the evaluation dictionary with the "unprojected" data
+    """
+    localIdentifier =  modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
+    # get job that just finished to gather the results
+    finishedRun = jobHandler.getFinished(jobIdentifier = localIdentifier, uniqueHandler=self.name+identifier)
+    evaluation = finishedRun[0].getEvaluation()
+    if isinstance(evaluation, rerror) or not evaluation:
       # the model failed
-      import traceback
-      msg = io.StringIO()
-      traceback.print_exception(excType, excValue, excTrace, limit=10, file=msg)
-      msg = msg.getvalue().replace('\n', '\n        ')
-      self.raiseAnError(RuntimeError, f'The Model "{modelToExecute["Instance"].name}" id "{localIdentifier}" '+
-                        f'failed! Trace:\n{"*"*72}\n{msg}\n{"*"*72}')
-    else:
-      if self.parallelStrategy == 1:
-        inRunTargetEvaluations.addRealization(evaluation)
-      else:
-        modelToExecute['Instance'].collectOutput(finishedRun[0],inRunTargetEvaluations)
+      for modelToRemove in list(set(self.orderList) - set([modelToExecute['Instance'].name])):
+        jobHandler.getFinished(jobIdentifier = modelToRemove + utils.returnIdSeparator() + identifier, uniqueHandler = self.name + identifier)
+      self.__raiseModelFailure(modelToExecute, localIdentifier, finishedRun[0].exceptionTrace)
+    # collect the target evaluation
+    modelToExecute['Instance'].collectOutput(finishedRun[0],inRunTargetEvaluations)
+    return self.__projectEvaluation(identifier, evaluation, inRunTargetEvaluations, iterationCount)
+
+  def __raiseModelFailure(self, modelToExecute, localIdentifier, excInfo):
+    """
+      Raises the error for a failed sub-model, reporting its trace
+      @ In, modelToExecute, super(Model), Model instance that failed
+      @ In, localIdentifier, str, the identifier of the job of the sub-model
+      @ In, excInfo, tuple, the exception info (type, value, traceback), if available
+      @ Out, None
+    """
+    import traceback
+    msg = io.StringIO()
+    if excInfo is not None:
+      traceback.print_exception(*excInfo, limit=10, file=msg)
+    msg = msg.getvalue().replace('\n', '\n        ')
+    self.raiseAnError(RuntimeError, f'The Model "{modelToExecute["Instance"].name}" id "{localIdentifier}" '+
+                      f'failed! Trace:\n{"*"*72}\n{msg}\n{"*"*72}')
 
+  def __projectEvaluation(self, identifier, evaluation, inRunTargetEvaluations, iterationCount):
+    """
+      Projects the evaluation of a sub-model on its target evaluation
+      @ In, identifier, str, current job identifier
+      @ In, evaluation, dict, the evaluation dictionary with the "unprojected" data
+      @ In, inRunTargetEvaluations, DataObject, target evaluation for the model (already containing the evaluation)
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ Out, returnDict, dict, dictionary containing the data extracted from the target evaluation
+      @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
+      @ Out, evaluation, dict, the evaluation dictionary with the "unprojected" data
+    """
+    returnDict = {}
     ## FIXME: The call asDataset() is unuseful here. It must be done because otherwise the realization(...) method from collector
     ## does not return the indexes values (TO FIX)
     inRunTargetEvaluations.asDataset()
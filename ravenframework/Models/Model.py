@@ -126,7 +126,8 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
                                                 'CustomSampler',
                                                 'AdaptiveMonteCarlo',
                                                 'Metropolis',
-                                                'AdaptiveMetropolis']
+                                                'AdaptiveMetropolis',
+                                                'DifferentialEvolutionMCMC']
   validateDict['Optimizer'].append(testDict.copy())
   validateDict['Optimizer'][0]['class'       ] ='Optimizers'
   validateDict['Optimizer'][0]['required'    ] = False
@@ -31,6 +31,7 @@ from .PostProcessorInterface import PostProcessorInterface
 from ...utils import utils
 from ...utils import InputData, InputTypes
 from ...utils import mathUtils
+from ...utils.quantileSketch import TDigest
 #Internal Modules End-----------------------------------------------------------
 
 class BasicStatistics(PostProcessorInterface):
@@ -137,6 +138,13 @@ class BasicStatistics(PostProcessorInterface):
     multipleFeaturesInput = InputData.parameterInputFactory("multipleFeatures", contentType=InputTypes.BoolType)
     inputSpecification.addSub(multipleFeaturesInput)
 
+    percentileSketchInput = InputData.parameterInputFactory("percentileSketch", contentType=InputTypes.IntegerType,
+        descr="""If provided, the weighted percentiles (median, percentile and valueAtRisk) are estimated with a
+                 streaming quantile sketch (t-digest) instead of sorting all the samples, which is useful for
+                 very large data sets. The value is the compression of the sketch (e.g. 200): larger values
+                 are more accurate, but slower.""")
+    inputSpecification.addSub(percentileSketchInput)
+
     return inputSpecification
 
   def __init__(self):
@@ -160,6 +168,8 @@ class BasicStatistics(PostProcessorInterface):
     self.realizationWeight = None # The joint probabilities
     self.steMetaIndex   = 'targets' # when Dataset is requested as output, the default index of ste metadata is ['targets', self.pivotParameter]
     self.multipleFeatures = True # True if multiple features are employed in linear regression as feature inputs
+    self.percentileSketch = None # compression of the streaming quantile sketch, if the weighted percentiles are estimated with it
+    self._sortedSamples = {}     # {target: sorted samples and CDF (or quantile sketches)}, shared by the percentile-based metrics during a run
     self.sampleSize     = None # number of sample size
     self.calculations   = {}
     self.validDataType  = ['PointSet', 'HistorySet', 'DataSet'] # The list of accepted types of DataObject
@@ -428,6 +438,10 @@ class BasicStatistics(PostProcessorInterface):
         self.outputDataset = child.value
       elif tag == "multipleFeatures":
         self.multipleFeatures = child.value
+      elif tag == "percentileSketch":
+        if child.value < 1:
+          self.raiseAnError(IOError, 'The compression of <percentileSketch> must be positive! Got', child.value)
+        self.percentileSketch = child.value
       else:
         if tag not in childVals:
           self.raiseAWarning('Unrecognized node in BasicStatistics "',tag,'" has been ignored!')
@@ -637,52 +651,111 @@ class BasicStatistics(PostProcessorInterface):
     """
     return np.sqrt(variance)
 
-  def _computeWeightedPercentile(self,arrayIn,pbWeight,interpolation='linear',percent=[0.5]):
+  def _sortWeightedSamples(self, arrayIn, pbWeight, key=None):
     """
-      Method to compute the weighted percentile in a array of data
-      @ In, arrayIn, list/numpy.array, the array of values from which the percentile needs to be estimated
-      @ In, pbWeight, list/numpy.array, the reliability weights that correspond to the values in 'array'
-      @ In, interpolation, str, 'linear' or 'midpoint'
-      @ In, percent, list/numpy.array, the percentile(s) that needs to be computed (between 0.01 and 1.0)
-      @ Out, result, list, the percentile(s)
+      Method to sort the samples and to compute the weighted CDF used by the percentile-based metrics.
+      When a key is given, the result is cached for the whole run, so that the samples of a target
+      are sorted only once (e.g. for median, percentile, valueAtRisk and expectedShortfall)
+      @ In, arrayIn, list/numpy.array, the array of values, shaped [#samples] or [#samples, #pivotValues]
+      @ In, pbWeight, list/numpy.array, the reliability weights that correspond to the samples in 'arrayIn'
+      @ In, key, str, optional, the cache key (e.g. the target name)
+      @ Out, sortedPoints, numpy.array, [#samples+1, #columns] the sorted values
+      @ Out, sortedWeights, numpy.array, [#samples+1, #columns] the weights of the sorted values
+      @ Out, weightsCDF, numpy.array, [#samples+1, #columns] the normalized cumulative sum of the sorted weights
     """
-
-    # only do the argsort once for all requested percentiles
-    idxs                   = np.argsort(np.asarray(list(zip(pbWeight,arrayIn)))[:,1])
+    if key is not None and key in self._sortedSamples:
+      return self._sortedSamples[key]
+    values = np.asarray(arrayIn, dtype=float)
+    if values.ndim == 1:
+      values = values[:, np.newaxis]
+    # only do the argsort once for all requested percentiles (and pivot values)
+    idxs = np.argsort(values, axis=0)
+    sortedPoints = np.take_along_axis(values, idxs, axis=0)
+    sortedWeights = np.asarray(pbWeight, dtype=float)[idxs]
     # Inserting [0.0,arrayIn[idxs[0]]] is needed when few samples are generated and
     # a percentile that is < that the first pb weight is requested. Otherwise the median
     # is returned.
-    sortedWeightsAndPoints = np.insert(np.asarray(list(zip(pbWeight[idxs],arrayIn[idxs]))),0,[0.0,arrayIn[idxs[0]]],axis=0)
-    weightsCDF             = np.cumsum(sortedWeightsAndPoints[:,0])
-    weightsCDF            /= weightsCDF[-1]
-    if interpolation == 'linear':
-      result = np.interp(percent, weightsCDF, sortedWeightsAndPoints[:, 1]).tolist()
-    elif interpolation == 'midpoint':
-      result = [self._computeSingleWeightedPercentile(pct, weightsCDF, sortedWeightsAndPoints) for pct in percent]
-
-    return result
-
-  def _computeSingleWeightedPercentile(self, pct, weightsCDF, sortedWeightsAndPoints):
+    sortedPoints = np.concatenate((sortedPoints[:1], sortedPoints), axis=0)
+    sortedWeights = np.concatenate((np.zeros((1, values.shape[1])), sortedWeights), axis=0)
+    weightsCDF = np.cumsum(sortedWeights, axis=0)
+    weightsCDF /= weightsCDF[-1]
+    if key is not None:
+      self._sortedSamples[key] = sortedPoints, sortedWeights, weightsCDF
+    return sortedPoints, sortedWeights, weightsCDF
+
+  def _sketchWeightedPercentile(self, arrayIn, pbWeight, percent, key=None):
     """
-      Method to compute a single percentile
-      @ In, pct, float, the percentile
-      @ In, weightsCDF, numpy.array, the cumulative sum of weights (CDF)
-      @ In, sortedWeightsAndPoints, numpy.array, array of weights and data points
-      @ Out, result, float, the percentile
+      Method to estimate the weighted percentiles with a streaming quantile sketch (t-digest),
+      feeding the samples by chunks, without sorting the whole array
+      @ In, arrayIn, numpy.array, the array of values, shaped [#samples] or [#samples, #pivotValues]
+      @ In, pbWeight, numpy.array, the reliability weights that correspond to the samples in 'arrayIn'
+      @ In, percent, numpy.array, the percentile(s) that needs to be computed (between 0.01 and 1.0)
+      @ In, key, str, optional, the cache key (e.g. the target name)
+      @ Out, result, numpy.array, [#pivotValues, #percent] the estimated percentile(s)
     """
-
-    # This step returns the index of the array which is < than the percentile, because
-    # the insertion create another entry, this index should shift to the bigger side
-    indexL = utils.first(np.asarray(weightsCDF >= pct).nonzero())[0]
-    # This step returns the indices (list of index) of the array which is > than the percentile
-    indexH = utils.first(np.asarray(weightsCDF > pct).nonzero())
-    try:
-      # if the indices exists that means the desired percentile lies between two data points
-      # with index as indexL and indexH[0]. Calculate the midpoint of these two points
-      result = 0.5*(sortedWeightsAndPoints[indexL,1]+sortedWeightsAndPoints[indexH[0],1])
-    except IndexError:
-      result = sortedWeightsAndPoints[indexL,1]
-
+    # the sketches are cached apart from the sorted samples, which might still be needed (e.g. by expectedShortfall)
+    key = None if key is None else ('sketch', key)
+    if key is not None and key in self._sortedSamples:
+      digests = self._sortedSamples[key]
+    else:
+      values = np.asarray(arrayIn, dtype=float)
+      if values.ndim == 1:
+        values = values[:, np.newaxis]
+      pbWeight = np.asarray(pbWeight, dtype=float)
+      digests = [TDigest(self.percentileSketch) for _ in range(values.shape[1])]
+      # the samples are fed by chunks of the size of the sketch buffer, which are merged without copies
+      chunkSize = digests[0].bufferSize
+      for begin in range(0, values.shape[0], chunkSize):
+        for col, digest in enumerate(digests):
+          digest.update(values[begin:begin+chunkSize, col], pbWeight[begin:begin+chunkSize])
+      if key is not None:
+        self._sortedSamples[key] = digests
+    return np.asarray([digest.quantile(percent) for digest in digests])
+
+  def _computeWeightedPercentile(self,arrayIn,pbWeight,interpolation='linear',percent=[0.5],key=None):
+    """
+      Method to compute the weighted percentile in a array of data
+      @ In, arrayIn, list/numpy.array, the array of values from which the percentile needs to be estimated,
+        shaped [#samples] or [#samples, #pivotValues] (all the pivot values are then computed at once)
+      @ In, pbWeight, list/numpy.array, the reliability weights that correspond to the samples in 'arrayIn'
+      @ In, interpolation, str, 'linear' or 'midpoint'
+      @ In, percent, list/numpy.array, the percentile(s) that needs to be computed (between 0.01 and 1.0)
+      @ In, key, str, optional, the key (e.g. the target name) the sorted samples are cached with,
+        so that they can be reused by the other percentile-based metrics
+      @ Out, result, list or numpy.array, the percentile(s); a list for one-dimensional arrayIn,
+        otherwise an array shaped [#pivotValues, #percent]
+    """
+    oneDim = np.ndim(arrayIn) == 1
+    percent = np.atleast_1d(np.asarray(percent, dtype=float))
+    if self.percentileSketch is not None:
+      # approximated, the interpolation is always linear between the centroids of the sketch
+      result = self._sketchWeightedPercentile(arrayIn, pbWeight, percent, key=key)
+      return result[0].tolist() if oneDim else result
+    sortedPoints, _, weightsCDF = self._sortWeightedSamples(arrayIn, pbWeight, key=key)
+    last = weightsCDF.shape[0] - 1
+    columns = np.arange(weightsCDF.shape[1])
+    result = np.empty((weightsCDF.shape[1], len(percent)))
+    for p, pct in enumerate(percent):
+      if interpolation == 'linear':
+        # same as numpy.interp, for all the columns at once:
+        # find the last CDF entry <= pct and interpolate towards the next one
+        lower = np.count_nonzero(weightsCDF <= pct, axis=0) - 1
+        upper = np.minimum(lower + 1, last)
+        cdfL, cdfH = weightsCDF[lower, columns], weightsCDF[upper, columns]
+        pointL, pointH = sortedPoints[lower, columns], sortedPoints[upper, columns]
+        inside = lower < last
+        slope = np.divide(pointH - pointL, cdfH - cdfL, out=np.zeros(len(columns)), where=inside)
+        result[:, p] = np.where(inside, pointL + slope * (pct - cdfL), sortedPoints[last, columns])
+      elif interpolation == 'midpoint':
+        # the first entry >= than the percentile always exists, since the CDF ends at 1.0;
+        # if there is also an entry > than the percentile, the percentile lies between the two data points
+        indexL = np.argmax(weightsCDF >= pct, axis=0)
+        above = weightsCDF > pct
+        indexH = np.argmax(above, axis=0)
+        pointL = sortedPoints[indexL, columns]
+        result[:, p] = np.where(above.any(axis=0), 0.5 * (pointL + sortedPoints[indexH, columns]), pointL)
+    if oneDim:
+      return result[0].tolist()
     return result
 
   def _runLocal(self, inputData):
@@ -885,9 +958,11 @@ class BasicStatistics(PostProcessorInterface):
             targWeight = relWeight[target].values
             targDa = dataSet[target]
             if self.pivotParameter in targDa.sizes.keys():
-              quantile = [self._computeWeightedPercentile(group.values,targWeight,needed[metric]['interpolation'],percent=[0.5])[0] for label,group in targDa.groupby(self.pivotParameter)]
+              # all the pivot values at once
+              samples = targDa.transpose(self.sampleTag, self.pivotParameter).values
+              quantile = self._computeWeightedPercentile(samples,targWeight,needed[metric]['interpolation'],percent=[0.5],key=target)[:, 0]
             else:
-              quantile = self._computeWeightedPercentile(targDa.values,targWeight,needed[metric]['interpolation'],percent=[0.5])[0]
+              quantile = self._computeWeightedPercentile(targDa.values,targWeight,needed[metric]['interpolation'],percent=[0.5],key=target)[0]
             if self.pivotParameter in targDa.sizes.keys():
               da = xr.DataArray(quantile,dims=(self.pivotParameter),coords={self.pivotParameter:self.pivotValue})
             else:
@@ -1062,13 +1137,12 @@ class BasicStatistics(PostProcessorInterface):
             targWeight = relWeight[target].values
             targDa = dataSet[target]
             if self.pivotParameter in targDa.sizes.keys():
-              quantile = []
-              for label, group in targDa.groupby(self.pivotParameter):
-                qtl = self._computeWeightedPercentile(group.values, targWeight, needed[metric]['interpolation'], percent=percent)
-                quantile.append(qtl)
+              # all the pivot values at once
+              samples = targDa.transpose(self.sampleTag, self.pivotParameter).values
+              quantile = self._computeWeightedPercentile(samples, targWeight, needed[metric]['interpolation'], percent=percent, key=target)
               da = xr.DataArray(quantile, dims=(self.pivotParameter, 'percent'), coords={'percent': percent, self.pivotParameter: self.pivotValue})
             else:
-              quantile = self._computeWeightedPercentile(targDa.values, targWeight, needed[metric]['interpolation'], percent=percent)
+              quantile = self._computeWeightedPercentile(targDa.values, targWeight, needed[metric]['interpolation'], percent=percent, key=target)
               da = xr.DataArray(quantile, dims=('percent'), coords={'percent': percent})
 
             percentileSet[target] = da
@@ -1176,10 +1250,7 @@ class BasicStatistics(PostProcessorInterface):
         featSet = dataSet.sel(**{'variable':features}).values
         targSet = dataSet.sel(**{'variable':targets}).values
         pivotVals = dataSet.coords[self.pivotParameter].values
-        da = None
-        for i in range(len(pivotVals)):
-          ds = self.sensitivityCalculation(features,targets,featSet[i,:,:],targSet[i,:,:],intersectionSet)
-          da = ds if da is None else xr.concat([da,ds], dim=self.pivotParameter)
+        da = self.sensitivityCalculation(features,targets,featSet,targSet,intersectionSet)
         da.coords[self.pivotParameter] = pivotVals
       else:
         # construct target and feature matrices
@@ -1213,15 +1284,11 @@ class BasicStatistics(PostProcessorInterface):
       varianceSet = self._computeVariance(dataSet,meanSet,pbWeight=relWeight,dim=self.sampleTag)
       dataSet = dataSet - meanSet
       if self.pivotParameter in dataSet.sizes.keys():
-        ds = None
+        # construct target and feature matrices, for all the pivot values at once
         paramDA = dataSet.to_array().transpose(self.pivotParameter,'variable',self.sampleTag).values
         varianceDA = varianceSet[targVars].to_array().transpose(self.pivotParameter,'variable').values
         pivotVals = dataSet.coords[self.pivotParameter].values
-        for i in range(len(pivotVals)):
-          # construct target and feature matrices
-          paramSamples = paramDA[i,...]
-          da = self.covarianceCalculation(paramDA[i,...],fact,varianceDA[i,:],targVars)
-          ds = da if ds is None else xr.concat([ds,da], dim=self.pivotParameter)
+        ds = self.covarianceCalculation(paramDA,fact,varianceDA,targVars)
         ds.coords[self.pivotParameter] = pivotVals
         calculations[metric] = ds
       else:
@@ -1252,12 +1319,9 @@ class BasicStatistics(PostProcessorInterface):
       targCoords = reducedCovar.coords['targets'].values
       if self.pivotParameter in reducedCovar.sizes.keys():
         pivotCoords = reducedCovar.coords[self.pivotParameter].values
-        ds = None
-        for label, group in reducedCovar.groupby(self.pivotParameter):
-          corrMatrix = self.corrCoeff(group.values)
-          da = xr.DataArray(corrMatrix, dims=('targets','features'), coords={'targets':targCoords,'features':targCoords})
-          ds = da if ds is None else xr.concat([ds,da], dim=self.pivotParameter)
-        ds.coords[self.pivotParameter] = pivotCoords
+        corrMatrix = self.corrCoeff(reducedCovar.transpose(self.pivotParameter,'targets','features').values)
+        ds = xr.DataArray(corrMatrix, dims=(self.pivotParameter,'targets','features'),
+                          coords={self.pivotParameter:pivotCoords,'targets':targCoords,'features':targCoords})
         calculations[metric] = ds
       else:
         corrMatrix = self.corrCoeff(reducedCovar.values)
@@ -1283,10 +1347,7 @@ class BasicStatistics(PostProcessorInterface):
         featSet = dataSet.sel(**{'variable':features}).values
         targSet = dataSet.sel(**{'variable':targets}).values
         pivotVals = dataSet.coords[self.pivotParameter].values
-        da = None
-        for i in range(len(pivotVals)):
-          ds = self.spearmanCorrelation(features,targets,featSet[i,:,:],targSet[i,:,:],relWeight)
-          da = ds if da is None else xr.concat([da,ds], dim=self.pivotParameter)
+        da = self.spearmanCorrelation(features,targets,featSet,targSet,relWeight)
         da.coords[self.pivotParameter] = pivotVals
       else:
         # construct target and feature matrices
@@ -1310,10 +1371,7 @@ class BasicStatistics(PostProcessorInterface):
       targCoords = reducedCovar.coords['targets'].values
       if self.pivotParameter in reducedCovar.sizes.keys():
         pivotCoords = reducedCovar.coords[self.pivotParameter].values
-        ds = None
-        for label, group in reducedCovar.groupby(self.pivotParameter):
-          da = self.varianceDepSenCalculation(targCoords,group.values)
-          ds = da if ds is None else xr.concat([ds,da], dim=self.pivotParameter)
+        ds = self.varianceDepSenCalculation(targCoords,reducedCovar.transpose(self.pivotParameter,'targets','features').values)
         ds.coords[self.pivotParameter] = pivotCoords
         calculations[metric] = ds
       else:
@@ -1401,31 +1459,71 @@ class BasicStatistics(PostProcessorInterface):
       Unbiased weighted covariance matrix,   weights is not None, bias is 0
       Biased weighted covariance matrix,     weights is not None, bias is 1
       can be calcuated depending on the selection of the inputs.
-      @ In,  covM, numpy.array, [#targets,#targets] covariance matrix
-      @ Out, covM, numpy.array, [#targets,#targets] correlation matrix
+      @ In,  covM, numpy.array, [#targets,#targets] covariance matrix, or [#pivotValues,#targets,#targets]
+      @ Out, covM, numpy.array, [#targets,#targets] correlation matrix, or [#pivotValues,#targets,#targets]
     """
     try:
-      d = np.diag(covM)
+      d = np.diagonal(covM, axis1=-2, axis2=-1)
     except ValueError:
       # scalar covariance
       # nan if incorrect value (nan, inf, 0), 1 otherwise
       return covM / covM
     stdDev = np.sqrt(d)
-    covM /= stdDev[:,None]
-    covM /= stdDev[None,:]
+    covM /= stdDev[...,:,None]
+    covM /= stdDev[...,None,:]
     return covM
 
+  def _matrixDataArray(self, matrix, targVars, featVars):
+    """
+      Wraps a (targets, features) matrix, possibly stacked over the pivot values, into a DataArray
+      @ In, matrix, numpy.ndarray, [#targets, #features] or [#pivotValues, #targets, #features] matrix
+      @ In, targVars, list, list of target variables
+      @ In, featVars, list, list of feature variables
+      @ Out, da, xarray.DataArray, the matrix with its coordinates (but the pivot ones)
+    """
+    dims = ('targets','features') if matrix.ndim == 2 else (self.pivotParameter,'targets','features')
+    da = xr.DataArray(matrix, dims=dims, coords={'targets':targVars,'features':featVars})
+    return da
+
+  def _checkConditionNumber(self, featSamples):
+    """
+      Warns about multicollinearity in the feature samples
+      @ In, featSamples, numpy.ndarray, [#samples, #features] or [#pivotValues, #samples, #features] array of features
+      @ Out, None
+    """
+    condNumber = np.max(np.linalg.cond(featSamples))
+    if condNumber > 30.:
+      self.raiseAWarning("Condition Number: {:10.4f} > 30.0. Detected SEVERE multicollinearity problem. Sensitivity might be incorrect!".format(condNumber))
+
+  @staticmethod
+  def _linearRegressionCoefficients(featSamples, targSamples):
+    """
+      Computes the coefficients of the (least squares, with intercept) linear regression of the targets
+      on the features, for all the pivot values at once
+      @ In, featSamples, numpy.ndarray, [#pivotValues, #samples, #features] array of features
+      @ In, targSamples, numpy.ndarray, [#pivotValues, #samples, #targets] array of targets
+      @ Out, coef, numpy.ndarray, [#pivotValues, #targets, #features] regression coefficients
+    """
+    featCentered = featSamples - featSamples.mean(axis=1, keepdims=True)
+    targCentered = targSamples - targSamples.mean(axis=1, keepdims=True)
+    # minimum norm least squares solution, as in LinearRegression
+    coef = np.linalg.pinv(featCentered) @ targCentered
+    return np.swapaxes(coef, 1, 2)
+
   def sensitivityCalculation(self,featVars, targVars, featSamples, targSamples, intersectionSet):
     """
-      This method computes the sensitivity coefficients based on the SciKitLearn LinearRegression method
+      This method computes the sensitivity coefficients based on linear regression (as the SciKitLearn
+      LinearRegression method), for all the pivot values at once
       @ In, featVars, list, list of feature variables
       @ In, targVars, list, list of target variables
-      @ In, featSamples, numpy.ndarray, [#samples, #features] array of features
-      @ In, targSamples, numpy.ndarray, [#samples, #targets] array of targets
+      @ In, featSamples, numpy.ndarray, [#samples, #features] or [#pivotValues, #samples, #features] array of features
+      @ In, targSamples, numpy.ndarray, [#samples, #targets] or [#pivotValues, #samples, #targets] array of targets
       @ In, intersectionSet, boolean, True if some target variables are in the list of features
       @ Out, da, xarray.DataArray, contains the calculations of sensitivity coefficients
     """
-    from sklearn.linear_model import LinearRegression
+    dynamic = featSamples.ndim == 3
+    if not dynamic:
+      featSamples, targSamples = featSamples[np.newaxis], targSamples[np.newaxis]
     if self.multipleFeatures:
       # intersectionSet is flag that used to check the relationship between the features and targets.
       # If True, part of the target variables are listed in teh feature set, then multivariate linear
@@ -1435,125 +1533,131 @@ class BasicStatistics(PostProcessorInterface):
       # added for the feature set. ~ wangc
 
       if not intersectionSet:
-        condNumber = np.linalg.cond(featSamples)
-        if condNumber > 30.:
-          self.raiseAWarning("Condition Number: {:10.4f} > 30.0. Detected SEVERE multicollinearity problem. Sensitivity might be incorrect!".format(condNumber))
-        senMatrix = LinearRegression().fit(featSamples,targSamples).coef_
+        self._checkConditionNumber(featSamples)
+        senMatrix = self._linearRegressionCoefficients(featSamples, targSamples)
       else:
         # Target variables are in feature variables list, multi-target linear regression can not be used
         # Since the 'multi-colinearity' exists, we need to loop over target variables
         # TODO: Some general methods need to be implemented in order to handle the 'multi-colinearity' -- wangc
-        senMatrix = np.zeros((len(targVars), len(featVars)))
+        senMatrix = np.zeros((featSamples.shape[0], len(targVars), len(featVars)))
         for p, targ in enumerate(targVars):
           ind = list(featVars).index(targ) if targ in featVars else None
           if ind is not None:
-            featMat = np.delete(featSamples,ind,axis=1)
+            featMat = np.delete(featSamples,ind,axis=2)
           else:
             featMat = featSamples
-          regCoeff = LinearRegression().fit(featMat, targSamples[:,p]).coef_
-          condNumber = np.linalg.cond(featMat)
-          if condNumber > 30.:
-            self.raiseAWarning("Condition Number: {:10.4f} > 30.0. Detected SEVERE multicollinearity problem. Sensitivity might be incorrect!".format(condNumber))
+          regCoeff = self._linearRegressionCoefficients(featMat, targSamples[:,:,p:p+1])[:,0,:]
+          self._checkConditionNumber(featMat)
           if ind is not None:
-            regCoeff = np.insert(regCoeff,ind,1.0)
-          senMatrix[p,:] = regCoeff
+            regCoeff = np.insert(regCoeff,ind,1.0,axis=1)
+          senMatrix[:,p,:] = regCoeff
     else:
-      senMatrix = np.zeros((len(targVars), len(featVars)))
-      for p, feat in enumerate(featVars):
-        regCoeff = LinearRegression().fit(featSamples[:,p].reshape(-1,1),targSamples).coef_
-        senMatrix[:,p] = regCoeff[:,0]
-    da = xr.DataArray(senMatrix, dims=('targets','features'), coords={'targets':targVars,'features':featVars})
-
-    return da
+      # one regression per feature, i.e. cov(target, feature) / var(feature)
+      featCentered = featSamples - featSamples.mean(axis=1, keepdims=True)
+      targCentered = targSamples - targSamples.mean(axis=1, keepdims=True)
+      covYX = np.swapaxes(targCentered, 1, 2) @ featCentered
+      varX = (featCentered**2).sum(axis=1)[:, np.newaxis, :]
+      # a constant feature has no effect, as the least squares (minimum norm) solution
+      senMatrix = np.divide(covYX, varX, out=np.zeros(covYX.shape), where=varX > 0)
+    if not dynamic:
+      senMatrix = senMatrix[0]
+    return self._matrixDataArray(senMatrix, targVars, featVars)
 
   def covarianceCalculation(self,paramSamples,fact,variance,targVars):
     """
       This method computes the covariance of given sample matrix
-      @ In, paramSamples, numpy.ndarray, [#parameters, #samples], array of parameters
+      @ In, paramSamples, numpy.ndarray, [#parameters, #samples] or [#pivotValues, #parameters, #samples], array of parameters
       @ In, fact, float, the unbiase correction factor
-      @ In, variance, numpy.ndarray, [#parameters], variance of parameters
+      @ In, variance, numpy.ndarray, [#parameters] or [#pivotValues, #parameters], variance of parameters
       @ In, targVars, list, the list of parameters
       @ Out, da, xarray.DataArray, contains the calculations of covariance
     """
     if self.pbPresent:
-      paramSamplesT = (paramSamples*self.realizationWeight['ProbabilityWeight'].values).T
+      paramSamplesT = np.swapaxes(paramSamples*self.realizationWeight['ProbabilityWeight'].values, -1, -2)
     else:
-      paramSamplesT = paramSamples.T
-    cov = np.dot(paramSamples, paramSamplesT.conj())
+      paramSamplesT = np.swapaxes(paramSamples, -1, -2)
+    cov = paramSamples @ paramSamplesT.conj()
     cov *= fact
-    np.fill_diagonal(cov,variance)
-    da = xr.DataArray(cov, dims=('targets','features'), coords={'targets':targVars,'features':targVars})
-    return da
+    diag = np.arange(len(targVars))
+    cov[..., diag, diag] = variance
+    return self._matrixDataArray(cov, targVars, targVars)
 
   def varianceDepSenCalculation(self,targCoords, cov):
     """
       This method computes the covariance of given sample matrix
       @ In, targCoords, list, the list of parameters
-      @ In, cov, numpy.ndarray, the covariance of parameters
+      @ In, cov, numpy.ndarray, the covariance of parameters, [#parameters, #parameters] or [#pivotValues, #parameters, #parameters]
       @ Out, da, xarray.DataArray, contains the calculations of variance dependent sensitivities
     """
-    senMatrix = np.zeros((len(targCoords), len(targCoords)))
     if self.multipleFeatures:
+      senMatrix = np.zeros(cov.shape)
       for p, param in enumerate(targCoords):
-        covX = np.delete(cov,p,axis=0)
-        covX = np.delete(covX,p,axis=1)
-        covYX = np.delete(cov[p,:],p)
-        sensCoef = np.dot(covYX,np.linalg.pinv(covX))
-        sensCoef = np.insert(sensCoef,p,1.0)
-        senMatrix[p,:] = sensCoef
+        others = np.arange(len(targCoords)) != p
+        covX = cov[..., others, :][..., :, others]
+        covYX = cov[..., p:p+1, others]
+        senMatrix[..., p, others] = (covYX @ np.linalg.pinv(covX))[..., 0, :]
+        senMatrix[..., p, p] = 1.0
     else:
-      for p, param in enumerate(targCoords):
-        covX = cov[p,p]
-        covYX = cov[:,p]
-        sensCoef = covYX / covX
-        senMatrix[:,p] = sensCoef
-    da = xr.DataArray(senMatrix, dims=('targets','features'), coords={'targets':targCoords,'features':targCoords})
-    return da
+      senMatrix = cov / np.diagonal(cov, axis1=-2, axis2=-1)[..., None, :]
+    return self._matrixDataArray(senMatrix, targCoords, targCoords)
 
   def spearmanCorrelation(self, featVars, targVars, featSamples, targSamples, pbWeights):
     """
-      This method computes the spearman correlation coefficients
+      This method computes the spearman correlation coefficients, for all the pivot values at once
       @ In, featVars, list, list of feature variables
       @ In, targVars, list, list of target variables
-      @ In, featSamples, numpy.ndarray, [#samples, #features] array of features
-      @ In, targSamples, numpy.ndarray, [#samples, #targets] array of targets
+      @ In, featSamples, numpy.ndarray, [#samples, #features] or [#pivotValues, #samples, #features] array of features
+      @ In, targSamples, numpy.ndarray, [#samples, #targets] or [#pivotValues, #samples, #targets] array of targets
       @ In, pbWeights, dataset, probability weights
       @ Out, da, xarray.DataArray, contains the calculations of spearman coefficients
     """
-    spearmanMat = np.zeros((len(targVars), len(featVars)))
-    wf, wt = None, None
+    dynamic = featSamples.ndim == 3
+    if not dynamic:
+      featSamples, targSamples = featSamples[np.newaxis], targSamples[np.newaxis]
+    numSamples = featSamples.shape[1]
     # compute unbiased factor
     if self.pbPresent:
       fact = (self.__computeUnbiasedCorrection(2, self.realizationWeight)).to_array().values if not self.biased else 1.0
       vp = self.__computeVp(1,self.realizationWeight)['ProbabilityWeight'].values
       varianceFactor = fact*(1.0/vp)
+      wf = np.stack([np.asarray(pbWeights[feat], dtype=float) for feat in featVars], axis=1)
+      wt = np.stack([np.asarray(pbWeights[target], dtype=float) for target in targVars], axis=1)
     else:
-      fact = 1.0 / (float(featSamples.shape[0]) - 1.0) if not self.biased else 1.0 / float(featSamples.shape[0])
+      fact = 1.0 / (float(numSamples) - 1.0) if not self.biased else 1.0 / float(numSamples)
       varianceFactor = fact
-
-    for tidx, target in enumerate(targVars):
-      for fidx, feat in enumerate(featVars):
-        if self.pbPresent:
-          wf, wt = np.asarray(pbWeights[feat]), np.asarray(pbWeights[target])
-        rankFeature, rankTarget = mathUtils.rankData(featSamples[:,fidx],wf),  mathUtils.rankData(targSamples[:,tidx],wt)
-        # compute covariance of the ranked features
-        cov  = np.cov(rankFeature, y=rankTarget, aweights=wt)
-        covF = np.cov(rankFeature,y=rankFeature, aweights=wf)
-        covT = np.cov(rankTarget,y=rankTarget, aweights=wf)
-        # apply correction factor (for biased or unbiased) (off diagonal)
-        cov[~np.eye(2,dtype=bool)] *= fact
-        covF[~np.eye(2,dtype=bool)] *= fact
-        covT[~np.eye(2,dtype=bool)] *= fact
-        # apply correction factor (for biased or unbiased) (diagonal)
-        cov[np.eye(2,dtype=bool)] *= varianceFactor
-        covF[~np.eye(2,dtype=bool)] *= varianceFactor
-        covT[~np.eye(2,dtype=bool)] *= varianceFactor
-        # now we can compute the pearson of such pairs
-        spearman = (cov / np.sqrt(covF * covT))[-1,0]
-        spearmanMat[tidx,fidx] = spearman
-
-    da = xr.DataArray(spearmanMat, dims=('targets','features'), coords={'targets':targVars,'features':featVars})
-    return da
+      wf = np.ones((numSamples, len(featVars)))
+      wt = np.ones((numSamples, len(targVars)))
+    # rank each variable only once (for each pivot value)
+    rankFeature = np.empty(featSamples.shape)
+    rankTarget = np.empty(targSamples.shape)
+    for i in range(featSamples.shape[0]):
+      for fidx in range(len(featVars)):
+        rankFeature[i,:,fidx] = mathUtils.rankData(featSamples[i,:,fidx], wf[:,fidx])
+      for tidx in range(len(targVars)):
+        rankTarget[i,:,tidx] = mathUtils.rankData(targSamples[i,:,tidx], wt[:,tidx])
+    # weighted (co)variances of the ranks, normalized as numpy.cov with analytic weights, i.e.
+    #   sum(w*(x-<x>)*(y-<y>)) / (sum(w) - sum(w**2)/sum(w))
+    # the covariance of each feature-target pair uses the target weights, while both the variances
+    # of the pair use the feature weights
+    sumF, sumT = wf.sum(axis=0), wt.sum(axis=0)
+    normF, normT = sumF - (wf**2).sum(axis=0)/sumF, sumT - (wt**2).sum(axis=0)/sumT
+    weightedTarget = wt * rankTarget
+    covFT = np.swapaxes(weightedTarget, 1, 2) @ rankFeature
+    covFT -= weightedTarget.sum(axis=1)[:, :, None] * (wt.T @ rankFeature) / sumT[None, :, None]
+    covFT /= normT[None, :, None]
+    varF = np.einsum('nf,pnf->pf', wf, rankFeature**2) - np.einsum('nf,pnf->pf', wf, rankFeature)**2 / sumF
+    varF /= normF
+    varT = np.swapaxes(rankTarget**2, 1, 2) @ wf - (np.swapaxes(rankTarget, 1, 2) @ wf)**2 / sumF
+    varT /= normF
+    # apply correction factor (for biased or unbiased)
+    covFT *= fact
+    varF = varF * fact * varianceFactor
+    varT = varT * fact * varianceFactor
+    # now we can compute the pearson of such pairs
+    spearmanMat = covFT / np.sqrt(varF[:, None, :] * varT)
+    if not dynamic:
+      spearmanMat = spearmanMat[0]
+    return self._matrixDataArray(spearmanMat, targVars, featVars)
 
   def run(self, inputIn):
     """
@@ -1562,7 +1666,9 @@ class BasicStatistics(PostProcessorInterface):
       @ Out, outputSet, xarray.Dataset or dictionary, dataset or dictionary containing the results
     """
     inputData = self.inputToInternal(inputIn)
+    self._sortedSamples = {}
     outputSet = self._runLocal(inputData)
+    self._sortedSamples = {}
     return outputSet
 
   def collectOutput(self, finishedJob, output):
@@ -25,7 +25,6 @@ import scipy.stats as stats
 #Internal Modules---------------------------------------------------------------
 from .PostProcessorInterface import PostProcessorInterface
 from .BasicStatistics import BasicStatistics
-from ...utils import utils
 from ...utils import InputData, InputTypes
 #Internal Modules End-----------------------------------------------------------
 
@@ -306,22 +305,6 @@ class EconomicRatio(BasicStatistics):
 
     return valsToAdd
 
-  def _computeSortedWeightsAndPoints(self,arrayIn,pbWeight,percent):
-    """
-      Method to compute the sorted weights and points
-      @ In, arrayIn, list/numpy.array, the array of values from which the percentile needs to be estimated
-      @ In, pbWeight, list/numpy.array, the reliability weights that correspond to the values in 'array'
-      @ In, percent, float, the percentile that needs to be computed (between 0.01 and 1.0)
-      @ Out, sortedWeightsAndPoints, list/numpy.array, with [:,0] as the value of the probability density function at the bin, normalized, and [:,1] is the coresonding edge of the probability density function.
-      @ Out, indexL, index of the lower quantile
-    """
-
-    idxs                   = np.argsort(np.asarray(list(zip(pbWeight,arrayIn)))[:,1])
-    sortedWeightsAndPoints = np.asarray(list(zip(pbWeight[idxs],arrayIn[idxs])))
-    weightsCDF             = np.cumsum(sortedWeightsAndPoints[:,0])
-    indexL = utils.first(np.asarray(weightsCDF >= percent).nonzero())[0]
-    return sortedWeightsAndPoints, indexL
-
   def __runLocal(self, inputData):
     """
       This method executes the postprocessor action. In this case, it computes all the requested statistical FOMs
@@ -435,18 +418,15 @@ class EconomicRatio(BasicStatistics):
           for target in needed[metric]['targets']:
             targWeight = relWeight[target].values
             targDa = dataSet[target]
+            # the sorted samples are shared with the other percentile-based metrics of the target
             if self.pivotParameter in targDa.sizes.keys():
-              VaRList = []
-              for label, group in targDa.groupby(self.pivotParameter):
-                VaR = self._computeWeightedPercentile(group.values, targWeight, needed[metric]['interpolation'], percent=threshold)
-                for i in len(VaR):
-                  VaR[i] = -VaR[i]
-                VaRList.append(VaR)
-              da = xr.DataArray(VaRList, dims=('threshold',self.pivotParameter), coords={'threshold':threshold, self.pivotParameter:self.pivotValue})
+              # all the pivot values at once
+              samples = targDa.transpose(self.sampleTag, self.pivotParameter).values
+              VaR = -self._computeWeightedPercentile(samples, targWeight, needed[metric]['interpolation'], percent=threshold, key=target)
+              da = xr.DataArray(VaR.T, dims=('threshold',self.pivotParameter), coords={'threshold':threshold, self.pivotParameter:self.pivotValue})
             else:
-              VaRList = self._computeWeightedPercentile(targDa.values, targWeight, needed[metric]['interpolation'], percent=threshold)
-              for i in len(VaRList):
-                VaRList[i] = -VaRList[i]
+              VaRList = self._computeWeightedPercentile(targDa.values, targWeight, needed[metric]['interpolation'], percent=threshold, key=target)
+              VaRList = [-VaR for VaR in VaRList]
               da = xr.DataArray(VaRList, dims=('threshold'), coords={'threshold':threshold})
 
             VaRSet[target] = da
@@ -547,29 +527,27 @@ class EconomicRatio(BasicStatistics):
       for target in needed[metric]['targets']:
         targWeight = relWeight[target].values
         targDa = dataSet[target]
-        CVaRList = []
-        for thd in threshold:
-          if self.pivotParameter in targDa.sizes.keys():
-            subCVaR = []
-            for label, group in targDa.groupby(self.pivotParameter):
-              sortedWeightsAndPoints, indexL = self._computeSortedWeightsAndPoints(group.values, targWeight,thd)
-              quantile = self._computeWeightedPercentile(group.values, targWeight, needed[metric]['interpolation'], percent=[thd])[0]
-              lowerPartialE = np.sum(sortedWeightsAndPoints[:indexL, 0]*sortedWeightsAndPoints[:indexL,1])
-              lowerPartialP = np.sum(sortedWeightsAndPoints[:indexL,0])
-              Es = lowerPartialE + quantile*(thd - lowerPartialP)
-              subCVaR.append(-Es/(thd))
-            CVaRList.append(subCVaR)
-          else:
-            sortedWeightsAndPoints, indexL = self._computeSortedWeightsAndPoints(targDa.values,targWeight,thd)
-            quantile = self._computeWeightedPercentile(targDa.values,targWeight,needed[metric]['interpolation'],percent=[thd])[0]
-            lowerPartialE = np.sum(sortedWeightsAndPoints[:indexL,0]*sortedWeightsAndPoints[:indexL,1])
-            lowerPartialP = np.sum(sortedWeightsAndPoints[:indexL,0])
-            Es = lowerPartialE + quantile*(thd -lowerPartialP)
-            CVaRList.append(-Es/(thd))
+        if self.pivotParameter in targDa.sizes.keys():
+          samples = targDa.transpose(self.sampleTag, self.pivotParameter).values
+        else:
+          samples = targDa.values
+        # the samples are sorted once for all the thresholds (and pivot values), and shared with
+        # the other percentile-based metrics of the target
+        quantile = np.atleast_2d(self._computeWeightedPercentile(samples, targWeight, needed[metric]['interpolation'], percent=threshold, key=target))
+        sortedPoints, sortedWeights, _ = self._sortWeightedSamples(samples, targWeight, key=target)
+        # lower partial expectations and probabilities, for all the sorted samples
+        lowerPartialE = np.cumsum(sortedWeights*sortedPoints, axis=0)
+        lowerPartialP = np.cumsum(sortedWeights, axis=0)
+        CVaRList = np.empty((len(threshold), sortedPoints.shape[1]))
+        for col in range(sortedPoints.shape[1]):
+          # samples below the first one whose cumulative probability is >= than the threshold
+          indexL = np.searchsorted(lowerPartialP[:, col], threshold, side='left') - 1
+          Es = lowerPartialE[indexL, col] + quantile[col]*(np.asarray(threshold) - lowerPartialP[indexL, col])
+          CVaRList[:, col] = -Es/np.asarray(threshold)
         if self.pivotParameter in targDa.sizes.keys():
           da = xr.DataArray(CVaRList,dims=('threshold',self.pivotParameter),coords={'threshold':threshold,self.pivotParameter:self.pivotValue})
         else:
-          da = xr.DataArray(CVaRList,dims=('threshold'),coords={'threshold':threshold})
+          da = xr.DataArray(CVaRList[:, 0],dims=('threshold'),coords={'threshold':threshold})
         CVaRSet[target] = da
       calculations[metric] = CVaRSet
     #
@@ -735,12 +713,15 @@ class EconomicRatio(BasicStatistics):
       @ In,  inputIn, object, object contained the data to process. (inputToInternal output)
       @ Out, outputSet, xarray.Dataset or dictionary, dataset or dictionary containing the results
     """
+    inputData = self.inputToInternal(inputIn)
+    # the sorted samples are shared by the percentile-based metrics of BasicStatistics and EconomicRatio
+    self._sortedSamples = {}
     # get metrics from BasicStatistics
-    outputSetBasicStatistics = BasicStatistics.run(self, inputIn)
+    outputSetBasicStatistics = self._runLocal(inputData)
 
     # get metrics from EconomicRatio
-    inputData = self.inputToInternal(inputIn)
     outputSet = self.__runLocal(inputData)
+    self._sortedSamples = {}
 
     # combine results
     if isinstance(outputSet, dict):
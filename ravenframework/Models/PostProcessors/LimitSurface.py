@@ -18,7 +18,6 @@ Created on July 10, 2013
 """
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
-import copy
 from collections import OrderedDict
 #External Modules End--------------------------------------------------------------------------------
 
@@ -367,10 +366,9 @@ class LimitSurface(PostProcessorInterface):
       self.raiseADebug('LimitSurface: Prediction performed')
       # here next the points that are close to any change are detected by a gradient (it is a pre-screener)
       if self.nVar > 1:
-        toBeTested = np.squeeze(np.dstack(np.nonzero(np.sum(np.abs(np.gradient(self.testMatrix[nodeName])), axis = 0))))
+        toBeTested = np.argwhere(np.sum(np.abs(np.gradient(self.testMatrix[nodeName])), axis = 0))
       else:
-        toBeTested = np.squeeze(np.dstack(np.nonzero(np.abs(np.gradient(self.testMatrix[nodeName])))))
-      toBeTested = np.atleast_2d(toBeTested).T if self.nVar == 1 else toBeTested
+        toBeTested = np.argwhere(np.abs(np.gradient(self.testMatrix[nodeName])))
       #printing----------------------
       self.raiseADebug('LimitSurface:  Limit surface candidate points')
       if self.getVerbosity() == 'debug':
@@ -410,9 +408,9 @@ class LimitSurface(PostProcessorInterface):
     if self.name != exceptionGrid:
       self.listSurfPointNegative, self.listSurfPointPositive = listSurfPoint[self.name][:nNegPoints-1],listSurfPoint[self.name][nNegPoints:]
     if merge == True:
-      evals = np.hstack(evaluations.values())
-      listSurfPoints = np.hstack(listSurfPoint.values())
-      surfPoint = np.hstack(self.surfPoint.values())
+      evals = np.hstack(list(evaluations.values()))
+      listSurfPoints = np.hstack(list(listSurfPoint.values()))
+      surfPoint = np.hstack(list(self.surfPoint.values()))
       returnSurface = (surfPoint, evals, listSurfPoints) if returnListSurfCoord else (surfPoint, evals)
     else:
       returnSurface = (self.surfPoint, evaluations, listSurfPoint) if returnListSurfCoord else (self.surfPoint, evaluations)
@@ -423,34 +421,44 @@ class LimitSurface(PostProcessorInterface):
       It returns the list of points belonging to the limit state surface and resulting in
       positive or negative responses by the ROM, depending on whether ''sign''
       equals either -1 or 1, respectively.
-      @ In, toBeTested, np.ndarray, the nodes to be tested
+      @ In, toBeTested, np.ndarray, the nodes to be tested (shape (nPoints, nVar))
       @ In, sign, int, the sign that should be tested (-1 or +1)
       @ In, nodeName, string, the sub-grid name
       @ Out, listSurfPoint, list, the list of limit surface coordinates
     """
-    #TODO: This approach might be extremely slow. It must be replaced with matrix operations
-    listSurfPoint = []
-    gridShape = self.gridEntity.returnParameter("gridShape",nodeName)
-    myIdList = np.zeros(self.nVar,dtype=int)
-    putIt = np.zeros(self.nVar,dtype=bool)
-    for coordinate in np.rollaxis(toBeTested, 0):
-      myIdList[:] = coordinate
-      putIt[:]    = False
-      if self.testMatrix[nodeName][tuple(coordinate)] * sign > 0:
-        for iVar in range(self.nVar):
-          if coordinate[iVar] + 1 < gridShape[iVar]:
-            myIdList[iVar] += 1
-            if self.testMatrix[nodeName][tuple(myIdList)] * sign <= 0:
-              putIt[iVar] = True
-              listSurfPoint.append(copy.copy(coordinate))
-              break
-            myIdList[iVar] -= 1
-            if coordinate[iVar] > 0:
-              myIdList[iVar] -= 1
-              if self.testMatrix[nodeName][tuple(myIdList)] * sign <= 0:
-                putIt[iVar] = True
-                listSurfPoint.append(copy.copy(coordinate))
-                break
-              myIdList[iVar] += 1
-      #if len(set(putIt)) == 1 and  list(set(putIt))[0] == True: listSurfPoint.append(copy.copy(coordinate))
-    return listSurfPoint
+    if len(toBeTested) == 0:
+      return []
+    onSurface = self.__limitStateMask(self.testMatrix[nodeName], sign)
+    return list(toBeTested[onSurface[tuple(toBeTested.T)]])
+
+  @staticmethod
+  def __limitStateMask(testMatrix, sign):
+    """
+      Flags the nodes of a (sub-)grid that belong to the limit state surface on the ''sign'' side:
+      the nodes whose response has the requested sign and that have at least one first neighbor
+      (along any axis) whose response does not. The neighbors are compared shifting the whole
+      test matrix along each axis. As in the original node-by-node search, the nodes on the upper
+      edge of an axis are not compared with any neighbor along that axis.
+      @ In, testMatrix, np.ndarray, the N-D array of the responses on the grid nodes
+      @ In, sign, int, the sign that should be tested (-1 or +1)
+      @ Out, onSurface, np.ndarray, N-D boolean array, True for the nodes on the limit surface
+    """
+    values = testMatrix * sign
+    inside = values > 0
+    outside = values <= 0
+    changes = np.zeros(values.shape, dtype=bool)
+    for axis in range(values.ndim):
+      lower = [slice(None)] * values.ndim
+      upper = [slice(None)] * values.ndim
+      inner = [slice(None)] * values.ndim
+      below = [slice(None)] * values.ndim
+      lower[axis] = slice(None, -1)
+      upper[axis] = slice(1, None)
+      inner[axis] = slice(1, -1)
+      below[axis] = slice(None, -2)
+      # neighbor in the positive direction of the axis
+      changes[tuple(lower)] |= outside[tuple(upper)]
+      # neighbor in the negative direction of the axis, only where the positive one exists
+      changes[tuple(inner)] |= outside[tuple(below)]
+    onSurface = inside & changes
+    return onSurface
@@ -19,6 +19,7 @@ Created on July 10, 2013
 import numpy as np
 import xarray
 import math
+from scipy import stats
 
 from .PostProcessorInterface import PostProcessorInterface
 from ...utils import InputData, InputTypes
@@ -60,6 +61,12 @@ class LimitSurfaceIntegral(PostProcessorInterface):
     LSIIntegralTypeInput = InputData.parameterInputFactory("integralType", contentType=InputTypes.StringType)
     inputSpecification.addSub(LSIIntegralTypeInput)
 
+    LSIBatchSizeInput = InputData.parameterInputFactory("batchSize", contentType=InputTypes.IntegerType)
+    inputSpecification.addSub(LSIBatchSizeInput)
+
+    LSIConfidenceInput = InputData.parameterInputFactory("confidence", contentType=InputTypes.FloatType)
+    inputSpecification.addSub(LSIConfidenceInput)
+
     LSISeedInput = InputData.parameterInputFactory("seed", contentType=InputTypes.IntegerType)
     inputSpecification.addSub(LSISeedInput)
 
@@ -85,7 +92,9 @@ class LimitSurfaceIntegral(PostProcessorInterface):
     self.variableDist = {}  # dictionary created upon the .xml input file reading. It stores the distributions for each variable.
     self.target = None  # target that defines the f(x1,x2,...,xn)
     self.tolerance = 0.0001  # integration tolerance
-    self.integralType = 'montecarlo'  # integral type (which alg needs to be used). Either montecarlo or quadrature(quadrature not yet)
+    self.integralType = 'montecarlo'  # integral type (which alg needs to be used). Either montecarlo or quasimontecarlo
+    self.batchSize = None  # number of samples drawn and evaluated at once (if None, montecarlo draws all the samples in one shot)
+    self.confidence = 0.95  # confidence level of the tolerance (used when the samples are drawn in batches)
     self.seed = 20021986  # seed for montecarlo
     self.matrixDict = {}  # dictionary of arrays and target
     self.computeErrrorBounds = False #  compute the bounding error?
@@ -131,17 +140,22 @@ class LimitSurfaceIntegral(PostProcessorInterface):
           self.raiseAnError(ValueError, "tolerance can not be converted into a float value!")
       elif child.getName() == 'integralType':
         self.integralType = child.value.strip().lower()
-        if self.integralType not in ['montecarlo']:
-          self.raiseAnError(IOError, 'only one integral types are available: MonteCarlo!')
+        if self.integralType not in ['montecarlo', 'quasimontecarlo']:
+          self.raiseAnError(IOError, 'only two integral types are available: MonteCarlo and QuasiMonteCarlo!')
+      elif child.getName() == 'batchSize':
+        self.batchSize = child.value
+        if self.batchSize < 1:
+          self.raiseAnError(IOError, 'batchSize must be a positive integer!')
+      elif child.getName() == 'confidence':
+        self.confidence = child.value
+        if not 0. < self.confidence < 1.:
+          self.raiseAnError(IOError, 'confidence must be in (0,1)!')
       elif child.getName() == 'seed':
         try:
           self.seed = child.value
         except ValueError:
           self.raiseAnError(ValueError, 'seed can not be converted into a int value!')
-        if self.integralType != 'montecarlo':
-          self.raiseAWarning('integral type is ' + self.integralType + ' but a seed has been inputted!!!')
-        else:
-          np.random.seed(self.seed)
+        np.random.seed(self.seed)
       elif child.getName() == 'target':
         self.target = child.value
       elif child.getName() == 'outputName':
@@ -157,6 +171,9 @@ class LimitSurfaceIntegral(PostProcessorInterface):
             self.raiseAnError(NameError, 'either a distribution name or lowerBound and upperBound need to be specified for variable ' + varName)
     if self.computationPrefix is None:
       self.raiseAnError(IOError,'The required XML node <outputName> has not been inputted!!!')
+    if self.integralType == 'quasimontecarlo' and self.batchSize is None:
+      # the batches are the randomized replicates of the quasi-random sequence, their size is better a power of 2
+      self.batchSize = 4096
     if self.target is None:
       self.raiseAWarning('integral target has not been provided. The postprocessor is going to take the last output it finds in the provided limitsurface!!!')
     True
@@ -246,20 +263,78 @@ class LimitSurfaceIntegral(PostProcessorInterface):
       @ Out, boundError, float, optional, error bound (maximum error of the computed probability)
     """
     pb, boundError = None, None
-    if self.integralType == 'montecarlo':
-      tempDict = {}
+    if self.integralType == 'montecarlo' and self.batchSize is None:
       randomMatrix = np.random.rand(int(math.ceil(1.0 / self.tolerance**2)), len(self.variableDist.keys()))
-      for index, varName in enumerate(self.variableDist.keys()):
-        if self.variableDist[varName] == None:
-          randomMatrix[:, index] = randomMatrix[:, index] * (self.lowerUpperDict[varName]['upperBound'] - self.lowerUpperDict[varName]['lowerBound']) + self.lowerUpperDict[varName]['lowerBound']
-        else:
-          randomMatrix[:, index] = self.variableDist[varName].ppf(randomMatrix[:, index])  # previously used np.vectorize in the calculation, but this is faster with scipy distributions
-        tempDict[varName] = randomMatrix[:, index]
+      tempDict = self._toIntegrationDomain(randomMatrix)
       pb = self.stat.run({'targets':{self.target:xarray.DataArray(self.functionS.evaluate(tempDict)[self.target])}})[self.computationPrefix +"_"+self.target]
       if self.errorModel:
         boundError = abs(pb-self.stat.run({'targets':{self.target:xarray.DataArray(self.errorModel.evaluate(tempDict)[self.target])}})[self.computationPrefix +"_"+self.target])
+    elif self.integralType in ['montecarlo', 'quasimontecarlo']:
+      pb, boundError = self._batchedIntegral()
     else:
-      self.raiseAnError(NotImplemented, "quadrature not yet implemented")
+      self.raiseAnError(NotImplementedError, "quadrature not yet implemented")
+    return pb, boundError
+
+  def _toIntegrationDomain(self, randomMatrix):
+    """
+      Maps samples in the unit hypercube into the integration domain (in place)
+      @ In, randomMatrix, np.ndarray, the samples in the unit hypercube (nSamples, nVars)
+      @ Out, tempDict, dict, the samples of each variable {varName: np.ndarray}
+    """
+    tempDict = {}
+    for index, varName in enumerate(self.variableDist.keys()):
+      if self.variableDist[varName] == None:
+        randomMatrix[:, index] = randomMatrix[:, index] * (self.lowerUpperDict[varName]['upperBound'] - self.lowerUpperDict[varName]['lowerBound']) + self.lowerUpperDict[varName]['lowerBound']
+      else:
+        randomMatrix[:, index] = self.variableDist[varName].ppf(randomMatrix[:, index])  # previously used np.vectorize in the calculation, but this is faster with scipy distributions
+      tempDict[varName] = randomMatrix[:, index]
+    return tempDict
+
+  def _batchedIntegral(self):
+    """
+      Computes the integral drawing and evaluating the samples in batches of fixed size, so that the memory
+      usage does not depend on the tolerance. The probability and its variance are accumulated batch by batch
+      and the integration stops as soon as the confidence interval is narrower than the tolerance
+      (or when the 1/tolerance^2 samples of the one-shot integration have been used).
+      For quasimontecarlo, each batch is an independently scrambled Sobol' sequence and the variance
+      is estimated from the spread of the batch means.
+      @ In, None
+      @ Out, pb, float, integral outcome (probability of the event)
+      @ Out, boundError, float, error bound (maximum error of the computed probability), None if not requested
+    """
+    nVars = len(self.variableDist.keys())
+    maxSamples = int(math.ceil(1.0 / self.tolerance**2))
+    zScore = stats.norm.ppf(0.5 + 0.5 * self.confidence)
+    nSamples, sumPb, sumError = 0, 0.0, 0.0
+    batchMeans = []
+    converged = False
+    while nSamples < maxSamples and not converged:
+      if self.integralType == 'quasimontecarlo':
+        engine = stats.qmc.Sobol(nVars, scramble=True, seed=np.random.randint(2**31 - 1))
+        randomMatrix = engine.random(self.batchSize)
+      else:
+        randomMatrix = np.random.rand(min(self.batchSize, maxSamples - nSamples), nVars)
+      tempDict = self._toIntegrationDomain(randomMatrix)
+      batchSum = float(np.sum(self.functionS.evaluate(tempDict)[self.target]))
+      if self.errorModel:
+        sumError += float(np.sum(self.errorModel.evaluate(tempDict)[self.target]))
+      sumPb += batchSum
+      nSamples += len(randomMatrix)
+      batchMeans.append(batchSum / len(randomMatrix))
+      if self.integralType == 'quasimontecarlo':
+        if len(batchMeans) < 2:
+          continue
+        stdError = np.std(batchMeans, ddof=1) / math.sqrt(len(batchMeans))
+      else:
+        # variance of the Bernoulli trials, regularized so that a batch with no (or only) events does not stop the integration
+        regularized = (sumPb + 1.0) / (nSamples + 2.0)
+        stdError = math.sqrt(regularized * (1.0 - regularized) / nSamples)
+      converged = zScore * stdError <= self.tolerance
+    pb = sumPb / nSamples
+    self.raiseADebug('Limit surface integral computed with {} samples (converged: {})'.format(nSamples, converged))
+    if not converged:
+      self.raiseAWarning('The limit surface integral did not reach the requested tolerance with {} samples!'.format(nSamples))
+    boundError = abs(pb - sumError / nSamples) if self.errorModel else None
     return pb, boundError
 
   def collectOutput(self, finishedJob, output):
@@ -16,12 +16,12 @@
   @ Authors: Mohammad Abdo (@Jimmy-INL)
              Niharika Karnik (@nkarnik)
 '''
-import pysensors as ps
 import numpy as np
 import xarray as xr
 
 from .PostProcessorReadyInterface import PostProcessorReadyInterface
-from ...utils import InputData, InputTypes
+from ...utils import InputData, InputTypes, importerUtils
+ps = importerUtils.importModuleLazyRenamed('ps', globals(), 'pysensors')
 
 class SparseSensing(PostProcessorReadyInterface):
   """
@@ -26,13 +26,13 @@
 import numpy as np
 import xarray as xr
 from scipy import stats
-from sklearn.linear_model import OrthogonalMatchingPursuit
-from sklearn.neighbors import KNeighborsRegressor
-from sklearn.preprocessing import StandardScaler
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
-from ravenframework.utils import InputData, InputTypes
+from ravenframework.utils import InputData, InputTypes, importerUtils
+linear_model = importerUtils.importModuleLazyRenamed('linear_model', globals(), 'sklearn.linear_model')
+neighbors = importerUtils.importModuleLazyRenamed('neighbors', globals(), 'sklearn.neighbors')
+preprocessing = importerUtils.importModuleLazyRenamed('preprocessing', globals(), 'sklearn.preprocessing')
 from .. import ValidationBase
 #Internal Modules End--------------------------------------------------------------------------------
 
@@ -196,7 +196,7 @@ class PhysicsGuidedCoverageMapping(ValidationBase):
         # OrthogonalMatchingPursuit from sklearn used here
         # Possibly change to other regressors
         elif yExpStd.shape[1]>1:
-          regrExp = OrthogonalMatchingPursuit(fit_intercept=False).fit(yExpStd, yAppStd)
+          regrExp = linear_model.OrthogonalMatchingPursuit(fit_intercept=False).fit(yExpStd, yAppStd)
           yExpReg = regrExp.predict(yExpStd)
           # Combine measurements by multiple Experiment regression
           yMsrReg = regrExp.predict(yMsrStd)
@@ -278,11 +278,11 @@ class PhysicsGuidedCoverageMapping(ValidationBase):
           expM = expM.reshape(1, expM.shape[0])
       # Scale exp data with its mean (mu) and standard deviation (std).  [expS = (exp - mu)/std]
       # Scale expM data with by same mu and std. [expMS = (expM - mu)/std]
-      scaler = StandardScaler()
+      scaler = preprocessing.StandardScaler()
       expS = scaler.fit_transform(exp)
       expMS = scaler.transform(expM)
       # Fit KNN regression model
-      model = KNeighborsRegressor(n_neighbors=k, metric=Metric)
+      model = neighbors.KNeighborsRegressor(n_neighbors=k, metric=Metric)
       model.fit(expS, app)
       # Predict on measurement set
       appPred = model.predict(expMS)
@@ -456,6 +456,28 @@ class ROM(Dummy):
       resultsDict[k] = np.atleast_1d(v)
     return resultsDict
 
+  def evaluateBatch(self, request, numSamples):
+    """
+      Evaluates the same request several times at once (e.g. to generate several synthetic histories from a
+      stochastic ROM). ROMs that support it evaluate all the realizations together.
+      @ In, request, datatype, feature coordinates (request)
+      @ In, numSamples, int, number of evaluations
+      @ Out, results, list(dict), the dicts containing the outputs for each target ({'target1':np.array(size 1 or n_ts),'target2':np.array(...)}
+    """
+    if not self.segment and len(self.supervisedContainer) > 1:
+      return [self.evaluate(request) for _ in range(numSamples)]
+    request = self._inputToInternal(request)
+    if self.pickled:
+      self.raiseAnError(RuntimeError,'ROM "', self.name, '" has not been loaded yet!  Use an IOStep to load it.')
+    if not self.amITrained:
+      self.raiseAnError(RuntimeError, "ROM ", self.name, " has not been trained yet and, consequentially, can not be evaluated!")
+    results = self.supervisedContainer[0].evaluateBatch(request, numSamples)
+    # assure numpy array formatting
+    for resultsDict in results:
+      for k,v in resultsDict.items():
+        resultsDict[k] = np.atleast_1d(v)
+    return results
+
   def derivatives(self, request, feats = None, order=1):
     """
       This method is aimed to evaluate the derivatives using this ROM
@@ -24,7 +24,7 @@ import scipy.optimize as sciopt
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
-from ..utils import InputData, InputTypes, mathUtils
+from ..utils import InputData, InputTypes, mathUtils, randomUtils
 from .RavenSampled import RavenSampled
 from .acquisitionFunctions import factory as acqFactory
 #Internal Modules End--------------------------------------------------------------------------------
@@ -75,7 +75,9 @@ class BayesianOptimizer(RavenSampled):
                                                   descr=r"""An optional node allowing the user to specify the details of model selection.
                                                   For example, the manner in which hyperparameters are selected for the GPR model.""")
     modelSelect.addSub(InputData.parameterInputFactory('Duration', contentType=InputTypes.IntegerType,
-                                                       descr=r"""Number of iterations between each reselection of the model. Default is 1"""))
+                                                       descr=r"""Number of iterations between each reselection of the model.
+                                                       Between two reselections, the model is conditioned on the new samples
+                                                       without changing its hyperparameters (incremental update). Default is 1"""))
     modelSelect.addSub(InputData.parameterInputFactory('Method', contentType=InputTypes.makeEnumType("Method", "MethodType", ['External', 'Internal', 'Average']),
                                                        descr=r"""Determines methodology for selecting the model. This methodology is applied
                                                        after every duration length.
@@ -86,6 +88,26 @@ class BayesianOptimizer(RavenSampled):
                                                        \end{itemize}. Default is Internal""", default='Internal'))
     specs.addSub(modelSelect)
 
+    # Batch (parallel) acquisition
+    batchAcq = InputData.parameterInputFactory('BatchAcquisition', strictMode=True,
+                                               printPriority=107,
+                                               descr=r"""An optional node allowing the user to select several samples at each
+                                               iteration, to be evaluated in parallel. The samples of a batch are selected one
+                                               at a time, conditioning the model on a fantasized observation at each selected
+                                               point, so that the next selections look elsewhere.""")
+    batchAcq.addSub(InputData.parameterInputFactory('Size', contentType=InputTypes.IntegerType,
+                                                    descr=r"""Number of samples selected at each iteration. Default is 1"""))
+    batchAcq.addSub(InputData.parameterInputFactory('Strategy', contentType=InputTypes.makeEnumType("Strategy", "StrategyType",
+                                                    ['KrigingBeliever', 'ConstantLiarMin', 'ConstantLiarMean', 'ConstantLiarMax']),
+                                                    descr=r"""Determines the fantasized observation at each selected point of a batch.
+                                                    \begin{itemize}
+                                                    \item KrigingBeliever, the prediction of the model
+                                                    \item ConstantLiarMin, the minimum of the observations
+                                                    \item ConstantLiarMean, the mean of the observations
+                                                    \item ConstantLiarMax, the maximum of the observations
+                                                    \end{itemize}. Default is KrigingBeliever""", default='KrigingBeliever'))
+    specs.addSub(batchAcq)
+
     # Convergence
     conv = InputData.parameterInputFactory('convergence', strictMode=True,
                                            printPriority=108,
@@ -149,6 +171,9 @@ class BayesianOptimizer(RavenSampled):
     self._evaluationCount = 0                                                 # Number of function/model calls
     self._paramSelectionOptions = {'ftol':1e-10, 'maxiter':200, 'disp':False} # Optimizer options for hyperparameter selection
     self._externalParamOptimizer = 'fmin_l_bfgs_b'                            # Optimizer for external hyperparameter selection
+    self._batchSize = 1                                                       # Number of samples selected at each iteration
+    self._batchStrategy = 'KrigingBeliever'                                   # Fantasized observation used to select the samples of a batch
+    self._modelSize = 0                                                       # Number of samples the regression model is currently conditioned on
 
   def handleInput(self, paramInput):
     """
@@ -188,6 +213,18 @@ class BayesianOptimizer(RavenSampled):
       if method:
         self._modelSelection = method.value
 
+    # Batch acquisition
+    batchNode = paramInput.findFirst('BatchAcquisition')
+    if batchNode:
+      size = batchNode.findFirst('Size')
+      if size:
+        if size.value < 1:
+          self.raiseAnError(IOError, f'<BatchAcquisition><Size> must be a positive integer, got {size.value}')
+        self._batchSize = size.value
+      strategy = batchNode.findFirst('Strategy')
+      if strategy:
+        self._batchStrategy = strategy.value
+
     # Convergence
     convNode = paramInput.findFirst('convergence')
     # Similar to model selection, if no parent node or some child node is missing, __init__ provides default
@@ -298,7 +335,7 @@ class BayesianOptimizer(RavenSampled):
     step = info['step'] + 1
     if not isinstance(rlz, dict):
       if step == 1:
-        self.batch = 1 # FIXME when implementing parallel expected improvement, fix this
+        self.batch = self._batchSize
         self.counter -= 1 #FIXME hacky way to make sure iterations are correctly counted
         self.raiseAMessage(f'Initialization data of dimension {self._initialSampleSize} received... '
                            f'Setting sample batch size to {self.batch}')
@@ -313,6 +350,8 @@ class BayesianOptimizer(RavenSampled):
       self._generatePredictiveModel(traj)
       self._resolveMultiSample(traj, rlz, info)
     elif isinstance(rlz, dict):
+      if step == 1:
+        self.batch = self._batchSize
       self.raiseAMessage(f'Received next sample for iteration: {self.getIteration(traj)}')
 
       # Add new input and model evaluation to the dataset
@@ -324,9 +363,9 @@ class BayesianOptimizer(RavenSampled):
       optVal = rlz[self._objectiveVar]
       self._resolveNewOptPoint(traj, rlz, optVal, info)
 
-    # Use acquisition to select next point
-    newPoint = self._acquFunction.conductAcquisition(self)
-    self._submitRun(newPoint, traj, step)
+    # Use acquisition to select next point(s)
+    for newPoint in self._selectBatch(traj):
+      self._submitRun(newPoint, traj, step)
     self.incrementIteration(traj)
 
   def flush(self):
@@ -342,6 +381,7 @@ class BayesianOptimizer(RavenSampled):
     self._trainingInputs = [{}]
     self._trainingTargets = []
     self._model = None
+    self._modelSize = 0
     return
 
   ###################
@@ -532,6 +572,7 @@ class BayesianOptimizer(RavenSampled):
       trainingSet[varName] = np.asarray(self._trainingInputs[traj][varName])
     trainingSet[self._objectiveVar] = np.asarray(self._trainingTargets[traj])
     self._model.train(trainingSet)
+    self._modelSize = len(self._trainingTargets[traj])
     # NOTE It would be preferrable to use targetEvaluation;
     # however, there does not appear a built in normalization method and as
     # consequence, it is preferrable to use the in class attributes to train the ROM
@@ -558,9 +599,77 @@ class BayesianOptimizer(RavenSampled):
         self.raiseAnError(RuntimeError, 'Model averaging is not yet available')
       else:
         self._trainRegressionModel(traj)
+    else:
+      self._updateRegressionModel(traj)
+
+  def _updateRegressionModel(self, traj):
+    """
+      Conditions the regression model on the samples collected since its last training, without
+      reselecting the hyperparameters; the model is trained again if it cannot be updated
+      @ In, traj, trajectory
+      @ Out, None
+    """
+    nNew = len(self._trainingTargets[traj]) - self._modelSize
+    if self._modelSize == 0 or nNew < 0:
+      self._trainRegressionModel(traj)
+      return
+    if nNew == 0:
+      return
+    gpr = self._model.supervisedContainer[0]
+    featureVals = np.asarray([self._trainingInputs[traj][varName][-nNew:] for varName in gpr.features], dtype=float).T
+    targetVals = np.asarray(self._trainingTargets[traj][-nNew:], dtype=float).reshape(nNew, 1)
+    if gpr.updateTraining(featureVals, targetVals):
+      self._modelSize += nNew
     else:
       self._trainRegressionModel(traj)
 
+  def _selectBatch(self, traj):
+    """
+      Selects the next samples, optimizing the acquisition function once per sample: after each selection,
+      the regression model is conditioned on a fantasized observation at the selected point (according to
+      the batch strategy), then restored once the whole batch is selected
+      @ In, traj, trajectory
+      @ Out, newPoints, list, the selected points (dict)
+    """
+    newPoints = [self._acquFunction.conductAcquisition(self)]
+    if self.batch == 1:
+      return newPoints
+    # the acquisition value of the first selection is the one reported and checked for convergence
+    optValue = self._acquFunction._optValue
+    gpr = self._model.supervisedContainer[0]
+    state = gpr.getFittedState()
+    fantasize = True
+    while len(newPoints) < self.batch:
+      if fantasize:
+        featureVals = np.atleast_2d([float(newPoints[-1][varName]) for varName in gpr.features])
+        fantasize = gpr.updateTraining(featureVals, np.atleast_2d(self._fantasyValue(traj, newPoints[-1])))
+      if fantasize:
+        newPoints.append(self._acquFunction.conductAcquisition(self))
+      else:
+        # the model could not be conditioned (e.g., the same point was selected twice), hence the
+        # rest of the batch is sampled at random in the (normalized) input space
+        newPoints.append(self.arrayToFeaturePoint(randomUtils.random(dim=len(self.toBeSampled), samples=1)))
+    gpr.setFittedState(state)
+    self._acquFunction._optValue = optValue
+    return newPoints
+
+  def _fantasyValue(self, traj, point):
+    """
+      Provides the fantasized observation at a selected point of a batch
+      @ In, traj, trajectory
+      @ In, point, dict, the selected point
+      @ Out, value, float, the fantasized value of the objective
+    """
+    if self._batchStrategy == 'KrigingBeliever':
+      value = float(np.ravel(self._evaluateRegressionModel(point)[0])[0])
+    elif self._batchStrategy == 'ConstantLiarMin':
+      value = np.min(self._trainingTargets[traj])
+    elif self._batchStrategy == 'ConstantLiarMean':
+      value = np.mean(self._trainingTargets[traj])
+    else:
+      value = np.max(self._trainingTargets[traj])
+    return value
+
   def _evaluateRegressionModel(self, featurePoint):
     """
       Evaluates GPR mean and standard deviation at a given input location
@@ -103,6 +103,18 @@ class GeneticAlgorithm(RavenSampled):
     self._penaltyCoeff = None
     self._fitnessInstance = None
     self._repairInstance = None
+    # steady-state (asynchronous) mode, see _useSteadyStateRealization
+    self._steadyState = False   # if True, each collected evaluation immediately produces a replacement child
+    self._minBreeders = 2       # number of evaluated chromosomes needed before breeding (steady-state)
+    self._popValues = None      # np.array, genes of the population (steady-state), populationSize x nGenes
+    self._popObjective = None   # np.array, objective values of the population (steady-state)
+    self._popConstraints = None # np.array, constraint evaluations of the population (steady-state), populationSize x nConstraints
+    self._popFitness = None     # np.array, fitness of the population (steady-state)
+    self._popBirth = None       # np.array, number of evaluations collected when each chromosome joined the population (steady-state)
+    self._popCount = 0          # number of chromosomes currently in the population (steady-state)
+    self._nEvaluated = 0        # number of evaluations collected (steady-state)
+    self._pendingChildren = 0   # replacement children owed to the JobHandler, not produced yet (steady-state)
+    self._generationRlzs = []   # (rlz, fitness, g) of the evaluations collected during the current generation (steady-state)
 
   ##########################
   # Initialization Methods #
@@ -271,6 +283,22 @@ class GeneticAlgorithm(RavenSampled):
         descr=r""" b: coefficient of constraint penalty.""")
     fitness.addSub(penaltyCoeff)
     GAparams.addSub(fitness)
+
+    # Steady-state (asynchronous) mode
+    steadyState = InputData.parameterInputFactory('steadyState', strictMode=True,
+        contentType=InputTypes.BoolType,
+        printPriority=108,
+        descr=r"""If True, the GA runs in asynchronous steady-state mode: instead of waiting for the whole
+                  generation, each collected evaluation immediately goes through survivor selection
+                  (replacing a chromosome of the population according to \xmlNode{survivorSelection})
+                  and triggers the production (parent selection, crossover, mutation and repair) and the
+                  submission of a replacement child. Hence, \xmlNode{populationSize} evaluations are always
+                  running, which keeps the available cores busy when the model run times are heterogeneous.
+                  Convergence checks and the solution export are performed every \xmlNode{populationSize}
+                  collected evaluations (i.e., a generation). Note that in this mode \xmlNode{limit} counts
+                  the model evaluations, rather than the generations.
+                  \default{False}""")
+    GAparams.addSub(steadyState)
     specs.addSub(GAparams)
 
     # convergence
@@ -370,6 +398,14 @@ class GeneticAlgorithm(RavenSampled):
     self._penaltyCoeff = fitnessNode.findFirst('b').value if fitnessNode.findFirst('b') is not None else None
     self._fitnessInstance = fitnessReturnInstance(self,name = self._fitnessType)
     self._repairInstance = repairReturnInstance(self,name='replacementRepair')  # currently only replacement repair is implemented.
+    # steady-state mode
+    steadyStateNode = gaParamsNode.findFirst('steadyState')
+    self._steadyState = steadyStateNode is not None and steadyStateNode.value
+    if self._steadyState:
+      # two parents are selected for each child, and tournamentSelection needs twice as many candidates
+      self._minBreeders = 4 if self._parentSelectionType == 'tournamentSelection' else 2
+      if self._populationSize < self._minBreeders:
+        self.raiseAnError(IOError, f'In steady-state mode, the population size must be at least {self._minBreeders} for "{self._parentSelectionType}"!')
 
     # Convergence Criterion
     convNode = paramInput.findFirst('convergence')
@@ -397,7 +433,22 @@ class GeneticAlgorithm(RavenSampled):
 
     meta = ['batchId']
     self.addMetaKeys(meta)
-    self.batch = self._populationSize
+    if self._steadyState:
+      # each evaluation is collected (and replaced) as soon as it is done
+      self.batch = 1
+      nGenes = len(self.toBeSampled)
+      nConstraints = len(self._constraintFunctions) + len(self._impConstraintFunctions)
+      self._popValues = np.zeros((self._populationSize, nGenes))
+      self._popObjective = np.zeros(self._populationSize)
+      self._popConstraints = np.zeros((self._populationSize, nConstraints))
+      self._popFitness = np.zeros(self._populationSize)
+      self._popBirth = np.zeros(self._populationSize, dtype=int)
+      self._popCount = 0
+      self._nEvaluated = 0
+      self._pendingChildren = 0
+      self._generationRlzs = []
+    else:
+      self.batch = self._populationSize
     if self._populationSize != len(self._initialValues):
       self.raiseAnError(IOError, f'Number of initial values provided for each variable is {len(self._initialValues)}, while the population size is {self._populationSize}')
     for _, init in enumerate(self._initialValues):
@@ -436,9 +487,12 @@ class GeneticAlgorithm(RavenSampled):
       Used to feedback the collected runs into actionable items within the sampler.
       This is called by localFinalizeActualSampling, and hence should contain the main skeleton.
       @ In, info, dict, identifying information about the realization
-      @ In, rlz, xr.Dataset, new batched realizations
+      @ In, rlz, xr.Dataset, new batched realizations (dict, a single realization, in steady-state mode)
       @ Out, None
     """
+    if self._steadyState:
+      self._useSteadyStateRealization(info, rlz)
+      return
     # The whole skeleton should be here, this should be calling all classes and _private methods.
     traj = info['traj']
     for t in self._activeTraj[1:]:
@@ -458,37 +512,9 @@ class GeneticAlgorithm(RavenSampled):
     offSprings = datasetToDataArray(rlz, list(self.toBeSampled))
     objectiveVal = list(np.atleast_1d(rlz[self._objectiveVar].data))
 
-    # collect parameters that the constraints functions need (neglecting the default params such as inputs and objective functions)
-    constraintData = {}
-    if self._constraintFunctions or self._impConstraintFunctions:
-      params = []
-      for y in (self._constraintFunctions + self._impConstraintFunctions):
-        params += y.parameterNames()
-      for p in list(set(params) -set([self._objectiveVar]) -set(list(self.toBeSampled.keys()))):
-        constraintData[p] = list(np.atleast_1d(rlz[p].data))
     # Compute constraint function g_j(x) for all constraints (j = 1 .. J)
     # and all x's (individuals) in the population
-    g0 = np.zeros((np.shape(offSprings)[0],len(self._constraintFunctions)+len(self._impConstraintFunctions)))
-
-    g = xr.DataArray(g0,
-                     dims=['chromosome','Constraint'],
-                     coords={'chromosome':np.arange(np.shape(offSprings)[0]),
-                             'Constraint':[y.name for y in (self._constraintFunctions + self._impConstraintFunctions)]})
-    # FIXME The constraint handling is following the structure of the RavenSampled.py,
-    #        there are many utility functions that can be simplified and/or merged together
-    #        _check, _handle, and _apply, for explicit and implicit constraints.
-    #        This can be simplified in the near future in GradientDescent, SimulatedAnnealing, and here in GA
-    for index,individual in enumerate(offSprings):
-      newOpt = individual
-      opt = {self._objectiveVar:objectiveVal[index]}
-      for p, v in constraintData.items():
-        opt[p] = v[index]
-
-      for constIndex, constraint in enumerate(self._constraintFunctions + self._impConstraintFunctions):
-        if constraint in self._constraintFunctions:
-          g.data[index, constIndex] = self._handleExplicitConstraints(newOpt, constraint)
-        else:
-          g.data[index, constIndex] = self._handleImplicitConstraints(newOpt, opt, constraint)
+    g = self._evaluateConstraints(rlz, offSprings, objectiveVal)
     offSpringFitness = self._fitnessInstance(rlz,
                                              objVar=self._objectiveVar,
                                              a=self._objCoeff,
@@ -517,59 +543,240 @@ class GeneticAlgorithm(RavenSampled):
         self.fitness = offSpringFitness
         self.objectiveVal = rlz[self._objectiveVar].data
 
-      # 1 @ n: Parent selection from population
-      # pair parents together by indexes
-      parents = self._parentSelectionInstance(self.population,
-                                              variables=list(self.toBeSampled),
-                                              fitness=self.fitness,
-                                              nParents=self._nParents)
-
-      # 2 @ n: Crossover from set of parents
-      # create childrenCoordinates (x1,...,xM)
-      childrenXover = self._crossoverInstance(parents=parents,
-                                              variables=list(self.toBeSampled),
-                                              crossoverProb=self._crossoverProb,
-                                              points=self._crossoverPoints)
-
-      # 3 @ n: Mutation
-      # perform random directly on childrenCoordinates
-      childrenMutated = self._mutationInstance(offSprings=childrenXover,
-                                               distDict=self.distDict,
-                                               locs=self._mutationLocs,
-                                               mutationProb=self._mutationProb,
-                                               variables=list(self.toBeSampled))
-
-      # 4 @ n: repair/replacement
-      # repair should only happen if multiple genes in a single chromosome have the same values (),
-      # and at the same time the sampling of these genes should be with Out replacement.
-      needsRepair = False
-      for chrom in range(self._nChildren):
-        unique = set(childrenMutated.data[chrom, :])
-        if len(childrenMutated.data[chrom,:]) != len(unique):
-          for var in self.toBeSampled: # TODO: there must be a smarter way to check if a variables strategy is without replacement
-            if (hasattr(self.distDict[var], 'strategy') and self.distDict[var].strategy == 'withoutReplacement'):
-              needsRepair = True
-              break
-      if needsRepair:
-        children = self._repairInstance(childrenMutated,variables=list(self.toBeSampled),distInfo=self.distDict)
-      else:
-        children = childrenMutated
+      # 1-4 @ n: parent selection, crossover, mutation and repair
+      children = self._reproduce(self.population, self.fitness, self._nParents)
 
       # keeping the population size constant by ignoring the excessive children
-      children = children[:self._populationSize, :]
-
-      daChildren = xr.DataArray(children,
-                              dims=['chromosome','Gene'],
-                              coords={'chromosome': np.arange(np.shape(children)[0]),
-                                      'Gene':list(self.toBeSampled)})
+      children = np.atleast_2d(children.data)[:self._populationSize, :]
 
       # 5 @ n: Submit children batch
       # submit children coordinates (x1,...,xm), i.e., self.childrenCoordinates
-      for i in range(self.batch):
-        newRlz = {}
-        for _, var in enumerate(self.toBeSampled.keys()):
-          newRlz[var] = float(daChildren.loc[i, var].values)
-        self._submitRun(newRlz, traj, self.getIteration(traj))
+      for child in children[:self.batch]:
+        self._submitRun(dict(zip(self.toBeSampled, child.tolist())), traj, self.getIteration(traj))
+
+  def _evaluateConstraints(self, rlz, offSprings, objectiveVal):
+    """
+      Evaluates the explicit and implicit constraint functions for the given chromosomes
+      @ In, rlz, xr.Dataset or dict, realization(s) containing the chromosomes
+      @ In, offSprings, xr.DataArray, the chromosomes, dims=['chromosome','Gene']
+      @ In, objectiveVal, list, objective values at each chromosome
+      @ Out, g, xr.DataArray, the constraint evaluations g_j(x), dims=['chromosome','Constraint']
+    """
+    # collect parameters that the constraints functions need (neglecting the default params such as inputs and objective functions)
+    constraintData = {}
+    if self._constraintFunctions or self._impConstraintFunctions:
+      params = []
+      for y in (self._constraintFunctions + self._impConstraintFunctions):
+        params += y.parameterNames()
+      for p in list(set(params) -set([self._objectiveVar]) -set(list(self.toBeSampled.keys()))):
+        constraintData[p] = list(np.atleast_1d(np.asarray(rlz[p])))
+    g0 = np.zeros((np.shape(offSprings)[0],len(self._constraintFunctions)+len(self._impConstraintFunctions)))
+
+    g = xr.DataArray(g0,
+                     dims=['chromosome','Constraint'],
+                     coords={'chromosome':np.arange(np.shape(offSprings)[0]),
+                             'Constraint':[y.name for y in (self._constraintFunctions + self._impConstraintFunctions)]})
+    # FIXME The constraint handling is following the structure of the RavenSampled.py,
+    #        there are many utility functions that can be simplified and/or merged together
+    #        _check, _handle, and _apply, for explicit and implicit constraints.
+    #        This can be simplified in the near future in GradientDescent, SimulatedAnnealing, and here in GA
+    for index,individual in enumerate(offSprings):
+      newOpt = individual
+      opt = {self._objectiveVar:objectiveVal[index]}
+      for p, v in constraintData.items():
+        opt[p] = v[index]
+
+      for constIndex, constraint in enumerate(self._constraintFunctions + self._impConstraintFunctions):
+        if constraint in self._constraintFunctions:
+          g.data[index, constIndex] = self._handleExplicitConstraints(newOpt, constraint)
+        else:
+          g.data[index, constIndex] = self._handleImplicitConstraints(newOpt, opt, constraint)
+
+    return g
+
+  def _reproduce(self, population, fitness, nParents):
+    """
+      Produces children from the population: parent selection, crossover, mutation and repair
+      @ In, population, xr.DataArray, the population, dims=['chromosome','Gene']
+      @ In, fitness, xr.DataArray, the fitness of the population
+      @ In, nParents, int, the number of parents to select
+      @ Out, children, xr.DataArray, the children, i.e. np.shape(children) = nParents x (nParents-1) x nGenes
+    """
+    # 1: Parent selection from population
+    # pair parents together by indexes
+    parents = self._parentSelectionInstance(population,
+                                            variables=list(self.toBeSampled),
+                                            fitness=fitness,
+                                            nParents=nParents)
+
+    # 2: Crossover from set of parents
+    # create childrenCoordinates (x1,...,xM)
+    childrenXover = self._crossoverInstance(parents=parents,
+                                            variables=list(self.toBeSampled),
+                                            crossoverProb=self._crossoverProb,
+                                            points=self._crossoverPoints)
+
+    # 3: Mutation
+    # perform random directly on childrenCoordinates
+    childrenMutated = self._mutationInstance(offSprings=childrenXover,
+                                             distDict=self.distDict,
+                                             locs=self._mutationLocs,
+                                             mutationProb=self._mutationProb,
+                                             variables=list(self.toBeSampled))
+
+    # 4: repair/replacement
+    # repair should only happen if multiple genes in a single chromosome have the same values (),
+    # and at the same time the sampling of these genes should be with Out replacement.
+    needsRepair = False
+    for chrom in range(childrenMutated.shape[0]):
+      unique = set(childrenMutated.data[chrom, :])
+      if len(childrenMutated.data[chrom,:]) != len(unique):
+        for var in self.toBeSampled: # TODO: there must be a smarter way to check if a variables strategy is without replacement
+          if (hasattr(self.distDict[var], 'strategy') and self.distDict[var].strategy == 'withoutReplacement'):
+            needsRepair = True
+            break
+    if needsRepair:
+      children = self._repairInstance(childrenMutated,variables=list(self.toBeSampled),distInfo=self.distDict)
+    else:
+      children = childrenMutated
+
+    return children
+
+  # * * * * * * * * * * * *
+  # Steady-state (asynchronous) mode
+  def _useSteadyStateRealization(self, info, rlz):
+    """
+      Steady-state counterpart of _useRealization: the collected evaluation immediately goes through
+      survivor selection, and a replacement child is produced and submitted, without waiting for
+      the rest of the generation.
+      @ In, info, dict, identifying information about the realization
+      @ In, rlz, dict, the new realization
+      @ Out, None
+    """
+    traj = info['traj']
+    for t in self._activeTraj[1:]:
+      self._closeTrajectory(t, 'cancel', 'Currently GA is single trajectory', 0)
+    variables = list(self.toBeSampled)
+    values = np.asarray([float(np.ravel(rlz[var])[0]) for var in variables])
+    objective = float(np.ravel(rlz[self._objectiveVar])[0])
+    offSpring = xr.DataArray(np.atleast_2d(values), dims=['chromosome','Gene'],
+                             coords={'chromosome':[0], 'Gene':variables})
+    g = self._evaluateConstraints(rlz, offSpring, [objective]).data[0]
+    self._nEvaluated += 1
+
+    # 5: survivor selection, the child joins the population (if it survives)
+    fitness = self._steadyStateSurvivorSelection(values, objective, g)
+    self._generationRlzs.append((rlz, fitness, g))
+
+    # a generation is resolved (convergence, solution export) every populationSize evaluations
+    if len(self._generationRlzs) == self._populationSize:
+      self._resolveSteadyStateGeneration(traj, info)
+
+    # 1-4: produce and submit the replacement child
+    if self._activeTraj:
+      self._pendingChildren += 1
+      if self._popCount < self._minBreeders:
+        # not enough evaluated chromosomes to select the parents yet
+        return
+      population = xr.DataArray(self._popValues[:self._popCount], dims=['chromosome','Gene'],
+                                coords={'chromosome':np.arange(self._popCount), 'Gene':variables})
+      popFitness = xr.DataArray(self._popFitness[:self._popCount], dims=['chromosome'],
+                                coords={'chromosome':np.arange(self._popCount)})
+      while self._pendingChildren > 0:
+        child = np.atleast_2d(self._reproduce(population, popFitness, 2).data)[0]
+        self._submitRun(dict(zip(variables, child.tolist())), traj, self.getIteration(traj) + 1)
+        self._pendingChildren -= 1
+
+  def _steadyStateFitness(self, objective, constraints):
+    """
+      Computes the fitness of a set of chromosomes (the fitness might depend on the whole set, e.g. feasibleFirst)
+      @ In, objective, np.array, the objective values of the chromosomes
+      @ In, constraints, np.array, the constraint evaluations of the chromosomes, nChromosomes x nConstraints
+      @ Out, fitness, np.array, the fitness of the chromosomes
+    """
+    chromosomes = np.arange(len(objective))
+    rlz = xr.Dataset({self._objectiveVar: ('chromosome', objective)}, coords={'chromosome': chromosomes})
+    g = xr.DataArray(constraints, dims=['chromosome','Constraint'],
+                     coords={'chromosome':chromosomes,
+                             'Constraint':[y.name for y in (self._constraintFunctions + self._impConstraintFunctions)]})
+    fitness = self._fitnessInstance(rlz,
+                                    objVar=self._objectiveVar,
+                                    a=self._objCoeff,
+                                    b=self._penaltyCoeff,
+                                    penalty=None,
+                                    constraintFunction=g,
+                                    type=self._minMax)
+    return np.atleast_1d(fitness.data)
+
+  def _steadyStateSurvivorSelection(self, values, objective, g):
+    """
+      Inserts a new chromosome in the population, replacing (if the population is full) a chromosome
+      according to the survivor selection type:
+        ageBased, the oldest chromosome is replaced (the least fit, among equally old ones);
+        fitnessBased, the least fit chromosome, including the new one, is discarded (the oldest, among equally fit ones).
+      @ In, values, np.array, the genes of the new chromosome
+      @ In, objective, float, the objective value of the new chromosome
+      @ In, g, np.array, the constraint evaluations of the new chromosome
+      @ Out, fitness, float, the fitness of the new chromosome (with respect to the current population)
+    """
+    n = self._popCount
+    objectives = np.append(self._popObjective[:n], objective)
+    constraints = np.vstack((self._popConstraints[:n], g))
+    fitness = self._steadyStateFitness(objectives, constraints)
+    if n < self._populationSize:
+      # the population is still being filled
+      replace = n
+      self._popCount += 1
+    else:
+      age = np.append(self._nEvaluated - self._popBirth, 0)
+      if self._survivorSelectionType == 'ageBased':
+        candidates = np.flatnonzero(age[:-1] == age[:-1].max())
+        replace = candidates[np.argmin(fitness[candidates])]
+      else:
+        candidates = np.flatnonzero(fitness == fitness.min())
+        replace = candidates[np.argmax(age[candidates])]
+    if replace < self._populationSize:
+      self._popValues[replace] = values
+      self._popObjective[replace] = objective
+      self._popConstraints[replace] = g
+      self._popBirth[replace] = self._nEvaluated
+      # the fitness might depend on the whole population, so it is updated for everybody
+      self._popFitness[:self._popCount] = self._steadyStateFitness(self._popObjective[:self._popCount],
+                                                                   self._popConstraints[:self._popCount])
+    return fitness[-1]
+
+  def _resolveSteadyStateGeneration(self, traj, info):
+    """
+      Resolves the generation made of the last populationSize collected evaluations: convergence check,
+      optimal point history and solution export, as done in generational mode.
+      @ In, traj, int, trajectory identifier
+      @ In, info, dict, identifying information about the last realization
+      @ Out, None
+    """
+    self.incrementIteration(traj)
+    self.batchId = self.getIteration(traj)
+    info['step'] = self.getIteration(traj)
+    rlzs, fitness, g = zip(*self._generationRlzs)
+    self._generationRlzs = []
+    # only the scalar entries of the realizations are gathered
+    keys = [key for key, val in rlzs[0].items() if np.size(val) == 1]
+    chromosomes = np.arange(len(rlzs))
+    rlz = xr.Dataset(dict((key, ('RAVEN_sample_ID', np.asarray([np.ravel(r[key])[0] for r in rlzs]))) for key in keys),
+                     coords={'RAVEN_sample_ID': chromosomes})
+    objectiveVal = list(rlz[self._objectiveVar].data)
+    fitness = xr.DataArray(np.asarray(fitness), dims=['chromosome'], coords={'chromosome': chromosomes})
+    g = xr.DataArray(np.asarray(g).reshape(len(rlzs), -1), dims=['chromosome','Constraint'],
+                     coords={'chromosome':chromosomes,
+                             'Constraint':[y.name for y in (self._constraintFunctions + self._impConstraintFunctions)]})
+    self._collectOptPoint(rlz, fitness, objectiveVal, g)
+    self._resolveNewGeneration(traj, rlz, objectiveVal, fitness, g, info)
+    # snapshot of the population, compared with the next generation for convergence
+    n = self._popCount
+    self.population = xr.DataArray(self._popValues[:n].copy(), dims=['chromosome','Gene'],
+                                   coords={'chromosome':np.arange(n), 'Gene':list(self.toBeSampled)})
+    self.fitness = xr.DataArray(self._popFitness[:n].copy(), dims=['chromosome'], coords={'chromosome':np.arange(n)})
+    self.objectiveVal = self._popObjective[:n].copy()
+    self.popAge = list((self._nEvaluated - self._popBirth[:n]) // self._populationSize)
 
   def _submitRun(self, point, traj, step, moreInfo=None):
     """
@@ -609,6 +816,15 @@ class GeneticAlgorithm(RavenSampled):
     self.bestFitness = None
     self.bestObjective = None
     self.objectiveVal = None
+    self._popValues = None
+    self._popObjective = None
+    self._popConstraints = None
+    self._popFitness = None
+    self._popBirth = None
+    self._popCount = 0
+    self._nEvaluated = 0
+    self._pendingChildren = 0
+    self._generationRlzs = []
 
   # END queuing Runs
   # * * * * * * * * * * * * * * * *
@@ -646,7 +862,11 @@ class GeneticAlgorithm(RavenSampled):
     self.raiseADebug(f'Trajectory {traj} iteration {info["step"]} resolving new state ...')
     # note the collection of the opt point
     self._stepTracker[traj]['opt'] = (rlz, info)
-    acceptable = 'accepted' if self.counter > 1 else 'first'
+    if self._steadyState:
+      # the counter tracks the evaluations in steady-state mode, hence the (0-based) generation is used instead
+      acceptable = 'accepted' if self.getIteration(traj) > 0 else 'first'
+    else:
+      acceptable = 'accepted' if self.counter > 1 else 'first'
     old = self.population
     converged = self._updateConvergence(traj, rlz, old, acceptable)
     if converged:
@@ -685,7 +905,9 @@ class GeneticAlgorithm(RavenSampled):
     optPoints,fit,obj,gOfBest = zip(*[[x,y,z,w] for x, y, z,w in sorted(zip(np.atleast_2d(population.data),np.atleast_1d(fitness.data),objectiveVal,np.atleast_2d(g.data)),reverse=True,key=lambda x: (x[1]))])
     point = dict((var,float(optPoints[0][i])) for i, var in enumerate(selVars) if var in rlz.data_vars)
     gOfBest = dict(('ConstraintEvaluation_'+name,float(gOfBest[0][i])) for i, name in enumerate(g.coords['Constraint'].values))
-    if (self.counter > 1 and obj[0] <= self.bestObjective and fit[0] >= self.bestFitness) or self.counter == 1:
+    # in steady-state mode the counter tracks the evaluations, so the first generation is the one without a best point yet
+    firstGeneration = self.bestFitness is None if self._steadyState else self.counter == 1
+    if firstGeneration or (obj[0] <= self.bestObjective and fit[0] >= self.bestFitness):
       point.update(gOfBest)
       self.bestPoint = point
       self.bestFitness = fit[0]
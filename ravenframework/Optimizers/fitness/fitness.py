@@ -70,7 +70,7 @@ def invLinear(rlz,**kwargs):
   data = np.atleast_1d(rlz[objVar].data)
 
   fitness = -a * (rlz[objVar].data).reshape(-1,1) - b * np.sum(np.maximum(0,-penalty),axis=-1).reshape(-1,1)
-  fitness = xr.DataArray(np.squeeze(fitness),
+  fitness = xr.DataArray(np.atleast_1d(np.squeeze(fitness)),
                           dims=['chromosome'],
                           coords={'chromosome': np.arange(len(data))})
   return fitness
@@ -34,7 +34,7 @@ class FilePrint(PrintInterface):
     """
     spec = super().getInputSpecification()
 
-    types = InputTypes.makeEnumType('FilePrintTypes', 'FilePrintTypes', ['csv', 'xml'])
+    types = InputTypes.makeEnumType('FilePrintTypes', 'FilePrintTypes', ['csv', 'hdf5', 'xml'])
     spec.addSub(InputData.parameterInputFactory('type', contentType=types))
     spec.addSub(InputData.parameterInputFactory('source', contentType=InputTypes.StringListType))
     spec.addSub(InputData.parameterInputFactory('what', contentType=InputTypes.StringListType))
@@ -91,7 +91,7 @@ class FilePrint(PrintInterface):
       self.options['clusterLabel'] = cluster.value
 
     # checks
-    if self.options['type'] == 'csv' and self.what is not None:
+    if self.options['type'] in ['csv', 'hdf5'] and self.what is not None:
       for target in [x.lower() for x in self.what]:
         if not target.startswith(('input', 'output', 'metadata')):
           self.raiseAnError(IOError, f'<what> requests must start with "input", "output", or "metadata"! See OutStream.Print "{self.name}"')
@@ -122,6 +122,11 @@ class FilePrint(PrintInterface):
     """
     self.legacyCollectSources(stepEntities)
     super().initialize(stepEntities)
+    # the single-file HDF5 store is only available for histories
+    if self.options['type'] == 'hdf5':
+      for source in self.sourceData:
+        if getattr(source, 'type', None) != 'HistorySet':
+          self.raiseAnError(IOError, f'OutStream.Print "{self.name}" requests type "hdf5", which only supports HistorySet sources, but "{source.name}" is a {source.type}!')
 
   def run(self):
     """
@@ -145,7 +150,7 @@ class FilePrint(PrintInterface):
       dictOptions['target'] = self.options['target']
 
     for index in range(len(self.sourceName)):
-      if self.options['type'] == 'csv':
+      if self.options['type'] in ['csv', 'hdf5']:
         filename = dictOptions['filenameroot']
         rlzIndex = self.indexPrinted.get(filename,0)
         dictOptions['firstIndex'] = rlzIndex
@@ -156,7 +161,7 @@ class FilePrint(PrintInterface):
           else:
             dictOptions['clusterLabel'] = self.options['clusterLabel']
         try:
-          rlzIndex = self.sourceData[index].write(filename,style='CSV',**dictOptions)
+          rlzIndex = self.sourceData[index].write(filename,style=self.options['type'].upper(),**dictOptions)
         except AttributeError:
           self.raiseAnError(NotImplementedError, f'No implementation for source type {self.sourceData[index].type} and output type "{self.options["type"].strip()}"!')
         finally:
@@ -72,6 +72,8 @@ class DaskRunner(InternalRunner):
     # __funcLock is needed because if isDone and kill are called at the
     # same time, isDone might end up trying to use __func after it is deleted
     self.__funcLock = threading.RLock()
+    # True if the completion is notified through a callback on the remote future
+    self.__notifies = False
 
   def __getstate__(self):
     """
@@ -81,6 +83,7 @@ class DaskRunner(InternalRunner):
     """
     state = copy.copy(self.__dict__)
     state.pop('_DaskRunner__funcLock')
+    state['_completionCallback'] = None
     return state
 
   def __setstate__(self, d):
@@ -126,6 +129,14 @@ class DaskRunner(InternalRunner):
 
     return self.returnCode
 
+  def notifiesCompletion(self):
+    """
+      Returns whether this runner invokes its completion callback by itself once the job is done.
+      @ In, None
+      @ Out, notifies, bool, True if a done-callback could be attached to the remote future
+    """
+    return self.__notifies
+
   def _collectRunnerResponse(self):
     """
       Method to add the process response in the internal variable (pointer)
@@ -159,6 +170,8 @@ class DaskRunner(InternalRunner):
       self.__func = self.__client.submit(self.functionToRun, *self.args, retries=0)
       self.trackTime('runner_started')
       self.started = True
+      self.__func.add_done_callback(lambda _: self._notifyCompletion())
+      self.__notifies = True
       gc.collect()
       return
 
@@ -182,3 +195,4 @@ class DaskRunner(InternalRunner):
       self.__func = None
     self.returnCode = -1
     self.trackTime('runner_killed')
+    self._notifyCompletion()
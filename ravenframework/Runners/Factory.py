@@ -25,6 +25,7 @@ from .RayRunner import RayRunner
 from .InternalRunner import InternalRunner
 from .PassthroughRunner import PassthroughRunner
 from .SharedMemoryRunner import SharedMemoryRunner
+from .ProcessPoolRunner import ProcessPoolRunner
 
 class RunnerFactory(EntityFactory):
   """ Specific implementation for runners """
@@ -0,0 +1,336 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Runner for internal objects (ExternalModels, ROMs) on a pool of local worker processes.
+  No distributed library (ray or dask) is needed.
+"""
+#External Modules------------------------------------------------------------------------------------
+import os
+import sys
+import copy
+import pickle
+import shutil
+import tempfile
+import threading
+import collections
+import concurrent.futures
+from multiprocessing import shared_memory
+import cloudpickle
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from .InternalRunner import InternalRunner
+#Internal Modules End--------------------------------------------------------------------------------
+
+# objects (models) already loaded by this worker process, by token, the most recently used last
+_workerObjects = collections.OrderedDict()
+# maximum number of objects kept loaded by each worker process (the least recently used are evicted)
+_maxWorkerObjects = 8
+# results with out-of-band buffers larger than this (bytes) are sent back through shared memory
+_sharedMemoryThreshold = 1 << 20
+
+def _loadWorkerObject(token, path):
+  """
+    Provides the object (model) associated to the token, loading it (once per worker process) if needed.
+    Since the objects are shared again at each step (with new tokens), the least recently used ones are evicted.
+    @ In, token, str, the token of the object
+    @ In, path, str, the file containing the pickled object
+    @ Out, obj, object, the object
+  """
+  if token in _workerObjects:
+    _workerObjects.move_to_end(token)
+  else:
+    with open(path, 'rb') as pickled:
+      _workerObjects[token] = pickle.load(pickled)
+    while len(_workerObjects) > _maxWorkerObjects:
+      _workerObjects.popitem(last=False)
+  return _workerObjects[token]
+
+def _runInWorker(methodName, token, path, args):
+  """
+    Runs a job in a worker process. The result is serialized with out-of-band buffers
+    (pickle protocol 5), so that large arrays are returned through shared memory instead of the pipe.
+    @ In, methodName, str, the name of the method of the object to run as method(obj, *args)
+    @ In, token, str, the token of the object (model) the method is run on
+    @ In, path, str, the file containing the pickled object
+    @ In, args, tuple, the other arguments of the method (e.g. the sampled variables)
+    @ Out, packed, tuple, (payload, buffers, sharedName) the serialized result
+  """
+  obj = _loadWorkerObject(token, path)
+  method = getattr(type(obj), methodName)
+  # the methods decorated as Parallel keep the underlying function in "original_function"
+  method = getattr(method, 'original_function', method)
+  result = method(obj, *args)
+  buffers = []
+  payload = pickle.dumps(result, protocol=5, buffer_callback=buffers.append)
+  raws = [buffer.raw() for buffer in buffers]
+  size = sum(raw.nbytes for raw in raws)
+  if size < _sharedMemoryThreshold:
+    return payload, [raw.tobytes() for raw in raws], None
+  shared = shared_memory.SharedMemory(create=True, size=size)
+  offsets = []
+  begin = 0
+  for raw in raws:
+    shared.buf[begin:begin + raw.nbytes] = raw.cast('B')
+    offsets.append((begin, begin + raw.nbytes))
+    begin += raw.nbytes
+  shared.close()
+  return payload, offsets, shared.name
+
+def _unpack(packed):
+  """
+    Deserializes the result of a job run in a worker process, releasing its shared memory (if any)
+    @ In, packed, tuple, (payload, buffers, sharedName) the serialized result
+    @ Out, result, object, the result of the job
+  """
+  payload, buffers, sharedName = packed
+  if sharedName is None:
+    return pickle.loads(payload, buffers=buffers)
+  shared = shared_memory.SharedMemory(name=sharedName)
+  try:
+    # the buffers are copied, since the shared memory is released right after
+    result = pickle.loads(payload, buffers=[bytearray(shared.buf[begin:end]) for begin, end in buffers])
+  finally:
+    shared.close()
+    shared.unlink()
+  return result
+
+class ProcessPool:
+  """
+    Pool of long-lived local worker processes.
+    The objects the jobs are run on (e.g. models) are pickled once (per step) into a file and loaded
+    once by each worker, so that each job only transfers its own arguments.
+  """
+  def __init__(self, numWorkers, workingDir=None):
+    """
+      Constructor
+      @ In, numWorkers, int, the number of worker processes
+      @ In, workingDir, str, optional, the working directory (added to the path of the workers)
+      @ Out, None
+    """
+    self.numWorkers = numWorkers
+    self._paths = [path for path in [workingDir] if path is not None]
+    self._executor = None
+    self._tempDir = None
+    self._objects = {}  # {id(obj): (obj, token, path)}, the objects shared with the workers
+    self._counter = 0   # counter to generate the tokens
+    self._lock = threading.RLock()
+
+  def __getstate__(self):
+    """
+      The workers and the shared objects are bound to this process, so only the settings are pickled
+      @ In, None
+      @ Out, state, dict, the settings of the pool
+    """
+    return {'numWorkers': self.numWorkers, 'paths': self._paths}
+
+  def __setstate__(self, d):
+    """
+      Restores a pool (with no workers started yet)
+      @ In, d, dict, the settings of the pool
+      @ Out, None
+    """
+    self.__init__(d['numWorkers'])
+    self._paths = d['paths']
+
+  def _shareObject(self, obj):
+    """
+      Provides the token and the file of an object, pickling it if not shared yet
+      @ In, obj, object, the object to share with the workers
+      @ Out, token, str, the token of the object
+      @ Out, path, str, the file containing the pickled object
+    """
+    with self._lock:
+      if id(obj) not in self._objects:
+        if self._tempDir is None:
+          self._tempDir = tempfile.mkdtemp(prefix='raven_pool_')
+        self._counter += 1
+        token = f'{os.getpid()}_{self._counter}'
+        path = os.path.join(self._tempDir, token + '.pk')
+        with open(path, 'wb') as pickled:
+          cloudpickle.dump(obj, pickled, protocol=pickle.HIGHEST_PROTOCOL)
+        # the object is kept alive, so that its id is not reused while shared
+        self._objects[id(obj)] = (obj, token, path)
+      _, token, path = self._objects[id(obj)]
+    return token, path
+
+  def submit(self, methodName, obj, args):
+    """
+      Submits a job to the workers
+      @ In, methodName, str, the name of the method of the object to run as method(obj, *args)
+      @ In, obj, object, the object (model) the method is run on
+      @ In, args, tuple, the other arguments of the method
+      @ Out, future, concurrent.futures.Future, the future of the job
+    """
+    token, path = self._shareObject(obj)
+    with self._lock:
+      if self._executor is None:
+        self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.numWorkers,
+                                                                initializer=sys.path.extend,
+                                                                initargs=(self._paths,))
+    return self._executor.submit(_runInWorker, methodName, token, path, args)
+
+  def reset(self):
+    """
+      Forgets the shared objects (e.g. at the beginning of a new step, since they might have changed).
+      The workers are kept alive.
+      @ In, None
+      @ Out, None
+    """
+    with self._lock:
+      for _, _, path in self._objects.values():
+        if os.path.exists(path):
+          os.remove(path)
+      self._objects = {}
+
+  def shutdown(self):
+    """
+      Stops the workers and removes the shared objects
+      @ In, None
+      @ Out, None
+    """
+    with self._lock:
+      if self._executor is not None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+      self._objects = {}
+      if self._tempDir is not None:
+        shutil.rmtree(self._tempDir, ignore_errors=True)
+        self._tempDir = None
+
+class ProcessPoolRunner(InternalRunner):
+  """
+    Class for running internal objects on a pool of local worker processes
+  """
+  def __init__(self, args, functionToRun, **kwargs):
+    """
+      Init method
+      @ In, args, list, the ProcessPool followed by the list of arguments that will be passed as
+        function parameters into whatever method is stored in functionToRun.
+        e.g., functionToRun(*args). The first argument is the object shared with the workers (e.g. the model)
+      @ In, functionToRun, method or function, method of the first argument that needs to be run
+      @ In, kwargs, dict, additional arguments to base class
+      @ Out, None
+    """
+    self.__pool, args = args[0], args[1:]
+    super().__init__(args, functionToRun, **kwargs)
+    self.__future = None
+    # __futureLock is needed because if isDone and kill are called at the
+    # same time, isDone might end up trying to use __future after it is deleted
+    self.__futureLock = threading.RLock()
+
+  def __getstate__(self):
+    """
+      This function return the state of the ProcessPoolRunner
+      @ In, None
+      @ Out, state, dict, it contains all the information needed by the ProcessPoolRunner to be initialized
+    """
+    state = copy.copy(self.__dict__)
+    state.pop('_ProcessPoolRunner__futureLock')
+    state['_ProcessPoolRunner__future'] = None
+    state['_completionCallback'] = None
+    return state
+
+  def __setstate__(self, d):
+    """
+      Initialize the ProcessPoolRunner with the data contained in newstate
+      @ In, d, dict, it contains all the information needed by the ProcessPoolRunner to be initialized
+      @ Out, None
+    """
+    self.__dict__.update(d)
+    self.__futureLock = threading.RLock()
+
+  def isDone(self):
+    """
+      Method to check if the calculation associated with this Runner is finished
+      @ In, None
+      @ Out, finished, bool, is it finished?
+    """
+    ## If the process has not been started yet, then return False
+    if not self.started:
+      return False
+
+    with self.__futureLock:
+      if self.__future is None or self.hasBeenAdded:
+        return True
+      return self.__future.done()
+
+  def notifiesCompletion(self):
+    """
+      Returns whether this runner invokes its completion callback by itself once the job is done.
+      @ In, None
+      @ Out, notifies, bool, True since a done-callback is attached to the future of the job
+    """
+    return True
+
+  def getReturnCode(self):
+    """
+      Returns the return code from running the code.  If return code not yet
+      set, then set it.
+      @ In, None
+      @ Out, returnCode, int,  the return code of this evaluation
+    """
+    if not self.hasBeenAdded:
+      self._collectRunnerResponse()
+    return self.returnCode
+
+  def _collectRunnerResponse(self):
+    """
+      Method to add the process response in the internal variable (pointer)
+      self.runReturn
+      @ In, None
+      @ Out, None
+    """
+    with self.__futureLock:
+      if not self.hasBeenAdded:
+        self.runReturn = None
+        if self.__future is not None:
+          try:
+            self.runReturn = _unpack(self.__future.result())
+          except Exception as ae:
+            self.returnCode = -1
+            self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+        self.hasBeenAdded = True
+
+  def start(self):
+    """
+      Method to start the job associated to this Runner
+      @ In, None
+      @ Out, None
+    """
+    try:
+      self.__future = self.__pool.submit(self.functionToRun.__name__, self.args[0], tuple(self.args[1:]))
+      self.trackTime('runner_started')
+      self.started = True
+      self.__future.add_done_callback(lambda _: self._notifyCompletion())
+    except Exception as ae:
+      self.exceptionTrace = sys.exc_info()
+      self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+      self.returnCode = -1
+      self.started = True
+      self._notifyCompletion()
+
+  def kill(self):
+    """
+      Method to kill the job associated to this Runner
+      @ In, None
+      @ Out, None
+    """
+    with self.__futureLock:
+      if self.__future is not None:
+        self.__future.cancel()
+      self.__future = None
+    self.returnCode = -1
+    self.trackTime('runner_killed')
+    self._notifyCompletion()
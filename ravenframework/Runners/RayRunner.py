@@ -62,6 +62,8 @@ class RayRunner(InternalRunner):
     # __funcLock is needed because if isDone and kill are called at the
     # same time, isDone might end up trying to use __func after it is deleted
     self.__funcLock = threading.RLock()
+    # True if the completion is notified through a callback on the remote future
+    self.__notifies = False
 
   def __getstate__(self):
     """
@@ -71,6 +73,7 @@ class RayRunner(InternalRunner):
     """
     state = copy.copy(self.__dict__)
     state.pop('_RayRunner__funcLock')
+    state['_completionCallback'] = None
     return state
 
   def __setstate__(self, d):
@@ -119,6 +122,14 @@ class RayRunner(InternalRunner):
         #return self.__func in ray.wait([self.__func], timeout=waitTimeOut)[0]
         #which ran slower in ray 1.9
 
+  def notifiesCompletion(self):
+    """
+      Returns whether this runner invokes its completion callback by itself once the job is done.
+      @ In, None
+      @ Out, notifies, bool, True if a done-callback could be attached to the remote future
+    """
+    return self.__notifies
+
   def _collectRunnerResponse(self):
     """
       Method to add the process response in the internal variable (pointer)
@@ -144,6 +155,12 @@ class RayRunner(InternalRunner):
       self.__func = self.functionToRun(*self.args)
       self.trackTime('runner_started')
       self.started = True
+      try:
+        # the ObjectRef can be converted into a concurrent future, whose callback feeds the JobHandler
+        self.__func.future().add_done_callback(lambda _: self._notifyCompletion())
+        self.__notifies = True
+      except Exception:
+        self.__notifies = False
       gc.collect()
       return
 
@@ -167,3 +184,4 @@ class RayRunner(InternalRunner):
       self.__func = None
     self.returnCode = -1
     self.trackTime('runner_killed')
+    self._notifyCompletion()
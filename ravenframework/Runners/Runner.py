@@ -56,6 +56,7 @@ class Runner(MessageUser):
     self.uniqueHandler  = uniqueHandler
     self.groupId        = None  # the id of the group this run belong to (batching, if activated)
     self.started        = False
+    self._completionCallback = None  # function called with this runner once its job completes (see setCompletionCallback)
 
     ## First attempt to use a user-specified identifier name
     if identifier is not None:
@@ -145,3 +146,31 @@ class Runner(MessageUser):
       @ Out, None
     """
     pass
+
+  def setCompletionCallback(self, callback):
+    """
+      Sets the function to be called (with this runner as only argument) as soon as the job completes.
+      The callback may be invoked from a thread different from the one that started the job.
+      @ In, callback, function, the function to call on completion (None to remove it)
+      @ Out, None
+    """
+    self._completionCallback = callback
+
+  def notifiesCompletion(self):
+    """
+      Returns whether this runner invokes its completion callback by itself once the job is done.
+      Runners that do not notify need to be polled through isDone.
+      @ In, None
+      @ Out, notifies, bool, True if the completion callback is guaranteed to be called
+    """
+    return False
+
+  def _notifyCompletion(self):
+    """
+      Invokes the completion callback, if any.
+      @ In, None
+      @ Out, None
+    """
+    callback = self._completionCallback
+    if callback is not None:
+      callback(self)
@@ -57,6 +57,7 @@ class SharedMemoryRunner(InternalRunner):
 
     self.skipOnCopy.append('subque')
     self.thread = None
+    self.__completed = False # True once the function returned (or raised), even if the thread is still winding down
 
   def isDone(self):
     """
@@ -68,11 +69,19 @@ class SharedMemoryRunner(InternalRunner):
     if not self.started:
       return False
 
-    if self.thread is None:
+    if self.thread is None or self.__completed:
       return True
     else:
       return not self.thread.is_alive()
 
+  def notifiesCompletion(self):
+    """
+      Returns whether this runner invokes its completion callback by itself once the job is done.
+      @ In, None
+      @ Out, notifies, bool, True since the running thread notifies on exit
+    """
+    return True
+
   def getReturnCode(self):
     """
       Returns the return code from running the code.  If return code not yet
@@ -112,7 +121,14 @@ class SharedMemoryRunner(InternalRunner):
       @ Out, None
     """
     try:
-      self.thread = InterruptibleThread(target = lambda q, *arg : q.append(self.functionToRun(*arg)),
+      self.__completed = False
+      # a failed job re-added to the queue (repeatFailureRuns) must not keep the outcome of the previous trial
+      self.subque.clear()
+      self.runReturn = None
+      self.hasBeenAdded = False
+      self.returnCode = 0
+      self.exceptionTrace = None
+      self.thread = InterruptibleThread(target = self.__runAndNotify,
                                      name = self.identifier,
                                      args=(self.subque,) + tuple(self.args))
 
@@ -125,6 +141,19 @@ class SharedMemoryRunner(InternalRunner):
       self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
       self.returnCode = -1
 
+  def __runAndNotify(self, queue, *args):
+    """
+      Thread target: runs the function, stores its return in the queue and notifies the completion
+      @ In, queue, collections.deque, the queue where the function return is appended
+      @ In, args, list, the arguments of the function
+      @ Out, None
+    """
+    try:
+      queue.append(self.functionToRun(*args))
+    finally:
+      self.__completed = True
+      self._notifyCompletion()
+
   def kill(self):
     """
       Method to kill the job associated to this Runner
@@ -153,13 +182,14 @@ def _asyncRaise(tid, exceptionType):
   """
   if not inspect.isclass(exceptionType):
     raise TypeError("Only types can be raised (not instances)")
-  res = ctypes.pythonapi.PyThreadState_SetAsyncExc(tid, ctypes.py_object(exceptionType))
+  # the thread id is an unsigned long: passed as a plain int, it would be truncated to a C int (invalid id)
+  res = ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(tid), ctypes.py_object(exceptionType))
   if res == 0:
     raise ValueError("invalid thread id")
   elif res != 1:
     # "if it returns a number greater than one, you're in trouble,
     # and you should call it again with exc=NULL to revert the effect"
-    ctypes.pythonapi.PyThreadState_SetAsyncExc(tid, 0)
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(tid), None)
     raise SystemError("PyThreadState_SetAsyncExc failed")
 
 class InterruptibleThread(threading.Thread):
@@ -29,6 +29,7 @@ from .InternalRunner import InternalRunner
 from .SharedMemoryRunner import SharedMemoryRunner
 from .RayRunner import RayRunner
 from .DaskRunner import DaskRunner
+from .ProcessPoolRunner import ProcessPoolRunner, ProcessPool
 from .PassthroughRunner import PassthroughRunner
 from .Error import Error
 
@@ -47,6 +47,7 @@ from .AdaptiveDynamicEventTree import AdaptiveDynamicEventTree
 # MCMC Samplers
 from .MCMC import Metropolis
 from .MCMC import AdaptiveMetropolis
+from .MCMC import DifferentialEvolutionMCMC
 
 factory = EntityFactory('Sampler')
 factory.registerType('MonteCarlo'              , MonteCarlo)
@@ -66,3 +67,4 @@ factory.registerType('AdaptiveDynamicEventTree', AdaptiveDynamicEventTree)
 factory.registerType('AdaptiveMonteCarlo'      , AdaptiveMonteCarlo)
 factory.registerType('Metropolis'              , Metropolis)
 factory.registerType('AdaptiveMetropolis'      , AdaptiveMetropolis)
+factory.registerType('DifferentialEvolutionMCMC', DifferentialEvolutionMCMC)
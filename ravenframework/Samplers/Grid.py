@@ -35,6 +35,7 @@ from .Sampler import Sampler
 from ..utils import utils
 from ..utils import InputData, InputTypes
 from .. import GridEntities
+from .. import Distributions
 # Internal Modules End------------------------------------------------------------------------------
 
 class Grid(Sampler):
@@ -86,6 +87,7 @@ class Grid(Sampler):
     self.externalgGridCoord = False    # boolean attribute. True if the coordinate list has been filled by external source (see factorial sampler)
     self.gridCoordinate = []           # current grid coordinates
     self.gridEntity = None
+    self._axisTables = None            # {'name of the variable': {quantity: np.ndarray}} distribution quantities at the nodes of the 1D axes
 
   def localInputAndChecks(self, xmlNode, paramInput):
     """
@@ -154,6 +156,42 @@ class Grid(Sampler):
     """
     self.gridEntity.initialize()
     self.limit = self.gridEntity.len()
+    self._axisTables = None
+
+  def _computeAxisTables(self):
+    """
+      Evaluates the distributions on the whole set of nodes of each 1D axis of the grid, so that the
+      coordinate, pdf and weight of a grid point are looked up instead of evaluated point by point.
+      Only the axes sampled from 1D crow distributions are tabulated.
+      @ In, None
+      @ Out, axisTables, dict, {'name of the variable': {'coordinate': np.ndarray, 'pdf': np.ndarray, 'weight': np.ndarray}}
+    """
+    axisTables = {}
+    gridVectors = self.gridEntity.returnParameter('gridVectors')
+    for varName in self.axisName:
+      if not (("<distribution>" in varName) or self.variables2distributionsMapping[varName]['totDim'] == 1):
+        continue
+      dist = self.distDict[varName]
+      if not isinstance(dist, Distributions.BoostDistribution) or self.gridInfo[varName] not in ['CDF', 'value']:
+        continue
+      nodes = np.asarray(gridVectors[varName], dtype=float)
+      coordinate = dist.ppf(nodes) if self.gridInfo[varName] == 'CDF' else nodes
+      pdf = dist.pdf(coordinate)
+      if dist.getDistType() == 'Discrete':
+        gridWeight = pdf
+      elif self.gridInfo[varName] == 'CDF':
+        # the cells are bounded by the mid points (in CDF) between neighboring nodes, and by 0 and 1 at the extremes
+        nodeCdf = dist.cdf(coordinate)
+        midPlusCDF = np.append((nodes[1:] + nodeCdf[:-1])/2.0, 1.0)
+        midMinusCDF = np.insert((nodes[:-1] + nodeCdf[1:])/2.0, 0, 0.0)
+        gridWeight = midPlusCDF - midMinusCDF
+      else:
+        # the cells are bounded by the mid points (in value) between neighboring nodes
+        midCDF = dist.cdf((nodes[:-1] + nodes[1:])/2.0)
+        gridWeight = np.append(midCDF, 1.0) - np.insert(midCDF, 0, 0.0)
+      axisTables[varName] = {'coordinate': coordinate, 'pdf': pdf, 'weight': gridWeight}
+
+    return axisTables
 
   def localGenerateInput(self, model, oldInput):
     """
@@ -169,9 +207,14 @@ class Grid(Sampler):
     self.inputInfo['distributionType'] = {} # Used to determine which distribution type is used
     weight = 1.0
     recastDict = {}
+    if self._axisTables is None:
+      self._axisTables = self._computeAxisTables()
     for i in range(len(self.axisName)):
       varName = self.axisName[i]
       if self.gridInfo[varName] == 'CDF':
+        if varName in self._axisTables:
+          # the coordinate is looked up in the axis table once the grid point is known
+          continue
         if self.distDict[varName].getDimensionality() == 1:
           recastDict[varName] = [self.distDict[varName].ppf]
         else:
@@ -201,6 +244,8 @@ class Grid(Sampler):
     if coordinates is None:
       self.raiseADebug('Grid finished with restart points!  Moving on...')
       raise utils.NoMoreSamplesNeeded
+    for varName, table in self._axisTables.items():
+      coordinates[varName] = float(table['coordinate'][currentIndexes[varName]])
     coordinatesPlusOne  = self.gridEntity.returnShiftedCoordinate(currentIndexes,dict.fromkeys(self.axisName,1))
     coordinatesMinusOne = self.gridEntity.returnShiftedCoordinate(currentIndexes,dict.fromkeys(self.axisName,-1))
     for i in range(len(self.axisName)):
@@ -211,7 +256,10 @@ class Grid(Sampler):
           self.inputInfo['distributionName'][key] = self.toBeSampled[varName]
           self.inputInfo['distributionType'][key] = self.distDict[varName].type
           self.values[key] = coordinates[varName]
-          self.inputInfo['SampledVarsPb'][key] = self.distDict[varName].pdf(self.values[key])
+          if varName in self._axisTables:
+            self.inputInfo['SampledVarsPb'][key] = float(self._axisTables[varName]['pdf'][currentIndexes[varName]])
+          else:
+            self.inputInfo['SampledVarsPb'][key] = self.distDict[varName].pdf(self.values[key])
       # compute the SampledVarsPb for N-D distribution
       else:
         if self.variables2distributionsMapping[varName]['reducedDim'] == 1:
@@ -231,7 +279,9 @@ class Grid(Sampler):
           self.inputInfo['SampledVarsPb'][varName] = self.distDict[varName].pdf(ndCoordinate)
       # Compute the ProbabilityWeight
       if ("<distribution>" in varName) or (self.variables2distributionsMapping[varName]['totDim']==1):
-        if self.distDict[varName].getDistType() == 'Discrete':
+        if varName in self._axisTables:
+          gridWeight = float(self._axisTables[varName]['weight'][currentIndexes[varName]])
+        elif self.distDict[varName].getDistType() == 'Discrete':
           gridWeight = self.distDict[varName].pdf(coordinates[varName])
         else:
           if self.gridInfo[varName]=='CDF':
@@ -307,5 +357,6 @@ class Grid(Sampler):
       @ Out, None
     """
     super().flush()
+    self._axisTables = None
     if self.gridEntity is not None:
       self.gridEntity.flush()
@@ -34,6 +34,8 @@ class AdaptiveMetropolis(MCMC):
   """
     Adaptive Metropolis Hastings Sampler
   """
+  _chainAttributes = MCMC._chainAttributes + ['_lambda', '_gamma', '_ensembleMean', '_ensembleCov', '_proposal']
+
   @classmethod
   def getInputSpecification(cls):
     """
@@ -263,9 +265,9 @@ class AdaptiveMetropolis(MCMC):
       @ Out, None
     """
     self.values.update(self._updateValues)
-    if self.counter > 1:
+    if self._chainStep > 1:
       self._localReady = False
-      newVal = self._proposal.rvs()
+      newVal = self._proposal.rvs(engine=self._engine)
       # update sampled value using proposal distribution
       for i, var in enumerate(self._orderedVarsList):
         ## scaling for the new generated inputs
@@ -322,7 +324,7 @@ class AdaptiveMetropolis(MCMC):
       @ Out, None
     """
     MCMC.localFinalizeActualSampling(self, jobObject, model, myInput)
-    if self.counter > 1:
+    if self._chainStep > 1:
       self._updateAdaptiveParams(self.netLogPosterior, self._currentRlz)
 
   def _useRealization(self, newRlz, currentRlz):
@@ -363,16 +365,16 @@ class AdaptiveMetropolis(MCMC):
     """
     ### first use normal strategy (tuneScalingParam) to update scaling parameter until burnIn
     ### Reset scaling and then start to use adaptive approach to update scaling and cov parameters
-    if self.counter == self._burnIn:
+    if self._chainStep == self._burnIn:
       self._lambda = self._scaling**2
       self._scaling = 1.
       self._tune = False
-    elif self.counter > self._burnIn:
+    elif self._chainStep > self._burnIn:
       orderedVarsVals = np.asarray([rlz[var] for var in self._orderedVarsList])
       ## update _lambda and _gamma
-      self._gamma = 1.0/np.sqrt(self.counter-self._burnIn+1.0)
+      self._gamma = 1.0/np.sqrt(self._chainStep-self._burnIn+1.0)
       self._lambda = self._lambda * np.exp(self._gamma * (np.exp(alpha) - self._optAlpha))
-      if self.counter % self._adaptiveInterval == 0:
+      if self._chainStep % self._adaptiveInterval == 0:
         diff = orderedVarsVals - self._ensembleMean
         self._ensembleMean += self._gamma * diff
         self._ensembleCov += self._gamma * (np.outer(diff, diff)-self._ensembleCov)
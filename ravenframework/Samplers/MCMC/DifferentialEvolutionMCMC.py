@@ -0,0 +1,137 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Differential Evolution Markov Chain (DE-MC) Algorithm for Markov Chain Monte Carlo
+  Reference: C. J. F. ter Braak, "A Markov Chain Monte Carlo version of the genetic algorithm
+  Differential Evolution: easy Bayesian computing for real parameter spaces",
+  Statistics and Computing, 16, 239-249 (2006)
+"""
+
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from .Metropolis import Metropolis
+from ...utils import randomUtils, InputData, InputTypes
+#Internal Modules End--------------------------------------------------------------------------------
+
+class DifferentialEvolutionMCMC(Metropolis):
+  """
+    Differential Evolution Markov Chain Sampler: a population of chains is advanced one generation
+    at a time, the proposal of each chain being built from the difference of two other chains
+  """
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, inputSpecification, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    inputSpecification = super(DifferentialEvolutionMCMC, cls).getInputSpecification()
+    samplerInit = inputSpecification.getSub('samplerInit')
+    jumpInterval = InputData.parameterInputFactory("jumpInterval", contentType=InputTypes.IntegerType,
+        descr=r"""the number of generations between two proposals with a unit jump factor (instead of
+              $2.38/\sqrt{2d}$, $d$ being the number of calibrated variables), which allows the chains to
+              jump between the modes of the posterior""", default=10)
+    samplerInit.addSub(jumpInterval)
+    noise = InputData.parameterInputFactory("noise", contentType=InputTypes.FloatType,
+        descr=r"""the scaling of the \xmlNode{proposal} distributions used to perturb the differential
+              evolution proposals, ensuring the ergodicity of the chains""", default=0.01)
+    samplerInit.addSub(noise)
+    return inputSpecification
+
+  def __init__(self):
+    """
+      Default Constructor that will initialize member variables with reasonable
+      defaults or empty lists/dictionaries where applicable.
+      @ In, None
+      @ Out, None
+    """
+    Metropolis.__init__(self)
+    self._synchronousChains = True # a generation is only proposed once all the chains are updated
+    self._jumpInterval = 10 # the number of generations between two unit jump factors
+    self._noise = 0.01 # the scaling of the proposal distributions perturbing the DE proposals
+    self._jumpFactor = None # the jump factor 2.38/sqrt(2d)
+
+  def handleInput(self, paramInput):
+    """
+      Read input specs
+      @ In, paramInput, InputData.ParameterInput, parameter specs interpreted
+      @ Out, None
+    """
+    Metropolis.handleInput(self, paramInput)
+    init = paramInput.findFirst('samplerInit')
+    if init is not None:
+      jumpInterval = init.findFirst('jumpInterval')
+      if jumpInterval is not None:
+        self._jumpInterval = jumpInterval.value
+      noise = init.findFirst('noise')
+      if noise is not None:
+        self._noise = noise.value
+    if self._nChains < 3:
+      self.raiseAnError(IOError, 'DifferentialEvolutionMCMC requires at least 3 "chains", got {}!'.format(self._nChains))
+
+  def initialize(self, externalSeeding=None, solutionExport=None):
+    """
+      This function should be called every time a clean MCMC is needed. Called before takeAstep in <Step>
+      @ In, externalSeeding, int, optional, external seed
+      @ In, solutionExport, DataObject, optional, a PointSet to hold the solution
+      @ Out, None
+    """
+    Metropolis.initialize(self, externalSeeding=externalSeeding, solutionExport=solutionExport)
+    self._jumpFactor = 2.38 / np.sqrt(2.0 * len(self._updateValues))
+
+  def localGenerateInput(self, model, myInput):
+    """
+      Provides the next sample to take.
+      After this method is called, the self.inputInfo should be ready to be sent
+      to the model
+      @ In, model, model instance, an instance of a model
+      @ In, myInput, list, a list of the original needed inputs for the model (e.g. list of files, etc.)
+      @ Out, None
+    """
+    if self._chainStep < 2:
+      Metropolis.localGenerateInput(self, model, myInput)
+      self.inputInfo['SamplerType'] = 'DifferentialEvolutionMCMC'
+      return
+    self._localReady = False
+    # the current states of two other chains, from the last generation
+    others = [chain for chain in range(self._nChains) if chain != self._activeChain]
+    first, second = randomUtils.randomPermutation(others, self, engine=self._engine)[:2]
+    rlzA = self._chainStates[first]['_currentRlz']
+    rlzB = self._chainStates[second]['_currentRlz']
+    gamma = 1.0 if self._chainStep % self._jumpInterval == 0 else self._jumpFactor * self._scaling
+    for key, value in self._updateValues.items():
+      newVal = value + gamma * (float(rlzA[key]) - float(rlzB[key])) + self._noise * self._proposal[key].rvs(engine=self._engine)
+      self.values[key] = newVal
+      if key in self.distDict:
+        ## check the lowerBound and upperBound
+        lowerBound = self.distDict[key].lowerBound
+        upperBound = self.distDict[key].upperBound
+        if lowerBound is not None and self.values[key] < lowerBound:
+          self.values[key] = lowerBound
+        if upperBound is not None and self.values[key] > upperBound:
+          self.values[key] = upperBound
+        self.inputInfo['SampledVarsPb'][key] = self.distDict[key].pdf(newVal)
+      else:
+        self.inputInfo['SampledVarsPb'][key] = self._priorFuns[key].evaluate("pdf", self.values)
+      self.inputInfo['ProbabilityWeight-' + key] = 1.
+    self.inputInfo['PointProbability'] = 1.0
+    self.inputInfo['ProbabilityWeight' ] = 1.0
+    self.inputInfo['SamplerType'] = 'DifferentialEvolutionMCMC'
+    self.inputInfo['LogPosterior'] = self.netLogPosterior
+    self.inputInfo['AcceptRate'] = self._acceptRate
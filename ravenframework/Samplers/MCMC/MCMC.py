@@ -35,6 +35,9 @@ class MCMC(AdaptiveSampler):
   """
     Markov Chain Monte Carlo Sampler.
   """
+  # attributes holding the state of a single Markov chain, swapped in and out when several chains are advanced
+  _chainAttributes = ['_chainStep', '_updateValues', '_currentRlz', 'netLogPosterior', '_acceptRate', '_acceptCount',
+                      '_scaling', '_countsUntilTune', '_acceptInTune', '_accepted', '_tune', '_engine']
 
   @classmethod
   def userManualDescription(cls):
@@ -92,6 +95,13 @@ class MCMC(AdaptiveSampler):
     tuneInterval = InputData.parameterInputFactory("tuneInterval", contentType=InputTypes.IntegerType,
         descr=r"""The number of sample steps for each tuning of scaling parameter""")
     samplerInitInput.addSub(tuneInterval)
+    chains = InputData.parameterInputFactory("chains", contentType=InputTypes.IntegerType,
+        descr=r"""The number of independent Markov chains, advanced concurrently (each chain has its own
+              pending sample, hence up to \xmlNode{chains} samples are evaluated in parallel).
+              The first chain starts from the \xmlNode{initial} values, the other ones from random draws of
+              the variable distributions. \xmlNode{limit} is the total number of samples of all the chains,
+              while \xmlNode{burnIn} applies to each chain.""", default=1)
+    samplerInitInput.addSub(chains)
     inputSpecification.addSub(samplerInitInput)
     likelihoodInp = InputData.parameterInputFactory("likelihood",contentType=InputTypes.StringType,
         printPriority=5,
@@ -129,7 +139,10 @@ class MCMC(AdaptiveSampler):
     new = {'traceID': 'integer identifying which iteration a Markov chain is on',
            '{VAR}': r'any variable from the \xmlNode{TargetEvaluation} input or output at current iteration',
            'LogPosterior': 'log-posterior distribution value',
-           'AcceptRate': 'the accept rate of MCMC algorithm'
+           'AcceptRate': 'the accept rate of MCMC algorithm',
+           'chainID': 'integer identifying the Markov chain',
+           'Rhat_{VAR}': r"""Gelman-Rubin potential scale reduction factor of each calibrated variable across the
+                         chains (only with multiple chains), computed from the samples after the burn-in"""
            }
     vars.update(new)
     return vars
@@ -168,6 +181,18 @@ class MCMC(AdaptiveSampler):
     self._acceptInTune = 0 # The accepted number of samples for given tune interval
     self._accepted = False # The indication of current samples, True if accepted otherwise False
     self._stdProposalDefault = 0.2 # the initial scaling of the std of proposal distribution (only apply to default)
+    self._chainStep = 0 # the number of samples of the (current) chain
+    self._nChains = 1 # the number of Markov chains
+    self._synchronousChains = False # if True, a chain is only advanced once all the chains collected their last sample
+    self._activeChain = 0 # the chain currently being advanced or collected
+    self._engine = None # the random number generator of the active chain (the global one if None, i.e. a single chain)
+    self._chainStates = [] # the state of each chain, i.e. [{attr: value}] for attr in self._chainAttributes
+    self._idleChains = [] # the chains ready to propose a new sample
+    self._waitingChains = [] # the chains waiting for the others (synchronous chains only)
+    self._prefixToChain = {} # the chain of each pending sample, i.e. {prefix: chain}
+    self._traceCount = None # the number of samples (after burn-in) of each chain
+    self._traceMean = None # the running mean of the calibrated variables for each chain
+    self._traceM2 = None # the running sum of squared deviations of the calibrated variables for each chain
     # assembler objects
     self.addAssemblerObject('proposal', InputData.Quantity.zero_to_infinity)
     self.addAssemblerObject('probabilityFunction', InputData.Quantity.zero_to_infinity)
@@ -218,6 +243,11 @@ class MCMC(AdaptiveSampler):
       tuneInterval = init.findFirst('tuneInterval')
       if tuneInterval is not None:
         self._tuneInterval = tuneInterval.value
+      chains = init.findFirst('chains')
+      if chains is not None:
+        if chains.value < 1:
+          self.raiseAnError(IOError, 'The number of "chains" must be a positive integer, got {}!'.format(chains.value))
+        self._nChains = chains.value
     else:
       self.raiseAnError(IOError, 'MCMC', self.name, 'needs the samplerInit block')
     if self._burnIn >= self.limit:
@@ -326,6 +356,121 @@ class MCMC(AdaptiveSampler):
 
     meta = ['LogPosterior', 'AcceptRate']
     self.addMetaKeys(meta)
+    # the chains are set up once the subclasses are initialized, see _initializeChains
+    self._chainStep = 0
+    self._activeChain = 0
+    self._chainStates = []
+    self._idleChains = []
+    self._waitingChains = []
+    self._prefixToChain = {}
+    nVars = len(self.toBeCalibrated)
+    self._traceCount = np.zeros(self._nChains)
+    self._traceMean = np.zeros((self._nChains, nVars))
+    self._traceM2 = np.zeros((self._nChains, nVars))
+
+  def _initializeChains(self):
+    """
+      Sets up the state of each chain, from the state of the (fully initialized) sampler
+      @ In, None
+      @ Out, None
+    """
+    for chain in range(self._nChains):
+      state = {}
+      for attr in self._chainAttributes:
+        value = getattr(self, attr)
+        # containers are updated in place, while distributions are only replaced
+        state[attr] = copy.deepcopy(value) if isinstance(value, (dict, list, np.ndarray)) else value
+      # each chain draws from its own generator, so that it is reproducible whatever the order in which the samples are collected
+      state['_engine'] = randomUtils.newRNG()
+      seed = np.random.SeedSequence([self.initSeed, chain]).generate_state(1)[0]
+      randomUtils.randomSeed(int(seed), engine=state['_engine'])
+      if chain > 0:
+        state['_updateValues'] = self._drawInitialValues(state['_updateValues'], state['_engine'])
+      self._chainStates.append(state)
+    self._idleChains = list(range(self._nChains))
+
+  def _drawInitialValues(self, values, engine):
+    """
+      Draws the initial values of a chain from the distributions of the variables (the variables with a
+      probabilityFunction keep the provided initial value)
+      @ In, values, dict, the initial values of the first chain, i.e. {var: val}
+      @ In, engine, instance, the random number generator of the new chain
+      @ Out, values, dict, the initial values of the new chain
+    """
+    values = dict(values)
+    draws = {}
+    for var in values:
+      if var in self.distDict:
+        distName = self.variables2distributionsMapping[var]['name']
+        if distName not in draws:
+          draws[distName] = self.distDict[var].rvs(engine=engine)
+        draw = np.atleast_1d(draws[distName])
+        values[var] = draw[self.variables2distributionsMapping[var]['dim'] - 1] if draw.size > 1 else float(draw[0])
+    return values
+
+  def _activateChain(self, chain):
+    """
+      Loads the state of a chain, including its random number generator
+      @ In, chain, int, the chain identifier
+      @ Out, None
+    """
+    self._activeChain = chain
+    for attr, value in self._chainStates[chain].items():
+      setattr(self, attr, value)
+
+  def _storeChain(self, chain):
+    """
+      Stores the state of a chain
+      @ In, chain, int, the chain identifier
+      @ Out, None
+    """
+    for attr in self._chainAttributes:
+      self._chainStates[chain][attr] = getattr(self, attr)
+
+  def generateInput(self, model, oldInput):
+    """
+      Generates the next sample, advancing one of the idle chains
+      @ In, model, model instance, it is the instance of a RAVEN model
+      @ In, oldInput, list, a list of the original needed inputs for the model (e.g. list of files, etc. etc)
+      @ Out, generateInput, tuple(int, object), see Sampler.generateInput
+    """
+    if self._nChains == 1:
+      self._chainStep += 1
+      return AdaptiveSampler.generateInput(self, model, oldInput)
+    if not self._chainStates:
+      self._initializeChains()
+    chain = self._idleChains.pop(0)
+    self._activateChain(chain)
+    self._chainStep += 1
+    out = AdaptiveSampler.generateInput(self, model, oldInput)
+    self._prefixToChain[self.inputInfo['prefix']] = chain
+    self._storeChain(chain)
+    self._localReady = len(self._idleChains) > 0
+    return out
+
+  def finalizeActualSampling(self, jobObject, model, myInput):
+    """
+      Collects a finished sample, within the chain that proposed it
+      @ In, jobObject, instance, an instance of a JobHandler
+      @ In, model, model instance, it is the instance of a RAVEN model
+      @ In, myInput, list, the generating input
+      @ Out, None
+    """
+    if self._nChains == 1:
+      AdaptiveSampler.finalizeActualSampling(self, jobObject, model, myInput)
+      return
+    chain = self._prefixToChain.pop(jobObject.getMetadata()['prefix'])
+    self._activateChain(chain)
+    AdaptiveSampler.finalizeActualSampling(self, jobObject, model, myInput)
+    self._storeChain(chain)
+    if self._synchronousChains:
+      self._waitingChains.append(chain)
+      if len(self._waitingChains) == self._nChains:
+        self._idleChains.extend(sorted(self._waitingChains))
+        self._waitingChains = []
+    else:
+      self._idleChains.append(chain)
+    self._localReady = len(self._idleChains) > 0
 
   def localGenerateInput(self, model, myInput):
     """
@@ -361,15 +506,19 @@ class MCMC(AdaptiveSampler):
     self._localReady = True
     AdaptiveSampler.localFinalizeActualSampling(self, jobObject, model, myInput)
     prefix = jobObject.getMetadata()['prefix']
-    full = self._targetEvaluation.realization(index=self.counter-1)
+    if self._nChains == 1:
+      full = self._targetEvaluation.realization(index=self.counter-1)
+    else:
+      # the samples of different chains are collected in any order
+      _, full = self._targetEvaluation.realization(matchDict={'prefix': prefix})
     rlz = dict((var, full[var]) for var in (list(self.toBeCalibrated.keys()) + [self._likelihood] + list(self.dependentSample.keys())))
-    rlz['traceID'] = self.counter
+    rlz['traceID'] = self._chainStep
     rlz['LogPosterior'] = self.inputInfo['LogPosterior']
     rlz['AcceptRate'] = self.inputInfo['AcceptRate']
-    if self.counter == 1:
+    if self._chainStep == 1:
       self._addToSolutionExport(rlz)
       self._currentRlz = rlz
-    if self.counter > 1:
+    if self._chainStep > 1:
       alpha = self._useRealization(rlz, self._currentRlz)
       self.netLogPosterior = alpha
       self._accepted = self._checkAcceptance(alpha)
@@ -378,7 +527,7 @@ class MCMC(AdaptiveSampler):
         self._addToSolutionExport(rlz)
         self._updateValues = dict((var, rlz[var]) for var in self._updateValues)
       else:
-        self._currentRlz.update({'traceID':self.counter, 'LogPosterior': self.inputInfo['LogPosterior'], 'AcceptRate':self.inputInfo['AcceptRate']})
+        self._currentRlz.update({'traceID':self._chainStep, 'LogPosterior': self.inputInfo['LogPosterior'], 'AcceptRate':self.inputInfo['AcceptRate']})
         self._addToSolutionExport(self._currentRlz)
         self._updateValues = dict((var, self._currentRlz[var]) for var in self._updateValues)
     if self._tune:
@@ -407,11 +556,11 @@ class MCMC(AdaptiveSampler):
       @ In, alpha, float, the accepted probabilty
       @ Out, acceptable, bool, True if we accept the new sampled point
     """
-    acceptValue = np.log(self._acceptDist.rvs())
+    acceptValue = np.log(self._acceptDist.rvs(engine=self._engine))
     acceptable = alpha > acceptValue
     if acceptable:
       self._acceptCount += 1
-    self._acceptRate = self._acceptCount/self.counter
+    self._acceptRate = self._acceptCount/self._chainStep
     return acceptable
 
   def localStillReady(self, ready):
@@ -441,7 +590,13 @@ class MCMC(AdaptiveSampler):
       @ Out, acceptable, set, modified set of acceptable variables with all formatting complete
     """
     acceptable = AdaptiveSampler._formatSolutionExportVariableNames(self, acceptable)
-    return acceptable
+    new = []
+    for template in acceptable:
+      if template == 'Rhat_{VAR}':
+        new.extend(utils.partialFormat(template, {'VAR': var}) for var in self.toBeCalibrated)
+      else:
+        new.append(template)
+    return new
 
   def _addToSolutionExport(self, rlz):
     """
@@ -449,10 +604,42 @@ class MCMC(AdaptiveSampler):
       @ In, rlz, dict, sampled realization
       @ Out, None
     """
-    if self._burnIn < self.counter:
+    if self._burnIn < self._chainStep:
+      rlz = dict(rlz)
+      # update the running statistics of the chain trace
+      chain = self._activeChain
+      values = np.asarray([float(np.ravel(rlz[var])[0]) for var in self.toBeCalibrated])
+      self._traceCount[chain] += 1
+      delta = values - self._traceMean[chain]
+      self._traceMean[chain] += delta / self._traceCount[chain]
+      self._traceM2[chain] += delta * (values - self._traceMean[chain])
+      rHat = self.gelmanRubin(self._traceCount, self._traceMean, self._traceM2)
+      for index, var in enumerate(self.toBeCalibrated):
+        rlz['Rhat_' + var] = rHat[index]
+      rlz['chainID'] = chain
       rlz = dict((var, np.atleast_1d(val)) for var, val in rlz.items())
       self._solutionExport.addRealization(rlz)
 
+  @staticmethod
+  def gelmanRubin(count, mean, m2):
+    """
+      Computes the Gelman-Rubin potential scale reduction factor (R-hat) of each variable across the chains,
+      from the running statistics of each chain (for chains of different lengths, the average length is used)
+      @ In, count, numpy.array, the number of samples of each chain, shape (nChains,)
+      @ In, mean, numpy.array, the mean of each variable for each chain, shape (nChains, nVars)
+      @ In, m2, numpy.array, the sum of squared deviations of each variable for each chain, shape (nChains, nVars)
+      @ Out, rHat, numpy.array, the R-hat of each variable (NaN if not enough samples), shape (nVars,)
+    """
+    rHat = np.full(mean.shape[1], np.nan)
+    if len(count) < 2 or np.min(count) < 2:
+      return rHat
+    n = np.mean(count)
+    within = np.mean(m2 / (count[:, np.newaxis] - 1.0), axis=0)
+    between = np.var(mean, axis=0, ddof=1)
+    valid = within > 0
+    rHat[valid] = np.sqrt(((n - 1.0) / n * within[valid] + between[valid]) / within[valid])
+    return rHat
+
   @staticmethod
   def tuneScalingParam(scale, acceptRate):
     """
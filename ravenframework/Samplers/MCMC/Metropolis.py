@@ -124,13 +124,13 @@ class Metropolis(MCMC):
       @ In, myInput, list, a list of the original needed inputs for the model (e.g. list of files, etc.)
       @ Out, None
     """
-    if self.counter < 2:
+    if self._chainStep < 2:
       MCMC.localGenerateInput(self, model, myInput)
     else:
       self._localReady = False
       for key, value in self._updateValues.items():
         # update value based on proposal distribution
-        newVal = value + self._proposal[key].rvs() * self._scaling
+        newVal = value + self._proposal[key].rvs(engine=self._engine) * self._scaling
         self.values[key] = newVal
         if key in self.distDict:
           ## check the lowerBound and upperBound
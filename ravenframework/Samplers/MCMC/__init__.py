@@ -21,6 +21,8 @@
 from .MCMC import MCMC
 from .Metropolis import Metropolis
 from .AdaptiveMetropolis import AdaptiveMetropolis
+from .DifferentialEvolutionMCMC import DifferentialEvolutionMCMC
 
 __all__ = ['Metropolis',
-           'AdaptiveMetropolis']
+           'AdaptiveMetropolis',
+           'DifferentialEvolutionMCMC']
@@ -27,6 +27,7 @@ import numpy as np
 # Internal Modules----------------------------------------------------------------------------------
 from .Sampler import Sampler
 from ..utils import utils,randomUtils,InputData, InputTypes
+from .. import Distributions
 # Internal Modules End------------------------------------------------------------------------------
 
 class MonteCarlo(Sampler):
@@ -100,6 +101,45 @@ class MonteCarlo(Sampler):
     else:
       self.raiseAnError(IOError, self, f'Monte Carlo sampler {self.name} needs the samplerInit block')
 
+  def localGenerateBatch(self, batchSize):
+    """
+      Generates the next "batchSize" samples at once, evaluating the distributions on whole arrays.
+      The random numbers are drawn in the same order used by localGenerateInput (sample by sample,
+      variable by variable), so the samples are the same as if they were generated one at a time.
+      Only available if all the variables are sampled from 1D crow distributions.
+      @ In, batchSize, int, number of samples to generate
+      @ Out, batch, dict, {name: np.ndarray} with the sample index as first axis (empty if not supported)
+    """
+    keys = sorted(self.distDict)
+    for key in keys:
+      if self.variables2distributionsMapping[key]['totDim'] != 1 or not isinstance(self.distDict[key], Distributions.BoostDistribution):
+        return {}
+      if self.samplingType == 'uniform':
+        distData = self.distDict[key].getCrowDistDict()
+        if ('xMin' not in distData.keys()) or ('xMax' not in distData.keys()):
+          # let localGenerateInput report the error
+          return {}
+    batch = {}
+    if not keys:
+      return batch
+    randomMatrix = randomUtils.random(len(keys), batchSize, keepMatrix=True)
+    weight = np.ones(batchSize)
+    for i, key in enumerate(keys):
+      if self.samplingType == 'uniform':
+        distData = self.distDict[key].getCrowDistDict()
+        lower = distData['xMin']
+        upper = distData['xMax']
+        rvsnum = lower + (upper - lower) * randomMatrix[:, i]
+        epsilon = (upper-lower)/self.limit
+        # as in localGenerateInput, only the weight of the last variable is retained
+        weight = self.distDict[key].cdf(rvsnum + epsilon) - self.distDict[key].cdf(rvsnum - epsilon)
+      else:
+        rvsnum = self.distDict[key].ppf(randomMatrix[:, i])
+      batch[key] = rvsnum
+      batch[f'SampledVarsPb-{key}'] = self.distDict[key].pdf(rvsnum)
+    batch['ProbabilityWeight'] = weight
+    return batch
+
   def localGenerateInput(self, model, myInput):
     """
       Provides the next sample to take.
@@ -109,6 +149,16 @@ class MonteCarlo(Sampler):
       @ In, myInput, list, a list of the original needed inputs for the model (e.g. list of files, etc.)
       @ Out, None
     """
+    index = self._popBatchSample()
+    if index is not None:
+      # the sample has already been generated by localGenerateBatch
+      for key in sorted(self.distDict):
+        for kkey in key.split(','):
+          self.values[kkey] = self._sampleBatch[key][index]
+        self.inputInfo['SampledVarsPb'][key] = float(self._sampleBatch[f'SampledVarsPb-{key}'][index])
+        self.inputInfo['ProbabilityWeight-' + key] = 1.
+      self._finalizeGeneratedInput(float(self._sampleBatch['ProbabilityWeight'][index]))
+      return
     # create values dictionary
     weight = 1.0
     for key in sorted(self.distDict):
@@ -162,7 +212,14 @@ class MonteCarlo(Sampler):
           self.inputInfo[f'ProbabilityWeight-{dist}'] = 1.
       else:
         self.raiseAnError(IOError, "Total dimension for given distribution should be >= 1")
+    self._finalizeGeneratedInput(weight)
 
+  def _finalizeGeneratedInput(self, weight):
+    """
+      Fills the sample-wide probability information, once the variables have been sampled.
+      @ In, weight, float, the weight of the sample (used for the uniform sampling type only)
+      @ Out, None
+    """
     if len(self.inputInfo['SampledVarsPb'].keys()) > 0:
       self.inputInfo['PointProbability'] = reduce(mul, self.inputInfo['SampledVarsPb'].values())
     else:
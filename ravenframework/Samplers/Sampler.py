@@ -223,6 +223,9 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta, BaseEntity), Assembler, InputD
     self.constantSources               = {}                        # storage for the way to obtain constant information
 
     self._endJobRunnable               = sys.maxsize               # max number of inputs creatable by the sampler right after a job ends (e.g., infinite for MC, 1 for Adaptive, etc)
+    self._sampleBatch                  = {}                        # samples generated at once by prepareBatch, as {name: np.ndarray} with one entry per sample
+    self._batchLength                  = 0                         # number of samples in self._sampleBatch
+    self._batchCursor                  = 0                         # index of the next sample to hand out from self._sampleBatch
     self.distributions2variablesIndexList = {}
 
     ######
@@ -547,6 +550,7 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta, BaseEntity), Assembler, InputD
     if self.initSeed is None:
       self.initSeed = randomUtils.randomIntegers(0,2**31,self)
     self.counter = 0
+    self._clearBatch()
     if not externalSeeding:
       randomUtils.randomSeed(self.initSeed) # use the sampler initialization seed
       self.auxcnt = self.initSeed
@@ -1000,6 +1004,7 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta, BaseEntity), Assembler, InputD
       @ Out, newInputs, list of list, list of the list of input sets
     """
     newInputs = []
+    self.prepareBatch(batchSize - self.counter)
     while self.amIreadyToProvideAnInput() and (self.counter < batchSize):
       if projector is None:
         newInputs.append(self.generateInput(model, myInput))
@@ -1008,6 +1013,58 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta, BaseEntity), Assembler, InputD
 
     return newInputs
 
+  def prepareBatch(self, batchSize):
+    """
+      Informs the sampler that the next "batchSize" inputs are going to be requested one right after the
+      other, so that samplers able to do so can generate all of them at once (see localGenerateBatch),
+      evaluating the distributions on whole arrays of samples. The samples are then handed out, in order,
+      by the following calls to generateInput.
+      @ In, batchSize, int, number of inputs about to be requested
+      @ Out, None
+    """
+    # samples still pending from a previous batch come first; never generate past the limit,
+    # so that the random number stream is consumed as if the samples were generated one by one
+    if self.limit is not None:
+      batchSize = min(batchSize, self.limit - self.counter)
+    if self._batchCursor < self._batchLength or batchSize < 2 or self.reseedAtEachIteration:
+      return
+    self._clearBatch()
+    batch = self.localGenerateBatch(batchSize)
+    if batch:
+      self._sampleBatch = batch
+      self._batchLength = len(next(iter(batch.values())))
+
+  def localGenerateBatch(self, batchSize):
+    """
+      Generates the next "batchSize" samples at once. Samplers supporting batch generation overwrite this
+      method, and consume the batch in localGenerateInput through _popBatchSample.
+      @ In, batchSize, int, number of samples to generate
+      @ Out, batch, dict, {name: np.ndarray} with the sample index as first axis (empty if not supported)
+    """
+    return {}
+
+  def _clearBatch(self):
+    """
+      Discards any sample left from batch generation.
+      @ In, None
+      @ Out, None
+    """
+    self._sampleBatch = {}
+    self._batchLength = 0
+    self._batchCursor = 0
+
+  def _popBatchSample(self):
+    """
+      Provides the index of the next sample in the batch generated by prepareBatch, if any.
+      @ In, None
+      @ Out, index, int or None, index of the sample in self._sampleBatch (None if no batch sample is left)
+    """
+    if self._batchCursor >= self._batchLength:
+      return None
+    index = self._batchCursor
+    self._batchCursor += 1
+    return index
+
   @abc.abstractmethod
   def localGenerateInput(self, model, oldInput):
     """
@@ -1147,3 +1204,4 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta, BaseEntity), Assembler, InputD
     self.auxcnt = 0
     self.distDict = {}
     self.funcDict = {}
+    self._clearBatch()
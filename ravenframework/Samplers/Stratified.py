@@ -26,6 +26,7 @@ import numpy as np
 
 #Internal Modules------------------------------------------------------------------------------------
 from ..utils import utils, randomUtils, InputData, InputTypes
+from .. import Distributions
 from .Grid import Grid
 from .Sampler import Sampler
 #Internal Modules End--------------------------------------------------------------------------------
@@ -155,6 +156,54 @@ class Stratified(Grid):
     for nPoint in range(self.pointByVar-1):
       self.sampledCoordinate[nPoint] = [tempFillingCheck[mappingIdVarName[varName]][nPoint] for varName in self.axisName]
 
+  def localGenerateBatch(self, batchSize):
+    """
+      Generates the next "batchSize" samples at once, evaluating the distributions on whole arrays.
+      The random numbers are drawn in the same order used by localGenerateInput (sample by sample,
+      variable by variable), so the samples are the same as if they were generated one at a time.
+      Only available if all the variables are sampled from 1D crow distributions.
+      @ In, batchSize, int, number of samples to generate
+      @ Out, batch, dict, {name: np.ndarray} with the sample index as first axis (empty if not supported)
+    """
+    if self.variablesTransformationDict:
+      return {}
+    for varName in self.axisName:
+      if not (("<distribution>" in varName) or self.variables2distributionsMapping[varName]['totDim'] == 1):
+        return {}
+      if not isinstance(self.distDict[varName], Distributions.BoostDistribution) or self.gridInfo[varName] not in ['CDF', 'value']:
+        return {}
+    batch = {}
+    randomMatrix = randomUtils.random(len(self.axisName), batchSize, keepMatrix=True)
+    for varCount, varName in enumerate(self.axisName):
+      dist = self.distDict[varName]
+      upper = np.zeros(batchSize)
+      lower = np.zeros(batchSize)
+      for i in range(batchSize):
+        # the counter is incremented right before each call to localGenerateInput
+        interval = self.sampledCoordinate[self.counter+i][varCount]
+        upper[i] = self.gridEntity.returnShiftedCoordinate(self.gridEntity.returnIteratorIndexes(),{varName:interval+1})[varName]
+        lower[i] = self.gridEntity.returnShiftedCoordinate(self.gridEntity.returnIteratorIndexes(),{varName:interval})[varName]
+      if self.gridInfo[varName] == 'CDF':
+        coordinate = lower + (upper-lower)*randomMatrix[:, varCount]
+        values = dist.ppf(coordinate)
+        batch[f'lower-{varName}'] = dist.ppf(np.minimum(upper, lower))
+        batch[f'upper-{varName}'] = dist.ppf(np.maximum(upper, lower))
+        gridWeight = dist.cdf(batch[f'upper-{varName}']) - dist.cdf(batch[f'lower-{varName}'])
+      else:
+        cdfLower = dist.cdf(np.minimum(upper, lower))
+        cdfUpper = dist.cdf(np.maximum(upper, lower))
+        coordinateCdf = cdfLower + (cdfUpper - cdfLower)*randomMatrix[:, varCount]
+        if np.any(coordinateCdf == 0.0):
+          self.raiseAWarning(IOError, "The grid lower bound and upper bound in value will generate ZERO cdf value!!!")
+        values = dist.ppf(coordinateCdf)
+        batch[f'lower-{varName}'] = np.minimum(upper, lower)
+        batch[f'upper-{varName}'] = np.maximum(upper, lower)
+        gridWeight = cdfUpper - cdfLower
+      batch[varName] = values
+      batch[f'SampledVarsPb-{varName}'] = dist.pdf(values)
+      batch[f'ProbabilityWeight-{varName}'] = gridWeight
+    return batch
+
   def localGenerateInput(self, model, oldInput):
     """
       Function to select the next most informative point for refining the limit
@@ -169,6 +218,24 @@ class Stratified(Grid):
     self.inputInfo['distributionName'] = {} # Used to determine which distribution to change if needed.
     self.inputInfo['distributionType'] = {} # Used to determine which distribution type is used
     weight = 1.0
+    index = self._popBatchSample()
+    if index is not None:
+      # the sample has already been generated by localGenerateBatch
+      for varName in self.axisName:
+        self.inputInfo['SampledVarsPb'][varName] = float(self._sampleBatch[f'SampledVarsPb-{varName}'][index])
+        gridWeight = float(self._sampleBatch[f'ProbabilityWeight-{varName}'][index])
+        weight *= gridWeight
+        self.inputInfo['ProbabilityWeight-'+varName] = gridWeight
+        for subVar in varName.strip().split(','):
+          self.inputInfo['distributionName'][subVar] = self.toBeSampled[varName]
+          self.inputInfo['distributionType'][subVar] = self.distDict[varName].type
+          self.values[subVar] = float(self._sampleBatch[varName][index])
+          self.inputInfo['upper'][subVar] = float(self._sampleBatch[f'upper-{varName}'][index])
+          self.inputInfo['lower'][subVar] = float(self._sampleBatch[f'lower-{varName}'][index])
+      self.inputInfo['PointProbability'] = reduce(mul, self.inputInfo['SampledVarsPb'].values())
+      self.inputInfo['ProbabilityWeight' ] = weight
+      self.inputInfo['SamplerType'] = 'Stratified'
+      return
     for varName in self.axisName:
       # new implementation for ND LHS
       if not "<distribution>" in varName:
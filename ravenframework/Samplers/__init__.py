@@ -48,5 +48,6 @@ from .AdaptiveDynamicEventTree import AdaptiveDynamicEventTree
 # MCMC Samplers
 from .MCMC import Metropolis
 from .MCMC import AdaptiveMetropolis
+from .MCMC import DifferentialEvolutionMCMC
 
 from .Factory import factory
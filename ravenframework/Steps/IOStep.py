@@ -253,7 +253,9 @@ class IOStep(Step):
         # load a CSV from file
         infile = inDictionary['Input'][i]
         options = {'fileToLoad':infile}
-        outputs[i].load(inDictionary['Input'][i].getPath(),'csv',**options)
+        # the single-file HDF5 history stores are recognized by their extension
+        style = 'hdf5' if infile.getExt().lower() in ['h5', 'hdf5'] else 'csv'
+        outputs[i].load(inDictionary['Input'][i].getPath(),style,**options)
 
       else:
         # unrecognized, and somehow not caught by the step reader.
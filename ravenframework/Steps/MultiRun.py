@@ -119,6 +119,7 @@ class MultiRun(SingleRun):
       if not model.amITrained:
         model.raiseAnError(RuntimeError, f'ROM model "{model.name}" has not been trained yet, so it cannot be sampled!'+\
                                         ' Use a RomTrainer step to train it.')
+    inDictionary[self.samplerType].prepareBatch(inDictionary['jobHandler'].runInfoDict['batchSize'])
     for inputIndex in range(inDictionary['jobHandler'].runInfoDict['batchSize']):
       if inDictionary[self.samplerType].amIreadyToProvideAnInput():
         try:
@@ -152,6 +153,8 @@ class MultiRun(SingleRun):
     nextReportTime = time.time() + reportDeltaTime
     # run step loop
     while True:
+      # clear before re-checking the finished queue, so that no completion notified from now on is missed
+      jobHandler.clearActivity()
       # collect finished jobs
       finishedJobs = jobHandler.getFinished()
 
@@ -263,7 +266,8 @@ class MultiRun(SingleRun):
         # NOTE for some reason submission outside collection breaks the DET
         # however, it is necessary i.e. batch sampling
         self._addNewRuns(sampler, model, inputs, outputs, jobHandler, inDictionary, verbose=False)
-      time.sleep(self.sleepTime)
+      # block until a job finishes (or the job queue makes room), at most sleepTime, instead of busy polling
+      jobHandler.waitForActivity(self.sleepTime)
     # END while loop that runs the step iterations (collection and submission-for-DET)
     # if any collected runs failed, let the sampler treat them appropriately, and any other closing-out actions
     sampler.finalizeSampler(self.failedRuns)
@@ -293,7 +297,9 @@ class MultiRun(SingleRun):
     # So, we take the minimum of these two values.
     if verbose:
       self.raiseADebug('Testing if the sampler is ready to generate a new input')
-    for _ in range(min(jobHandler.availability(isEnsemble), sampler.endJobRunnable())):
+    numNewRuns = min(jobHandler.availability(isEnsemble), sampler.endJobRunnable())
+    sampler.prepareBatch(numNewRuns)
+    for _ in range(numNewRuns):
       if sampler.amIreadyToProvideAnInput():
         try:
           newInput = self._findANewInputToRun(sampler, model, inputs, outputs, jobHandler)
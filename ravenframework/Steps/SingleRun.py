@@ -21,7 +21,6 @@
 """
 # External Modules----------------------------------------------------------------------------------
 import atexit
-import time
 import os
 import copy
 # External Modules End------------------------------------------------------------------------------
@@ -48,6 +47,7 @@ class SingleRun(Step):
     self.samplerType = 'Sampler'
     self.failedRuns = []
     self.lockedFileName = "ravenLocked.raven"
+    self._lockedDirs = set() # working directories locked by this step (a step can be repeated in the Sequence)
     self.printTag = 'STEP SINGLERUN'
 
   def _localInputAndCheckParam(self, paramInput):
@@ -127,7 +127,7 @@ class SingleRun(Step):
         except FileExistsError:
           if utils.checkIfPathAreAccessedByAnotherProgram(currentWorkingDirectory,3.0):
             self.raiseAWarning(f'directory {currentWorkingDirectory} is likely used by another program!!! ')
-          if utils.checkIfLockedRavenFileIsPresent(currentWorkingDirectory,self.lockedFileName):
+          if currentWorkingDirectory not in self._lockedDirs and utils.checkIfLockedRavenFileIsPresent(currentWorkingDirectory,self.lockedFileName):
             self.raiseAnError(RuntimeError, self, f"another instance of RAVEN is running in the working directory {currentWorkingDirectory}. Please check your input!")
           if self._clearRunDir and not alreadyTried:
             self.raiseAWarning(f'The calculation run directory {currentWorkingDirectory} already exists, ' +
@@ -146,7 +146,9 @@ class SingleRun(Step):
                                 'Files present in this directory may be replaced, and error handling may not occur as expected.')
             workingDirReady = True
           # register function to remove the locked file at the end of execution
-        atexit.register(utils.removeFile,os.path.join(currentWorkingDirectory,self.lockedFileName))
+        if currentWorkingDirectory not in self._lockedDirs:
+          atexit.register(utils.removeFile,os.path.join(currentWorkingDirectory,self.lockedFileName))
+          self._lockedDirs.add(currentWorkingDirectory)
     inDictionary['Model'].initialize(inDictionary['jobHandler'].runInfoDict,inDictionary['Input'],modelInitDict)
 
     self.raiseADebug(f'for the role Model, the item of class {inDictionary["Model"].type} and name {inDictionary["Model"].name} has been initialized')
@@ -190,6 +192,8 @@ class SingleRun(Step):
     # empty dictionary corresponds to sampling data in MultiRun
     model.submit(inputs, None, jobHandler, **{'SampledVars': {'prefix':'None'}, 'additionalEdits': {}})
     while True:
+      # clear before re-checking the finished queue, so that no completion notified from now on is missed
+      jobHandler.clearActivity()
       finishedJobs = jobHandler.getFinished()
       for finishedJob in finishedJobs:
         if finishedJob.getReturnCode() == 0:
@@ -218,7 +222,8 @@ class SingleRun(Step):
               self.raiseAWarning(f'The job "{finishedJob.identifier}" has been submitted {self.failureHandling["repetitions"]} times, failing every time!!!')
       if jobHandler.isFinished() and len(jobHandler.getFinishedNoPop()) == 0:
         break
-      time.sleep(self.sleepTime)
+      # block until a job finishes (or the job queue makes room), at most sleepTime, instead of busy polling
+      jobHandler.waitForActivity(self.sleepTime)
     if sampler is not None:
       sampler.handleFailedRuns(self.failedRuns)
     else:
@@ -1167,8 +1167,32 @@ class ARMA(SupervisedLearning):
     peakResults['nbin']=windowDict['nbin']
     rangeWindow = self.rangeWindow(windowDict=peakResults)
     peakResults['rangeWindow']=rangeWindow
+    peakResults['samplers']=self._trainPeakSamplers(groupWin, rangeWindow)
     return peakResults
 
+  def _trainPeakSamplers(self, groupWin, rangeWindow):
+    """
+      Build the samplers used to regenerate the peaks of each type of window, so that the
+      distributions are constructed once and not at every evaluation
+      @ In, groupWin, list, list of dictionaries which store the peak information
+      @ In, rangeWindow, list, list of dictionaries which store the window index for each target
+      @ Out, samplers, list, list of dictionaries with the probability of existence ('prbExist')
+        and the distributions of the amplitude ('amp') and relative position ('ind') of the peaks
+    """
+    samplers = []
+    for i, group in enumerate(groupWin):
+      sampler = {'prbExist': len(group['Ind'])/len(rangeWindow[i]['bg']),
+                 'amp': None,
+                 'ind': None}
+      # (amount of peaks that collected in the windows)/(the amount of windows)
+      # this is the probability to check if we should add a peak in each type of window
+      if len(group['Ind']) > 0:
+        # distribution of the amplitude and of the position (relative index) in the window
+        sampler['amp'] = rv_histogram(np.histogram(group['Amp']))
+        sampler['ind'] = rv_histogram(np.histogram(group['Ind']))
+      samplers.append(sampler)
+    return samplers
+
   def _trainFourier(self, pivotValues, periods, values, masks=None,target=None):
     """
       Perform fitting of Fourier series on self.timeSeriesDatabase
@@ -1978,6 +2002,7 @@ class ARMA(SupervisedLearning):
         groupWin[g]['Ind']=indLocal
         groupWin[g]['Amp']=ampLocal
       self.peaks[target]['groupWin']=groupWin
+      self.peaks[target]['samplers']=self._trainPeakSamplers(groupWin, self.peaks[target]['rangeWindow'])
 
   def getGlobalRomSegmentSettings(self, trainingDict, divisions):
     """
@@ -2380,53 +2405,41 @@ class ARMA(SupervisedLearning):
       @ Out, maskPeakRes, np.array, boolean mask where is the residual signal
     """
     groupWin = []
-    maskPeakRes = np.ones(len(signal), dtype=bool)
+    numValues = len(signal)
+    maskPeakRes = np.ones(numValues, dtype=bool)
     rangeWindow = self.rangeWindow(windowDict)
     low = windowDict['threshold']
     windows = windowDict['windows']
     period = windowDict['period']
+    # the peaks are found once on the signal extended by one period, so that the windows
+    # wrapping around the end of the signal are contiguous
+    peaks, heights = self._peakPicker(np.concatenate([signal, signal[:period]]), low=low)
     for i in range(len(windowDict['windows'])):
-      bg  = rangeWindow[i]['bg']
-      end = rangeWindow[i]['end']
-      peakInfo   = {}
-      indLocal   = []
-      ampLocal   = []
-      for j in range(min(len(bg), len(end))):
-        ##FIXME this might ignore one window, because the amount of the
-        # staring points and the ending points might be different here,
-        # we choose the shorter one to make sure each window is complete.
-        # Future developer can extend the head and tail of the signal to
-        # include all the posible windows
-        bgLocal = bg[j]
-        endLocal = end[j]
-        if bgLocal<endLocal:
-          peak, height = self._peakPicker(signal[bgLocal:endLocal], low=low)
-        else:
-          peak, height = self._peakPicker(np.concatenate([signal[bgLocal:], signal[:endLocal]]), low=low)
-        if len(peak) == 1:
-          indLocal.append(int(peak))
-          ampLocal.append(float(height))
-          maskBg=int((int(peak)+bgLocal-int(np.floor(windows[i]['width']/2)))%len(self.pivotParameterValues))
-          maskEnd=int((int(peak)+bgLocal+int(np.ceil(windows[i]['width']/2)))%len(self.pivotParameterValues))
-          if maskBg>maskEnd:
-            maskPeakRes[maskBg:] = False
-            maskPeakRes[:maskEnd] = False
-          else:
-            maskPeakRes[maskBg:maskEnd] = False
-        elif len(peak) > 1:
-          indLocal.append(int(peak[np.argmax(height)]))
-          ampLocal.append(float(height[np.argmax(height)]))
-          maskBg=int((int(peak[np.argmax(height)])+bgLocal-int(np.floor(windows[i]['width']/2)))%len(self.pivotParameterValues))
-          maskEnd=int((int(peak[np.argmax(height)])+bgLocal+int(np.ceil(windows[i]['width']/2)))%len(self.pivotParameterValues))
-          if maskBg>maskEnd:
-            maskPeakRes[maskBg:] = False
-            maskPeakRes[:maskEnd] = False
-          else:
-            maskPeakRes[maskBg:maskEnd] = False
-
-      peakInfo['Ind'] = indLocal
-      peakInfo['Amp'] = ampLocal
-      groupWin.append(peakInfo)
+      ##FIXME this might ignore one window, because the amount of the
+      # staring points and the ending points might be different here,
+      # we choose the shorter one to make sure each window is complete.
+      # Future developer can extend the head and tail of the signal to
+      # include all the posible windows
+      numWindows = min(len(rangeWindow[i]['bg']), len(rangeWindow[i]['end']))
+      bg = np.asarray(rangeWindow[i]['bg'][:numWindows], dtype=int)
+      end = np.asarray(rangeWindow[i]['end'][:numWindows], dtype=int)
+      end = np.where(bg < end, end, end + numValues)
+      # a peak in the window [bg, end) needs both of its neighbors inside the window
+      first = np.searchsorted(peaks, bg, side='right')
+      last = np.searchsorted(peaks, end - 1, side='left')
+      indLocal = []
+      ampLocal = []
+      peakPos = []
+      for j in np.where(last > first)[0]:
+        # if more peaks are found, the highest is taken
+        highest = first[j] + np.argmax(heights[first[j]:last[j]])
+        indLocal.append(int(peaks[highest] - bg[j]))
+        ampLocal.append(float(heights[highest]))
+        peakPos.append(peaks[highest])
+      if len(peakPos) > 0:
+        offsets = np.arange(-int(np.floor(windows[i]['width']/2)), int(np.ceil(windows[i]['width']/2)))
+        maskPeakRes[(np.asarray(peakPos)[:, None] + offsets[None, :]) % numValues] = False
+      groupWin.append({'Ind': indLocal, 'Amp': ampLocal})
     return groupWin , maskPeakRes
 
   def _transformBackPeaks(self,signal,windowDict):
@@ -2436,54 +2449,41 @@ class ARMA(SupervisedLearning):
       @ In, windowDict, dict, dictionary for specefic target peaks
       @ Out, signal, np.array(float), new signal after transformation
     """
-    groupWin = windowDict['groupWin']
     windows  = windowDict['windows']
-    # rangeWindow = self.rangeWindow(windowDict)
     rangeWindow = windowDict['rangeWindow']
+    samplers = windowDict.get('samplers')
+    if samplers is None:
+      # ROMs trained before the samplers were stored
+      samplers = self._trainPeakSamplers(windowDict['groupWin'], rangeWindow)
+      windowDict['samplers'] = samplers
+    numValues = len(self.pivotParameterValues)
     for i in range(len(windows)):
-      prbExist = len(groupWin[i]['Ind'])/len(rangeWindow[i]['bg'])
-      # (amount of peaks that collected in the windows)/(the amount of windows)
-      # this is the probability to check if we should add a peak in each type of window
-      histAmp = np.histogram(groupWin[i]['Amp'])
-      # generate the distribution of the amplitude for this type of peak
-      histInd = np.histogram(groupWin[i]['Ind'])
-      # generate the distribution of the position( relative index) in the window
-      for j in range(min(len(rangeWindow[i]['bg']),len(rangeWindow[i]['end']))):
-        # the length of the starting points and ending points might be different
-        bgLocal = rangeWindow[i]['bg'][j]
-        # choose the starting index for specific window
-        exist = np.random.choice(2, 1, p=[1-prbExist,prbExist])
-        # generate 1 or 0 base on the prbExist
-        if exist == 1:
-          Amp = rv_histogram(histAmp).rvs()
-          Ind = int(rv_histogram(histInd).rvs())
-          # generate the amplitude and the relative position base on the distribution
-          SigIndOrg = bgLocal+Ind
-          #signalOrg can be longer than the segment length
-          SigInd = int(SigIndOrg%len(self.pivotParameterValues))
-          signal[SigInd] = Amp
-          # replace the signal with peak in this window
-          maskBg = SigInd-int(np.floor(windows[i]['width']/2))
-          ## peaks begin index can be negative end index can be more than the length of the segments
-          maskEnd = SigInd+int(np.ceil(windows[i]['width']/2))
-          bgValue = signal[maskBg-1]
-          endVaue = signal[int((maskEnd+1)%len(self.pivotParameterValues))]
-          # valueBg=np.interp(range(maskBg,SigInd), [maskBg-1,SigInd], [bgValue,  Amp])
-          # valueEnd=np.interp(range(SigInd+1,maskEnd+1), [SigInd,maskEnd+1],   [Amp,endVaue])
-          valuePeak=np.interp(range(maskBg,maskEnd+1), [maskBg-1,SigInd,maskEnd+1],   [bgValue,Amp,endVaue])
-          maskBg=int(maskBg%len(self.pivotParameterValues))
-          maskEnd=int(maskEnd%len(self.pivotParameterValues))
-          # maskbg and end now can be used as index in segment
-          # replace the signal inside the width of this peak by interpolation
-          if maskEnd > maskBg:
-            signal[maskBg:maskEnd+1]=valuePeak
-          else:
-            localTailInd=list(range(maskBg, int(len(self.pivotParameterValues))))
-            localHeadInd=list(range(0, maskEnd+1))
-            actPeakInd=localTailInd+localHeadInd
-            for idd, ind in enumerate(actPeakInd):
-              signal[ind]=valuePeak[idd]
-      return signal
+      sampler = samplers[i]
+      # the length of the starting points and ending points might be different
+      numWindows = min(len(rangeWindow[i]['bg']),len(rangeWindow[i]['end']))
+      # decide which windows get a peak, based on the probability of existence
+      exist = np.random.random(numWindows) < sampler['prbExist']
+      numPeaks = int(exist.sum())
+      if numPeaks == 0:
+        continue
+      # generate the amplitude and the relative position base on the distribution
+      amp = np.atleast_1d(sampler['amp'].rvs(size=numPeaks))
+      ind = np.atleast_1d(sampler['ind'].rvs(size=numPeaks)).astype(int)
+      # signalOrg can be longer than the segment length
+      sigInd = (np.asarray(rangeWindow[i]['bg'][:numWindows], dtype=int)[exist] + ind) % numValues
+      # peaks begin index can be negative end index can be more than the length of the segments
+      before = int(np.floor(windows[i]['width']/2))
+      after = int(np.ceil(windows[i]['width']/2))
+      bgValue = signal[(sigInd - before - 1) % numValues]
+      endValue = signal[(sigInd + after + 1) % numValues]
+      # replace the signal inside the width of this peak by linear interpolation between the
+      # values right outside the peak and the peak amplitude
+      offsets = np.arange(-before, after + 1)
+      rise = bgValue[:, None] + (amp - bgValue)[:, None] * (offsets[None, :] + before + 1) / (before + 1)
+      fall = amp[:, None] + (endValue - amp)[:, None] * offsets[None, :] / (after + 1)
+      valuePeak = np.where(offsets[None, :] <= 0, rise, fall)
+      signal[(sigInd[:, None] + offsets[None, :]) % numValues] = valuePeak
+    return signal
 
   ### ESSENTIALLY UNUSED ###
   def _localNormalizeData(self,values,names,feat):
@@ -22,11 +22,11 @@
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
 import scipy
-from sklearn import neighbors
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
-from ..utils import mathUtils
+from ..utils import mathUtils, importerUtils
+neighbors = importerUtils.importModuleLazyRenamed("neighbors", globals(), "sklearn.neighbors")
 from ..utils import InputData, InputTypes
 from .DynamicModeDecomposition import DMD
 #Internal Modules End--------------------------------------------------------------------------------
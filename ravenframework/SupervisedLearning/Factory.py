@@ -35,87 +35,93 @@ from .DynamicModeDecompositionControl import DMDC
 from .ARMA               import ARMA
 from .ROMCollection      import Segments, Clusters, Interpolated
 
-## Tensorflow-Keras Neural Network Models
-from .KerasMLPClassifier import KerasMLPClassifier
-from .KerasMLPRegression import KerasMLPRegression
-from .KerasConvNetClassifier import KerasConvNetClassifier
-from .KerasLSTMClassifier import KerasLSTMClassifier
-from .KerasLSTMRegression import KerasLSTMRegression
-
-## import ScikitLearn models
-# DiscriminantAnalysis
-from .ScikitLearn.DiscriminantAnalysis import LinearDiscriminantAnalysis
-from .ScikitLearn.DiscriminantAnalysis import QuadraticDiscriminantAnalysis
-# LinearModel
-from .ScikitLearn.LinearModel.ARDRegression import ARDRegression
-from .ScikitLearn.LinearModel.BayesianRidge import BayesianRidge
-from .ScikitLearn.LinearModel.ElasticNet import ElasticNet
-from .ScikitLearn.LinearModel.ElasticNetCV import ElasticNetCV
-from .ScikitLearn.LinearModel.Lars import Lars
-from .ScikitLearn.LinearModel.LarsCV import LarsCV
-from .ScikitLearn.LinearModel.Lasso import Lasso
-from .ScikitLearn.LinearModel.LassoCV import LassoCV
-from .ScikitLearn.LinearModel.LassoLars import LassoLars
-from .ScikitLearn.LinearModel.LassoLarsCV import LassoLarsCV
-from .ScikitLearn.LinearModel.LassoLarsIC import LassoLarsIC
-from .ScikitLearn.LinearModel.LinearRegression import LinearRegression
-from .ScikitLearn.LinearModel.LogisticRegression import LogisticRegression
-from .ScikitLearn.LinearModel.MultiTaskElasticNet import MultiTaskElasticNet
-from .ScikitLearn.LinearModel.MultiTaskElasticNetCV import MultiTaskElasticNetCV
-from .ScikitLearn.LinearModel.MultiTaskLasso import MultiTaskLasso
-from .ScikitLearn.LinearModel.MultiTaskLassoCV import MultiTaskLassoCV
-from .ScikitLearn.LinearModel.OrthogonalMatchingPursuit import OrthogonalMatchingPursuit
-from .ScikitLearn.LinearModel.OrthogonalMatchingPursuitCV import OrthogonalMatchingPursuitCV
-from .ScikitLearn.LinearModel.PassiveAggressiveClassifier import PassiveAggressiveClassifier
-from .ScikitLearn.LinearModel.PassiveAggressiveRegressor import PassiveAggressiveRegressor
-from .ScikitLearn.LinearModel.Perceptron import Perceptron
-from .ScikitLearn.LinearModel.Ridge import Ridge
-from .ScikitLearn.LinearModel.RidgeCV import RidgeCV
-from .ScikitLearn.LinearModel.RidgeClassifier import RidgeClassifier
-from .ScikitLearn.LinearModel.RidgeClassifierCV import RidgeClassifierCV
-from .ScikitLearn.LinearModel.SGDClassifier import SGDClassifier
-from .ScikitLearn.LinearModel.SGDRegressor import SGDRegressor
-# NaiveBayes
-from .ScikitLearn.NaiveBayes.ComplementNBClassifier import ComplementNB
-from .ScikitLearn.NaiveBayes.CategoricalNBClassifier import CategoricalNB
-from .ScikitLearn.NaiveBayes.BernoulliNBClassifier import BernoulliNB
-from .ScikitLearn.NaiveBayes.MultinomialNBClassifier import MultinomialNB
-from .ScikitLearn.NaiveBayes.GaussianNBClassifier import GaussianNB
-# NeuralNetwork
-from .ScikitLearn.NeuralNetwork.MLPClassifier import MLPClassifier
-from .ScikitLearn.NeuralNetwork.MLPRegressor import MLPRegressor
-# GaussianProcess
-from .ScikitLearn.GaussianProcess.GaussianProcessClassifier import GaussianProcessClassifier
-from .ScikitLearn.GaussianProcess.GaussianProcessRegressor import GaussianProcessRegressor
-# MultiClass
-from .ScikitLearn.MultiClass.OneVsOneClassifier import OneVsOneClassifier
-from .ScikitLearn.MultiClass.OneVsRestClassifier import OneVsRestClassifier
-from .ScikitLearn.MultiClass.OutputCodeClassifier import OutputCodeClassifier
-# Neighbors
-from .ScikitLearn.Neighbors.KNeighborsClassifier import KNeighborsClassifier
-from .ScikitLearn.Neighbors.NearestCentroidClassifier import NearestCentroid
-from .ScikitLearn.Neighbors.RadiusNeighborsRegressor import RadiusNeighborsRegressor
-from .ScikitLearn.Neighbors.KNeighborsRegressor import KNeighborsRegressor
-from .ScikitLearn.Neighbors.RadiusNeighborsClassifier import RadiusNeighborsClassifier
-# SVM
-from .ScikitLearn.SVM.LinearSVC import LinearSVC
-from .ScikitLearn.SVM.LinearSVR import LinearSVR
-from .ScikitLearn.SVM.NuSVC import NuSVC
-from .ScikitLearn.SVM.NuSVR import NuSVR
-from .ScikitLearn.SVM.SVC import SVC
-from .ScikitLearn.SVM.SVR import SVR
-# Tree
-from .ScikitLearn.Tree.DecisionTreeClassifier import DecisionTreeClassifier
-from .ScikitLearn.Tree.DecisionTreeRegressor import DecisionTreeRegressor
-from .ScikitLearn.Tree.ExtraTreeClassifier import ExtraTreeClassifier
-from .ScikitLearn.Tree.ExtraTreeRegressor import ExtraTreeRegressor
-# Ensemble ROM for Regression
-from .ScikitLearn.Ensemble.VotingRegressor import VotingRegressor
-from .ScikitLearn.Ensemble.BaggingRegressor import BaggingRegressor
-from .ScikitLearn.Ensemble.AdaBoostRegressor import AdaBoostRegressor
-# require sklearn version 0.24 at least
-from .ScikitLearn.Ensemble.StackingRegressor import StackingRegressor
+## ROMs wrapping Tensorflow-Keras and scikit-learn are only imported when requested by the input,
+## so that these modules (and their dependencies) are not loaded at startup.
+## {type name: module}
+_lazyTypes = {
+  # Tensorflow-Keras Neural Network Models
+  'KerasMLPClassifier':              '.KerasMLPClassifier',
+  'KerasMLPRegression':              '.KerasMLPRegression',
+  'KerasConvNetClassifier':          '.KerasConvNetClassifier',
+  'KerasLSTMClassifier':             '.KerasLSTMClassifier',
+  'KerasLSTMRegression':             '.KerasLSTMRegression',
+  # ScikitLearn models
+  # DiscriminantAnalysis
+  'LinearDiscriminantAnalysisClassifier': '.ScikitLearn.DiscriminantAnalysis.LinearDiscriminantAnalysis',
+  'QuadraticDiscriminantAnalysisClassifier': '.ScikitLearn.DiscriminantAnalysis.QuadraticDiscriminantAnalysis',
+  # LinearModel
+  'ARDRegression':                   '.ScikitLearn.LinearModel.ARDRegression',
+  'BayesianRidge':                   '.ScikitLearn.LinearModel.BayesianRidge',
+  'ElasticNet':                      '.ScikitLearn.LinearModel.ElasticNet',
+  'ElasticNetCV':                    '.ScikitLearn.LinearModel.ElasticNetCV',
+  'Lars':                            '.ScikitLearn.LinearModel.Lars',
+  'LarsCV':                          '.ScikitLearn.LinearModel.LarsCV',
+  'Lasso':                           '.ScikitLearn.LinearModel.Lasso',
+  'LassoCV':                         '.ScikitLearn.LinearModel.LassoCV',
+  'LassoLars':                       '.ScikitLearn.LinearModel.LassoLars',
+  'LassoLarsCV':                     '.ScikitLearn.LinearModel.LassoLarsCV',
+  'LassoLarsIC':                     '.ScikitLearn.LinearModel.LassoLarsIC',
+  'LinearRegression':                '.ScikitLearn.LinearModel.LinearRegression',
+  'LogisticRegression':              '.ScikitLearn.LinearModel.LogisticRegression',
+  'MultiTaskElasticNet':             '.ScikitLearn.LinearModel.MultiTaskElasticNet',
+  'MultiTaskElasticNetCV':           '.ScikitLearn.LinearModel.MultiTaskElasticNetCV',
+  'MultiTaskLasso':                  '.ScikitLearn.LinearModel.MultiTaskLasso',
+  'MultiTaskLassoCV':                '.ScikitLearn.LinearModel.MultiTaskLassoCV',
+  'OrthogonalMatchingPursuit':       '.ScikitLearn.LinearModel.OrthogonalMatchingPursuit',
+  'OrthogonalMatchingPursuitCV':     '.ScikitLearn.LinearModel.OrthogonalMatchingPursuitCV',
+  'PassiveAggressiveClassifier':     '.ScikitLearn.LinearModel.PassiveAggressiveClassifier',
+  'PassiveAggressiveRegressor':      '.ScikitLearn.LinearModel.PassiveAggressiveRegressor',
+  'Perceptron':                      '.ScikitLearn.LinearModel.Perceptron',
+  'Ridge':                           '.ScikitLearn.LinearModel.Ridge',
+  'RidgeCV':                         '.ScikitLearn.LinearModel.RidgeCV',
+  'RidgeClassifier':                 '.ScikitLearn.LinearModel.RidgeClassifier',
+  'RidgeClassifierCV':               '.ScikitLearn.LinearModel.RidgeClassifierCV',
+  'SGDClassifier':                   '.ScikitLearn.LinearModel.SGDClassifier',
+  'SGDRegressor':                    '.ScikitLearn.LinearModel.SGDRegressor',
+  # NaiveBayes
+  'ComplementNB':                    '.ScikitLearn.NaiveBayes.ComplementNBClassifier',
+  'CategoricalNB':                   '.ScikitLearn.NaiveBayes.CategoricalNBClassifier',
+  'BernoulliNB':                     '.ScikitLearn.NaiveBayes.BernoulliNBClassifier',
+  'MultinomialNB':                   '.ScikitLearn.NaiveBayes.MultinomialNBClassifier',
+  'GaussianNB':                      '.ScikitLearn.NaiveBayes.GaussianNBClassifier',
+  # NeuralNetwork
+  'MLPClassifier':                   '.ScikitLearn.NeuralNetwork.MLPClassifier',
+  'MLPRegressor':                    '.ScikitLearn.NeuralNetwork.MLPRegressor',
+  # GaussianProcess
+  'GaussianProcessClassifier':       '.ScikitLearn.GaussianProcess.GaussianProcessClassifier',
+  'GaussianProcessRegressor':        '.ScikitLearn.GaussianProcess.GaussianProcessRegressor',
+  # MultiClass
+  'OneVsOneClassifier':              '.ScikitLearn.MultiClass.OneVsOneClassifier',
+  'OneVsRestClassifier':             '.ScikitLearn.MultiClass.OneVsRestClassifier',
+  'OutputCodeClassifier':            '.ScikitLearn.MultiClass.OutputCodeClassifier',
+  # Neighbors
+  'KNeighborsClassifier':            '.ScikitLearn.Neighbors.KNeighborsClassifier',
+  'NearestCentroid':                 '.ScikitLearn.Neighbors.NearestCentroidClassifier',
+  'RadiusNeighborsRegressor':        '.ScikitLearn.Neighbors.RadiusNeighborsRegressor',
+  'KNeighborsRegressor':             '.ScikitLearn.Neighbors.KNeighborsRegressor',
+  'RadiusNeighborsClassifier':       '.ScikitLearn.Neighbors.RadiusNeighborsClassifier',
+  # SVM
+  'LinearSVC':                       '.ScikitLearn.SVM.LinearSVC',
+  'LinearSVR':                       '.ScikitLearn.SVM.LinearSVR',
+  'NuSVC':                           '.ScikitLearn.SVM.NuSVC',
+  'NuSVR':                           '.ScikitLearn.SVM.NuSVR',
+  'SVC':                             '.ScikitLearn.SVM.SVC',
+  'SVR':                             '.ScikitLearn.SVM.SVR',
+  # Tree
+  'DecisionTreeClassifier':          '.ScikitLearn.Tree.DecisionTreeClassifier',
+  'DecisionTreeRegressor':           '.ScikitLearn.Tree.DecisionTreeRegressor',
+  'ExtraTreeClassifier':             '.ScikitLearn.Tree.ExtraTreeClassifier',
+  'ExtraTreeRegressor':              '.ScikitLearn.Tree.ExtraTreeRegressor',
+  # Ensemble ROM for Regression
+  'VotingRegressor':                 '.ScikitLearn.Ensemble.VotingRegressor',
+  'BaggingRegressor':                '.ScikitLearn.Ensemble.BaggingRegressor',
+  'AdaBoostRegressor':               '.ScikitLearn.Ensemble.AdaBoostRegressor',
+  # require sklearn version 0.24 at least
+  'StackingRegressor':               '.ScikitLearn.Ensemble.StackingRegressor',
+}
 ################################################################################
 
 factory = EntityFactory('SupervisedLearning')
 factory.registerAllSubtypes(SupervisedLearning)
+for _name, _module in _lazyTypes.items():
+  factory.registerLazyType(_name, _module, package=__package__)
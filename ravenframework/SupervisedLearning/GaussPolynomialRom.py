@@ -40,6 +40,8 @@ class GaussPolynomialRom(SupervisedLearning):
   """
 
   info = {'problemtype':'regression', 'normalize':True}
+  # maximum number of entries of the polynomial basis matrix built at once when evaluating
+  _maxBasisEntries = 2**22
 
   @classmethod
   def getInputSpecification(cls):
@@ -161,7 +163,8 @@ class GaussPolynomialRom(SupervisedLearning):
       @ In, None
       @ Out, None
     """
-    pass
+    self._polyOrders = None
+    self._coeffMatrix = None
 
   def __returnCurrentSettingLocal__(self):
     """
@@ -209,6 +212,8 @@ class GaussPolynomialRom(SupervisedLearning):
     self.sdx           = None
     self.partialVariances = None
     self.sparseGridType    = 'smolyak' #type of sparse quadrature to use,default smolyak
+    self._polyOrders   = None #np.array(int), polynomial orders of each term (nTerms, nFeatures)
+    self._coeffMatrix  = None #np.array, polynomial coefficients of each term for each target (nTerms, nTargets)
 
   def _handleInput(self, paramInput):
     """
@@ -427,6 +432,47 @@ class GaussPolynomialRom(SupervisedLearning):
       tot*=self.polys[varName](o,p)
     return tot
 
+  def _standardPoints(self,featureVals):
+    """
+      Converts points from the distribution domains to the quadrature standard domains.
+      @ In, featureVals, np.array, points to convert (nPoints, nFeatures)
+      @ Out, stdPts, np.array, converted points (nPoints, nFeatures)
+    """
+    featureVals = np.atleast_2d(np.asarray(featureVals, dtype=float))
+    stdPts = np.empty(featureVals.shape)
+    for i,varName in enumerate(self.sparseGrid.varNames):
+      stdPts[:,i] = self.distDict[varName].convertToQuad(self.quads[varName].type,featureVals[:,i])
+    return stdPts
+
+  def _polyBasisMatrix(self,orders,stdPts):
+    """
+      Evaluates the multivariate polynomials of the given orders at several points, i.e. the
+      (generalized) Vandermonde matrix of the expansion. Each 1D polynomial is evaluated once per
+      order and variable, and the multivariate terms are products of the 1D tables.
+      @ In, orders, np.array(int), polynomial orders of each term (nTerms, nFeatures)
+      @ In, stdPts, np.array, points in the quadrature standard domains (nPoints, nFeatures)
+      @ Out, basis, np.array, evaluations of each polynomial at each point (nPoints, nTerms)
+    """
+    basis = np.ones((stdPts.shape[0], orders.shape[0]))
+    for i,varName in enumerate(self.sparseGrid.varNames):
+      table = np.array([self.polys[varName](o, stdPts[:,i]) * np.ones(stdPts.shape[0]) for o in range(orders[:,i].max()+1)])
+      basis *= table[orders[:,i]].T
+    return basis
+
+  def _polyCoefficients(self):
+    """
+      Returns the polynomial orders and coefficients of the expansion as arrays, built from polyCoeffDict.
+      @ In, None
+      @ Out, orders, np.array(int), polynomial orders of each term (nTerms, nFeatures)
+      @ Out, coeffs, np.array, polynomial coefficients of each term for each target (nTerms, nTargets)
+    """
+    # ROMs pickled before the cache existed do not carry it, so build it on first use
+    if getattr(self, '_coeffMatrix', None) is None:
+      terms = list(self.polyCoeffDict[self.target[0]].keys())
+      self._polyOrders = np.asarray(terms, dtype=int).reshape(len(terms), len(self.features))
+      self._coeffMatrix = np.array([[self.polyCoeffDict[target][term] for target in self.target] for term in terms]).reshape(len(terms), len(self.target))
+    return self._polyOrders, self._coeffMatrix
+
   def _train(self,featureVals,targetVals):
     """
       Trains ROM.
@@ -441,28 +487,13 @@ class GaussPolynomialRom(SupervisedLearning):
     self.polyCoeffDict = {key: dict({}) for key in self.target}
     #check equality of point space
     self.raiseADebug('...checking required points are available...')
-    fvs = []
-    tvs = {key: list({}) for key in self.target}
     sgs = list(self.sparseGrid.points())
-    missing=[]
     kdTree = spatial.KDTree(featureVals)
-    #TODO this is slowest loop in this algorithm, by quite a bit.
-    for pt in sgs:
-      #KDtree way
-      distances,idx = kdTree.query(pt,k=1,distance_upper_bound=1e-9) #FIXME how to set the tolerance generically?
-      #KDTree repots a "not found" as at infinite distance with index len(data)
-      if idx >= len(featureVals):
-        found = False
-      else:
-        found = True
-        point = tuple(featureVals[idx])
-      #end KDTree way
-      if found:
-        fvs.append(point)
-        for cnt, target in enumerate(self.target):
-          tvs[target].append(targetVals[idx,cnt])
-      else:
-        missing.append(pt)
+    distances,idx = kdTree.query(np.asarray(sgs),k=1,distance_upper_bound=1e-9) #FIXME how to set the tolerance generically?
+    #KDTree repots a "not found" as at infinite distance with index len(data)
+    found = idx < len(featureVals)
+    fvs = featureVals[idx[found]]
+    missing = [pt for pt,f in zip(sgs,found) if not f]
     if len(missing)>0:
       msg='\n'
       msg+='DEBUG missing feature vals:\n' + '\n'.join(map(lambda x:'  '+str(x),missing))+ '\n'
@@ -470,32 +501,17 @@ class GaussPolynomialRom(SupervisedLearning):
       self.raiseADebug('sparse:',sgs)
       self.raiseADebug('solns :',fvs)
       self.raiseAnError(IOError,'input values do not match required values!')
-    #make translation matrix between lists, also actual-to-standardized point map
-    self.raiseADebug('...constructing translation matrices...')
-    translate={}
-    for i in range(len(fvs)):
-      translate[tuple(fvs[i])]=sgs[i]
-    standardPoints = {}
-    for pt in fvs:
-      stdPt = []
-      for i,p in enumerate(pt):
-        varName = self.sparseGrid.varNames[i]
-        stdPt.append( self.distDict[varName].convertToQuad(self.quads[varName].type,p) )
-      standardPoints[tuple(pt)] = stdPt[:]
-    #make polynomials
+    #pseudo-spectral projection: the coefficients of all the terms for all the targets are the
+    #  weighted inner products of the solutions with the columns of the polynomial basis matrix
     self.raiseADebug('...constructing polynomials...')
     self.norm = np.prod(list(self.distDict[v].measureNorm(self.quads[v].type) for v in self.distDict.keys()))
-    for i,idx in enumerate(self.indexSet):
-      idx=tuple(idx)
-      for target in self.target:
-        self.polyCoeffDict[target][idx]=0
-        wtsum=0
-        for pt,soln in zip(fvs,tvs[target]):
-          tupPt = tuple(pt)
-          stdPt = standardPoints[tupPt]
-          wt = self.sparseGrid.weights(translate[tupPt])
-          self.polyCoeffDict[target][idx]+=soln*self._multiDPolyBasisEval(idx,stdPt)*wt
-        self.polyCoeffDict[target][idx]*=self.norm
+    weights = np.asarray(self.sparseGrid.weights())
+    orders = np.asarray([tuple(idx) for idx in self.indexSet], dtype=int).reshape(len(self.indexSet), len(self.features))
+    basis = self._polyBasisMatrix(orders, self._standardPoints(fvs))
+    coeffs = self.norm * basis.T.dot(weights[:,np.newaxis] * targetVals[idx].reshape(len(sgs), len(self.target)))
+    for t,target in enumerate(self.target):
+      self.polyCoeffDict[target] = dict(zip(map(tuple, orders.tolist()), coeffs[:,t]))
+    self._polyOrders, self._coeffMatrix = orders, coeffs
     self.amITrained=True
     self.raiseADebug('...training complete!')
 
@@ -560,29 +576,23 @@ class GaussPolynomialRom(SupervisedLearning):
       return self.polyCoeffDict[target][tuple([0]*len(self.features))]
     elif r==2:
       return sum(s**2 for s in self.polyCoeffDict[target].values())
-    tot=0
-    for pt,wt in self.sparseGrid:
-      tot+=self.__evaluateLocal__([pt])[target]**r*wt
-    tot*=self.norm
+    values = self.__evaluateLocal__(np.asarray(self.sparseGrid.points()))[target]
+    tot = np.sum(values**r*np.asarray(self.sparseGrid.weights()))*self.norm
     return tot
 
   def __evaluateLocal__(self,featureVals):
     """
-      Evaluates a point.
-      @ In, featureVals, list, of values at which to evaluate the ROM
-      @ Out, returnDict, dict, the evaluated point for each target
-    """
-    featureVals=featureVals[0]
-    returnDict={}
-    stdPt = np.zeros(len(featureVals))
-    for p,pt in enumerate(featureVals):
-      varName = self.sparseGrid.varNames[p]
-      stdPt[p] = self.distDict[varName].convertToQuad(self.quads[varName].type,pt)
-    for target in self.target:
-      tot=0
-      for idx,coeff in self.polyCoeffDict[target].items():
-        tot+=coeff*self._multiDPolyBasisEval(idx,stdPt)
-      returnDict[target] = tot
+      Evaluates the ROM at a batch of points, by chunks of points bounding the size of the polynomial basis matrix.
+      @ In, featureVals, np.array, values at which to evaluate the ROM (nPoints, nFeatures)
+      @ Out, returnDict, dict, the evaluated points for each target, {target: np.array(nPoints)}
+    """
+    orders, coeffs = self._polyCoefficients()
+    stdPts = self._standardPoints(featureVals)
+    values = np.empty((stdPts.shape[0], coeffs.shape[1]))
+    chunk = max(1, self._maxBasisEntries // max(1, orders.shape[0]))
+    for start in range(0, stdPts.shape[0], chunk):
+      values[start:start+chunk] = self._polyBasisMatrix(orders, stdPts[start:start+chunk]).dot(coeffs)
+    returnDict = dict((target, values[:,t]) for t,target in enumerate(self.target))
     return returnDict
 
   def _printPolynomial(self):
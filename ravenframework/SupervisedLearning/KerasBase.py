@@ -21,7 +21,6 @@
 #External Modules------------------------------------------------------------------------------------
 import copy
 import numpy as np
-from sklearn import preprocessing
 import random as rn
 import matplotlib
 import platform
@@ -31,6 +30,7 @@ import os
 from ..utils import importerUtils
 from ..utils import InputData, InputTypes
 tf = importerUtils.importModuleLazyRenamed("tf", globals(), "tensorflow")
+preprocessing = importerUtils.importModuleLazyRenamed("preprocessing", globals(), "sklearn.preprocessing")
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -22,6 +22,7 @@ import copy
 import warnings
 from collections import defaultdict, OrderedDict
 import pprint
+import concurrent.futures
 
 # external libraries
 import abc
@@ -34,6 +35,34 @@ from ..utils import InputData, InputTypes
 from .SupervisedLearning import SupervisedLearning
 # import pickle as pk # TODO remove me!
 import os
+
+def _trainInWorker(rom, seed, data, kwargs):
+  """
+    Trains a ROM in a worker process, after seeding the worker random engine
+    @ In, rom, SupervisedLearning, untrained ROM
+    @ In, seed, int, seed for the random engine of the worker
+    @ In, data, dict, training data
+    @ In, kwargs, dict, additional keyword arguments for the training
+    @ Out, rom, SupervisedLearning, trained ROM
+  """
+  randomUtils.randomSeed(seed)
+  rom.train(data, **kwargs)
+  return rom
+
+def _trainConcurrently(jobs, numWorkers):
+  """
+    Trains independent ROMs on a pool of worker processes. Each ROM gets its own seed,
+    drawn from (a copy of) the current random engine, so that results do not depend on the scheduling
+    and the random stream of the main process is the same as after a serial training.
+    @ In, jobs, list(tuple), (rom, data, kwargs) for each ROM to train
+    @ In, numWorkers, int, number of worker processes
+    @ Out, roms, list(SupervisedLearning), trained ROMs, in the same order as jobs
+  """
+  baseSeed = randomUtils.randomIntegers(0, 2**31 - 1 - len(jobs), engine=copy.deepcopy(randomUtils.getEngine()))
+  with concurrent.futures.ProcessPoolExecutor(max_workers=min(numWorkers, len(jobs))) as executor:
+    futures = [executor.submit(_trainInWorker, rom, baseSeed + j, data, kwargs) for j, (rom, data, kwargs) in enumerate(jobs)]
+    roms = [future.result() for future in futures]
+  return roms
 #
 #
 #
@@ -241,6 +270,11 @@ class Segments(Collection):
             subspace restarts at the value of the first segment. This is useful in the event subspace 0 is not
             a desirable value.""")
     segment.addSub(subspace)
+    segment.addSub(InputData.parameterInputFactory('numWorkers', contentType=InputTypes.IntegerType,
+        descr=r"""number of local worker processes used to train the segment ROMs concurrently. Each
+        segment ROM is trained with its own random seed, drawn from the RAVEN random engine, so that
+        results are reproducible regardless of the number of workers. The trained ROMs are identical
+        to the serial training, unless their training itself draws random numbers.""", default=1))
     spec.addSub(segment)
 
     return spec
@@ -262,6 +296,7 @@ class Segments(Collection):
     # allow some ROM training to happen globally, seperate from individual segment training
     ## see design note for Clusters
     self._romGlobalAdjustments = None  # global ROM settings, provided by the templateROM before clustering
+    self._numWorkers = 1               # number of worker processes to train the segment ROMs
 
   def _handleInput(self, paramInput):
     """
@@ -308,6 +343,12 @@ class Segments(Collection):
         else:
           self._divisionPivotShift[subspace] = None
 
+    numWorkers = inputSpecs.findFirst('numWorkers')
+    if numWorkers is not None:
+      if numWorkers.value < 1:
+        self.raiseAnError(IOError, f'<numWorkers> must be a positive integer; got "{numWorkers.value}".')
+      self._numWorkers = numWorkers.value
+
     self._divisionInstructions = divisionMode
     if len(self._divisionInstructions) > 1:
       self.raiseAnError(NotImplementedError, 'Segmented ROMs do not yet handle multiple subspaces!')
@@ -374,6 +415,48 @@ class Segments(Collection):
     result = self._templateROM.finalizeGlobalRomSegmentEvaluation(self._romGlobalAdjustments, result, weights=None, slicer=None)
     return result
 
+  def _evaluateBatch(self, edict, numSamples):
+    """
+      Performs several evaluations at once: each segment ROM evaluates all the realizations together
+      and the segments are stitched into the full histories for all the realizations at once.
+      @ In, edict, dict, evaluation dictionary
+      @ In, numSamples, int, number of evaluations
+      @ Out, batch, dict, {target: np.ndarray} the evaluations, shaped [numSamples, historyLength]
+      @ Out, shared, dict, entries shared by all the evaluations (pivot values)
+    """
+    pivotID = self._templateROM.pivotParameterID
+    lastEntry = self._divisionInfo['historyLength']
+    batch = {}
+    nextEntry = 0  # index to fill next data set into
+    self.raiseADebug('Sampling {} realizations from {} segments ...'.format(numSamples, len(self._roms)))
+    for r, rom in enumerate(self._getSequentialRoms()):
+      subResults, subShared = rom._evaluateBatch(edict, numSamples)
+      if subShared.get('_indexMap', None):
+        # ND targets are not stitched all at once, fall back to one evaluation at a time
+        return SupervisedLearning._evaluateBatch(self, edict, numSamples)
+      # the pivot values of the segment might be shifted, but only their number is used here
+      entries = len(subShared[pivotID])
+      # the last segment can be longer than the remainder of the history (e.g. if using clustering)
+      taken = min(entries, lastEntry - nextEntry)
+      for target, values in subResults.items():
+        if target not in batch:
+          batch[target] = np.zeros((numSamples, lastEntry))
+        batch[target][:, nextEntry:nextEntry+taken] = values[:, :taken]
+      nextEntry += entries
+    shared = {pivotID: self._indexValues[pivotID]}
+    # allow each segment ROM and the global ROM to modify the signals, one realization at a time
+    for n in range(numSamples):
+      result = dict((target, values[n]) for target, values in batch.items())
+      result.update(shared)
+      for s, segment in enumerate(self._getSequentialRoms()):
+        delim = self._divisionInfo['delimiters'][s]
+        picker = slice(delim[0], delim[-1] + 1)
+        result = segment.finalizeLocalRomSegmentEvaluation(self._romGlobalAdjustments, result, picker)
+      result = self._templateROM.finalizeGlobalRomSegmentEvaluation(self._romGlobalAdjustments, result, weights=None, slicer=None)
+      for target, values in batch.items():
+        values[n] = result[target]
+    return batch, shared
+
   def writePointwiseData(self, writeTo):
     """
       Writes pointwise data about this ROM to the data object.
@@ -606,6 +689,7 @@ class Segments(Collection):
       self._indexValues[pivotID] = trainingSet[pivotID][0]
     # loop over clusters and train data
     roms = []
+    jobs = []
     for i, subdiv in enumerate(counter):
       # slicer for data selection
       picker = slice(subdiv[0], subdiv[-1] + 1)
@@ -625,9 +709,16 @@ class Segments(Collection):
       newROM = copy.deepcopy(templateROM)
       newROM.name = '{}_seg{}'.format(self._romName, i)
       newROM.adjustLocalRomSegment(self._romGlobalAdjustments, picker)
+      if self._numWorkers > 1 and len(counter) > 1:
+        jobs.append((newROM, data, {}))
+        continue
       self.raiseADebug('Training segment', i, picker)
       newROM.train(data)
       roms.append(newROM)
+    # segments are independent, so train them concurrently if requested
+    if jobs:
+      self.raiseADebug(f'Training {len(jobs)} segments on {min(self._numWorkers, len(jobs))} worker processes ...')
+      roms = _trainConcurrently(jobs, self._numWorkers)
     # format array for future use
     roms = np.array(roms)
     return roms
@@ -937,6 +1028,17 @@ class Clusters(Segments):
     #  result['_indexMap']['cluster_multiplicity'] = np.atleast_1d([self._clusterVariableID])
     return result
 
+  def _evaluateBatch(self, edict, numSamples):
+    """
+      Performs several evaluations at once. The clustered evaluation modes are evaluated one
+      realization at a time.
+      @ In, edict, dict, evaluation dictionary
+      @ In, numSamples, int, number of evaluations
+      @ Out, batch, dict, {target: np.ndarray} the evaluations, shaped [numSamples, ...]
+      @ Out, shared, dict, entries shared by all the evaluations (indexes and "_indexMap")
+    """
+    return SupervisedLearning._evaluateBatch(self, edict, numSamples)
+
   def writePointwiseData(self, writeTo):
     """
       Writes pointwise data about this ROM to the data object.
@@ -1486,6 +1588,10 @@ class Interpolated(SupervisedLearning):
     segment.addSub(metric)
     segment.addSub(InputData.parameterInputFactory('macroParameter', contentType=InputTypes.StringType,
         descr=r"""pivot parameter for macro steps (e.g. years)"""))
+    segment.addSub(InputData.parameterInputFactory('numWorkers', contentType=InputTypes.IntegerType,
+        descr=r"""number of local worker processes used to train the macro steps (e.g. years)
+        concurrently. The segment ROMs within each macro step are then trained serially. Each macro
+        step is trained with its own random seed, drawn from the RAVEN random engine.""", default=1))
     spec.addSub(segment)
     return spec
 
@@ -1498,6 +1604,7 @@ class Interpolated(SupervisedLearning):
     super().__init__()
     self.printTag = 'Interp. Cluster ROM'
     self._maxCycles = None # maximum number of cycles to run (default no limit)
+    self._numWorkers = 1   # number of worker processes to train the macro steps
     self._macroTemplate = Clusters()
 
   def setTemplateROM(self, romInfo):
@@ -1527,6 +1634,11 @@ class Interpolated(SupervisedLearning):
       self._maxCycles = maxCycles.value
       self.raiseAMessage(f'Truncating macro parameter "{self._macroParameter}" to "{self._maxCycles}" successive steps.')
     self._macroSteps = {}                                               # collection of macro steps (e.g. each year)
+    numWorkers = inputSpecs.findFirst('numWorkers')
+    if numWorkers is not None:
+      if numWorkers.value < 1:
+        self.raiseAnError(IOError, f'<numWorkers> must be a positive integer; got "{numWorkers.value}".')
+      self._numWorkers = numWorkers.value
 
     self._macroTemplate._handleInput(paramInput)            # example "yearly" SVL engine collection
   # passthrough to template
@@ -1624,10 +1736,24 @@ class Interpolated(SupervisedLearning):
       self._macroSteps[macroID] = new
 
     # train the existing steps
-    for s, step in enumerate(self._macroSteps.values()):
-      self.raiseADebug('Training Statepoint Year {} ...'.format(s))
-      trainingData = dict((var, [tdict[var][s]]) for var in tdict.keys())
-      step.train(trainingData, skipAssembly=True)
+    if self._numWorkers > 1 and len(self._macroSteps) > 1:
+      # macro steps are independent, so train them concurrently; their segments are trained serially
+      jobs = []
+      for s, step in enumerate(self._macroSteps.values()):
+        step._numWorkers = 1
+        trainingData = dict((var, [tdict[var][s]]) for var in tdict.keys())
+        jobs.append((step, trainingData, {'skipAssembly': True}))
+      self.raiseADebug(f'Training {len(jobs)} Statepoint Years on {min(self._numWorkers, len(jobs))} worker processes ...')
+      trained = _trainConcurrently(jobs, self._numWorkers)
+      for macroID, step in zip(list(self._macroSteps), trained):
+        # assembled objects are not pickled, so add them back as in _copyAssembledModel
+        step.setAssembledObjects({})
+        self._macroSteps[macroID] = step
+    else:
+      for s, step in enumerate(self._macroSteps.values()):
+        self.raiseADebug('Training Statepoint Year {} ...'.format(s))
+        trainingData = dict((var, [tdict[var][s]]) for var in tdict.keys())
+        step.train(trainingData, skipAssembly=True)
     self.raiseADebug('  Statepoints trained ')
     # interpolate missing steps
     self._interpolateSteps(tdict)
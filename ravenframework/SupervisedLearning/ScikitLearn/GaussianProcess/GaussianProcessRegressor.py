@@ -23,7 +23,7 @@
 
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
-from scipy.linalg import solve_triangular
+from scipy.linalg import solve_triangular, cholesky, cho_solve
 from ....contrib.SKOpt.GPKernels import ConstantKernel as skConstantKernel
 from ....contrib.SKOpt.GPKernels import DotProduct as skDotProduct
 from ....contrib.SKOpt.GPKernels import Exponentiation as skExponentiation
@@ -371,6 +371,67 @@ class GaussianProcessRegressor(ScikitLearnBase):
 
     return meanGrad, stdGrad
 
+  def updateTraining(self, featureVals, targetVals):
+    """
+      Conditions the trained model on new samples, keeping the kernel hyperparameters: the Cholesky
+      factor of the kernel matrix is extended by the new rows, costing O(n^2 m) for m new samples
+      instead of the O(n^3) of a new fit
+      @ In, featureVals, np.array, shape=[n_newSamples, n_features], the new feature values
+      @ In, targetVals, np.array, shape=[n_newSamples, n_targets], the new target values
+      @ Out, updated, bool, False if the model cannot be updated (and needs to be trained again)
+    """
+    model = self.model
+    # only a fitted (single-output) regressor with a scalar noise level can be updated
+    if self.uniqueVals is not None or not hasattr(model, 'L_') or np.ndim(model.alpha) > 0:
+      return False
+    featureVals = np.atleast_2d(featureVals)
+    nOld, nNew = model.X_train_.shape[0], featureVals.shape[0]
+    kCross = model.kernel_(model.X_train_, featureVals)
+    kNew = model.kernel_(featureVals)
+    kNew[np.diag_indices_from(kNew)] += model.alpha
+    lCross = solve_triangular(model.L_, kCross, lower=True)
+    try:
+      lNew = cholesky(kNew - np.dot(lCross.T, lCross), lower=True)
+    except np.linalg.LinAlgError:
+      # the new samples are (numerically) already in the training set
+      return False
+    L = np.zeros((nOld + nNew, nOld + nNew))
+    L[:nOld, :nOld] = model.L_
+    L[nOld:, :nOld] = lCross.T
+    L[nOld:, nOld:] = lNew
+    # the targets are stored normalized
+    yTrain = model.y_train_ * model._y_train_std + model._y_train_mean
+    yTrain = np.concatenate((yTrain, np.asarray(targetVals, dtype=float).reshape((nNew,) + yTrain.shape[1:])))
+    if model.normalize_y:
+      model._y_train_mean = np.mean(yTrain, axis=0)
+      yStd = np.std(yTrain, axis=0)
+      model._y_train_std = np.where(yStd == 0, 1.0, yStd)
+    model.X_train_ = np.concatenate((model.X_train_, featureVals))
+    model.y_train_ = (yTrain - model._y_train_mean) / model._y_train_std
+    model.L_ = L
+    model.alpha_ = cho_solve((L, True), model.y_train_)
+    return True
+
+  def getFittedState(self):
+    """
+      Returns the fitted quantities of the model, i.e. the ones changed by training and updateTraining
+      @ In, None
+      @ Out, state, dict, the fitted quantities (to be restored with setFittedState)
+    """
+    state = {}
+    for attr in ['X_train_', 'y_train_', 'L_', 'alpha_', '_y_train_mean', '_y_train_std']:
+      state[attr] = getattr(self.model, attr)
+    return state
+
+  def setFittedState(self, state):
+    """
+      Restores the fitted quantities of the model
+      @ In, state, dict, the fitted quantities, from getFittedState
+      @ Out, None
+    """
+    for attr, value in state.items():
+      setattr(self.model, attr, value)
+
   def _handleInput(self, paramInput):
     """
       Function to handle the common parts of the distribution parameter input.
@@ -28,7 +28,6 @@
 import abc
 import copy
 import numpy as np
-import sklearn
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -396,6 +395,7 @@ class SupervisedLearning(BaseInterface):
     if self.performFeatureSpaceTransformation:
       # nsamples, timeStep, nFeatures
       nComponents = len(self.featureSpaceTransformationSettings['parametersToInclude'])
+      import sklearn.decomposition
       if self.featureSpaceTransformationSettings['transformationMethod'] == 'PCA':
         self.transformationEngine = sklearn.decomposition.IncrementalPCA(n_components=nComponents, whiten=True)
       elif self.featureSpaceTransformationSettings['transformationMethod'].startswith("Kernel"):
@@ -601,6 +601,41 @@ class SupervisedLearning(BaseInterface):
         evaluation[rem] = dummy
     return evaluation
 
+  def evaluateBatch(self, edict, numSamples):
+    """
+      Method to perform several evaluations of the same point at once (e.g. several synthetic histories
+      from a stochastic ROM)
+      @ In, edict, dict, evaluation dictionary
+      @ In, numSamples, int, number of evaluations
+      @ Out, evaluations, list(dict), the evaluations, each one as {target: evaluated points}
+    """
+    batch, shared = self._evaluateBatch(edict, numSamples)
+    evaluations = []
+    for n in range(numSamples):
+      evaluation = dict((target, values[n]) for target, values in batch.items())
+      evaluation.update(shared)
+      evaluations.append(evaluation)
+    return evaluations
+
+  def _evaluateBatch(self, edict, numSamples):
+    """
+      Performs several evaluations of the same point, stacked along a new leading axis.
+      ROMs that can vectorize the evaluations should overload this method.
+      @ In, edict, dict, evaluation dictionary
+      @ In, numSamples, int, number of evaluations
+      @ Out, batch, dict, {target: np.ndarray} the evaluations, shaped [numSamples, ...]
+      @ Out, shared, dict, entries shared by all the evaluations (indexes and "_indexMap")
+    """
+    evaluations = [self.evaluate(edict) for _ in range(numSamples)]
+    indexMap = evaluations[0].get('_indexMap', {})
+    indexMap = indexMap[0] if isinstance(indexMap, np.ndarray) else indexMap
+    sharedKeys = set(['_indexMap', getattr(self, 'pivotParameterID', None)])
+    for dims in indexMap.values():
+      sharedKeys.update(dims)
+    shared = dict((key, value) for key, value in evaluations[0].items() if key in sharedKeys)
+    batch = dict((key, np.stack([evaluation[key] for evaluation in evaluations])) for key in evaluations[0] if key not in sharedKeys)
+    return batch, shared
+
   def reset(self):
     """
       Reset ROM
@@ -100,6 +100,18 @@ class SyntheticHistory(SupervisedLearning, TSAUser):
     rlz = self.evaluateTSASequential()
     return rlz
 
+  def _evaluateBatch(self, edict, numSamples):
+    """
+      Generates several synthetic histories at once, applying each TSA algorithm to all of them together
+      @ In, edict, dict, evaluation dictionary (unused, as for evaluate)
+      @ In, numSamples, int, number of histories to generate
+      @ Out, batch, dict, {target: np.ndarray} the histories, shaped [numSamples, pivotValues]
+      @ Out, shared, dict, the pivot parameter values
+    """
+    batch = self.evaluateTSABatch(numSamples)
+    shared = {self.pivotParameterID: batch.pop(self.pivotParameterID)}
+    return batch, shared
+
 
   def getGlobalRomSegmentSettings(self, trainingDict, divisions):
     """
@@ -290,29 +290,58 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer, TimeSeriesTransformer):
       @ In, settings, dict, settings for this ROM
       @ Out, synthetic, np.array(float), synthetic ARMA signal
     """
-    # TODO if there's not a model, generate one?
-    # -> I think we need the training signal though ...
-    synthetic = np.zeros((len(pivot), len(params)))
+    return self.generateBatch(params, pivot, settings, 1)[0]
+
+  def generateBatch(self, params, pivot, settings, numSamples):
+    """
+      Generates several synthetic histories from fitted parameters at once. The noise of all the
+      histories is drawn together and the state space recursion runs for all of them at the same time.
+      @ In, params, dict, characterization such as otained from self.characterize()
+      @ In, pivot, np.array(float), pivot parameter values
+      @ In, settings, dict, settings for this ROM
+      @ In, numSamples, int, number of histories to generate
+      @ Out, synthetic, np.array(float), synthetic ARMA signals shaped [numSamples, pivotValues, targets]
+    """
+    synthetic = np.zeros((numSamples, len(pivot), len(params)))
     for t, (target, data) in enumerate(params.items()):
       armaData = data['arma']
       P,d,Q = armaData['lags']
-      modelParams = np.r_[armaData.get('const', 0), armaData['ar'], armaData['ma'], armaData.get('var', 1)]
-      msrShocks, stateShocks, initialState = self._generateNoise(armaData, synthetic.shape[0])
-      # measurement shocks
-      import statsmodels.api
-      model = statsmodels.tsa.arima.model.ARIMA(synthetic[:,t], order=(P, d, Q), trend='c')
-      # produce sample
-      new = model.simulate(modelParams,
-                           synthetic.shape[0],
-                           measurement_shocks=msrShocks,
-                           state_shocks=stateShocks,
-                           initial_state=initialState)
+      if d == 0:
+        msrShocks, stateShocks, initialState = self._generateNoise(armaData, len(pivot), numSamples)
+        new = self._simulateStateSpace(armaData, msrShocks, stateShocks, initialState)
+      else:
+        # integrated models are simulated through statsmodels, one history at a time
+        import statsmodels.api
+        model = statsmodels.tsa.arima.model.ARIMA(np.zeros(len(pivot)), order=(P, d, Q), trend='c')
+        modelParams = np.r_[armaData.get('const', 0), armaData['ar'], armaData['ma'], armaData.get('var', 1)]
+        new = np.zeros((numSamples, len(pivot)))
+        for n in range(numSamples):
+          msrShocks, stateShocks, initialState = self._generateNoise(armaData, len(pivot))
+          # produce sample
+          new[n] = model.simulate(modelParams,
+                                  len(pivot),
+                                  measurement_shocks=msrShocks,
+                                  state_shocks=stateShocks,
+                                  initial_state=initialState[:, 0])
       if settings.get('gaussianize', True):
         # back-transform through CDF
         new = mathUtils.degaussianize(new, params[target]['cdf'])
-      synthetic[:, t] = new
+      synthetic[:, :, t] = new
     return synthetic
 
+  def getCompositeBatch(self, initial, params, pivot, settings):
+    """
+      Combines several pairs of component signals at once (see getComposite)
+      @ In, initial, np.array, original signals shaped [numSamples, pivotValues, targets]
+      @ In, params, dict, training parameters as from self.characterize
+      @ In, pivot, np.array, time-like array values
+      @ In, settings, dict, additional settings specific to algorithm
+      @ Out, composite, np.array, resulting composite signals shaped [numSamples, pivotValues, targets]
+    """
+    synthetic = self.generateBatch(params, pivot, settings, initial.shape[0])
+    composite = initial + synthetic
+    return composite
+
   def writeXML(self, writeTo, params):
     """
       Allows the engine to put whatever it wants into an XML to print to file.
@@ -480,14 +509,15 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer, TimeSeriesTransformer):
     return transition, stateIntercept, stateCov, selection
 
   # utils
-  def _generateNoise(self, params, size):
+  def _generateNoise(self, params, size, numSamples=1):
     """
       Generates purturbations for ARMA sampling.
       @ In, params, dict, dictionary of trained model parameters
       @ In, size, int, length of time-like variable
-      @ Out, msrShocks, np.array, measurement shocks
-      @ Out, stateShocks, np.array, state shocks
-      @ Out, initialState, np.array, initial random state
+      @ In, numSamples, int, optional, number of histories to generate the perturbations for
+      @ Out, msrShocks, np.array, measurement shocks shaped [numSamples, size]
+      @ Out, stateShocks, np.array, state shocks shaped [numSamples, size]
+      @ Out, initialState, np.array, initial random states shaped [stateDimension, numSamples]
     """
     # measurement shocks -> these are usually near 0 but not exactly
     # note in statsmodels.tsa.statespace.kalman_filter, mean of measure shocks is 0s
@@ -499,12 +529,37 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer, TimeSeriesTransformer):
     #   is identified and to keep the RNG samples consistent with the existing tests.
     # msrCov = model['obs_cov']
     msrCov = np.zeros((1, 1))
-    msrShocks = randomUtils.randomMultivariateNormal(msrCov, size=size)
+    msrShocks = randomUtils.randomMultivariateNormal(msrCov, size=size*numSamples).reshape(numSamples, size)
     # state shocks -> these are the significant noise terms
     # note in statsmodels.tsa.statespace.kalman_filter, mean of state shocks is 0s
-    stateShocks = randomUtils.randomMultivariateNormal(np.atleast_2d(params['var']), size=size)
+    stateShocks = randomUtils.randomMultivariateNormal(np.atleast_2d(params['var']), size=size*numSamples).reshape(numSamples, size)
     # initial state
     initMean = params['initials']['mean']
     initCov = params['initials']['cov']
-    initialState = randomUtils.randomMultivariateNormal(initCov, size=1, mean=initMean)
+    # the mean is given as a column so each of the numSamples draws (columns) gets the full mean vector
+    initialState = randomUtils.randomMultivariateNormal(initCov, size=numSamples, mean=np.reshape(initMean, (-1, 1)))
     return msrShocks, stateShocks, initialState
+
+  def _simulateStateSpace(self, params, msrShocks, stateShocks, initialState):
+    """
+      Simulates several histories of the ARMA model at once using its state space representation
+        y_t = c + Z x_t + e_t
+        x_{t+1} = T x_t + R w_t
+      where Z = [1, 0, ..., 0] and c is the constant. This is the same representation (and so the same
+      signal, given the shocks) used by statsmodels.tsa.arima.model.ARIMA.simulate, without building
+      the statsmodels model each time.
+      @ In, params, dict, dictionary of trained model parameters
+      @ In, msrShocks, np.array, measurement shocks (e) shaped [numSamples, size]
+      @ In, stateShocks, np.array, state shocks (w) shaped [numSamples, size]
+      @ In, initialState, np.array, initial states (x_0) shaped [stateDimension, numSamples]
+      @ Out, signal, np.array, simulated histories shaped [numSamples, size]
+    """
+    transition, _, _, selection = self._buildStateSpaceMatrices(params)
+    numSamples, size = stateShocks.shape
+    signal = np.empty((numSamples, size))
+    state = initialState
+    for t in range(size):
+      signal[:, t] = state[0]
+      state = transition @ state + selection.reshape(-1, 1) * stateShocks[:, t][np.newaxis, :]
+    signal += params.get('const', 0) + msrShocks
+    return signal
@@ -18,10 +18,9 @@
 import copy
 import collections
 import numpy as np
-import sklearn.linear_model
-import statsmodels.api as sm
 
-from ..utils import InputData, InputTypes, randomUtils, xmlUtils, mathUtils, utils
+from ..utils import InputData, InputTypes, randomUtils, xmlUtils, mathUtils, utils, importerUtils
+sm = importerUtils.importModuleLazyRenamed('sm', globals(), 'statsmodels.api')
 from .TimeSeriesAnalyzer import TimeSeriesTransformer, TimeSeriesCharacterizer, TimeSeriesGenerator
 
 
@@ -270,6 +270,33 @@ class TSAUser:
 
     return rlz
 
+  def evaluateTSABatch(self, numSamples):
+    """
+      Evaluate TSA algorithms using a sequential linear superposition approach, for several
+      realizations at once (the algorithms are applied to all the realizations together)
+      @ In, numSamples, int, number of realizations to evaluate
+      @ Out, rlz, dict, realization dictionary of values for each target, shaped [numSamples, pivotValues]
+                        (the pivot parameter values are shared by all the realizations)
+    """
+    pivots = self.pivotParameterValues
+    noPivotTargets = [x for x in self.target if x != self.pivotParameterID]
+    result = np.zeros((numSamples, self.pivotParameterValues.size, len(noPivotTargets)))
+    for algo in self._tsaAlgorithms[::-1]:
+      settings = self._tsaAlgoSettings[algo]
+      targets = settings['target']
+      indices = list(noPivotTargets.index(t) for t in targets)
+      params = self._tsaTrainedParams[algo]
+      signal = result[:, :, indices]
+      if algo.canTransform():  # covers algorithms which are both transformers and generators
+        result[:, :, indices] = algo.getCompositeBatch(signal, params, pivots, settings)
+      elif algo.canGenerate():
+        result[:, :, indices] = algo.generateBatch(params, pivots, settings, numSamples)
+      else:  # Must be exclusively a TimeSeriesCharacterizer, so there is nothing to evaluate
+        continue
+    rlz = dict((target, result[:, :, t]) for t, target in enumerate(noPivotTargets))
+    rlz[self.pivotParameterID] = self.pivotParameterValues
+    return rlz
+
   def getGlobalTSARomSettings(self):
     """
       Train TSA algorithms using a sequential removal-and-residual approach.
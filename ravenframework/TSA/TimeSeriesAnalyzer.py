@@ -16,6 +16,7 @@
   checking time histories.
 """
 import abc
+import numpy as np
 
 from ..utils import utils, InputData, InputTypes, mathUtils
 
@@ -192,6 +193,22 @@ class TimeSeriesGenerator(TimeSeriesAnalyzer):
       @ Out, synthetic, np.array(float), synthetic signal
     """
 
+  def generateBatch(self, params, pivot, settings, numSamples):
+    """
+      Generates several synthetic histories from fitted parameters at once.
+      Algorithms that can vectorize the generation across histories should overload this method.
+      @ In, params, dict, training parameters as from self.characterize
+      @ In, pivot, np.array, time-like array values
+      @ In, settings, dict, additional settings specific to algorithm
+      @ In, numSamples, int, number of histories to generate
+      @ Out, synthetic, np.array(float), synthetic signals shaped [numSamples, pivotValues, targets]
+    """
+    if not self.isStochastic():
+      # deterministic algorithms generate the same history every time
+      synthetic = self.generate(params, pivot, settings)
+      return np.repeat(synthetic[np.newaxis], numSamples, axis=0)
+    return np.stack([self.generate(params, pivot, settings) for _ in range(numSamples)])
+
 
 class TimeSeriesCharacterizer(TimeSeriesAnalyzer):
   """
@@ -306,3 +323,16 @@ class TimeSeriesTransformer(TimeSeriesAnalyzer):
       @ In, settings, dict, additional settings specific to algorithm
       @ Out, composite, np.array, resulting composite signal
     """
+
+  def getCompositeBatch(self, initial, params, pivot, settings):
+    """
+      Combines several pairs of component signals at once (see getComposite).
+      Algorithms that can vectorize the composition across histories should overload this method.
+      @ In, initial, np.array, original signals shaped [numSamples, pivotValues, targets], targets MUST be in
+                               same order as self.target
+      @ In, params, dict, training parameters as from self.characterize
+      @ In, pivot, np.array, time-like array values
+      @ In, settings, dict, additional settings specific to algorithm
+      @ Out, composite, np.array, resulting composite signals shaped [numSamples, pivotValues, targets]
+    """
+    return np.stack([self.getComposite(signal, params, pivot, settings) for signal in initial])
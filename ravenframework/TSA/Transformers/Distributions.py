@@ -20,7 +20,6 @@
 """
 
 import numpy as np
-import sklearn.preprocessing as skl
 
 from ..TimeSeriesAnalyzer import TimeSeriesTransformer
 from .ScikitLearnBase import SKLTransformer
@@ -29,7 +28,8 @@ from ...utils import InputTypes, xmlUtils, mathUtils
 
 class Gaussianize(SKLTransformer):
   """ Uses scikit-learn's preprocessing.QuantileTransformer to transform data to a normal distribution """
-  templateTransformer = skl.QuantileTransformer(output_distribution='normal')
+  _templateClass = 'QuantileTransformer'
+  _templateKwargs = {'output_distribution': 'normal'}
 
   @classmethod
   def getInputSpecification(cls):
@@ -74,7 +74,8 @@ class Gaussianize(SKLTransformer):
 
 class QuantileTransformer(Gaussianize):
   """ Wrapper of scikit-learn's QuantileTransformer """
-  templateTransformer = skl.QuantileTransformer()
+  _templateClass = 'QuantileTransformer'
+  _templateKwargs = {}
 
   @classmethod
   def getInputSpecification(cls):
@@ -20,7 +20,6 @@ Commonly used stateless transformation functions
 
 import numpy as np
 import scipy.special as sps
-import sklearn.preprocessing as skl
 
 from .ScikitLearnBase import SKLTransformer
 from ...utils import InputTypes
@@ -28,7 +27,8 @@ from ...utils import InputTypes
 
 class LogTransformer(SKLTransformer):
   """ Wrapper of scikit-learn's FunctionTransformer for np.log/np.exp """
-  templateTransformer = skl.FunctionTransformer(np.log, np.exp)
+  _templateClass = 'FunctionTransformer'
+  _templateArgs = (np.log, np.exp)
 
   @classmethod
   def getInputSpecification(cls):
@@ -66,7 +66,8 @@ class LogTransformer(SKLTransformer):
 
 class ArcsinhTransformer(SKLTransformer):
   """ Wrapper of scikit-learn's FunctionTransformer for np.arcsinh/np.sinh """
-  templateTransformer = skl.FunctionTransformer(np.arcsinh, np.sinh)
+  _templateClass = 'FunctionTransformer'
+  _templateArgs = (np.arcsinh, np.sinh)
 
   @classmethod
   def getInputSpecification(cls):
@@ -86,7 +87,8 @@ class ArcsinhTransformer(SKLTransformer):
 
 class TanhTransformer(SKLTransformer):
   """ Wrapper of scikit-learn's FunctionTransformer for np.tanh/np.arctanh """
-  templateTransformer = skl.FunctionTransformer(np.tanh, np.arctanh)
+  _templateClass = 'FunctionTransformer'
+  _templateArgs = (np.tanh, np.arctanh)
 
   @classmethod
   def getInputSpecification(cls):
@@ -106,7 +108,8 @@ class TanhTransformer(SKLTransformer):
 
 class SigmoidTransformer(SKLTransformer):
   """ Wrapper of scikit-learn's FunctionTransformer for scipy.special.expit/scipy.special.logit """
-  templateTransformer = skl.FunctionTransformer(sps.expit, sps.logit)
+  _templateClass = 'FunctionTransformer'
+  _templateArgs = (sps.expit, sps.logit)
 
   @classmethod
   def getInputSpecification(cls):
@@ -126,7 +129,7 @@ class SigmoidTransformer(SKLTransformer):
 
 class OutTruncation(SKLTransformer):
   """ Wrapper of scikit-learn's FunctionTransformer for limiting generated data to a specific range """
-  templateTransformer = skl.FunctionTransformer()
+  _templateClass = 'FunctionTransformer'
 
   @classmethod
   def getInputSpecification(cls):
@@ -19,15 +19,13 @@ Created on June 20, 2023
 Wrappers for scikit-learn preprocessing scalers.
 """
 
-import sklearn.preprocessing as skl
-
 from .ScikitLearnBase import SKLCharacterizer
 
 
 class MaxAbsScaler(SKLCharacterizer):
   """ Wrapper of sklearn.preprocessing.MaxAbsScaler """
   _features = ['scale']
-  templateTransformer = skl.MaxAbsScaler()
+  _templateClass = 'MaxAbsScaler'
 
   @classmethod
   def getInputSpecification(cls):
@@ -48,7 +46,7 @@ class MaxAbsScaler(SKLCharacterizer):
 class MinMaxScaler(SKLCharacterizer):
   """ Wrapper of sklearn.preprocessing.MinMaxScaler """
   _features = ['dataMin', 'dataMax']
-  templateTransformer = skl.MinMaxScaler()
+  _templateClass = 'MinMaxScaler'
 
   @classmethod
   def getInputSpecification(cls):
@@ -69,7 +67,7 @@ class MinMaxScaler(SKLCharacterizer):
 class RobustScaler(SKLCharacterizer):
   """ Wrapper of sklearn.preprocessing.RobustScaler """
   _features = ['center', 'scale']
-  templateTransformer = skl.RobustScaler()
+  _templateClass = 'RobustScaler'
 
   @classmethod
   def getInputSpecification(cls):
@@ -90,7 +88,7 @@ class RobustScaler(SKLCharacterizer):
 class StandardScaler(SKLCharacterizer):
   """ Wrapper of sklearn.preprocessing.StandardScaler """
   _features = ['mean', 'scale']
-  templateTransformer = skl.StandardScaler()
+  _templateClass = 'StandardScaler'
 
   @classmethod
   def getInputSpecification(cls):
@@ -19,21 +19,32 @@ Created on June 20, 2023
 Base classes for wrapping scikit-learn style transformers and characterizers.
 """
 
-import abc
 from copy import deepcopy
 
 from ..TimeSeriesAnalyzer import TimeSeriesTransformer, TimeSeriesCharacterizer
-from ...utils import xmlUtils, InputTypes
+from ...utils import xmlUtils, InputTypes, importerUtils
+skl = importerUtils.importModuleLazyRenamed('skl', globals(), 'sklearn.preprocessing')
 
 
 class SKLTransformer(TimeSeriesTransformer):
   """ Wrapper for scikit-learn transformers """
   _acceptsMissingValues = True
+  # sklearn.preprocessing class (and its arguments) of the template transformer, set in child classes;
+  # the template is only built when first needed, so scikit-learn is not imported at module load
+  _templateClass = None
+  _templateArgs = ()
+  _templateKwargs = {}
 
   @property
-  @abc.abstractmethod
   def templateTransformer(self):
-    """ Template transformer that must be implemented in child classes """
+    """
+      Template transformer, built on first use from the class settings
+      @ In, None
+      @ Out, templateTransformer, object, scikit-learn transformer
+    """
+    if self.__dict__.get('_templateTransformer') is None:
+      self._templateTransformer = getattr(skl, self._templateClass)(*self._templateArgs, **self._templateKwargs)
+    return self._templateTransformer
 
   def fit(self, signal, pivot, targets, settings):
     """
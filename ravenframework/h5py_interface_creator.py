@@ -30,7 +30,13 @@ from .BaseClasses import InputDataUser, MessageUser
 # the database version should be modified
 # everytime a new modification of the internal
 # structure of the data is performed
-_hdf5DatabaseVersion = "v2.1"
+_hdf5DatabaseVersion = "v3.0"
+# older versions that can still be read (and extended) with their own layout
+_hdf5LegacyVersions = ["v2.1"]
+# name of the group holding the column-oriented storage of all the realizations (from v3.0)
+_realizationStoreName = "RAVEN_realizations"
+# number of rows per chunk in the column-oriented storage
+_chunkRows = 1024
 
 def _dumps(val, void=True):
   """
@@ -112,6 +118,7 @@ class hdf5Database(InputDataUser, MessageUser):
     # List of boolean variables, true if the corresponding group in self.allGroupPaths
     # is an ending group (no sub-groups appended), false otherwise
     self.allGroupEnds = []
+    self._storeColumns = None # {variable name: (values dataset, bounds dataset, shapes dataset)} of the realization store (from v3.0)
     # We can create a base empty database or we open an existing one
     if self.fileExist:
       # self.h5FileW is the HDF5 object. Open the database in "update" mode
@@ -122,14 +129,15 @@ class hdf5Database(InputDataUser, MessageUser):
       self.h5FileW = self.openDatabaseW(self.filenameAndPath, 'r+')
       # check version
       version = self.h5FileW.attrs.get("version", "None")
-      if version != _hdf5DatabaseVersion:
+      if version != _hdf5DatabaseVersion and version not in _hdf5LegacyVersions:
         self.raiseAnError(IOError, 'HDF5 RAVEN version (read mode) is outdated. ' +
                           f'Current version is "{_hdf5DatabaseVersion}". ' +
                           f'Version in HDF5 is "{version}".' +
                           'Read README file in folder ' +
                           '"raven/scripts/conversionScripts/conversion_hdf5"' +
                           ' to convert your outdated HDF5 into the new format!')
-
+      # layout of the data in the file (the legacy layouts are kept when extending an old file)
+      self.layout = version
       # Call the private method __createObjFromFile, that constructs the list of the paths "self.allGroupPaths"
       # and the list "self.allGroupEnds" based on the database that already exists
       self.parentGroupName = '/'
@@ -147,6 +155,7 @@ class hdf5Database(InputDataUser, MessageUser):
       self.firstRootGroup = False
       # The root name is / . it can be changed if addGroupInit is called
       self.parentGroupName = '/'
+      self.layout = _hdf5DatabaseVersion
       self.__createFileLevelInfoDatasets()
 
   def __len__(self):
@@ -218,6 +227,9 @@ class hdf5Database(InputDataUser, MessageUser):
       @ Out, None
     """
     if isinstance(obj,h5.Group):
+      if name.startswith(_realizationStoreName):
+        # the column-oriented storage is not a realization group
+        return
       self.allGroupPaths.append(utils.toBytes(name))
       try:
         self.allGroupEnds.append(obj.attrs["endGroup"])
@@ -236,7 +248,10 @@ class hdf5Database(InputDataUser, MessageUser):
         values of the dictionary are lists of the corresponding indexes/coordinates of given variable
       @ Out, None
     """
-    self.h5FileW.attrs['expectedMetadata'] = _dumps(list(keys))
+    if self.layout in _hdf5LegacyVersions:
+      self.h5FileW.attrs['expectedMetadata'] = _dumps(list(keys))
+    else:
+      self.h5FileW.attrs['expectedMetadata'] = np.array(list(keys), dtype=h5.string_dtype())
 
   def provideExpectedMetaKeys(self):
     """
@@ -248,7 +263,7 @@ class hdf5Database(InputDataUser, MessageUser):
     meta = set()
     gotMeta = self.h5FileW.attrs.get('expectedMetadata',None)
     if gotMeta is not None:
-      meta = set(_loads(gotMeta))
+      meta = set(_loads(gotMeta)) if self.layout in _hdf5LegacyVersions else set(utils.toString(key) for key in gotMeta)
     # FIXME, I'm not sure how to enable the HDF5 to store the time-dependent metadata,
     # or how to store the time dependent metadata in the HDF5, currently only empty dict of
     # indexes information is returned
@@ -326,22 +341,13 @@ class hdf5Database(InputDataUser, MessageUser):
     self.__updateFileLevelInfoDatasets()
     self.h5FileW.flush()
 
-  def __populateGroup(self, group, name,  rlz):
+  def __splitRealization(self, rlz):
     """
-      This method is a common method between the __addGroupRootLevel and __addSubGroup
-      It is used to populate the group with the info in the rlz
-      @ In, group, h5py.Group, the group instance
-      @ In, name, str, the group name (no path)
+      Splits the realization into the numeric data and the other (strings and objects) data to store
       @ In, rlz, dict, dictionary with the data and metadata to add
-      @ Out, None
+      @ Out, dataScalar, dict, {var: np.ndarray} numeric data
+      @ Out, dataOther, dict, {var: np.ndarray} other data
     """
-    # vectorize method
-    _vdumps = np.vectorize(_dumps)
-    # create local dump method (no void)
-    _vectDumps = lambda x: _vdumps(x,False)
-
-    group.attrs[b'hasScalar'] = False
-    group.attrs[b'hasOther'   ] = False
     if self.variables is not None:
       # check if all variables are contained in the rlz dictionary
       if not set(self.variables).issubset(rlz.keys()):
@@ -355,7 +361,31 @@ class hdf5Database(InputDataUser, MessageUser):
       dataScalar = dict( (key, np.atleast_1d(value)) for (key, value) in rlz.items()
                          if _checkTypeHDF5(value, False) and key in self.variables)
     # get other dtype data (strings and objects)
-    dataOther    = dict( (key, np.atleast_1d(_vectDumps(value))) for (key, value) in rlz.items() if _checkTypeHDF5(value, True) )
+    dataOther = dict( (key, np.atleast_1d(value)) for (key, value) in rlz.items() if _checkTypeHDF5(value, True) )
+
+    return dataScalar, dataOther
+
+  def __populateGroup(self, group, name,  rlz):
+    """
+      This method is a common method between the __addGroupRootLevel and __addSubGroup
+      It is used to populate the group with the info in the rlz
+      @ In, group, h5py.Group, the group instance
+      @ In, name, str, the group name (no path)
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, None
+    """
+    if self.layout not in _hdf5LegacyVersions:
+      self.__appendToStore(group, name, rlz)
+      return
+    # vectorize method
+    _vdumps = np.vectorize(_dumps)
+    # create local dump method (no void)
+    _vectDumps = lambda x: _vdumps(x,False)
+
+    group.attrs[b'hasScalar'] = False
+    group.attrs[b'hasOther'   ] = False
+    dataScalar, dataOther = self.__splitRealization(rlz)
+    dataOther = dict( (key, np.atleast_1d(_vectDumps(value))) for (key, value) in dataOther.items() )
     # get size of each data variable (float)
     varKeysScalar = list(dataScalar.keys())
     if len(varKeysScalar) > 0:
@@ -395,6 +425,181 @@ class hdf5Database(InputDataUser, MessageUser):
     group.attrs[b'nVarsScalar' ] = len(varKeysScalar)
     group.attrs[b'nVarsOther'    ] = len(varKeysOther)
 
+  def __realizationStore(self):
+    """
+      Provides the group holding the column-oriented storage of the realizations, creating it if needed.
+      Each variable has a "values" dataset (the flattened values of all the realizations, one after the other),
+      a "bounds" dataset (begin and end row of each realization in "values", -1 if the variable is missing) and,
+      for the numeric variables, a "shapes" dataset (shape of each ND realization value, empty if 1D).
+      @ In, None
+      @ Out, store, h5py.Group, the storage group
+    """
+    if _realizationStoreName not in self.h5FileW:
+      store = self.h5FileW.create_group(_realizationStoreName)
+      store.attrs['nRealizations'] = 0
+      store.create_dataset('names', shape=(0,), maxshape=(None,), chunks=(_chunkRows,), dtype=h5.string_dtype())
+      store.create_dataset('variables', shape=(0,), maxshape=(None,), chunks=(_chunkRows,), dtype=h5.string_dtype())
+    store = self.h5FileW[_realizationStoreName]
+    if self._storeColumns is None:
+      self._storeColumns = {}
+      for cnt, var in enumerate(store['variables'].asstr()[()]):
+        self._storeColumns[var] = (store[f'values{cnt}'], store[f'bounds{cnt}'], store.get(f'shapes{cnt}'))
+
+    return store
+
+  def __storeColumn(self, store, var, kind):
+    """
+      Provides the datasets of a variable in the realization store, creating them if needed
+      @ In, store, h5py.Group, the storage group
+      @ In, var, str, the variable name
+      @ In, kind, str, the kind of data ('float', 'bool', 'str' or 'object')
+      @ Out, column, tuple, (values dataset, bounds dataset, shapes dataset or None)
+    """
+    if var not in self._storeColumns:
+      cnt = len(self._storeColumns)
+      dtype = {'float': float,
+               'bool': bool,
+               'str': h5.string_dtype(),
+               'object': h5.vlen_dtype(np.dtype('uint8'))}[kind]
+      values = store.create_dataset(f'values{cnt}', shape=(0,), maxshape=(None,), chunks=(_chunkRows,), dtype=dtype)
+      values.attrs['kind'] = kind
+      bounds = store.create_dataset(f'bounds{cnt}', shape=(0, 2), maxshape=(None, 2), chunks=(_chunkRows, 2),
+                                    dtype=np.int64, fillvalue=-1)
+      shapes = None
+      if kind in ['float', 'bool']:
+        # the ND values are stored flattened, their shape can change from a realization to another
+        shapes = store.create_dataset(f'shapes{cnt}', shape=(0,), maxshape=(None,), chunks=(_chunkRows,),
+                                      dtype=h5.vlen_dtype(np.dtype('int64')))
+      store['variables'].resize((cnt + 1,))
+      store['variables'][cnt] = var
+      self._storeColumns[var] = (values, bounds, shapes)
+    column = self._storeColumns[var]
+    if column[0].attrs['kind'] != kind:
+      self.raiseAnError(IOError, f'Variable "{var}" has been stored as "{column[0].attrs["kind"]}" in database "{self.name}" ' +
+                        f'but a "{kind}" value has been received!')
+
+    return column
+
+  def __appendToStore(self, group, name, rlz):
+    """
+      Appends the realization to the column-oriented storage, and links it to its group
+      @ In, group, h5py.Group, the group instance
+      @ In, name, str, the group name (no path)
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, None
+    """
+    store = self.__realizationStore()
+    index = int(store.attrs['nRealizations'])
+    dataScalar, dataOther = self.__splitRealization(rlz)
+    data = dict((key, ('float', value.astype(float))) for key, value in dataScalar.items())
+    for key, value in dataOther.items():
+      if value.dtype == bool:
+        data[key] = ('bool', value)
+      elif value.dtype.kind in 'US' or all(isinstance(val, str) for val in value.ravel()):
+        data[key] = ('str', value.astype(str).astype(object).ravel())
+      else:
+        # arbitrary python objects have no native representation, they are serialized
+        encoded = np.empty(value.size, dtype=object)
+        encoded[:] = [np.frombuffer(_dumps(val, False), dtype=np.uint8) for val in value.ravel()]
+        data[key] = ('object', encoded)
+    for key, (kind, value) in data.items():
+      values, bounds, shapes = self.__storeColumn(store, key, kind)
+      if shapes is not None:
+        if shapes.shape[0] <= index:
+          shapes.resize((index + 1,))
+        if value.ndim > 1:
+          shapes[index] = np.asarray(value.shape, dtype=np.int64)
+        value = value.ravel()
+      begin = values.shape[0]
+      values.resize(begin + len(value), axis=0)
+      if kind == 'object':
+        # h5py does not broadcast an object array of buffers into a variable-length dataset
+        for row, buffer in enumerate(value):
+          values[begin + row] = buffer
+      else:
+        values[begin:] = value
+      if bounds.shape[0] <= index:
+        bounds.resize(index + 1, axis=0)
+      bounds[index] = (begin, begin + len(value))
+    store['names'].resize((index + 1,))
+    store['names'][index] = name
+    store.attrs['nRealizations'] = index + 1
+    # add some info
+    group.attrs[b'groupName'     ] = name
+    group.attrs[b'endGroup'      ] = True
+    group.attrs[b'RAVEN_parentID'] = group.parent.name
+    group.attrs[b'rlzIndex'      ] = index
+
+  @staticmethod
+  def __decodeColumn(values, kind):
+    """
+      Converts the values read from the realization store back into the realization format
+      @ In, values, np.ndarray, the values as read from the store
+      @ In, kind, str, the kind of data ('float', 'bool', 'str' or 'object')
+      @ Out, values, np.ndarray, the decoded values
+    """
+    if kind == 'str':
+      return np.array([utils.toString(val) for val in values], dtype=str)
+    if kind == 'object':
+      decoded = np.empty(len(values), dtype=object)
+      decoded[:] = [_loads(val.tobytes()) for val in values]
+      return decoded
+    return values
+
+  def __getDataFromStore(self, indices):
+    """
+      Retrieves realizations from the column-oriented storage, reading each variable once
+      @ In, indices, list, the indices of the realizations in the storage
+      @ Out, rlzs, list, list of dictionaries with the data of each realization
+    """
+    self.__realizationStore()
+    rlzs = [{} for _ in indices]
+    for var, (valuesDataset, boundsDataset, shapesDataset) in self._storeColumns.items():
+      kind = valuesDataset.attrs['kind']
+      # a single realization only needs its own bounds, shape and rows
+      if len(indices) == 1:
+        index = indices[0]
+        if index < boundsDataset.shape[0]:
+          start, end = boundsDataset[index]
+          if start >= 0:
+            value = self.__decodeColumn(valuesDataset[start:end], kind)
+            if shapesDataset is not None and index < shapesDataset.shape[0]:
+              shape = shapesDataset[index]
+              if len(shape):
+                value = value.reshape(shape)
+            rlzs[0][var] = value
+        continue
+      bounds = boundsDataset[()]
+      shapes = shapesDataset[()] if shapesDataset is not None else []
+      values = self.__decodeColumn(valuesDataset[()], kind)
+      for rlz, index in zip(rlzs, indices):
+        if index < len(bounds) and bounds[index][0] >= 0:
+          value = values[bounds[index][0]:bounds[index][1]]
+          rlz[var] = value.reshape(shapes[index]) if index < len(shapes) and len(shapes[index]) else value
+
+    return rlzs
+
+  def _getRealizationsByName(self, names):
+    """
+      Function to retrieve several realizations at once, given their end group names.
+      The hierarchical histories are not reconstructed (see _getRealizationByName).
+      @ In, names, list, the realization names
+      @ Out, rlzs, list, list of dictionaries with the data of each realization
+    """
+    if not self.fileOpen:
+      self.__createObjFromFile()
+    if self.layout in _hdf5LegacyVersions:
+      return [self._getRealizationByName(name, {'reconstruct': False})[0] for name in names]
+    store = self.__realizationStore()
+    positions = {}
+    for index, name in enumerate(store['names'].asstr()[()]):
+      positions.setdefault(name, index)
+    missing = [name for name in names if name not in positions]
+    if len(missing) > 0:
+      self.raiseAnError(IOError, 'Groups named ' + ', '.join(missing) + ' not found in database "' + self.name + '"!')
+
+    return self.__getDataFromStore([positions[name] for name in names])
+
   def __addGroupRootLevel(self,groupName,rlz):
     """
       Function to add a group into the database (root level)
@@ -524,6 +729,8 @@ class hdf5Database(InputDataUser, MessageUser):
       @ In, name, str, the group name
       @ Out, newData, dict, the dictionary with the data
     """
+    if self.layout not in _hdf5LegacyVersions:
+      return self.__getDataFromStore([int(group.attrs['rlzIndex'])])[0]
     newData = {}
     hasScalar = group.attrs['hasScalar']
     hasOther    = group.attrs['hasOther']
@@ -601,6 +808,8 @@ class hdf5Database(InputDataUser, MessageUser):
     """
     self.h5FileW.close()
     self.fileOpen = False
+    # the datasets of the realization store are bound to the closed file
+    self._storeColumns = None
     return
 
   def openDatabaseW(self,filename,mode='w'):
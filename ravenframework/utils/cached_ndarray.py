@@ -21,6 +21,8 @@ from __future__ import division, print_function, absolute_import
 #----- end python 2 - 3 compatibility
 #External Modules------------------------------------------------------------------------------------
 import sys
+import math
+import itertools
 import threading
 from numpy import ndarray
 import numpy as np
@@ -384,3 +386,541 @@ class cNDarray(object):
     assert(abs(index) < self.width)
     self.values = np.delete(self.values,index,axis=1)
     self.width -= 1
+
+#
+#
+#
+#
+class cColumnarArray(object):
+  """
+    Column-oriented caching of realizations, with the same interface as cNDarray.
+    Each entity (column) is stored in its own growable, typed np.ndarray:
+      - scalars are stored in a (capacity,) array of their numeric type;
+      - fixed-length numeric histories are stored in a (capacity, length) array;
+      - anything else (strings, misaligned histories, ND entries) falls back on a (capacity,) object array.
+    A column is promoted to a wider numeric type or to object storage as soon as a new entry does not fit.
+    Since the values are copied into the buffers when appended, the typed columns can be wrapped into
+    xr.DataArray without any further conversion (see getColumn).
+  """
+  ### CONSTRUCTOR ###
+  def __init__(self, values=None, width=None, length=None):
+    """
+      Constructor.
+      @ In, values, np.ndarray, optional, matrix of initial values with shape (# samples, # entities)
+      @ In, width, int, optional, if not using "values" then this is the number of entities to allocate
+      @ In, length, int, optional, if not using "values" then this is the initial capacity (number of samples) to allocate
+      @ Out, None
+    """
+    self.size     = 0    # number of rows (samples) with actual data (not including empty cached)
+    self.width    = 0    # number of entities aka columns
+    self.capacity = None # number of rows allocated in each column
+    self._columns = []   # one np.ndarray (or None if not typed yet) per entity
+    if values is not None:
+      if type(values) != np.ndarray:
+        raise IOError('Only np.ndarray can be used to set "values" in "cColumnarArray".  Got '+type(values).__name__)
+      self.size = values.shape[0]
+      self.capacity = max(self.size, 1)
+      for c in range(values.shape[1]):
+        self._columns.append(self._columnFromEntries(values[:, c]))
+      self.width = len(self._columns)
+    else:
+      if width is None:
+        raise IOError('Creating cColumnarArray: neither "values" nor "width" was specified!')
+      self.capacity = length if length is not None else 100
+      self.width = width
+      self._columns = [None] * width
+
+  ### PROPERTIES ###
+  @property
+  def shape(self):
+    """
+      Shape property, as used in np.ndarray structures.
+      @ In, None
+      @ Out, (int,int), the (#rows, #columns) of useful data in this cached array
+    """
+    return (self.size, self.width)
+
+  ### BUILTINS ###
+  def __array__(self, dtype=None):
+    """
+      so that numpy's array() returns values
+      @ In, dtype, np.type, the requested type of the array
+      @ Out, __array__, numpy.ndarray, the requested array
+    """
+    data = self.getData()
+    return data if dtype is None else data.astype(dtype)
+
+  def __getitem__(self, val):
+    """
+      Get item method. Supports the same requests of cNDarray, in particular
+      [row], [row, column], [row, (columns)], [:, column] and [rows].
+      Requesting a full column through [:, column] returns one entry per realization; use
+      getColumn to obtain the typed storage instead.
+      @ In, val, int or slice or tuple, the slicing object
+      @ Out, __getitem__, object or np.ndarray, the element(s)
+    """
+    if isinstance(val, tuple) and len(val) == 1:
+      val = val[0]
+    if not isinstance(val, tuple):
+      rows = self._rowIndices(val)
+      if rows is None:
+        return self._getRow(self._normalizeRow(val))
+      return self._getRows(rows)
+    row, col = val
+    cols = self._colIndices(col)
+    rows = self._rowIndices(row)
+    if rows is None:
+      row = self._normalizeRow(row)
+      if cols is None:
+        return self._getCell(col, row)
+      entries = np.empty(len(cols), dtype=object)
+      for e, c in enumerate(cols):
+        entries[e] = self._getCell(c, row)
+      return entries
+    if cols is None:
+      column = self.getColumn(col)[rows]
+      if column.ndim == 1:
+        return column
+      entries = np.empty(len(column), dtype=object)
+      for r in range(len(column)):
+        entries[r] = column[r]
+      return entries
+    return self._getRows(rows)[:, cols]
+
+  def __setitem__(self, val, value):
+    """
+      Set item method, only supports single-entry assignments as [row, column] = value.
+      @ In, val, tuple, (row, column) to set
+      @ In, value, object, the value to store
+      @ Out, None
+    """
+    row, col = val
+    self._setCell(col, self._normalizeRow(row), value)
+
+  def __iter__(self):
+    """
+      Overload of iterator, iterates over the realizations (rows)
+      @ In, None
+      @ Out, __iter__, iterator, iterator
+    """
+    return (self._getRow(r) for r in range(self.size))
+
+  def __len__(self):
+    """
+      Return size, which is the number of samples, independent of entities, containing useful data.
+      @ In, None
+      @ Out, __len__, integer, size
+    """
+    return self.size
+
+  def __repr__(self):
+    """
+      overload of __repr__ function
+      @ In, None
+      @ Out, __repr__, string, the representation string
+    """
+    return repr(self.getData())
+
+  ### UTILITY FUNCTIONS ###
+  def append(self, entry):
+    """
+      Append a single realization.
+      @ In, entry, list or np.ndarray, the values of the entities, in column order
+      @ Out, None
+    """
+    if len(entry) != self.width:
+      raise IOError('Tried to add new data to cColumnarArray.  Need {} entries in array, but got '.format(self.width)+str(len(entry)))
+    if self.size + 1 > self.capacity:
+      # quadruple available space, as in cNDarray
+      self._resize(self.capacity*4)
+    for c, value in enumerate(entry):
+      self._setCell(c, self.size, value)
+    self.size += 1
+
+  def addEntity(self, vals, firstEver=False):
+    """
+      Adds a column to the dataset.
+      @ In, vals, list, as list(#,#,#) where # is either single-valued or numpy array, one per realization
+      @ Out, None
+    """
+    assert len(vals) == self.size
+    column = None
+    if self.size:
+      entries = np.empty(self.size, dtype=object)
+      for r, val in enumerate(vals):
+        entries[r] = val
+      column = self._columnFromEntries(entries, self.capacity)
+    self._columns.append(column)
+    self.width += 1
+
+  def getColumn(self, index):
+    """
+      Returns the storage of a column up to the used size, without copying.
+      @ In, index, int, index of the column
+      @ Out, column, np.ndarray, shape (size,) for scalars and non-typed entries or (size, length) for aligned histories
+    """
+    column = self._columns[index]
+    if column is None:
+      return np.empty(0, dtype=object)
+    return column[:self.size]
+
+  def getData(self):
+    """
+      Returns the data as a row-oriented object matrix, as cNDarray does.
+      Note this creates a new matrix, so it is expensive for large collectors.
+      @ In, None
+      @ Out, getData, np.ndarray, object matrix with shape (size, width)
+    """
+    return self._getRows(np.arange(self.size))
+
+  def removeEntity(self, index):
+    """
+      Removes a column from this dataset
+      @ In, index, int, index of entry to remove
+      @ Out, None
+    """
+    assert(abs(index) < self.width)
+    del self._columns[index]
+    self.width -= 1
+
+  ### PRIVATE ###
+  def _castableInto(self, column, value):
+    """
+      Determines the column dtype needed to store "value" in "column".
+      @ In, column, np.ndarray, typed column storage
+      @ In, value, object, value to store
+      @ Out, dtype, np.dtype or None, dtype to use (None if the column must fall back on object storage)
+    """
+    kind = column.dtype.kind
+    if column.ndim == 2:
+      if not isinstance(value, np.ndarray) or value.shape != column.shape[1:]:
+        return None
+      valueDtype = value.dtype
+    else:
+      # fast path for the most common case
+      if kind == 'f' and type(value) in (float, np.float64):
+        return column.dtype
+      if isinstance(value, np.ndarray) and value.ndim > 0:
+        return None
+      valueDtype = np.asarray(value).dtype
+    if valueDtype.kind not in 'biufc' or kind not in 'biufc':
+      return None
+    return np.promote_types(column.dtype, valueDtype)
+
+  def _colIndices(self, col):
+    """
+      Converts a column request into a list of column indices, or None if a single column is requested.
+      @ In, col, int or tuple or list, the column request
+      @ Out, cols, list or None, column indices
+    """
+    if isinstance(col, (tuple, list, np.ndarray)):
+      return list(col)
+    if isinstance(col, slice):
+      return list(range(self.width))[col]
+    return None
+
+  def _columnFromEntries(self, entries, capacity=None):
+    """
+      Creates a column from one entry per realization, choosing the tightest storage.
+      @ In, entries, np.ndarray, object array with one entry per realization
+      @ In, capacity, int, optional, number of rows to allocate (defaults to the number of entries)
+      @ Out, column, np.ndarray, column storage
+    """
+    size = len(entries)
+    capacity = max(capacity if capacity is not None else size, size)
+    typed = None
+    if size:
+      first = entries[0]
+      if isinstance(first, np.ndarray):
+        if first.ndim == 1 and first.dtype.kind in 'biufc' and \
+           all(isinstance(e, np.ndarray) and e.shape == first.shape and e.dtype.kind in 'biufc' for e in entries):
+          typed = np.stack(entries)
+      else:
+        try:
+          typed = np.array(entries.tolist())
+        except (ValueError, TypeError):
+          typed = None
+        if typed is not None and (typed.ndim != 1 or typed.dtype.kind not in 'biufc'):
+          typed = None
+    if typed is None:
+      typed = np.empty(size, dtype=object)
+      for r, entry in enumerate(entries):
+        typed[r] = entry.copy() if isinstance(entry, np.ndarray) else entry
+    if capacity > size:
+      column = np.zeros((capacity,) + typed.shape[1:], dtype=typed.dtype)
+      column[:size] = typed
+      return column
+    return typed
+
+  def _getCell(self, col, row):
+    """
+      Gets a single entry.
+      @ In, col, int, column index
+      @ In, row, int, row index (nonnegative)
+      @ Out, value, object, the entry
+    """
+    return self._columns[col][row]
+
+  def _getRow(self, row):
+    """
+      Gets a single realization as object array
+      @ In, row, int, row index (nonnegative)
+      @ Out, entries, np.ndarray, object array of entries in column order
+    """
+    entries = np.empty(self.width, dtype=object)
+    for c, column in enumerate(self._columns):
+      entries[c] = column[row]
+    return entries
+
+  def _getRows(self, rows):
+    """
+      Gets several realizations as object matrix
+      @ In, rows, np.ndarray, row indices
+      @ Out, entries, np.ndarray, object matrix with shape (len(rows), width)
+    """
+    entries = np.empty((len(rows), self.width), dtype=object)
+    for c, column in enumerate(self._columns):
+      if column is None:
+        continue
+      if column.ndim == 1:
+        entries[:, c] = column[:self.size][rows]
+      else:
+        for e, r in enumerate(rows):
+          entries[e, c] = column[r]
+    return entries
+
+  def _normalizeRow(self, row):
+    """
+      Converts a (possibly negative) row index into a nonnegative one
+      @ In, row, int, row index
+      @ Out, row, int, nonnegative row index
+    """
+    if row < 0:
+      row += self.size
+    if not 0 <= row < self.size:
+      raise IndexError('Index {} is out of bounds for cColumnarArray with size {}'.format(row, self.size))
+    return row
+
+  def _resize(self, capacity):
+    """
+      Changes the allocated number of rows of every column
+      @ In, capacity, int, new capacity
+      @ Out, None
+    """
+    for c, column in enumerate(self._columns):
+      if column is None:
+        continue
+      newColumn = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+      newColumn[:self.size] = column[:self.size]
+      self._columns[c] = newColumn
+    self.capacity = capacity
+
+  def _rowIndices(self, row):
+    """
+      Converts a row request into an array of row indices, or None if a single row is requested.
+      @ In, row, int or slice or np.ndarray or list, the row request
+      @ Out, rows, np.ndarray or None, row indices
+    """
+    if isinstance(row, slice):
+      return np.arange(self.size)[row]
+    if isinstance(row, (list, np.ndarray)):
+      return np.arange(self.size)[np.asarray(row)]
+    return None
+
+  def _setCell(self, col, row, value):
+    """
+      Stores a single entry, promoting the column storage if needed.
+      @ In, col, int, column index
+      @ In, row, int, row index (nonnegative, lower than capacity)
+      @ In, value, object, value to store
+      @ Out, None
+    """
+    column = self._columns[col]
+    if column is None:
+      # first entry of this column determines its storage
+      entries = np.empty(1, dtype=object)
+      entries[0] = value
+      column = self._columnFromEntries(entries, self.capacity)
+      if row != 0:
+        column[row] = column[0]
+      self._columns[col] = column
+      return
+    if column.dtype != object:
+      dtype = self._castableInto(column, value)
+      if dtype is not None:
+        if dtype != column.dtype:
+          column = column.astype(dtype)
+          self._columns[col] = column
+        column[row] = value
+        return
+      column = self._toObjectColumn(col)
+    # object storage: protect against the caller changing the value afterwards
+    column[row] = value.copy() if isinstance(value, np.ndarray) else value
+
+  def _toObjectColumn(self, col):
+    """
+      Converts a typed column into object storage
+      @ In, col, int, column index
+      @ Out, column, np.ndarray, the new object column
+    """
+    column = self._columns[col]
+    newColumn = np.empty(self.capacity, dtype=object)
+    if column.ndim == 1:
+      newColumn[:self.size] = column[:self.size]
+    else:
+      for r in range(self.size):
+        newColumn[r] = column[r].copy()
+    self._columns[col] = newColumn
+    return newColumn
+
+#
+#
+#
+#
+class cMatchIndex(object):
+  """
+    Tolerance-aware hash index over a fixed set of scalar entities (columns) of a collection of realizations.
+    Numeric values are quantized into buckets (one bucket width per entity), anything else is hashed as it is.
+    A lookup returns the rows that MIGHT match the requested values within the given distances (a superset of
+    the actual matches), which the caller is responsible for checking exactly.
+    Rows are only ever appended, so the index can be updated incrementally as realizations are collected.
+  """
+  binsPerRange = 1024 # number of buckets spanning the range of the values the index is built on
+  maxProbes = 64      # maximum number of buckets to look into before giving up on the index
+
+  ### CONSTRUCTOR ###
+  def __init__(self, names, columns):
+    """
+      Constructor.
+      @ In, names, tuple(str), names of the indexed entities
+      @ In, columns, list(list), existing values of each entity, one list per entity (all of the same length)
+      @ Out, None
+    """
+    self.names = tuple(names)
+    self.size = 0
+    self._buckets = {}
+    self._widths = list(self._binWidth(column) for column in columns)
+    self.extend(columns)
+
+  ### BUILTINS ###
+  def __len__(self):
+    """
+      Overload len
+      @ In, None
+      @ Out, size, int, number of indexed rows
+    """
+    return self.size
+
+  def __repr__(self):
+    """
+      overload of __repr__ function
+      @ In, None
+      @ Out, __repr__, string, the representation string
+    """
+    return f'cMatchIndex({", ".join(self.names)}; {self.size} rows in {len(self._buckets)} buckets)'
+
+  ### UTILITY FUNCTIONS ###
+  def append(self, entry):
+    """
+      Adds the next row to the index.
+      @ In, entry, list, values of the new row, one per indexed entity (ordered as self.names)
+      @ Out, None
+    """
+    key = tuple(self._key(value, self._widths[e]) for e, value in enumerate(entry))
+    # NaN can't match anything, so such rows are not stored (but still counted)
+    if None not in key:
+      self._buckets.setdefault(key, []).append(self.size)
+    self.size += 1
+
+  def extend(self, columns):
+    """
+      Adds several rows to the index.
+      @ In, columns, list(list), values of each entity for the new rows, one list per entity
+      @ Out, None
+    """
+    for entry in zip(*columns):
+      self.append(entry)
+
+  def lookup(self, values, deltas):
+    """
+      Finds the rows that might match the given values.
+      @ In, values, list, requested values, one per indexed entity (ordered as self.names)
+      @ In, deltas, list(float), largest distance from each (numeric) value that can still be a match
+      @ Out, rows, list(int) or None, sorted candidate rows, or None if the request would need
+                                      too many buckets (in which case the caller should search everything)
+    """
+    probes = []
+    numProbes = 1
+    for e, value in enumerate(values):
+      width = self._widths[e]
+      if self._isNumeric(value):
+        value = float(value)
+        if math.isnan(value):
+          return []
+        if math.isinf(value):
+          probes.append([('inf', value)])
+          continue
+        # pad for round-off in the quantization of the stored values
+        delta = deltas[e] + 1e-9 * (abs(value) + deltas[e] + width)
+        if not math.isfinite(delta):
+          return None
+        low = math.floor((value - delta) / width)
+        high = math.floor((value + delta) / width)
+        numProbes *= high - low + 1
+        if numProbes > self.maxProbes:
+          return None
+        probes.append(range(low, high + 1))
+      else:
+        probes.append([self._key(value, width)])
+    rows = []
+    for key in itertools.product(*probes):
+      rows.extend(self._buckets.get(key, []))
+    rows.sort()
+    return rows
+
+  ### PRIVATE ###
+  def _binWidth(self, column):
+    """
+      Chooses the width of the buckets for an entity based on the values it holds.
+      @ In, column, list, values of the entity
+      @ Out, width, float, bucket width
+    """
+    numeric = list(float(value) for value in column if self._isNumeric(value))
+    numeric = np.asarray(numeric, dtype=float)
+    numeric = numeric[np.isfinite(numeric)]
+    if len(numeric):
+      width = (numeric.max() - numeric.min()) / self.binsPerRange
+      if width > 0 and np.isfinite(width):
+        return float(width)
+      scale = abs(numeric[0])
+      if scale > 0:
+        return float(scale) / self.binsPerRange
+    return 1.0
+
+  @staticmethod
+  def _isNumeric(value):
+    """
+      Determines if a value is quantized (rather than hashed as it is) by the index.
+      Booleans are included so they meet the numbers they compare equal to.
+      @ In, value, object, value to check
+      @ Out, isNumeric, bool, True if numeric
+    """
+    return isinstance(value, (int, float, np.number, np.bool_))
+
+  def _key(self, value, width):
+    """
+      Computes the bucket key of a single value.
+      @ In, value, object, value to store
+      @ In, width, float, bucket width for this entity
+      @ Out, key, object, hashable bucket key (None for NaN)
+    """
+    if self._isNumeric(value):
+      value = float(value)
+      if math.isnan(value):
+        return None
+      if math.isinf(value):
+        return ('inf', value)
+      return math.floor(value / width)
+    # raises TypeError for unhashable values, which the owner of the index should handle
+    hash(value)
+    return ('value', value)
@@ -17,6 +17,7 @@
   @authors: Diego Mandelli and Mohammad Abdo
 """
 # External Imports
+import bisect
 import numpy as np
 # Internal Imports
 
@@ -71,31 +72,91 @@ def nonDominatedFrontier(data, returnMask, minMask=None):
 
 def rankNonDominatedFrontiers(data):
   """
-    This method ranks the non dominated fronts by omitting thr first front from the data
-    and searching the remaining data for a new one recursively.
+    This method ranks the non dominated fronts of the data (minimization of all the objectives):
+    the first front contains the non-dominated points, the second front contains the points that are
+    non-dominated once the first front is omitted, and so on.
+    As in nonDominatedFrontier, when several points are equal, only one of them belongs to the front:
+    the copies of a point are in successive fronts (in the order of their indices), as if each copy
+    dominated the following ones.
+    Bi-objective data are sorted in O(N log N), by a sweep over the points sorted by the first objective,
+    otherwise a (vectorized) dominance matrix is used.
     @ In, data, np.array, data matrix (nPoints, nObjectives) containing the multi-objective
                           evaluations of each point/individual, element (i,j)
                           means jth objective function at the ith point/individual
     @ out, nonDominatedRank, list, a list of length nPoints that has the ranking
                                   of the front passing through each point
   """
-  nonDominatedRank = np.zeros(data.shape[0],dtype=int)
-  rank = 0
-  indicesDominated = list(np.arange(data.shape[0]))
-  indicesNonDominated = []
-  rawData = data
-  while np.shape(data)[0] > 0:
-    rank += 1
-    indicesNonDominated = list(nonDominatedFrontier(data, False))
-    if rank > 1:
-      for i in range(len(indicesNonDominated)):
-        indicesNonDominated[i] = indicesDominated[indicesNonDominated[i]]
-    indicesDominated = list(set(indicesDominated)-set(indicesNonDominated))
-    data = rawData[indicesDominated]
-    nonDominatedRank[indicesNonDominated] = rank
+  data = np.asarray(data, dtype=float)
+  if data.shape[0] == 0:
+    return []
+  if data.shape[1] == 2:
+    nonDominatedRank = _rankBiObjective(data)
+  else:
+    nonDominatedRank = _rankDominanceMatrix(data)
   nonDominatedRank = list(nonDominatedRank)
   return nonDominatedRank
 
+def _rankBiObjective(data):
+  """
+    Non-dominated sorting of bi-objective data.
+    The points are swept in lexicographic order (first objective, second objective, index): each point
+    can only be dominated by the points already swept, and it is dominated by the front k if the last
+    point added to front k has a lower (or equal) second objective. These values increase with k,
+    hence the front of each point is found by bisection. The copies of a point are swept in the order of
+    their indices, so that each copy is in the front following the one of the previous copy.
+    Reference: H. Fang et al., "An efficient non-dominated sorting method for evolutionary algorithms",
+    Evolutionary Computation, 16 (2008)
+    @ In, data, np.array, data matrix (nPoints, 2)
+    @ Out, rank, np.array, the rank (starting from 1) of the front of each point
+  """
+  nPoints = data.shape[0]
+  order = np.lexsort((data[:, 1], data[:, 0]))
+  rank = np.zeros(nPoints, dtype=int)
+  lastObjective = [] # second objective of the last point added to each front
+  for index, objective in zip(order, data[order, 1]):
+    front = bisect.bisect_right(lastObjective, objective)
+    if front == len(lastObjective):
+      lastObjective.append(objective)
+    else:
+      lastObjective[front] = objective
+    rank[index] = front + 1
+  return rank
+
+def _rankDominanceMatrix(data, maxBlockSize=2**24):
+  """
+    Non-dominated sorting based on the dominance matrix: the number of points dominating each point
+    is computed once, then the fronts are peeled off by subtracting the contribution of the last front.
+    The copies of a point are dominated by the copies with lower indices.
+    @ In, data, np.array, data matrix (nPoints, nObjectives)
+    @ In, maxBlockSize, int, optional, maximum number of comparisons held in memory when building the matrix
+    @ Out, rank, np.array, the rank (starting from 1) of the front of each point
+  """
+  nPoints, nObjectives = data.shape
+  # dominates[i, j] is True if the point i dominates the point j (or is equal to it, with i < j)
+  dominates = np.empty((nPoints, nPoints), dtype=bool)
+  blockSize = max(1, maxBlockSize // (nPoints * nObjectives))
+  indices = np.arange(nPoints)
+  for start in range(0, nPoints, blockSize):
+    # one objective at a time, since reducing over the (short) objective axis is much slower
+    block = data[start:start+blockSize]
+    lessEqual = block[:, np.newaxis, 0] <= data[:, 0]
+    less = block[:, np.newaxis, 0] < data[:, 0]
+    for obj in range(1, nObjectives):
+      lessEqual &= block[:, np.newaxis, obj] <= data[:, obj]
+      less |= block[:, np.newaxis, obj] < data[:, obj]
+    dominates[start:start+blockSize] = lessEqual & (less | (indices[start:start+blockSize, np.newaxis] < indices))
+  nDominating = dominates.sum(axis=0)
+  rank = np.zeros(nPoints, dtype=int)
+  front = np.flatnonzero(nDominating == 0)
+  currentRank = 0
+  while front.size:
+    currentRank += 1
+    rank[front] = currentRank
+    nDominating -= dominates[front].sum(axis=0)
+    nDominating[front] = -1
+    front = np.flatnonzero(nDominating == 0)
+  return rank
+
 def crowdingDistance(rank, popSize, objectives):
   """
     Method designed to calculate the crowding distance for each front
@@ -104,17 +165,25 @@ def crowdingDistance(rank, popSize, objectives):
     @ In, objectives, np.array, matrix contains objective values for each element of the population
     @ Out, crowdDist, np.array, array of crowding distances
   """
+  rank = np.asarray(rank)
+  objectives = np.asarray(objectives)
   crowdDist = np.zeros(popSize)
-  fronts = np.unique(rank)
-  fronts = fronts[fronts!=np.inf]
-
-  for f in range(len(fronts)):
-    front = np.where(np.asarray(rank)==f+1)[0]
-    fMax = np.max(objectives[front, :], axis=0)
-    fMin = np.min(objectives[front, :], axis=0)
-    for obj in range(np.shape(objectives)[1]):
-      sortedRank = np.argsort(objectives[front, obj])
-      crowdDist[front[sortedRank[0]]] = crowdDist[front[sortedRank[-1]]] = np.inf
-      for i in range(1, len(front)-1):
-        crowdDist[front[sortedRank[i]]] = crowdDist[front[sortedRank[i]]] + (objectives[front[sortedRank[i+1]], obj] - objectives[front[sortedRank[i-1]], obj]) / (fMax[obj]-fMin[obj])
+  members = np.flatnonzero(np.isfinite(rank))
+  if members.size == 0:
+    return crowdDist
+  rank = rank[members]
+  for obj in range(np.shape(objectives)[1]):
+    # all the fronts at once: the members are sorted by front, then by objective value
+    values = objectives[members, obj]
+    order = np.lexsort((values, rank))
+    sortedRank = rank[order]
+    sortedValues = values[order]
+    start = np.concatenate(([True], sortedRank[1:] != sortedRank[:-1]))
+    end = np.concatenate((sortedRank[1:] != sortedRank[:-1], [True]))
+    # objective range of the front of each member (the first and last members of each front)
+    frontId = np.cumsum(start) - 1
+    span = (sortedValues[end] - sortedValues[start])[frontId]
+    interior = np.flatnonzero(~(start | end))
+    crowdDist[members[order[interior]]] += (sortedValues[interior+1] - sortedValues[interior-1]) / span[interior]
+    crowdDist[members[order[start | end]]] = np.inf
   return crowdDist
@@ -0,0 +1,147 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Streaming (weighted) quantile sketch, used to estimate percentiles of very large
+  sample sets without sorting all the samples at once.
+  Reference: T. Dunning and O. Ertl, "Computing Extremely Accurate Quantiles Using t-Digests",
+  arXiv:1902.04023 (2019)
+"""
+import numpy as np
+
+class TDigest:
+  """
+    Merging t-digest: the samples are summarized by a (small) sorted set of weighted centroids,
+    which are finer in the tails of the distribution, where the percentiles of interest for the
+    risk metrics usually are. The incoming samples are collected in a bounded buffer; only the
+    buffer is sorted when it is full, and then merged (linearly) into the sorted centroids.
+  """
+  def __init__(self, compression=200, bufferSize=None):
+    """
+      Constructor
+      @ In, compression, int, optional, compression parameter (the digest keeps about compression/2 centroids)
+      @ In, bufferSize, int, optional, number of samples collected before they are merged into the
+        centroids (if None, 50 times the compression)
+      @ Out, None
+    """
+    self.compression = compression
+    self.bufferSize = 50 * compression if bufferSize is None else bufferSize
+    self.totalWeight = 0.0
+    self.min = np.inf
+    self.max = -np.inf
+    self._means = np.empty(0)
+    self._weights = np.empty(0)
+    self._bufferValues = np.empty(self.bufferSize)
+    self._bufferWeights = np.empty(self.bufferSize)
+    self._buffered = 0
+
+  def __len__(self):
+    """
+      Number of centroids in the digest
+      @ In, None
+      @ Out, len, int, the number of centroids
+    """
+    self._flush()
+    return len(self._means)
+
+  def update(self, values, weights=None):
+    """
+      Adds a batch of samples to the digest
+      @ In, values, numpy.array, the values of the samples
+      @ In, weights, numpy.array, optional, the weights of the samples (if None, equally-weighted)
+      @ Out, None
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    weights = np.ones(len(values)) if weights is None else np.asarray(weights, dtype=float).ravel()
+    positive = weights > 0
+    values, weights = values[positive], weights[positive]
+    if len(values) == 0:
+      return
+    self.min = min(self.min, values.min())
+    self.max = max(self.max, values.max())
+    self.totalWeight += weights.sum()
+    begin = 0
+    while begin < len(values):
+      end = min(len(values), begin + self.bufferSize - self._buffered)
+      if not self._buffered and end - begin == self.bufferSize:
+        # a whole buffer of samples, no need to copy them
+        self._merge(values[begin:end], weights[begin:end])
+      else:
+        stored = self._buffered + end - begin
+        self._bufferValues[self._buffered:stored] = values[begin:end]
+        self._bufferWeights[self._buffered:stored] = weights[begin:end]
+        self._buffered = stored
+        if self._buffered == self.bufferSize:
+          self._flush()
+      begin = end
+
+  def _flush(self):
+    """
+      Merges the buffered samples into the centroids
+      @ In, None
+      @ Out, None
+    """
+    if self._buffered:
+      self._merge(self._bufferValues[:self._buffered], self._bufferWeights[:self._buffered])
+      self._buffered = 0
+
+  def _merge(self, values, weights):
+    """
+      Sorts a (bounded) set of samples and merges them into the (sorted) centroids
+      @ In, values, numpy.array, the values of the samples
+      @ In, weights, numpy.array, the weights of the samples
+      @ Out, None
+    """
+    order = np.argsort(values)
+    values = values[order]
+    weights = weights[order]
+    # merge of two sorted sequences: position of each sample among the centroids and the samples before it
+    positions = np.searchsorted(self._means, values, side='right') + np.arange(len(values))
+    means = np.empty(len(self._means) + len(values))
+    merged = np.empty(len(means))
+    fromCentroids = np.ones(len(means), dtype=bool)
+    fromCentroids[positions] = False
+    means[positions] = values
+    means[fromCentroids] = self._means
+    merged[positions] = weights
+    merged[fromCentroids] = self._weights
+    self._compress(means, merged)
+
+  def _compress(self, means, weights):
+    """
+      Merges the adjacent (sorted) centroids that fall in the same unit of the scale function
+      k(q) = compression/(2 pi) asin(2q-1)
+      @ In, means, numpy.array, the sorted means of the centroids
+      @ In, weights, numpy.array, the weights of the centroids
+      @ Out, None
+    """
+    qMid = (np.cumsum(weights) - 0.5 * weights) / weights.sum()
+    scale = self.compression / (2.0 * np.pi) * np.arcsin(np.clip(2.0 * qMid - 1.0, -1.0, 1.0))
+    bucket = np.floor(scale)
+    starts = np.flatnonzero(np.concatenate(([True], bucket[1:] != bucket[:-1])))
+    self._weights = np.add.reduceat(weights, starts)
+    self._means = np.add.reduceat(weights * means, starts) / self._weights
+
+  def quantile(self, percent):
+    """
+      Estimates the quantile(s) of the samples added so far, interpolating linearly between the centroids
+      @ In, percent, float or list/numpy.array, the quantile(s) to estimate (between 0 and 1)
+      @ Out, quantile, float or numpy.array, the estimated quantile(s)
+    """
+    if self.totalWeight == 0:
+      raise ValueError('The digest is empty: no sample has been added yet!')
+    self._flush()
+    centers = (np.cumsum(self._weights) - 0.5 * self._weights) / self.totalWeight
+    cdf = np.concatenate(([0.0], centers, [1.0]))
+    points = np.concatenate(([self.min], self._means, [self.max]))
+    return np.interp(percent, cdf, points)
@@ -160,15 +160,18 @@ class CrowRNG:
 
   def random(self, size):
     """
-      Wrapper for RandomClass.random()
+      Wrapper for RandomClass.random_vector()
       @ In, size, tuple, size of array to return
       @ Out, vals, np.ndarray, random numbers from RNG engine
     """
-    vals = np.zeros(size)
-    for i in range(size[0]):
-      for j in range(size[1]):
-        vals[i][j] = self._engine.random()
-    return vals
+    count = int(np.prod(size))
+    if hasattr(self._engine, 'random_vector'):
+      # the engine fills the whole (row-major) array in one call, same stream as one random() call per entry
+      vals = np.fromiter(self._engine.random_vector(count), dtype=float, count=count)
+    else:
+      # crow modules compiled before random_vector was added (they need to be rebuilt to use it)
+      vals = np.fromiter((self._engine.random() for _ in range(count)), dtype=float, count=count)
+    return vals.reshape(size)
 
   def getRNGState(self):
     """
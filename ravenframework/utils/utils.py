@@ -48,7 +48,7 @@ try:
   #Enum of the parallel libraries we support
   #Note that shared is use no parallel lib, and distributed is choose one
   # and use it.
-  ParallelLibEnum = enum.Enum('ParallelLibEnum', ['dask','ray','shared','distributed'])
+  ParallelLibEnum = enum.Enum('ParallelLibEnum', ['dask','ray','shared','distributed','process'])
 except ImportError:
   ParallelLibEnum = "ParallelLibEnum is not available without enum"
 
@@ -836,6 +836,27 @@ class pickleSafeSubprocessPopen(subprocess.Popen):
       self.__dict__ = d
       self._handle = None
 
+def killProcessTree(process):
+  """
+    Kills a process together with all its descendants (e.g. a code run through a shell, which would
+    otherwise survive the shell), and waits for it
+    @ In, process, subprocess.Popen, the process to kill
+    @ Out, None
+  """
+  import psutil
+  # the children must be collected before killing their parent, since afterwards they are adopted by init
+  try:
+    children = psutil.Process(process.pid).children(recursive=True)
+  except psutil.NoSuchProcess:
+    children = []
+  process.kill()
+  for child in children:
+    try:
+      child.kill()
+    except psutil.NoSuchProcess:
+      pass
+  process.wait()
+
 def removeDuplicates(objectList):
   """
     Method to efficiently remove duplicates from a list and maintain their
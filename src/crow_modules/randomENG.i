@@ -3,7 +3,6 @@
 #include "randomClass.h"
 %}
 %include "std_vector.i"
-%include "randomClass.h"
 
 namespace std {
    %template(vectd) vector<double>;
@@ -12,3 +11,4 @@ namespace std {
    %template(vecti2d) vector< vector<int> >;
 };
 
+%include "randomClass.h"
@@ -0,0 +1,49 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import xml.etree.ElementTree as ET
+
+def run(xin,yin,out):
+  """
+    Running interface for RAVEN.
+    Evaluates a linear model whose coefficients are read from the auxiliary file "coeffs.dat",
+    and reports if that file is hard-linked (more than one link to its content).
+    @ In, xin, str, filename for input containing x
+    @ In, yin, str, filename for input containing y
+    @ In, out, str, output file base name
+    @ Out, None
+  """
+  x = float(ET.parse(xin).getroot().find('x').text)
+  with open(yin,'r') as iny:
+    for line in iny:
+      if line.startswith('y ='):
+        y = float(line.split('=')[1])
+  coeffs = {}
+  with open('coeffs.dat','r') as aux:
+    for line in aux:
+      if '=' in line and not line.startswith('#'):
+        key, val = line.split('=')
+        coeffs[key.strip()] = float(val)
+  linked = 1 if os.stat('coeffs.dat').st_nlink > 1 else 0
+  with open(out+'.csv','w') as outf:
+    outf.write('x,y,poly,linked\n')
+    outf.write(','.join(str(v) for v in [x, y, coeffs['a']*x + coeffs['b']*y, linked])+'\n')
+
+if __name__=='__main__':
+  import sys
+  args = sys.argv
+  inp1 = args[args.index('-i')+1] if '-i' in args else None
+  inp2 = args[args.index('-a')+1] if '-a' in args else None
+  out  = args[args.index('-o')+1] if '-o' in args else None
+  run(inp1,inp2,out)
@@ -0,0 +1,54 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Dummy code for the branches of the EnsembleModel tests of concurrent sub-models.
+  It reports when it started and ended (to check the overlap of the branches) and how many
+  times it ran to completion in its sample directory (to check that cancelled runs are killed).
+"""
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+def run(inp, out):
+  """
+    Running interface for RAVEN.
+    @ In, inp, str, input file name
+    @ In, out, str, output file base name
+    @ Out, None
+  """
+  root = ET.parse(inp).getroot()
+  name = root.find('name').text.strip()
+  mode = root.find('mode').text.strip()
+  value = float(root.find('value').text)
+  start = time.time()
+  if mode == 'fail':
+    raise RuntimeError(f'Branch {name} failed on purpose')
+  if mode == 'failOnce' and not os.path.isfile('failedOnce'):
+    open('failedOnce', 'w').close()
+    raise RuntimeError(f'Branch {name} failed on purpose (first attempt)')
+  time.sleep(float(root.find('sleep').text))
+  runs = 1
+  if os.path.isfile('completed'):
+    with open('completed', 'r') as counter:
+      runs += int(counter.read())
+  with open('completed', 'w') as counter:
+    counter.write(str(runs))
+  with open(out+'.csv', 'w') as outFile:
+    outFile.write(f'{name},start{name},end{name},runs{name}\n')
+    outFile.write(f'{2.0*value},{start},{time.time()},{runs}\n')
+
+if __name__ == '__main__':
+  args = sys.argv
+  run(args[args.index('-i')+1], args[args.index('-o')+1])
@@ -603,6 +603,27 @@ os.remove(csvname+'_1.csv')
 os.remove(csvname+'_2.csv')
 os.remove(csvname+'_3.csv')
 
+# to HDF5, appending histories with a different set of variables
+h5name = 'HistorySetUnitTest'
+data.write(h5name,style='HDF5',**{'what':'a,b,x,RAVEN_sample_ID'.split(',')})
+nFirst = len(data)
+data.write(h5name,style='HDF5',**{'what':'a,b,y,RAVEN_sample_ID'.split(','),'firstIndex':nFirst-2})
+import h5py
+with h5py.File(h5name+'.h5','r') as h5:
+  offsets = h5['offsets'][()]
+  checkSame('HDF5 append histories',len(offsets)-1,nFirst+2)
+  for var in h5['inputs']:
+    checkSame('HDF5 append input "{}" aligned'.format(var),len(h5['inputs'][var]),nFirst+2)
+  for var in h5['histories']:
+    checkSame('HDF5 append history "{}" aligned'.format(var),len(h5['histories'][var]),offsets[-1])
+  # "y" is back-filled for the first histories, "x" is missing in the appended ones
+  checkTrue('HDF5 append back-fill',bool(np.isnan(h5['histories']['y'][:offsets[nFirst]]).all()))
+  checkTrue('HDF5 append fill',bool(np.isnan(h5['histories']['x'][offsets[nFirst]:]).all()))
+  checkArray('HDF5 append values',h5['histories']['y'][offsets[nFirst]:offsets[nFirst+1]],
+             data.realization(index=nFirst-2)['y'],float)
+os.remove(h5name+'.h5')
+os.remove(h5name+'.xml')
+
 
 ######################################
 #        ACCESS USING GETTERS        #
@@ -359,6 +359,43 @@ m, match = data2.realization(matchDict={'a': 11.0}, noMatchDict={'prefix': 'four
 checkSame('PointSet append 1 avoid prefix fourth index', m, 1)
 checkRlz('PointSet append 1 avoid prefix fourth', match, rlz1)
 
+# many realizations, matched through the realization index
+data3 = copy.deepcopy(data)
+for i in range(500):
+  rlz = {'a': 100.0 + i * 0.1,
+         'b': float(i % 5),
+         'x': -float(i),
+         'z': 0.0,
+         'prefix': 'many{}'.format(i),
+        }
+  formatRealization(rlz)
+  data3.addRealization(rlz)
+m, match = data3.realization(matchDict={'a': 100.0 + 123 * 0.1, 'b': 3.0})
+checkSame('PointSet index match collector index', m, 126)
+checkSame('PointSet index match collector prefix', match['prefix'], 'many123')
+m, match = data3.realization(matchDict={'a': 112.3 * (1.0 + 1e-9), 'b': 3.0}, tol=1e-6)
+checkSame('PointSet index match collector tolerance', m, 126)
+m, match = data3.realization(matchDict={'a': 112.3 * (1.0 + 1e-9), 'b': 3.0})
+checkNone('PointSet index no match collector tolerance', match)
+m, match = data3.realization(matchDict={'b': 3.0}, noMatchDict={'prefix': ['many3', 'many8']}, first=False)
+checkSame('PointSet index match collector all', len(m), 98)
+checkSame('PointSet index match collector all first', m[0], 16)
+# index is kept up to date when adding realizations
+rlz = {'a': 1e3, 'b': 3.0, 'x': 1.0, 'z': 0.0, 'prefix': 'last'}
+formatRealization(rlz)
+data3.addRealization(rlz)
+m, match = data3.realization(matchDict={'a': 1e3, 'b': 3.0})
+checkSame('PointSet index match added', m, 503)
+# same from the data
+data3.asDataset()
+m, match = data3.realization(matchDict={'a': 100.0 + 123 * 0.1, 'b': 3.0})
+checkSame('PointSet index match data index', m, 126)
+checkSame('PointSet index match data prefix', match['prefix'], 'many123')
+m, match = data3.realization(matchDict={'b': 3.0}, noMatchDict={'prefix': ['many3', 'many8']}, first=False)
+checkSame('PointSet index match data all', len(m), 99)
+m, match = data3.realization(matchDict={'a': 1e3, 'b': 2.0})
+checkNone('PointSet index no match data', match)
+
 ######################################
 #        COLLAPSING DATA SET         #
 ######################################
@@ -0,0 +1,105 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the column-oriented realization storage of the HDF5 database:
+  floats, strings and arbitrary (serialized) python objects are written and read back.
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import tempfile
+import numpy as np
+
+ravenDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir))
+sys.path.append(ravenDir)
+from ravenframework.h5py_interface_creator import hdf5Database
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment, value, expected):
+  """
+    Takes a value and checks it against the expected one.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+
+rlzs = [{'prefix': np.array(['1']), 'x': np.array([1.0]), 'y': np.array([0.5, 1.5, 2.5]),
+         'label': np.array(['first']), 'info': np.array([{'a': 1, 'b': [1, 2]}], dtype=object)},
+        {'prefix': np.array(['2']), 'x': np.array([2.0]), 'y': np.array([3.5, 4.5, 5.5]),
+         'label': np.array(['second']), 'info': np.array([(3, 'three'), None], dtype=object)}]
+
+with tempfile.TemporaryDirectory() as tmpDir:
+  database = hdf5Database('test', tmpDir, 'store.h5', False)
+  for rlz in rlzs:
+    database.addGroup(rlz)
+  database.closeDatabaseW()
+  # read back from a new instance
+  database = hdf5Database('test', tmpDir, 'store.h5', True)
+  for rlz in rlzs:
+    name = rlz['prefix'][0]
+    read, _ = database._getRealizationByName(name)
+    checkTrue('float {}'.format(name), read['x'].tolist(), rlz['x'].tolist())
+    checkTrue('array {}'.format(name), read['y'].tolist(), rlz['y'].tolist())
+    checkTrue('string {}'.format(name), read['label'].tolist(), rlz['label'].tolist())
+    checkTrue('object {}'.format(name), read['info'].tolist(), rlz['info'].tolist())
+  batch = database._getRealizationsByName(['2', '1'])
+  checkTrue('batch order', [rlz['x'][0] for rlz in batch], [2.0, 1.0])
+  checkTrue('batch object', batch[0]['info'].tolist(), rlzs[1]['info'].tolist())
+  database.closeDatabaseW()
+
+# ND values whose shape changes from a realization to another
+ndRlzs = [{'prefix': np.array(['1']), 'x': np.array([1.0]), 'z': np.arange(6.0).reshape(2, 3),
+           'mask': np.array([[True, False], [False, True]])},
+          {'prefix': np.array(['2']), 'x': np.array([2.0]), 'z': np.arange(8.0).reshape(2, 4),
+           'mask': np.array([[True, True, False]])}]
+
+with tempfile.TemporaryDirectory() as tmpDir:
+  database = hdf5Database('testND', tmpDir, 'storeND.h5', False)
+  for rlz in ndRlzs:
+    database.addGroup(rlz)
+  database.closeDatabaseW()
+  database = hdf5Database('testND', tmpDir, 'storeND.h5', True)
+  for rlz in ndRlzs:
+    name = rlz['prefix'][0]
+    read, _ = database._getRealizationByName(name)
+    checkTrue('ND float {}'.format(name), read['z'].tolist(), rlz['z'].tolist())
+    checkTrue('ND bool {}'.format(name), read['mask'].tolist(), rlz['mask'].tolist())
+  batch = database._getRealizationsByName(['2', '1'])
+  checkTrue('ND batch shapes', [rlz['z'].shape for rlz in batch], [(2, 4), (2, 3)])
+  checkTrue('ND batch bool', batch[0]['mask'].tolist(), ndRlzs[1]['mask'].tolist())
+  database.closeDatabaseW()
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_tests.Databases.HDF5Store</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>h5py_interface_creator.hdf5Database</classesTested>
+    <description>
+       This test writes realizations with float, string and python object (non-numeric, non-string)
+       variables to an HDF5 database, and checks they are read back unchanged, including ND
+       variables whose shape changes between realizations.
+    </description>
+  </TestInfo>
+"""
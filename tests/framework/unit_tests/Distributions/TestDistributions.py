@@ -31,6 +31,7 @@ find_crow(frameworkDir)
 
 from ravenframework import MessageHandler
 from ravenframework import Distributions
+from ravenframework.utils import randomUtils
 
 mh = MessageHandler.MessageHandler()
 mh.initialize({'verbosity':'debug'})
@@ -291,6 +292,23 @@ checkAnswer("ptruncNormal ppf(0.1)",ptruncNormal.ppf(0.1),-0.498029197939)
 checkAnswer("ptruncNormal ppf(0.5)",ptruncNormal.ppf(0.5),1.0)
 checkAnswer("ptruncNormal ppf(0.9)",ptruncNormal.ppf(0.9),2.49802919794)
 
+# array-valued evaluation must match the scalar one, entry by entry
+truncNormalPoints = np.array([[0.0, 1.0], [2.0, 3.5]])
+for name, arrayValues, scalarMethod, points in [('cdf', truncNormal.cdf(truncNormalPoints), truncNormal.cdf, truncNormalPoints),
+                                                ('pdf', truncNormal.pdf(truncNormalPoints), truncNormal.pdf, truncNormalPoints),
+                                                ('ppf', truncNormal.ppf(np.array([0.1, 0.5, 0.9])), truncNormal.ppf, np.array([0.1, 0.5, 0.9]))]:
+  checkAnswer(f"truncNormal array {name} shape", str(np.shape(arrayValues)), str(points.shape))
+  for point, value in zip(points.ravel(), np.ravel(arrayValues)):
+    checkAnswer(f"truncNormal array {name}({point})", value, scalarMethod(float(point)))
+# the array draws use a dedicated engine, so the global random number stream of the checks below is untouched
+rvsEngine = randomUtils.newRNG()
+randomUtils.randomSeed(42, engine=rvsEngine)
+truncNormalRvs = truncNormal.rvs(4, engine=rvsEngine)
+checkAnswer("truncNormal rvs(4) size", len(truncNormalRvs), 4)
+randomUtils.randomSeed(42, engine=rvsEngine)
+for i, value in enumerate(truncNormalRvs):
+  checkAnswer(f"truncNormal rvs(4)[{i}]", value, truncNormal.rvs(engine=rvsEngine))
+
 lowtruncNormalElement = ET.Element("Normal",{"name":"test"})
 lowtruncNormalElement.append(createElement("mean",text="1.0"))
 lowtruncNormalElement.append(createElement("sigma",text="2.0"))
@@ -629,6 +647,8 @@ checkAnswer("binomial ppf(0.9)",binomial.ppf(0.9),4.0)
 checkAnswer("pbinomial ppf(0.1)",pbinomial.ppf(0.1),0.0)
 checkAnswer("pbinomial ppf(0.5)",pbinomial.ppf(0.5),2.0)
 checkAnswer("pbinomial ppf(0.9)",pbinomial.ppf(0.9),4.0)
+for point, value in zip([0.1, 0.5, 0.9], binomial.ppf(np.array([0.1, 0.5, 0.9]))):
+  checkAnswer(f"binomial array ppf({point})", value, binomial.ppf(point))
 
 
 #Test Bernoulli
@@ -1142,6 +1162,11 @@ checkAnswer("Categorical  ppf(0.1)" , Categorical.ppf(0.1),10)
 checkAnswer("Categorical  ppf(0.5)" , Categorical.ppf(0.5),50)
 checkAnswer("Categorical  ppf(0.9)" , Categorical.ppf(0.9),60)
 checkAnswer("Categorical  ppf(1.0)" , Categorical.ppf(1.0),60)
+# draws from a dedicated engine
+randomUtils.randomSeed(7, engine=rvsEngine)
+categoricalRandom = randomUtils.random(engine=rvsEngine)
+randomUtils.randomSeed(7, engine=rvsEngine)
+checkAnswer("Categorical  rvs(engine)", Categorical.rvs(engine=rvsEngine), Categorical.ppf(categoricalRandom))
 
 #Test Categorical (string)
 
@@ -1232,6 +1257,16 @@ checkAnswer("UniformDiscrete rvs10",UniformDiscrete.selectedRvs(discardedElems),
 checkAnswer("UniformDiscrete rvs11",UniformDiscrete.selectedRvs(discardedElems),4)
 checkAnswer("UniformDiscrete rvs12",UniformDiscrete.selectedRvs(discardedElems),3)
 
+# once the pot is empty, the draws without replacement refill it from the engine of the draw
+for _ in range(UniformDiscrete.pot.size):
+  UniformDiscrete.rvs()
+randomUtils.randomSeed(7, engine=rvsEngine)
+firstPot = [UniformDiscrete.rvs(engine=rvsEngine) for _ in range(UniformDiscrete.xArray.size)]
+checkAnswer("UniformDiscrete rvs(engine) pot", str(sorted(firstPot)), str(UniformDiscrete.xArray.tolist()))
+randomUtils.randomSeed(7, engine=rvsEngine)
+for i, value in enumerate(firstPot):
+  checkAnswer(f"UniformDiscrete rvs(engine) {i}", UniformDiscrete.rvs(engine=rvsEngine), value)
+
 #Test UniformDiscrete not integer values
 # >>> np.linspace(0,1,9)
 #     array([ 0.   ,  0.125,  0.25 ,  0.375,  0.5  ,  0.625,  0.75 ,  0.875,  1.   ])
@@ -1255,6 +1290,10 @@ checkAnswer("UniformDiscrete2 rvs3",UniformDiscrete2.rvs(),0.25)
 checkAnswer("UniformDiscrete2 rvs4",UniformDiscrete2.rvs(),0.25)
 checkAnswer("UniformDiscrete2 rvs5",UniformDiscrete2.rvs(),0.875)
 checkAnswer("UniformDiscrete2 rvs6",UniformDiscrete2.rvs(),0.25)
+randomUtils.randomSeed(7, engine=rvsEngine)
+uniformDiscreteRandom = randomUtils.random(engine=rvsEngine)
+randomUtils.randomSeed(7, engine=rvsEngine)
+checkAnswer("UniformDiscrete2 rvs(engine)",UniformDiscrete2.rvs(engine=rvsEngine),UniformDiscrete2.ppf(uniformDiscreteRandom))
 
 print(results)
 
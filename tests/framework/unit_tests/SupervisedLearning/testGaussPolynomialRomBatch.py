@@ -0,0 +1,118 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the batched evaluation of the GaussPolynomialRom:
+  evaluating many points at once, by chunks of points, must give the evaluation of each point.
+  The ROM is created with pickle_pce_rom.xml.
+  It can not be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import pickle
+import numpy as np
+
+# add RAVEN to path
+ravenDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)] + [os.pardir]*4)))
+frameworkDir = os.path.join(ravenDir, 'framework')
+if ravenDir not in sys.path:
+  sys.path.append(ravenDir)
+
+from ravenframework.utils.utils import find_crow
+find_crow(frameworkDir)
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment, res, update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def checkArray(comment, first, second, tol=1e-10, update=True):
+  """
+    This method is aimed to compare two float arrays
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the values to compare
+    @ In, second, np.array, the expected values
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = np.shape(first) == np.shape(second) and np.allclose(first, second, rtol=0, atol=tol)
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking array",comment,'|',first,"!=",second)
+      results["fail"] += 1
+  return res
+
+# load the pickled ROM
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'PCE.pk'), mode='rb') as pk:
+  rom = pickle.load(pk)
+pce = rom.supervisedContainer[0]
+
+# points within the distributions (x1, x2 uniform in [-pi, pi], x3 normal)
+rng = np.random.RandomState(42)
+nPoints = 1000
+points = np.column_stack((rng.uniform(-np.pi, np.pi, nPoints),
+                          rng.uniform(-np.pi, np.pi, nPoints),
+                          rng.normal(0.5, 1.0, nPoints)))
+
+orders, coeffs = pce._polyCoefficients()
+singleChunk = pce.__evaluateLocal__(points)['ans']
+
+# bound the basis matrix so that the points span several chunks, the last one being partial
+pce._maxBasisEntries = 64 * orders.shape[0]
+chunk = pce._maxBasisEntries // orders.shape[0]
+checkTrue('more than one chunk', nPoints > chunk and nPoints % chunk != 0)
+batch = pce.__evaluateLocal__(points)['ans']
+checkTrue('batch shape', batch.shape == (nPoints,))
+checkArray('chunked batch matches single chunk', batch, singleChunk)
+
+# each point evaluated alone
+perPoint = np.array([pce.__evaluateLocal__(point[np.newaxis, :])['ans'][0] for point in points])
+checkArray('chunked batch matches per-point evaluation', batch, perPoint)
+
+# each point evaluated as the sum of the terms of the expansion
+stdPts = pce._standardPoints(points)
+expansion = np.array([sum(coeff * pce._multiDPolyBasisEval(order, stdPt) for order, coeff in zip(orders, coeffs[:, 0]))
+                      for stdPt in stdPts])
+checkArray('chunked batch matches the expansion', batch, expansion)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_tests.SupervisedLearning.GaussPolynomialRomBatch</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>SupervisedLearning.GaussPolynomialRom</classesTested>
+    <description>
+       This test checks that the evaluation of many points at once by the GaussPolynomialRom, by chunks
+       of points bounding the size of the polynomial basis matrix, gives the evaluation of each point alone.
+    </description>
+  </TestInfo>
+"""
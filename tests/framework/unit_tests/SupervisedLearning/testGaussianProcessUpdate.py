@@ -0,0 +1,173 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the incremental update of the GaussianProcessRegressor:
+  conditioning a trained model on new samples must give the model fitted on all the samples
+  with the same kernel hyperparameters.
+  It can not be considered part of the active code but of the regression test system
+"""
+import xml.etree.ElementTree as ET
+import sys, os
+import numpy as np
+import sklearn.base
+
+# find location of crow, message handler
+ravenDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4)))
+
+sys.path.append(ravenDir)
+frameworkDir = os.path.join(ravenDir, 'framework')
+
+from ravenframework.utils.utils import find_crow
+find_crow(frameworkDir)
+
+from ravenframework import MessageHandler
+
+# message handler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'debug', 'callerLength':10, 'tagLength':10})
+
+# input specs come mostly from the Models.ROM
+from ravenframework.Models import ROM
+
+def createElement(tag,attrib=None,text=None):
+  """
+    Method to create a dummy xml element readable by the distribution classes
+    @ In, tag, string, the node tag
+    @ In, attrib, dict, optional, the attribute of the xml node
+    @ In, text, str, optional, the dict containig what should be in the xml text
+  """
+  if attrib is None:
+    attrib = {}
+  if text is None:
+    text = ''
+  element = ET.Element(tag,attrib)
+  element.text = text
+  return element
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def checkArray(comment,first,second,tol=1e-10,update=True):
+  """
+    This method is aimed to compare two float arrays
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the values to compare
+    @ In, second, np.array, the expected values
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = np.shape(first) == np.shape(second) and np.allclose(first, second, rtol=0, atol=tol)
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking array",comment,'|',first,"!=",second)
+      results["fail"] += 1
+  return res
+
+def createGPR(normalize):
+  """
+    Creates a GaussianProcessRegressor ROM as the BayesianOptimizer uses it
+    @ In, normalize, bool, whether the targets are normalized
+    @ Out, gpr, GaussianProcessRegressor, the (untrained) supervised learning engine
+  """
+  xml = createElement('ROM',attrib={'name':'gpROM', 'subType':'GaussianProcessRegressor'})
+  xml.append(createElement('Features',text='x,y'))
+  xml.append(createElement('Target',text='ans'))
+  xml.append(createElement('alpha',text='1e-8'))
+  xml.append(createElement('n_restarts_optimizer',text='2'))
+  xml.append(createElement('normalize_y',text=str(normalize)))
+  xml.append(createElement('random_state',text='42'))
+  xml.append(createElement('kernel',text='Custom'))
+  xml.append(createElement('custom_kernel',text='(Constant*RBF)+(Constant*Matern)'))
+  xml.append(createElement('multioutput',text='False'))
+  rom = ROM()
+  rom._readMoreXML(xml)
+  return rom.supervisedContainer[0]
+
+def function(x):
+  """
+    The response used to train the models
+    @ In, x, np.array, shape=[n_samples, 2], the feature values
+    @ Out, y, np.array, shape=[n_samples, 1], the target values
+  """
+  return (np.sin(x[:, 0]) * np.cos(0.5 * x[:, 1]) + 0.1 * x[:, 0]).reshape(-1, 1)
+
+rng = np.random.default_rng(42)
+trainX = rng.uniform(0, 10, size=(20, 2))
+newX = rng.uniform(0, 10, size=(5, 2))
+testX = rng.uniform(0, 10, size=(50, 2))
+allX = np.concatenate((trainX, newX))
+
+for normalize in [True, False]:
+  gpr = createGPR(normalize)
+  gpr._train(trainX, function(trainX))
+  mean, std = gpr.model.predict(testX, return_std=True)
+  theta = gpr.model.kernel_.theta
+  state = gpr.getFittedState()
+
+  # incremental update vs a refit on all the samples, with the hyperparameters of the first fit
+  checkTrue(f'update accepted (normalize_y={normalize})', gpr.updateTraining(newX, function(newX)))
+  reference = sklearn.base.clone(gpr.model).set_params(kernel=gpr.model.kernel_, optimizer=None)
+  reference.fit(allX, function(allX))
+  updatedMean, updatedStd = gpr.model.predict(testX, return_std=True)
+  refMean, refStd = reference.predict(testX, return_std=True)
+  checkArray(f'updated mean matches refit (normalize_y={normalize})', updatedMean, refMean)
+  checkArray(f'updated std matches refit (normalize_y={normalize})', updatedStd, refStd)
+  checkArray(f'updated Cholesky factor matches refit (normalize_y={normalize})', gpr.model.L_, reference.L_)
+  checkArray(f'hyperparameters are kept (normalize_y={normalize})', gpr.model.kernel_.theta, theta, tol=0.0)
+
+  # the fitted state is restored (as after selecting a batch)
+  gpr.setFittedState(state)
+  restoredMean, restoredStd = gpr.model.predict(testX, return_std=True)
+  checkArray(f'restored mean (normalize_y={normalize})', restoredMean, mean, tol=0.0)
+  checkArray(f'restored std (normalize_y={normalize})', restoredStd, std, tol=0.0)
+
+# a model trained on a constant response (not fitted) can not be updated, it needs to be trained again
+gpr = createGPR(True)
+gpr._train(trainX, np.ones((len(trainX), 1)))
+checkTrue('constant response model not updated', not gpr.updateTraining(newX, function(newX)))
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_tests.SupervisedLearning.GaussianProcessUpdate</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>SupervisedLearning.GaussianProcessRegressor</classesTested>
+    <description>
+       This test checks that the incremental update of a trained GaussianProcessRegressor gives the model
+       fitted on all the samples with the same hyperparameters, that the fitted state can be restored and
+       that a model which was not fitted is not updated.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,64 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module runs the startup import-time benchmark (developer_tools/importTimeBenchmark.py):
+  the framework must be importable on its own, without loading scikit-learn or tensorflow.
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import subprocess
+
+ravenDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir))
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment, value, expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to compare
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+
+benchmark = os.path.join(ravenDir, 'developer_tools', 'importTimeBenchmark.py')
+run = subprocess.run([sys.executable, benchmark, '--repeat', '1', '--top', '3'], cwd=ravenDir, capture_output=True, text=True)
+print(run.stdout)
+if run.stderr:
+  print(run.stderr)
+checkTrue('benchmark exit code', run.returncode, 0)
+checkTrue('benchmark reports the import time', run.stdout.startswith('import ravenframework.Simulation: median'), True)
+checkTrue('no heavy library imported at startup', 'FAILED' in run.stdout, False)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_tests.SupervisedLearning.ImportTimeBenchmark</name>
+    <author>agent</author>
+    <created>2026-10-19</created>
+    <classesTested>Simulation</classesTested>
+    <description>
+       This test runs the import-time benchmark of the developer tools, checking that the framework
+       can be imported in a fresh interpreter without loading scikit-learn or tensorflow.
+    </description>
+  </TestInfo>
+"""
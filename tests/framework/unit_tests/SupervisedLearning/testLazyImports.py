@@ -0,0 +1,82 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the lazy registration of the SupervisedLearning types:
+  the scikit-learn and Keras wrappers (and the libraries they wrap) must only be imported when requested.
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import json
+import subprocess
+
+ravenDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir))
+sys.path.append(ravenDir)
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment, value, expected):
+  """
+    Takes a boolean and checks it against True or False.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to compare
+    @ In, expected, bool, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+
+# import in a fresh interpreter, so that modules loaded by the test harness do not interfere
+# the checked values are printed as JSON on the last line, since importing RAVEN may print messages
+script = """
+import sys
+import json
+from ravenframework import SupervisedLearning, TSA
+loaded = [lib for lib in ['sklearn', 'tensorflow'] if lib in sys.modules]
+wrapper = 'ravenframework.SupervisedLearning.ScikitLearn.SVM.SVR' in sys.modules
+known = 'SVR' in SupervisedLearning.factory.knownTypes()
+svr = SupervisedLearning.factory.returnClass('SVR')
+print(json.dumps([loaded, wrapper, known, svr.__name__,
+                  'ravenframework.SupervisedLearning.ScikitLearn.SVM.SVR' in sys.modules]))
+"""
+run = subprocess.run([sys.executable, '-c', script], cwd=ravenDir, capture_output=True, text=True)
+if run.returncode:
+  print(run.stderr)
+  results["fail"] += 1
+else:
+  loaded, wrapperAtStartup, known, svrName, wrapperAfterRequest = json.loads(run.stdout.strip().splitlines()[-1])
+  checkTrue('heavy libraries imported at startup', loaded, [])
+  checkTrue('SVR wrapper imported at startup', wrapperAtStartup, False)
+  checkTrue('SVR is a known type', known, True)
+  checkTrue('SVR class requested', svrName, 'SVR')
+  checkTrue('SVR wrapper imported on request', wrapperAfterRequest, True)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_tests.SupervisedLearning.LazyImports</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>EntityFactory, SupervisedLearning.Factory</classesTested>
+    <description>
+       This test checks that the scikit-learn and Keras ROM wrappers are registered without
+       being imported, and are imported when requested.
+    </description>
+  </TestInfo>
+"""
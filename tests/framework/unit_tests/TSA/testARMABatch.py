@@ -0,0 +1,138 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the batched generation of the TSA.ARMA class:
+  the state space recursion run for several histories at once must reproduce, sample for sample,
+  the statsmodels ARIMA.simulate signal for the same shocks.
+  It can not be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import numpy as np
+import statsmodels.api
+
+# add RAVEN to path
+ravenDir =  os.path.abspath(os.path.join(*([os.path.dirname(__file__)] + [os.pardir]*4)))
+frameworkDir = os.path.join(ravenDir, 'framework')
+if ravenDir not in sys.path:
+  sys.path.append(ravenDir)
+
+from ravenframework.utils.utils import find_crow
+find_crow(frameworkDir)
+
+from ravenframework.utils import randomUtils
+
+from ravenframework.TSA import ARMA
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment, value, expected, update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def checkArray(comment, first, second, tol=1e-10, update=True):
+  """
+    This method is aimed to compare two float arrays
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the values to compare
+    @ In, second, np.array, the expected values
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = np.shape(first) == np.shape(second) and np.allclose(first, second, rtol=0, atol=tol)
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking array",comment,'|',first,"!=",second)
+      results["fail"] += 1
+  return res
+
+# ARMA(2, 3): the state dimension (4) differs from the number of histories (5)
+arma = ARMA()
+armaParams = {'const': 0.5,
+              'ar': np.array([0.4, 0.2]),
+              'ma': np.array([0.3, 0.2, 0.1]),
+              'var': 1.3,
+              'lags': [2, 0, 3]}
+transition, stateIntercept, stateCov, selection = arma._buildStateSpaceMatrices(armaParams)
+initMean, initCov = arma._solveStateDistribution(transition, stateIntercept, stateCov, selection)
+armaParams['initials'] = {'mean': initMean, 'cov': initCov}
+size = 200
+numSamples = 5
+
+randomUtils.randomSeed(42)
+msrShocks, stateShocks, initialState = arma._generateNoise(armaParams, size, numSamples)
+checkSame('measurement shocks shape', msrShocks.shape, (numSamples, size))
+checkSame('state shocks shape', stateShocks.shape, (numSamples, size))
+checkSame('initial states shape', initialState.shape, (4, numSamples))
+batch = arma._simulateStateSpace(armaParams, msrShocks, stateShocks, initialState)
+checkSame('batch shape', batch.shape, (numSamples, size))
+
+model = statsmodels.tsa.arima.model.ARIMA(np.zeros(size), order=(2, 0, 3), trend='c')
+modelParams = np.r_[armaParams['const'], armaParams['ar'], armaParams['ma'], armaParams['var']]
+for n in range(numSamples):
+  reference = model.simulate(modelParams,
+                             size,
+                             measurement_shocks=msrShocks[n],
+                             state_shocks=stateShocks[n],
+                             initial_state=initialState[:, n])
+  checkArray('history {} matches ARIMA.simulate'.format(n), batch[n], reference)
+
+# through the generator interface, the histories are the state space simulation of the drawn noise
+params = {'A': {'arma': armaParams}}
+pivot = np.arange(size)
+settings = {'gaussianize': False}
+randomUtils.randomSeed(42)
+batch = arma.generateBatch(params, pivot, settings, numSamples)
+checkSame('generateBatch shape', batch.shape, (numSamples, size, 1))
+randomUtils.randomSeed(42)
+expected = arma._simulateStateSpace(armaParams, *arma._generateNoise(armaParams, size, numSamples))
+checkArray('generateBatch matches the simulated histories', batch[:, :, 0], expected)
+randomUtils.randomSeed(42)
+single = arma.generate(params, pivot, settings)
+checkSame('generate shape', single.shape, (size, 1))
+randomUtils.randomSeed(42)
+checkArray('batch of one matches generate', arma.generateBatch(params, pivot, settings, 1)[0], single)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_tests.TSA.ARMABatch</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>TSA.ARMA</classesTested>
+    <description>
+       This test checks that the batched state space simulation of the ARMA TimeSeriesAnalyzer
+       reproduces the statsmodels ARIMA.simulate signal for the same shocks, for several histories at once.
+    </description>
+  </TestInfo>
+"""
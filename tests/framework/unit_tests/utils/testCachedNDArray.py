@@ -105,6 +105,46 @@ else:
   print('checking string representation does not match:\n'+msg,'\n!=\n'+right)
   results['fail']+=1
 
+#test columnar collector
+collector = cached_ndarray.cColumnarArray(width=4, length=2)
+for i in range(5):
+  collector.append([float(i), i, 'name{}'.format(i), np.arange(3)+i])
+checkAnswer('columnar length',len(collector),5)
+checkAnswer('columnar width',collector.width,4)
+checkAnswer('columnar capacity grown',collector.capacity >= 5,1)
+checkAnswer('columnar float column typed',collector.getColumn(0).dtype == np.float64,1)
+checkAnswer('columnar int column typed',collector.getColumn(1).dtype.kind == 'i',1)
+checkAnswer('columnar string column object',collector.getColumn(2).dtype == object,1)
+checkAnswer('columnar history column 2d',len(collector.getColumn(3).shape),2)
+checkAnswer('columnar getitem cell',collector[3,0],3.0)
+checkAnswer('columnar getitem history',collector[4,3][2],6)
+checkAnswer('columnar getitem column',collector[:,1].sum(),10)
+row = collector[2]
+checkAnswer('columnar getitem row',row[1],2)
+checkAnswer('columnar getitem row string',row[2] == 'name2',1)
+# promotion of a column after mixed entries
+collector.append([5.0, 5.5, 'name5', np.arange(3)+5])
+checkAnswer('columnar promoted column',collector[5,1],5.5)
+checkAnswer('columnar promoted column kept',collector[1,1],1.0)
+# history of different length falls back to object storage
+collector.append([6.0, 6, 'name6', np.arange(4)])
+checkAnswer('columnar ragged history',len(collector[6,3]),4)
+checkAnswer('columnar ragged history kept',collector[0,3][2],2)
+# set and remove
+collector[0,0] = 42.0
+checkAnswer('columnar setitem',collector[0,0],42.0)
+# multiple rows
+rows = collector[np.where(collector[:,0] > 4.5)]
+checkAnswer('columnar select rows',len(rows),3)
+# remove an entity (column)
+collector.removeEntity(2)
+checkAnswer('columnar remove width',collector.width,3)
+checkAnswer('columnar remove shift',collector[0,2][1],1)
+# construct from values
+copied = cached_ndarray.cColumnarArray(values=collector.getData())
+checkAnswer('columnar from values length',len(copied),7)
+checkAnswer('columnar from values entry',copied[3,1],3.0)
+
 print(results)
 
 sys.exit(results["fail"])
@@ -121,6 +161,7 @@ sys.exit(results["fail"])
     <revisions>
       <revision author="talbpaul" date="2016-11-08">Relocated utils tests</revision>
       <revision author="alfoa" date="2017-01-21">Adding this test description.</revision>
+      <revision author="agent" date="2026-10-18">Added tests for the columnar collector.</revision>
     </revisions>
   </TestInfo>
 """
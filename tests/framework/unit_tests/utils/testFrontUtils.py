@@ -181,6 +181,54 @@ rank3D = frontUtils.rankNonDominatedFrontiers(test3D)
 indexesCD3D = frontUtils.crowdingDistance(rank=rank3D, popSize=len(rank3D), objectives=test3D)
 answerIndexesCD3D = np.array([np.inf, np.inf, 1.06417083, np.inf, np.inf,0.56135102, np.inf, np.inf, np.inf,np.inf])
 checkArray('3D crowding distance', indexesCD3D.tolist(), answerIndexesCD3D.tolist())
+
+## Testing ranking of the non-dominated fronts against successive extraction of the non-dominated frontier
+def rankByFrontierExtraction(data):
+  """
+    Reference ranking, removing the non-dominated frontier of the remaining points recursively
+    (the remaining points are kept in the order of their indices, so the copies of a point are set in successive fronts in that order)
+    @ In, data, np.array, data matrix (nPoints, nObjectives)
+    @ Out, rank, np.array, the rank of the front of each point
+  """
+  rank = np.zeros(data.shape[0], dtype=int)
+  remaining = np.arange(data.shape[0])
+  front = 0
+  while remaining.size:
+    front += 1
+    efficient = frontUtils.nonDominatedFrontier(data[remaining].copy(), returnMask=True)
+    rank[remaining[efficient]] = front
+    remaining = remaining[~efficient]
+  return rank
+
+rng = np.random.RandomState(42)
+for nObjectives in [2, 3, 4]:
+  testRank = rng.rand(300, nObjectives)
+  rank = frontUtils.rankNonDominatedFrontiers(testRank)
+  checkArray('{}D rankNonDominatedFrontiers'.format(nObjectives), rank, rankByFrontierExtraction(testRank).tolist())
+  # rounded values, so that ties and duplicated points are tested too
+  testRank = np.round(testRank, 1)
+  rank = frontUtils.rankNonDominatedFrontiers(testRank)
+  checkArray('{}D rankNonDominatedFrontiers with ties'.format(nObjectives), rank, rankByFrontierExtraction(testRank).tolist())
+  # few distinct values, so that most points have several copies
+  testRank = np.floor(testRank * 3)
+  rank = frontUtils.rankNonDominatedFrontiers(testRank)
+  checkArray('{}D rankNonDominatedFrontiers with duplicates'.format(nObjectives), rank, rankByFrontierExtraction(testRank).tolist())
+
+# ties: equal points are in successive fronts (in the order of their indices), weakly dominated points are after the points dominating them
+testTies = np.array([[3., 1.], [0., 3.], [2., 2.], [2., 2.], [3., 0.], [1., 3.], [3., 3.], [2., 1.], [3., 3.], [2., 1.]])
+rankTies = frontUtils.rankNonDominatedFrontiers(testTies)
+checkArray('ranks with equal points', rankTies, [3, 1, 3, 4, 1, 2, 5, 1, 6, 2])
+testTies = np.array([[1., 2.], [1., 3.], [2., 2.], [0., 4.], [2., 3.]])
+rankTies = frontUtils.rankNonDominatedFrontiers(testTies)
+checkArray('ranks with weakly dominated points', rankTies, [1, 2, 2, 1, 3])
+
+# crowding distance over several fronts, compared with the distance of each front taken alone
+testFronts = np.array([[0., 4.], [1., 2.], [2., 1.], [4., 0.], [1., 5.], [3., 3.], [5., 1.], [6., 6.]])
+rankFronts = frontUtils.rankNonDominatedFrontiers(testFronts)
+checkArray('ranks of multiple fronts', rankFronts, [1, 1, 1, 1, 2, 2, 2, 3])
+cdFronts = frontUtils.crowdingDistance(rank=rankFronts, popSize=len(rankFronts), objectives=testFronts)
+answerCDFronts = [np.inf, 1.25, 1.25, np.inf, np.inf, 2.0, np.inf, np.inf]
+checkArray('crowding distance of multiple fronts', cdFronts.tolist(), answerCDFronts)
 ###########################################
 print(results)
 
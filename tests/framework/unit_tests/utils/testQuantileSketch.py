@@ -0,0 +1,103 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the quantileSketch module
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os,sys
+import numpy as np
+
+ravenDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir))
+sys.path.append(ravenDir)
+from ravenframework.utils.quantileSketch import TDigest
+
+results = {"pass":0,"fail":0}
+
+def checkAnswer(comment,value,expected,tol=1e-10):
+  """
+    This method is aimed to compare two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ Out, None
+  """
+  if abs(value - expected) > tol:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+  else:
+    results["pass"] += 1
+
+rng = np.random.default_rng(42)
+percent = np.array([0.01, 0.05, 0.5, 0.95, 0.99])
+
+# unweighted samples, fed by chunks
+samples = rng.normal(size=200000)
+digest = TDigest(compression=200)
+for chunk in np.array_split(samples, 20):
+  digest.update(chunk)
+checkAnswer('total weight', digest.totalWeight, len(samples))
+checkAnswer('number of centroids bounded', len(digest) <= 200, True)
+checkAnswer('minimum', digest.quantile(0.0), samples.min())
+checkAnswer('maximum', digest.quantile(1.0), samples.max())
+for pct, estimate, exact in zip(percent, digest.quantile(percent), np.quantile(samples, percent)):
+  checkAnswer('normal quantile {}'.format(pct), estimate, exact, tol=2e-2)
+
+# weighted samples: uniform samples weighted with a linear density, i.e. a triangular distribution
+samples = rng.uniform(size=200000)
+weights = 2.0 * samples / len(samples)
+digest = TDigest(compression=200)
+for chunk, wchunk in zip(np.array_split(samples, 10), np.array_split(weights, 10)):
+  digest.update(chunk, wchunk)
+for pct, estimate in zip(percent, digest.quantile(percent)):
+  checkAnswer('weighted quantile {}'.format(pct), estimate, np.sqrt(pct), tol=2e-2)
+
+# the samples are merged by full buffers, whatever the size of the updates
+samples = rng.exponential(size=25000)
+bulk = TDigest(compression=100, bufferSize=1000)
+bulk.update(samples)
+pieces = TDigest(compression=100, bufferSize=1000)
+for chunk in np.array_split(samples, 173):
+  pieces.update(chunk)
+checkAnswer('buffered samples bounded', pieces._buffered < pieces.bufferSize, True)
+for pct, estimate, expected in zip(percent, pieces.quantile(percent), bulk.quantile(percent)):
+  checkAnswer('updates by pieces quantile {}'.format(pct), estimate, expected, tol=1e-12)
+
+# zero weights are ignored
+digest = TDigest(compression=50)
+digest.update([1.0, 2.0, 100.0], [1.0, 1.0, 0.0])
+checkAnswer('zero weight ignored', digest.quantile(1.0), 2.0)
+
+# empty digest
+try:
+  TDigest().quantile(0.5)
+  results["fail"] += 1
+except ValueError:
+  results["pass"] += 1
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.quantileSketch</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>utils.quantileSketch.TDigest</classesTested>
+    <description>
+       This test performs Unit Tests for the streaming quantile sketch (t-digest) used by
+       BasicStatistics to estimate the weighted percentiles of very large data sets.
+    </description>
+  </TestInfo>
+"""
@@ -400,6 +400,19 @@ for env in ['crow', 'numpy']:
   sampled = [randomUtils.random(engine=engine) for _ in range(5)]
   checkArray('Independent RNG, seeded',sampled,correct)
 
+# bulk draws of the crow engine: same stream, and same counter advance, as consecutive single draws
+bulkRNG = randomUtils.CrowRNG()
+singleRNG = randomUtils.CrowRNG()
+bulkRNG.seed(42)
+singleRNG.seed(42)
+bulk = bulkRNG.random((3, 4))
+single = np.array([singleRNG._engine.random() for _ in range(12)]).reshape(3, 4)
+checkTrue('CrowRNG bulk draws shape', bulk.shape == (3, 4), True)
+checkArray('CrowRNG bulk draws match consecutive draws', bulk.ravel(), single.ravel(), tol=0.0)
+checkAnswer('CrowRNG bulk draws advance the counter', bulkRNG.getRNGState(), 12)
+checkAnswer('CrowRNG bulk and single draws advance the counter alike', bulkRNG.getRNGState(), singleRNG.getRNGState())
+checkAnswer('CrowRNG next draw after bulk draws', bulkRNG.random((1, 1))[0, 0], singleRNG._engine.random(), tol=0.0)
+
 print(results)
 
 sys.exit(results["fail"])